@@ -3,101 +3,384 @@
 
 from __future__ import unicode_literals
 
+import collections
+import threading
+
+from multiprocessing import pool
+
 import pysigscan
 
 from dfvfs.analyzer import specification
 from dfvfs.lib import definitions
+from dfvfs.lib import source_file
+from dfvfs.resolver import context
 from dfvfs.resolver import resolver
 
 
+class FormatCategoryScanner(object):
+  """Signature scanner of a format category.
+
+  Attributes:
+    footer_range_size (int): size of the data at the end of a file that
+        contains all signatures with an offset relative from the end.
+    footer_signature_scanner (pysigscan.scanner): signature scanner of
+        the signatures with an offset relative from the end, relative from
+        the start of the footer range, or None if there are no such
+        signatures.
+    header_range_size (int): size of the data at the start of a file that
+        contains all signatures with an offset relative from the start or
+        None if there are signatures without an offset.
+    header_signature_scanner (pysigscan.scanner): signature scanner of
+        the signatures with an offset relative from the start or None if
+        there are no such signatures.
+    remainder_list (list[AnalyzerHelper]): remaining analyzer helpers that
+        do not have a format specification.
+    signature_scanner (pysigscan.scanner): signature scanner of all
+        signatures or None if there are no format specifications.
+    specification_store (FormatSpecificationStore): specification store.
+  """
+
+  def __init__(self, specification_store, remainder_list):
+    """Initializes a format category scanner.
+
+    Args:
+      specification_store (FormatSpecificationStore): specification store.
+      remainder_list (list[AnalyzerHelper]): remaining analyzer helpers that
+          do not have a format specification.
+    """
+    super(FormatCategoryScanner, self).__init__()
+    self.footer_range_size = 0
+    self.footer_signature_scanner = None
+    self.header_range_size = 0
+    self.header_signature_scanner = None
+    self.remainder_list = remainder_list
+    self.signature_scanner = None
+    self.specification_store = specification_store
+
+
 class Analyzer(object):
   """Format analyzer."""
 
-  _SCAN_BUFFER_SIZE = 33 * 1024
+  # The maximum number of cached format analysis results.
+  _MAXIMUM_NUMBER_OF_CACHED_RESULTS = 4096
 
-  _analyzer_helpers = {}
+  # The maximum number of pending files per worker when determining
+  # the format types of multiple files.
+  _MAXIMUM_NUMBER_OF_PENDING_FILES_PER_WORKER = 16
 
-  # The archive format category analyzer helpers that do not have
-  # a format specification.
-  _archive_remainder_list = None
+  # The maximum number of scan results a scan state accumulates before it
+  # is replaced, since a scan state cannot be reset.
+  _MAXIMUM_NUMBER_OF_SCAN_RESULTS = 1024
 
-  # The archive format category signature scanner.
-  _archive_scanner = None
-
-  # The archive format category specification store.
-  _archive_store = None
+  _SCAN_BUFFER_SIZE = 33 * 1024
 
-  # The compressed stream format category analyzer helpers that do not have
-  # a format specification.
-  _compressed_stream_remainder_list = None
+  _analyzer_helpers = {}
 
-  # The compressed stream format category signature scanner.
-  _compressed_stream_scanner = None
+  # The version of the format category scanners, which is incremented when
+  # the format category scanners are flushed.
+  _format_category_scanners_version = 0
 
-  # The compressed stream format category specification store.
-  _compressed_stream_store = None
+  # The size and modification time of the source and the format analysis
+  # results per path specification comparable and format category, in least
+  # recently used order.
+  _results_cache = collections.OrderedDict()
 
-  # The file system format category analyzer helpers that do not have
-  # a format specification.
-  _file_system_remainder_list = None
+  # Lock that protects the results cache.
+  _results_cache_lock = threading.Lock()
 
-  # The file system format category signature scanner.
-  _file_system_scanner = None
+  # Thread-local storage of the format category scanners and scan state,
+  # since the signature scanners and scan states are not shared by threads.
+  _thread_local_storage = threading.local()
 
-  # The file system format category specification store.
-  _file_system_store = None
+  # Persistent format analysis results store, where None represents that
+  # format analysis results are not persisted.
+  results_store = None
 
-  # The storage media image format category analyzer helpers that do not have
-  # a format specification.
-  _storage_media_image_remainder_list = None
+  @classmethod
+  def _CacheResult(
+      cls, path_spec, format_category, source_values, type_indicators):
+    """Caches a format analysis result.
 
-  # The storage media image format category signature scanner.
-  _storage_media_image_scanner = None
+    If the maximum number of cached results is exceeded the least recently
+    used results are evicted. A result is not cached when the size of
+    the source is not available, since it then cannot be validated.
 
-  # The storage media image format category specification store.
-  _storage_media_image_store = None
+    Args:
+      path_spec (PathSpec): path specification.
+      format_category (str): format category.
+      source_values (tuple[int, str]): size and modification time of
+          the source, where None represents a value that is not available.
+      type_indicators (list[str]): supported format type indicators.
+    """
+    if source_values[0] is None:
+      return
 
-  # The volume system format category analyzer helpers that do not have
-  # a format specification.
-  _volume_system_remainder_list = None
+    key = (path_spec.comparable, format_category)
+    with cls._results_cache_lock:
+      cls._results_cache.pop(key, None)
+      cls._results_cache[key] = (source_values, list(type_indicators))
 
-  # The volume system format category signature scanner.
-  _volume_system_scanner = None
+      while len(cls._results_cache) > cls._MAXIMUM_NUMBER_OF_CACHED_RESULTS:
+        cls._results_cache.popitem(last=False)
 
-  # The volume system format category specification store.
-  _volume_system_store = None
+    if cls.results_store:
+      analyzer_helpers = cls._GetAnalyzerHelperTypeIndicators(format_category)
+      cls.results_store.WriteResult(
+          path_spec, format_category, analyzer_helpers, source_values,
+          type_indicators)
 
   @classmethod
   def _FlushCache(cls, format_categories):
     """Flushes the cached objects for the specified format categories.
 
+    The format category scanners of all format categories are flushed, since
+    they are stored per thread and are rebuilt by each thread on demand.
+
     Args:
       format_categories (set[str]): format categories.
     """
-    if definitions.FORMAT_CATEGORY_ARCHIVE in format_categories:
-      cls._archive_remainder_list = None
-      cls._archive_scanner = None
-      cls._archive_store = None
-
-    if definitions.FORMAT_CATEGORY_COMPRESSED_STREAM in format_categories:
-      cls._compressed_stream_remainder_list = None
-      cls._compressed_stream_scanner = None
-      cls._compressed_stream_store = None
-
-    if definitions.FORMAT_CATEGORY_FILE_SYSTEM in format_categories:
-      cls._file_system_remainder_list = None
-      cls._file_system_scanner = None
-      cls._file_system_store = None
-
-    if definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE in format_categories:
-      cls._storage_media_image_remainder_list = None
-      cls._storage_media_image_scanner = None
-      cls._storage_media_image_store = None
-
-    if definitions.FORMAT_CATEGORY_VOLUME_SYSTEM in format_categories:
-      cls._volume_system_remainder_list = None
-      cls._volume_system_scanner = None
-      cls._volume_system_store = None
+    with cls._results_cache_lock:
+      cls._format_category_scanners_version += 1
+
+      for key in list(cls._results_cache.keys()):
+        if key[1] in format_categories:
+          del cls._results_cache[key]
+
+  @classmethod
+  def _GetAnalyzerHelperTypeIndicators(cls, format_category):
+    """Retrieves the type indicators of the analyzer helpers of a category.
+
+    Args:
+      format_category (str): format category.
+
+    Returns:
+      list[str]: sorted type indicators of the enabled analyzer helpers.
+    """
+    return sorted([
+        analyzer_helper.type_indicator
+        for analyzer_helper in cls._analyzer_helpers.values()
+        if analyzer_helper.IsEnabled() and
+        format_category in analyzer_helper.format_categories])
+
+  @classmethod
+  def _GetCachedResult(cls, path_spec, format_category, source_values):
+    """Retrieves a cached format analysis result.
+
+    A cached result is only used when the size and modification time of
+    the source still match those of the cached result.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_category (str): format category.
+      source_values (tuple[int, str]): size and modification time of
+          the source, where None represents a value that is not available.
+
+    Returns:
+      list[str]: supported format type indicators or None if not cached.
+    """
+    if source_values[0] is None:
+      return None
+
+    key = (path_spec.comparable, format_category)
+    with cls._results_cache_lock:
+      cached_result = cls._results_cache.pop(key, None)
+      if cached_result is not None:
+        cached_source_values, type_indicators = cached_result
+        if cached_source_values == source_values:
+          # Mark the result as most recently used.
+          cls._results_cache[key] = cached_result
+          return list(type_indicators)
+
+    if not cls.results_store:
+      return None
+
+    analyzer_helpers = cls._GetAnalyzerHelperTypeIndicators(format_category)
+    type_indicators = cls.results_store.ReadResult(
+        path_spec, format_category, analyzer_helpers, source_values)
+    if type_indicators is None:
+      return None
+
+    with cls._results_cache_lock:
+      cls._results_cache[key] = (source_values, type_indicators)
+
+      while len(cls._results_cache) > cls._MAXIMUM_NUMBER_OF_CACHED_RESULTS:
+        cls._results_cache.popitem(last=False)
+
+    return list(type_indicators)
+
+  @classmethod
+  def _GetFooterSignatureScanner(cls, specification_store, footer_range_size):
+    """Initializes a signature scanner for the footer range.
+
+    The offsets of the signatures relative from the end are converted to
+    offsets relative from the start of the footer range, since the signature
+    scanner only scans data buffers for signatures relative from the start.
+
+    Args:
+      specification_store (FormatSpecificationStore): specification store.
+      footer_range_size (int): size of the footer range.
+
+    Returns:
+      pysigscan.scanner: signature scanner or None if there are no signatures
+          with an offset relative from the end.
+    """
+    signature_scanner = None
+
+    for format_specification in specification_store.specifications:
+      for signature in format_specification.signatures:
+        if signature.offset is None or signature.offset >= 0:
+          continue
+
+        if not signature_scanner:
+          signature_scanner = pysigscan.scanner()
+          signature_scanner.set_scan_buffer_size(cls._SCAN_BUFFER_SIZE)
+
+        signature_scanner.add_signature(
+            signature.identifier, footer_range_size + signature.offset,
+            signature.pattern, pysigscan.signature_flags.RELATIVE_FROM_START)
+
+    return signature_scanner
+
+  @classmethod
+  def _GetFormatCategoryScanner(cls, format_category):
+    """Retrieves the format category scanner for specified format category.
+
+    Args:
+      format_category (str): format category.
+
+    Returns:
+      FormatCategoryScanner: format category scanner.
+    """
+    format_category_scanners = cls._GetFormatCategoryScanners()
+
+    format_category_scanner = format_category_scanners.get(
+        format_category, None)
+    if format_category_scanner is None:
+      specification_store, remainder_list = cls._GetSpecificationStore(
+          format_category)
+
+      format_category_scanner = FormatCategoryScanner(
+          specification_store, remainder_list)
+
+      if list(specification_store.specifications):
+        header_range_size, footer_range_size = cls._GetScanRangeSizes(
+            specification_store)
+
+        format_category_scanner.footer_range_size = footer_range_size
+        format_category_scanner.header_range_size = header_range_size
+        format_category_scanner.signature_scanner = cls._GetSignatureScanner(
+            specification_store)
+
+        if header_range_size is not None:
+          format_category_scanner.footer_signature_scanner = (
+              cls._GetFooterSignatureScanner(
+                  specification_store, footer_range_size))
+          format_category_scanner.header_signature_scanner = (
+              cls._GetHeaderSignatureScanner(specification_store))
+
+      format_category_scanners[format_category] = format_category_scanner
+
+    return format_category_scanner
+
+  @classmethod
+  def _GetFormatCategoryScanners(cls):
+    """Retrieves the format category scanners of the current thread.
+
+    The format category scanners of the current thread are discarded when
+    the format category scanners have been flushed.
+
+    Returns:
+      dict[str, FormatCategoryScanner]: format category scanners per format
+          category.
+    """
+    version = cls._format_category_scanners_version
+
+    thread_local_storage = cls._thread_local_storage
+    if getattr(thread_local_storage, 'version', None) != version:
+      thread_local_storage.format_category_scanners = {}
+      thread_local_storage.version = version
+
+    return thread_local_storage.format_category_scanners
+
+  @classmethod
+  def _GetHeaderSignatureScanner(cls, specification_store):
+    """Initializes a signature scanner for the header range.
+
+    Args:
+      specification_store (FormatSpecificationStore): specification store.
+
+    Returns:
+      pysigscan.scanner: signature scanner or None if there are no signatures
+          with an offset relative from the start.
+    """
+    signature_scanner = None
+
+    for format_specification in specification_store.specifications:
+      for signature in format_specification.signatures:
+        if signature.offset is None or signature.offset < 0:
+          continue
+
+        if not signature_scanner:
+          signature_scanner = pysigscan.scanner()
+          signature_scanner.set_scan_buffer_size(cls._SCAN_BUFFER_SIZE)
+
+        signature_scanner.add_signature(
+            signature.identifier, signature.offset, signature.pattern,
+            pysigscan.signature_flags.RELATIVE_FROM_START)
+
+    return signature_scanner
+
+  @classmethod
+  def _GetScanRangeSizes(cls, specification_store):
+    """Determines the sizes of the data that contain all signatures.
+
+    Args:
+      specification_store (FormatSpecificationStore): specification store.
+
+    Returns:
+      tuple[int, int]: size of the data at the start of a file that contains
+          all signatures with an offset relative from the start, or None if
+          there are signatures without an offset, and size of the data at
+          the end of a file that contains all signatures with an offset
+          relative from the end.
+    """
+    header_range_size = 0
+    footer_range_size = 0
+
+    for format_specification in specification_store.specifications:
+      for signature in format_specification.signatures:
+        if signature.offset is None:
+          header_range_size = None
+
+        elif signature.offset < 0:
+          footer_range_size = max(footer_range_size, -signature.offset)
+
+        elif header_range_size is not None:
+          header_range_size = max(
+              header_range_size, signature.offset + len(signature.pattern))
+
+    return header_range_size, footer_range_size
+
+  @classmethod
+  def _GetScanState(cls):
+    """Retrieves the scan state of the current thread.
+
+    The scan state is reused by the scans of the current thread. Since
+    a scan state accumulates the scan results of all scans, it is replaced
+    when it exceeds the maximum number of scan results.
+
+    Returns:
+      pysigscan.scan_state: scan state.
+    """
+    thread_local_storage = cls._thread_local_storage
+
+    scan_state = getattr(thread_local_storage, 'scan_state', None)
+    if (scan_state is None or scan_state.number_of_scan_results >=
+        cls._MAXIMUM_NUMBER_OF_SCAN_RESULTS):
+      scan_state = pysigscan.scan_state()
+      thread_local_storage.scan_state = scan_state
+
+    return scan_state
 
   @classmethod
   def _GetSignatureScanner(cls, specification_store):
@@ -161,49 +444,149 @@ class Analyzer(object):
 
   @classmethod
   def _GetTypeIndicators(
-      cls, signature_scanner, specification_store, remainder_list, path_spec,
-      resolver_context=None):
+      cls, format_category, path_spec, resolver_context=None,
+      skip_end_relative_signatures=False):
     """Determines if a file contains a supported format types.
 
     Args:
-      signature_scanner (pysigscan.scanner): signature scanner.
-      specification_store (FormatSpecificationStore): specification store.
-      remainder_list (list[AnalyzerHelper]): remaining analyzer helpers that
-          do not have a format specification.
+      format_category (str): format category.
       path_spec (PathSpec): path specification.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
+      skip_end_relative_signatures (Optional[bool]): True if signatures with
+          an offset relative from the end should not be scanned for.
 
     Returns:
       list[str]: supported format type indicators.
     """
-    type_indicator_list = []
+    type_indicators = cls.GetTypeIndicators(
+        path_spec, format_categories=[format_category],
+        resolver_context=resolver_context,
+        skip_end_relative_signatures=skip_end_relative_signatures)
 
-    file_object = resolver.Resolver.OpenFileObject(
-        path_spec, resolver_context=resolver_context)
-    scan_state = pysigscan.scan_state()
+    return type_indicators[format_category]
 
-    try:
-      signature_scanner.scan_file_object(scan_state, file_object)
+  @classmethod
+  def _ScanFileObject(
+      cls, format_category_scanner, file_object, header_data, footer_data):
+    """Determines if a file-like object contains a supported format types.
 
-      for scan_result in iter(scan_state.scan_results):
-        format_specification = specification_store.GetSpecificationBySignature(
-            scan_result.identifier)
+    Args:
+      format_category_scanner (FormatCategoryScanner): format category
+          scanner.
+      file_object (FileIO): file-like object.
+      header_data (bytes): data at the start of the file-like object, which
+          contains the header range of the format category scanner unless
+          the file-like object is smaller.
+      footer_data (bytes): data at the end of the file-like object, which
+          contains the footer range of the format category scanner unless
+          the file-like object is smaller, or None if signatures with
+          an offset relative from the end should not be scanned for.
 
-        if format_specification.identifier not in type_indicator_list:
-          type_indicator_list.append(format_specification.identifier)
+    Returns:
+      list[str]: supported format type indicators.
+    """
+    scan_results = []
+
+    if format_category_scanner.header_range_size is None:
+      # There are signatures without an offset hence the signature scanner
+      # determines the data to read.
+      scan_results.extend(cls._ScanFileObjectData(
+          format_category_scanner.signature_scanner, file_object))
+
+    else:
+      if format_category_scanner.header_signature_scanner:
+        scan_results.extend(cls._ScanData(
+            format_category_scanner.header_signature_scanner,
+            header_data[:format_category_scanner.header_range_size]))
+
+      if (format_category_scanner.footer_signature_scanner and
+          footer_data is not None):
+        footer_range_size = format_category_scanner.footer_range_size
+        footer_data_size = len(footer_data)
+
+        if footer_data_size >= footer_range_size:
+          scan_results.extend(cls._ScanData(
+              format_category_scanner.footer_signature_scanner,
+              footer_data[footer_data_size - footer_range_size:]))
+
+        elif footer_data_size > 0:
+          # The data is smaller than the footer range, which is rare enough
+          # to let the signature scanner handle it.
+          scan_results = cls._ScanFileObjectData(
+              format_category_scanner.signature_scanner, file_object)
 
-      for analyzer_helper in remainder_list:
-        result = analyzer_helper.AnalyzeFileObject(file_object)
+    type_indicator_list = []
 
-        if result is not None:
-          type_indicator_list.append(result)
+    specification_store = format_category_scanner.specification_store
+    for scan_result in scan_results:
+      format_specification = specification_store.GetSpecificationBySignature(
+          scan_result.identifier)
 
-    finally:
-      file_object.close()
+      if format_specification.identifier not in type_indicator_list:
+        type_indicator_list.append(format_specification.identifier)
+
+    for analyzer_helper in format_category_scanner.remainder_list:
+      result = analyzer_helper.AnalyzeFileObject(file_object)
+
+      if result is not None:
+        type_indicator_list.append(result)
 
     return type_indicator_list
 
+  @classmethod
+  def _ScanData(cls, signature_scanner, data):
+    """Scans data for signatures.
+
+    Args:
+      signature_scanner (pysigscan.scanner): signature scanner.
+      data (bytes): data.
+
+    Returns:
+      list[pysigscan.scan_result]: scan results.
+    """
+    if not data:
+      return []
+
+    scan_state = cls._GetScanState()
+    first_scan_result_index = scan_state.number_of_scan_results
+
+    scan_state.set_data_size(len(data))
+
+    signature_scanner.scan_start(scan_state)
+    signature_scanner.scan_buffer(scan_state, data)
+    signature_scanner.scan_stop(scan_state)
+
+    return [
+        scan_state.get_scan_result(scan_result_index)
+        for scan_result_index in range(
+            first_scan_result_index, scan_state.number_of_scan_results)]
+
+  @classmethod
+  def _ScanFileObjectData(cls, signature_scanner, file_object):
+    """Scans the data of a file-like object for signatures.
+
+    Args:
+      signature_scanner (pysigscan.scanner): signature scanner or None if
+          there are no format specifications.
+      file_object (FileIO): file-like object.
+
+    Returns:
+      list[pysigscan.scan_result]: scan results.
+    """
+    if not signature_scanner:
+      return []
+
+    scan_state = cls._GetScanState()
+    first_scan_result_index = scan_state.number_of_scan_results
+
+    signature_scanner.scan_file_object(scan_state, file_object)
+
+    return [
+        scan_state.get_scan_result(scan_result_index)
+        for scan_result_index in range(
+            first_scan_result_index, scan_state.number_of_scan_results)]
+
   @classmethod
   def DeregisterHelper(cls, analyzer_helper):
     """Deregisters a format analyzer helper.
@@ -227,143 +610,334 @@ class Analyzer(object):
     del cls._analyzer_helpers[analyzer_helper.type_indicator]
 
   @classmethod
-  def GetArchiveTypeIndicators(cls, path_spec, resolver_context=None):
+  def GetArchiveTypeIndicators(
+      cls, path_spec, resolver_context=None,
+      skip_end_relative_signatures=False):
     """Determines if a file contains a supported archive types.
 
     Args:
       path_spec (PathSpec): path specification.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
+      skip_end_relative_signatures (Optional[bool]): True if signatures with
+          an offset relative from the end should not be scanned for, which
+          is useful for files of which the size is expensive to determine,
+          such as compressed streams.
 
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._archive_remainder_list is None or
-        cls._archive_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_ARCHIVE)
-      cls._archive_remainder_list = remainder_list
-      cls._archive_store = specification_store
-
-    if cls._archive_scanner is None:
-      cls._archive_scanner = cls._GetSignatureScanner(cls._archive_store)
-
     return cls._GetTypeIndicators(
-        cls._archive_scanner, cls._archive_store,
-        cls._archive_remainder_list, path_spec,
-        resolver_context=resolver_context)
+        definitions.FORMAT_CATEGORY_ARCHIVE, path_spec,
+        resolver_context=resolver_context,
+        skip_end_relative_signatures=skip_end_relative_signatures)
 
   @classmethod
-  def GetCompressedStreamTypeIndicators(cls, path_spec, resolver_context=None):
+  def GetCompressedStreamTypeIndicators(
+      cls, path_spec, resolver_context=None,
+      skip_end_relative_signatures=False):
     """Determines if a file contains a supported compressed stream types.
 
     Args:
       path_spec (PathSpec): path specification.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
+      skip_end_relative_signatures (Optional[bool]): True if signatures with
+          an offset relative from the end should not be scanned for, which
+          is useful for files of which the size is expensive to determine,
+          such as compressed streams.
 
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._compressed_stream_remainder_list is None or
-        cls._compressed_stream_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_COMPRESSED_STREAM)
-      cls._compressed_stream_remainder_list = remainder_list
-      cls._compressed_stream_store = specification_store
+    return cls._GetTypeIndicators(
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM, path_spec,
+        resolver_context=resolver_context,
+        skip_end_relative_signatures=skip_end_relative_signatures)
+
+  @classmethod
+  def GetFileObjectTypeIndicators(
+      cls, file_object, format_categories=None,
+      skip_end_relative_signatures=False):
+    """Determines if a file-like object contains supported format types.
 
-    if cls._compressed_stream_scanner is None:
-      cls._compressed_stream_scanner = cls._GetSignatureScanner(
-          cls._compressed_stream_store)
+    The file-like object is not closed and its results are not cached, since
+    it does not need to have a path specification.
 
-    return cls._GetTypeIndicators(
-        cls._compressed_stream_scanner, cls._compressed_stream_store,
-        cls._compressed_stream_remainder_list, path_spec,
-        resolver_context=resolver_context)
+    Args:
+      file_object (FileIO): file-like object.
+      format_categories (Optional[set[str]]): format categories, where None
+          represents all format categories.
+      skip_end_relative_signatures (Optional[bool]): True if signatures with
+          an offset relative from the end should not be scanned for, which
+          is useful for file-like objects of which the size is expensive to
+          determine.
+
+    Returns:
+      dict[str, list[str]]: supported format type indicators per format
+          category.
+    """
+    if format_categories is None:
+      format_categories = definitions.FORMAT_CATEGORIES
+
+    format_category_scanners = [
+        (format_category, cls._GetFormatCategoryScanner(format_category))
+        for format_category in format_categories]
+
+    header_range_size = 0
+    footer_range_size = 0
+    for _, format_category_scanner in format_category_scanners:
+      if format_category_scanner.header_range_size is None:
+        continue
+
+      if format_category_scanner.header_signature_scanner:
+        header_range_size = max(
+            header_range_size, format_category_scanner.header_range_size)
+
+      if format_category_scanner.footer_signature_scanner:
+        footer_range_size = max(
+            footer_range_size, format_category_scanner.footer_range_size)
+
+    # The largest header and footer ranges are read once and the ranges of
+    # the individual format categories are scanned from these buffers.
+    header_data = b''
+    if header_range_size:
+      header_data = file_object.read_at(0, header_range_size)
+
+    footer_data = None
+    if not skip_end_relative_signatures:
+      footer_data = b''
+      if footer_range_size:
+        data_size = file_object.get_size()
+        footer_data_size = min(data_size, footer_range_size)
+        if footer_data_size > 0:
+          footer_data = file_object.read_at(
+              data_size - footer_data_size, footer_data_size)
+
+    type_indicators = {}
+    for format_category, format_category_scanner in format_category_scanners:
+      type_indicators[format_category] = cls._ScanFileObject(
+          format_category_scanner, file_object, header_data, footer_data)
+
+    return type_indicators
 
   @classmethod
-  def GetFileSystemTypeIndicators(cls, path_spec, resolver_context=None):
+  def GetFileSystemTypeIndicators(
+      cls, path_spec, resolver_context=None,
+      skip_end_relative_signatures=False):
     """Determines if a file contains a supported file system types.
 
     Args:
       path_spec (PathSpec): path specification.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
+      skip_end_relative_signatures (Optional[bool]): True if signatures with
+          an offset relative from the end should not be scanned for, which
+          is useful for files of which the size is expensive to determine,
+          such as compressed streams.
 
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._file_system_remainder_list is None or
-        cls._file_system_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_FILE_SYSTEM)
-      cls._file_system_remainder_list = remainder_list
-      cls._file_system_store = specification_store
-
-    if cls._file_system_scanner is None:
-      cls._file_system_scanner = cls._GetSignatureScanner(
-          cls._file_system_store)
-
     return cls._GetTypeIndicators(
-        cls._file_system_scanner, cls._file_system_store,
-        cls._file_system_remainder_list, path_spec,
-        resolver_context=resolver_context)
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM, path_spec,
+        resolver_context=resolver_context,
+        skip_end_relative_signatures=skip_end_relative_signatures)
 
   @classmethod
-  def GetStorageMediaImageTypeIndicators(cls, path_spec, resolver_context=None):
+  def GetStorageMediaImageTypeIndicators(
+      cls, path_spec, resolver_context=None,
+      skip_end_relative_signatures=False):
     """Determines if a file contains a supported storage media image types.
 
     Args:
       path_spec (PathSpec): path specification.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
+      skip_end_relative_signatures (Optional[bool]): True if signatures with
+          an offset relative from the end should not be scanned for, which
+          is useful for files of which the size is expensive to determine,
+          such as compressed streams.
 
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._storage_media_image_remainder_list is None or
-        cls._storage_media_image_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE)
-      cls._storage_media_image_remainder_list = remainder_list
-      cls._storage_media_image_store = specification_store
+    return cls._GetTypeIndicators(
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE, path_spec,
+        resolver_context=resolver_context,
+        skip_end_relative_signatures=skip_end_relative_signatures)
 
-    if cls._storage_media_image_scanner is None:
-      cls._storage_media_image_scanner = cls._GetSignatureScanner(
-          cls._storage_media_image_store)
+  @classmethod
+  def GetTypeIndicators(
+      cls, path_spec, format_categories=None, resolver_context=None,
+      skip_end_relative_signatures=False):
+    """Determines if a file contains supported types of multiple categories.
 
-    return cls._GetTypeIndicators(
-        cls._storage_media_image_scanner, cls._storage_media_image_store,
-        cls._storage_media_image_remainder_list, path_spec,
-        resolver_context=resolver_context)
+    The file is opened once and scanned for the format types of all format
+    categories, instead of being opened once per format category.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_categories (Optional[set[str]]): format categories, where None
+          represents all format categories.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built-in context which is not multi process safe.
+      skip_end_relative_signatures (Optional[bool]): True if signatures with
+          an offset relative from the end should not be scanned for, which
+          is useful for files of which the size is expensive to determine,
+          such as compressed streams. The results are not cached, since
+          they can lack format types that are only detected by such
+          signatures.
+
+    Returns:
+      dict[str, list[str]]: supported format type indicators per format
+          category.
+    """
+    if format_categories is None:
+      format_categories = definitions.FORMAT_CATEGORIES
+
+    # The size and modification time of the source are used to determine
+    # if cached results are still valid.
+    source_values = source_file.GetSourceValues(
+        path_spec, resolver_context=resolver_context)
+
+    type_indicators = {}
+    uncached_format_categories = []
+
+    for format_category in format_categories:
+      type_indicator_list = cls._GetCachedResult(
+          path_spec, format_category, source_values)
+      if type_indicator_list is None:
+        uncached_format_categories.append(format_category)
+      else:
+        type_indicators[format_category] = type_indicator_list
+
+    if not uncached_format_categories:
+      return type_indicators
+
+    file_object = resolver.Resolver.OpenFileObject(
+        path_spec, resolver_context=resolver_context)
+
+    try:
+      type_indicators.update(cls.GetFileObjectTypeIndicators(
+          file_object, format_categories=uncached_format_categories,
+          skip_end_relative_signatures=skip_end_relative_signatures))
+
+    finally:
+      file_object.close()
+
+    if skip_end_relative_signatures:
+      return type_indicators
+
+    for format_category in uncached_format_categories:
+      cls._CacheResult(
+          path_spec, format_category, source_values,
+          type_indicators[format_category])
+
+    return type_indicators
 
   @classmethod
-  def GetVolumeSystemTypeIndicators(cls, path_spec, resolver_context=None):
+  def GetVolumeSystemTypeIndicators(
+      cls, path_spec, resolver_context=None,
+      skip_end_relative_signatures=False):
     """Determines if a file contains a supported volume system types.
 
     Args:
       path_spec (PathSpec): path specification.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
+      skip_end_relative_signatures (Optional[bool]): True if signatures with
+          an offset relative from the end should not be scanned for, which
+          is useful for files of which the size is expensive to determine,
+          such as compressed streams.
 
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._volume_system_remainder_list is None or
-        cls._volume_system_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_VOLUME_SYSTEM)
-      cls._volume_system_remainder_list = remainder_list
-      cls._volume_system_store = specification_store
+    return cls._GetTypeIndicators(
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, path_spec,
+        resolver_context=resolver_context,
+        skip_end_relative_signatures=skip_end_relative_signatures)
 
-    if cls._volume_system_scanner is None:
-      cls._volume_system_scanner = cls._GetSignatureScanner(
-          cls._volume_system_store)
+  @classmethod
+  def IterateTypeIndicators(
+      cls, sources, format_categories=None, number_of_workers=0,
+      resolver_context=None, skip_end_relative_signatures=False):
+    """Determines the supported format types of multiple files.
 
-    return cls._GetTypeIndicators(
-        cls._volume_system_scanner, cls._volume_system_store,
-        cls._volume_system_remainder_list, path_spec,
-        resolver_context=resolver_context)
+    The results are yielded in the order of the sources, as soon as they
+    are available, such that the sources can be a generator of a large
+    number of files.
+
+    Args:
+      sources (iterable[PathSpec|FileIO]): path specifications or open
+          file-like objects of the files. File-like objects are not closed.
+      format_categories (Optional[set[str]]): format categories, where None
+          represents all format categories.
+      number_of_workers (Optional[int]): number of worker threads, where 0
+          represents that the files are analyzed by the calling thread.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built-in context which is not multi process safe,
+          or a thread-safe context if worker threads are used.
+      skip_end_relative_signatures (Optional[bool]): True if signatures with
+          an offset relative from the end should not be scanned for.
+
+    Yields:
+      tuple[PathSpec|FileIO, dict[str, list[str]]]: source and its supported
+          format type indicators per format category.
+    """
+    if format_categories is None:
+      format_categories = definitions.FORMAT_CATEGORIES
+
+    def _AnalyzeSource(source):
+      """Determines the supported format types of a source.
+
+      Args:
+        source (PathSpec|FileIO): path specification or open file-like object.
+
+      Returns:
+        tuple[PathSpec|FileIO, dict[str, list[str]]]: source and its
+            supported format type indicators per format category.
+      """
+      if hasattr(source, 'comparable'):
+        type_indicators = cls.GetTypeIndicators(
+            source, format_categories=format_categories,
+            resolver_context=resolver_context,
+            skip_end_relative_signatures=skip_end_relative_signatures)
+      else:
+        type_indicators = cls.GetFileObjectTypeIndicators(
+            source, format_categories=format_categories,
+            skip_end_relative_signatures=skip_end_relative_signatures)
+
+      return source, type_indicators
+
+    if number_of_workers <= 0:
+      for source in sources:
+        yield _AnalyzeSource(source)
+      return
+
+    if resolver_context is None:
+      resolver_context = context.ThreadSafeContext()
+
+    maximum_number_of_pending_results = (
+        number_of_workers * cls._MAXIMUM_NUMBER_OF_PENDING_FILES_PER_WORKER)
+    pending_results = collections.deque()
+
+    thread_pool = pool.ThreadPool(processes=number_of_workers)
+    try:
+      for source in sources:
+        pending_results.append(
+            thread_pool.apply_async(_AnalyzeSource, (source, )))
+
+        if len(pending_results) >= maximum_number_of_pending_results:
+          yield pending_results.popleft().get()
+
+      while pending_results:
+        yield pending_results.popleft().get()
+
+    finally:
+      thread_pool.terminate()
+      thread_pool.join()
 
   @classmethod
   def RegisterHelper(cls, analyzer_helper):
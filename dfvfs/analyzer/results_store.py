@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Persistent format analysis results store.
+
+Format analysis requires the data of a path specification to be read and
+scanned for signatures. The store keeps the results of the format analysis
+in a results file per path specification and format category, such that
+repeated analysis of the same source does not need to determine them again.
+"""
+
+from __future__ import unicode_literals
+
+import hashlib
+import os
+
+from dfvfs.lib import json_file
+
+
+class ResultsStore(object):
+  """Persistent format analysis results store.
+
+  Results files are stored in a directory and named after a hash of the path
+  specification and format category. A results file is only used when the
+  size and modification time of the source, which is the outermost parent
+  of the path specification, and the analyzer helpers used for the format
+  category still match those stored in the results file.
+  """
+
+  _FORMAT_VERSION = 1
+
+  _RESULTS_FILE_EXTENSION = '.json'
+
+  def __init__(self, path):
+    """Initializes a format analysis results store.
+
+    Args:
+      path (str): path of the directory that contains the results files.
+    """
+    super(ResultsStore, self).__init__()
+    self._path = path
+
+  def _GetResultsFilePath(self, path_spec, format_category):
+    """Retrieves the path of the results file of a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_category (str): format category.
+
+    Returns:
+      str: path of the results file.
+    """
+    key = '{0!s}\n{1!s}'.format(format_category, path_spec.comparable)
+    key_hash = hashlib.sha256(key.encode('utf-8'))
+    file_name = '{0:s}{1:s}'.format(
+        key_hash.hexdigest(), self._RESULTS_FILE_EXTENSION)
+    return os.path.join(self._path, file_name)
+
+  def ReadResult(
+      self, path_spec, format_category, analyzer_helpers, source_values):
+    """Reads the format analysis result of a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_category (str): format category.
+      analyzer_helpers (list[str]): type indicators of the analyzer helpers
+          used for the format category.
+      source_values (tuple[int, str]): size and modification time of
+          the source, where None represents a value that is not available.
+
+    Returns:
+      list[str]: supported format type indicators or None if no valid results
+          file is available.
+    """
+    results_file_path = self._GetResultsFilePath(path_spec, format_category)
+
+    results_file_values = json_file.ReadJSONFile(results_file_path)
+    if not results_file_values:
+      return None
+
+    if (results_file_values.get('format_version', None) !=
+        self._FORMAT_VERSION or
+        results_file_values.get('comparable', None) != path_spec.comparable or
+        results_file_values.get('format_category', None) != format_category or
+        results_file_values.get('analyzer_helpers', None) != analyzer_helpers):
+      return None
+
+    size, modification_time = source_values
+    if (size is None or results_file_values.get('source_size', None) != size or
+        results_file_values.get('source_modification_time', None) != (
+            modification_time)):
+      return None
+
+    type_indicators = results_file_values.get('type_indicators', None)
+    if not isinstance(type_indicators, list):
+      return None
+
+    return type_indicators
+
+  def WriteResult(
+      self, path_spec, format_category, analyzer_helpers, source_values,
+      type_indicators):
+    """Writes the format analysis result of a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_category (str): format category.
+      analyzer_helpers (list[str]): type indicators of the analyzer helpers
+          used for the format category.
+      source_values (tuple[int, str]): size and modification time of
+          the source, where None represents a value that is not available.
+      type_indicators (list[str]): supported format type indicators.
+    """
+    size, modification_time = source_values
+    if size is None:
+      # Without the size of the source the results file cannot be validated.
+      return
+
+    results_file_values = {
+        'analyzer_helpers': analyzer_helpers,
+        'comparable': path_spec.comparable,
+        'format_category': format_category,
+        'format_version': self._FORMAT_VERSION,
+        'source_modification_time': modification_time,
+        'source_size': size,
+        'type_indicators': type_indicators}
+
+    results_file_path = self._GetResultsFilePath(path_spec, format_category)
+
+    try:
+      json_file.WriteJSONFile(results_file_path, results_file_values)
+    except (IOError, OSError):
+      pass
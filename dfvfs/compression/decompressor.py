@@ -11,6 +11,15 @@ class Decompressor(object):
 
   # pylint: disable=redundant-returns-doc
 
+  def Copy(self):
+    """Copies the decompressor including its state.
+
+    Returns:
+      Decompressor: copy of the decompressor or None if the decompressor
+          does not support copying its state.
+    """
+    return None
+
   @abc.abstractmethod
   def Decompress(self, compressed_data):
     """Decompresses the compressed data.
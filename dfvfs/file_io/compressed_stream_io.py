@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import bisect
 import os
 
 from dfvfs.compression import manager as compression_manager
@@ -11,14 +12,70 @@ from dfvfs.lib import errors
 from dfvfs.resolver import resolver
 
 
+class _CompressedStreamCheckpoint(object):
+  """Compressed stream checkpoint.
+
+  A checkpoint contains the state needed to resume decompression at a specific
+  offset in the uncompressed stream.
+
+  Attributes:
+    compressed_data (bytes): compressed data that was read but not yet
+        consumed by the decompressor.
+    compressed_data_offset (int): offset, relative to the start of the parent
+        file-like object, of the compressed data that follows compressed_data.
+    decompressor (Decompressor): copy of the decompressor state or None
+        if decompression should start with a new decompressor.
+    uncompressed_data_offset (int): offset in the uncompressed stream.
+  """
+
+  def __init__(
+      self, compressed_data_offset, uncompressed_data_offset,
+      compressed_data=b'', decompressor=None):
+    """Initializes a compressed stream checkpoint.
+
+    Args:
+      compressed_data_offset (int): offset, relative to the start of the
+          parent file-like object, of the compressed data that follows
+          compressed_data.
+      uncompressed_data_offset (int): offset in the uncompressed stream.
+      compressed_data (Optional[bytes]): compressed data that was read but
+          not yet consumed by the decompressor.
+      decompressor (Optional[Decompressor]): copy of the decompressor state
+          or None if decompression should start with a new decompressor.
+    """
+    super(_CompressedStreamCheckpoint, self).__init__()
+    self.compressed_data = compressed_data
+    self.compressed_data_offset = compressed_data_offset
+    self.decompressor = decompressor
+    self.uncompressed_data_offset = uncompressed_data_offset
+
+
 class CompressedStream(file_io.FileIO):
-  """File-like object of a compressed stream."""
+  """File-like object of a compressed stream.
+
+  While decompressing, checkpoints are recorded that allow to resume
+  decompression close to an offset, instead of decompressing the stream from
+  the start on every backward seek. Checkpoints are only recorded for
+  decompressors that support copying their state.
+  """
 
   # The size of the compressed data buffer.
-  _COMPRESSED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
+  _COMPRESSED_DATA_BUFFER_SIZE = 1 * 1024 * 1024
+
+  # The default minimum number of bytes of uncompressed data between
+  # checkpoints.
+  _CHECKPOINT_SPACING = 4 * 1024 * 1024
+
+  # The estimated size of a copy of the decompressor state, such as the zlib
+  # window of 32 KiB and the zlib inflate state.
+  _DECOMPRESSOR_STATE_SIZE = 48 * 1024
+
+  # The default maximum number of bytes of memory used by checkpoints.
+  _MAXIMUM_CHECKPOINTS_SIZE = 32 * 1024 * 1024
 
   def __init__(
-      self, resolver_context, compression_method=None, file_object=None):
+      self, resolver_context, compression_method=None, file_object=None,
+      checkpoint_spacing=None, maximum_checkpoints_size=None):
     """Initializes a file-like object.
 
     If the file-like object is chained do not separately use the parent
@@ -28,6 +85,13 @@ class CompressedStream(file_io.FileIO):
       resolver_context (Context): resolver context.
       compression_method (Optional[str]): method used to the compress the data.
       file_object (Optional[file]): parent file-like object.
+      checkpoint_spacing (Optional[int]): minimum number of bytes of
+          uncompressed data between checkpoints, where None represents
+          the default.
+      maximum_checkpoints_size (Optional[int]): maximum number of bytes of
+          memory used by checkpoints, where None represents the default.
+          When the maximum is reached, every other checkpoint is discarded
+          and the checkpoint spacing is doubled.
 
     Raises:
       ValueError: if file_object provided but compression_method is not.
@@ -38,18 +102,66 @@ class CompressedStream(file_io.FileIO):
           'method.')
 
     super(CompressedStream, self).__init__(resolver_context)
+    self._checkpoint_spacing = checkpoint_spacing or self._CHECKPOINT_SPACING
+    # The uncompressed data offsets of the checkpoints, which are used to
+    # look up the checkpoint nearest before an offset.
+    self._checkpoint_offsets = []
+    self._checkpoints = []
+    self._checkpoints_size = 0
     self._compression_method = compression_method
     self._file_object = file_object
     self._file_object_set_in_init = bool(file_object)
     self._compressed_data = b''
+    self._compressed_data_offset = 0
     self._current_offset = 0
     self._decompressor = None
+    self._maximum_checkpoints_size = (
+        maximum_checkpoints_size or self._MAXIMUM_CHECKPOINTS_SIZE)
+    self._path_spec = None
     self._realign_offset = True
     self._uncompressed_data = b''
     self._uncompressed_data_offset = 0
     self._uncompressed_data_size = 0
+    self._uncompressed_stream_offset = 0
     self._uncompressed_stream_size = None
 
+  def _AddCheckpoint(self):
+    """Adds a checkpoint for the current decompressor state.
+
+    A checkpoint is only added when the decompressor supports copying its
+    state and the current offset is at least the checkpoint spacing past
+    the last checkpoint.
+    """
+    uncompressed_data_offset = (
+        self._uncompressed_stream_offset + self._uncompressed_data_size)
+
+    last_checkpoint = self._checkpoints[-1]
+    if uncompressed_data_offset < (
+        last_checkpoint.uncompressed_data_offset + self._checkpoint_spacing):
+      return
+
+    decompressor = self._decompressor.Copy()
+    if not decompressor:
+      return
+
+    checkpoint = _CompressedStreamCheckpoint(
+        self._compressed_data_offset, uncompressed_data_offset,
+        compressed_data=self._compressed_data, decompressor=decompressor)
+
+    self._checkpoint_offsets.append(uncompressed_data_offset)
+    self._checkpoints.append(checkpoint)
+    self._checkpoints_size += self._GetCheckpointSize(checkpoint)
+
+    if self._checkpoints_size > self._maximum_checkpoints_size:
+      # Keep the checkpoint at the start of the stream and every other
+      # checkpoint after it.
+      self._checkpoint_offsets = self._checkpoint_offsets[::2]
+      self._checkpoints = self._checkpoints[::2]
+      self._checkpoints_size = sum(
+          self._GetCheckpointSize(checkpoint)
+          for checkpoint in self._checkpoints)
+      self._checkpoint_spacing *= 2
+
   def _Close(self):
     """Closes the file-like object.
 
@@ -61,9 +173,40 @@ class CompressedStream(file_io.FileIO):
       self._file_object.close()
       self._file_object = None
 
+    self._checkpoint_offsets = []
+    self._checkpoints = []
+    self._checkpoints_size = 0
     self._compressed_data = b''
     self._uncompressed_data = b''
     self._decompressor = None
+    self._path_spec = None
+
+  def _GetCheckpoint(self, uncompressed_data_offset):
+    """Retrieves the checkpoint nearest before an uncompressed data offset.
+
+    Args:
+      uncompressed_data_offset (int): uncompressed data offset.
+
+    Returns:
+      _CompressedStreamCheckpoint: checkpoint.
+    """
+    checkpoint_index = bisect.bisect_right(
+        self._checkpoint_offsets, uncompressed_data_offset)
+    return self._checkpoints[max(checkpoint_index - 1, 0)]
+
+  def _GetCheckpointSize(self, checkpoint):
+    """Retrieves the estimated memory size of a checkpoint.
+
+    Args:
+      checkpoint (_CompressedStreamCheckpoint): checkpoint.
+
+    Returns:
+      int: estimated number of bytes of memory used by the checkpoint.
+    """
+    checkpoint_size = len(checkpoint.compressed_data)
+    if checkpoint.decompressor:
+      checkpoint_size += self._DECOMPRESSOR_STATE_SIZE
+    return checkpoint_size
 
   def _GetDecompressor(self):
     """Retrieves the decompressor.
@@ -80,22 +223,26 @@ class CompressedStream(file_io.FileIO):
     Returns:
       int: uncompressed stream size.
     """
-    self._file_object.seek(0, os.SEEK_SET)
-
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    # Decompression continues from the last checkpoint and the checkpoints
+    # recorded while doing so are used by subsequent seeks.
+    self._RestoreCheckpoint(self._checkpoints[-1])
+    self._realign_offset = True
 
-    compressed_data_offset = 0
     compressed_data_size = self._file_object.get_size()
-    uncompressed_stream_size = 0
 
-    while compressed_data_offset < compressed_data_size:
+    while self._compressed_data_offset < compressed_data_size:
       read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
       if read_count == 0:
         break
 
-      compressed_data_offset += read_count
-      uncompressed_stream_size += self._uncompressed_data_size
+    uncompressed_stream_size = (
+        self._uncompressed_stream_offset + self._uncompressed_data_size)
+
+    seek_index_store = resolver.Resolver.seek_index_store
+    if seek_index_store and self._path_spec:
+      seek_index_store.WriteIndex(
+          self._path_spec, self._file_object, self._resolver_context,
+          {'uncompressed_stream_size': uncompressed_stream_size})
 
     return uncompressed_stream_size
 
@@ -129,33 +276,53 @@ class CompressedStream(file_io.FileIO):
 
       self._file_object = resolver.Resolver.OpenFileObject(
           path_spec.parent, resolver_context=self._resolver_context)
+      self._path_spec = path_spec
+
+      seek_index_store = resolver.Resolver.seek_index_store
+      if seek_index_store:
+        index_values = seek_index_store.ReadIndex(
+            path_spec, self._file_object, self._resolver_context)
+        if index_values:
+          self._uncompressed_stream_size = index_values.get(
+              'uncompressed_stream_size', None)
+
+    self._checkpoint_offsets = [0]
+    self._checkpoints = [_CompressedStreamCheckpoint(0, 0)]
+    self._checkpoints_size = 0
 
   def _AlignUncompressedDataOffset(self, uncompressed_data_offset):
     """Aligns the compressed file with the uncompressed data offset.
 
+    Decompression continues from the current decompressor state when the
+    offset lies ahead of it and no nearer checkpoint is available, otherwise
+    from the checkpoint nearest before the offset.
+
     Args:
       uncompressed_data_offset (int): uncompressed data offset.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    checkpoint = self._GetCheckpoint(uncompressed_data_offset)
 
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    uncompressed_data_end_offset = (
+        self._uncompressed_stream_offset + self._uncompressed_data_size)
+
+    if (not self._decompressor or
+        uncompressed_data_offset < self._uncompressed_stream_offset or
+        checkpoint.uncompressed_data_offset > uncompressed_data_end_offset):
+      self._RestoreCheckpoint(checkpoint)
 
-    compressed_data_offset = 0
     compressed_data_size = self._file_object.get_size()
 
-    while compressed_data_offset < compressed_data_size:
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      if read_count == 0:
+    while uncompressed_data_offset >= (
+        self._uncompressed_stream_offset + self._uncompressed_data_size):
+      if self._compressed_data_offset >= compressed_data_size:
         break
 
-      compressed_data_offset += read_count
-
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
+      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
+      if read_count == 0:
         break
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+    self._uncompressed_data_offset = (
+        uncompressed_data_offset - self._uncompressed_stream_offset)
 
   def _ReadCompressedData(self, read_size):
     """Reads compressed data from the file-like object.
@@ -166,19 +333,48 @@ class CompressedStream(file_io.FileIO):
     Returns:
       int: number of bytes of compressed data read.
     """
+    self._file_object.seek(self._compressed_data_offset, os.SEEK_SET)
     compressed_data = self._file_object.read(read_size)
 
     read_count = len(compressed_data)
 
-    self._compressed_data = b''.join([self._compressed_data, compressed_data])
+    if self._compressed_data:
+      self._compressed_data = b''.join([self._compressed_data, compressed_data])
+    else:
+      self._compressed_data = compressed_data
+    self._compressed_data_offset += read_count
+
+    self._uncompressed_stream_offset += self._uncompressed_data_size
 
     self._uncompressed_data, self._compressed_data = (
         self._decompressor.Decompress(self._compressed_data))
 
     self._uncompressed_data_size = len(self._uncompressed_data)
 
+    if read_count > 0:
+      self._AddCheckpoint()
+
     return read_count
 
+  def _RestoreCheckpoint(self, checkpoint):
+    """Restores the decompressor state of a checkpoint.
+
+    Args:
+      checkpoint (_CompressedStreamCheckpoint): checkpoint.
+    """
+    if checkpoint.decompressor:
+      # Copy the decompressor state so that the checkpoint can be reused.
+      self._decompressor = checkpoint.decompressor.Copy()
+    else:
+      self._decompressor = self._GetDecompressor()
+
+    self._compressed_data = checkpoint.compressed_data
+    self._compressed_data_offset = checkpoint.compressed_data_offset
+    self._uncompressed_data = b''
+    self._uncompressed_data_offset = 0
+    self._uncompressed_data_size = 0
+    self._uncompressed_stream_offset = checkpoint.uncompressed_data_offset
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -203,6 +399,40 @@ class CompressedStream(file_io.FileIO):
     if not self._is_open:
       raise IOError('Not opened.')
 
+    if self._uncompressed_stream_size is None:
+      self._uncompressed_stream_size = self._GetUncompressedStreamSize()
+
+    remaining_uncompressed_stream_size = (
+        self._uncompressed_stream_size - self._current_offset)
+    if size is None or size > remaining_uncompressed_stream_size:
+      size = remaining_uncompressed_stream_size
+
+    # The data is read into a preallocated buffer to prevent the data read
+    # so far from being copied for every uncompressed data buffer.
+    uncompressed_data = bytearray(max(size, 0))
+    read_count = self.readinto(uncompressed_data)
+
+    return memoryview(uncompressed_data)[:read_count].tobytes()
+
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    The function will read up to the size of the buffer.
+
+    Args:
+      buffer_object (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read into the buffer, where 0 represents that
+          there is no more data to read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
     if self._current_offset < 0:
       raise IOError(
           'Invalid current offset: {0:d} value less than zero.'.format(
@@ -214,54 +444,43 @@ class CompressedStream(file_io.FileIO):
     if self._uncompressed_stream_size < 0:
       raise IOError('Invalid uncompressed stream size.')
 
-    if self._current_offset >= self._uncompressed_stream_size:
-      return b''
+    buffer_view = memoryview(buffer_object)
+
+    size = min(
+        len(buffer_view), self._uncompressed_stream_size - self._current_offset)
+    if size <= 0:
+      return 0
 
     if self._realign_offset:
       self._AlignUncompressedDataOffset(self._current_offset)
       self._realign_offset = False
 
-    if size is None:
-      size = self._uncompressed_stream_size
-    if self._current_offset + size > self._uncompressed_stream_size:
-      size = self._uncompressed_stream_size - self._current_offset
-
-    uncompressed_data = b''
-
-    if size == 0:
-      return uncompressed_data
+    buffer_offset = 0
+    while buffer_offset < size:
+      if self._uncompressed_data_offset >= self._uncompressed_data_size:
+        read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
+        self._uncompressed_data_offset = 0
+        if read_count == 0 and self._uncompressed_data_size == 0:
+          break
 
-    while size > self._uncompressed_data_size:
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[self._uncompressed_data_offset:]])
+        continue
 
-      remaining_uncompressed_data_size = (
+      copy_size = min(
+          size - buffer_offset,
           self._uncompressed_data_size - self._uncompressed_data_offset)
 
-      self._current_offset += remaining_uncompressed_data_size
-      size -= remaining_uncompressed_data_size
-
-      if self._current_offset >= self._uncompressed_stream_size:
-        break
-
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      self._uncompressed_data_offset = 0
-      if read_count == 0:
-        break
-
-    if size > 0:
-      slice_start_offset = self._uncompressed_data_offset
-      slice_end_offset = slice_start_offset + size
+      buffer_end_offset = buffer_offset + copy_size
+      uncompressed_data_end_offset = self._uncompressed_data_offset + copy_size
 
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[slice_start_offset:slice_end_offset]])
+      uncompressed_data_view = memoryview(self._uncompressed_data)
+      buffer_view[buffer_offset:buffer_end_offset] = uncompressed_data_view[
+          self._uncompressed_data_offset:uncompressed_data_end_offset]
 
-      self._uncompressed_data_offset += size
-      self._current_offset += size
+      buffer_offset = buffer_end_offset
+      self._uncompressed_data_offset = uncompressed_data_end_offset
+      self._current_offset += copy_size
 
-    return uncompressed_data
+    return buffer_offset
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
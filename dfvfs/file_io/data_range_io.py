@@ -152,22 +152,89 @@ class DataRange(file_io.FileIO):
           'Invalid current offset: {0:d} value less than zero.'.format(
               self._current_offset))
 
-    if self._current_offset >= self._range_size:
-      return b''
-
     if size is None:
       size = self._range_size
-    if self._current_offset + size > self._range_size:
-      size = self._range_size - self._current_offset
+
+    data = self.read_at(self._current_offset, size)
+
+    self._current_offset += len(data)
+
+    return data
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed. The data is
+    read by the parent file-like object at the corresponding offset.
+
+    Args:
+      offset (int): offset to read from.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._range_offset < 0 or self._range_size < 0:
+      raise IOError('Invalid data range.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    size = min(size, self._range_size - offset)
+    if size <= 0:
+      return b''
+
+    return self._file_object.read_at(self._range_offset + offset, size)
+
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    The function will read up to the size of the buffer. The data is read
+    directly into the buffer by the parent file-like object.
+
+    Args:
+      buffer_object (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read into the buffer, where 0 represents that
+          there is no more data to read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._range_offset < 0 or self._range_size < 0:
+      raise IOError('Invalid data range.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    buffer_view = memoryview(buffer_object)
+
+    size = min(len(buffer_view), self._range_size - self._current_offset)
+    if size <= 0:
+      return 0
 
     self._file_object.seek(
         self._range_offset + self._current_offset, os.SEEK_SET)
 
-    data = self._file_object.read(size)
+    read_count = self._file_object.readinto(buffer_view[:size])
 
-    self._current_offset += len(data)
+    self._current_offset += read_count
 
-    return data
+    return read_count
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -182,7 +182,10 @@ class EncryptedStream(file_io.FileIO):
 
     read_count = len(encrypted_data)
 
-    self._encrypted_data = b''.join([self._encrypted_data, encrypted_data])
+    if self._encrypted_data:
+      self._encrypted_data = b''.join([self._encrypted_data, encrypted_data])
+    else:
+      self._encrypted_data = encrypted_data
 
     self._decrypted_data, self._encrypted_data = (
         self._decrypter.Decrypt(self._encrypted_data))
@@ -239,6 +242,40 @@ class EncryptedStream(file_io.FileIO):
     if not self._is_open:
       raise IOError('Not opened.')
 
+    if self._decrypted_stream_size is None:
+      self._decrypted_stream_size = self._GetDecryptedStreamSize()
+
+    remaining_decrypted_stream_size = (
+        self._decrypted_stream_size - self._current_offset)
+    if size is None or size > remaining_decrypted_stream_size:
+      size = remaining_decrypted_stream_size
+
+    # The data is read into a preallocated buffer to prevent the data read
+    # so far from being copied for every decrypted data buffer.
+    decrypted_data = bytearray(max(size, 0))
+    read_count = self.readinto(decrypted_data)
+
+    return memoryview(decrypted_data)[:read_count].tobytes()
+
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    The function will read up to the size of the buffer.
+
+    Args:
+      buffer_object (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read into the buffer, where 0 represents that
+          there is no more data to read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
     if self._current_offset < 0:
       raise IOError(
           'Invalid current offset: {0:d} value less than zero.'.format(
@@ -250,54 +287,43 @@ class EncryptedStream(file_io.FileIO):
     if self._decrypted_stream_size < 0:
       raise IOError('Invalid decrypted stream size.')
 
-    if self._current_offset >= self._decrypted_stream_size:
-      return b''
+    buffer_view = memoryview(buffer_object)
+
+    size = min(
+        len(buffer_view), self._decrypted_stream_size - self._current_offset)
+    if size <= 0:
+      return 0
 
     if self._realign_offset:
       self._AlignDecryptedDataOffset(self._current_offset)
       self._realign_offset = False
 
-    if size is None:
-      size = self._decrypted_stream_size
-    if self._current_offset + size > self._decrypted_stream_size:
-      size = self._decrypted_stream_size - self._current_offset
-
-    decrypted_data = b''
-
-    if size == 0:
-      return decrypted_data
+    buffer_offset = 0
+    while buffer_offset < size:
+      if self._decrypted_data_offset >= self._decrypted_data_size:
+        read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
+        self._decrypted_data_offset = 0
+        if read_count == 0 and self._decrypted_data_size == 0:
+          break
 
-    while size > self._decrypted_data_size:
-      decrypted_data = b''.join([
-          decrypted_data,
-          self._decrypted_data[self._decrypted_data_offset:]])
+        continue
 
-      remaining_decrypted_data_size = (
+      copy_size = min(
+          size - buffer_offset,
           self._decrypted_data_size - self._decrypted_data_offset)
 
-      self._current_offset += remaining_decrypted_data_size
-      size -= remaining_decrypted_data_size
-
-      if self._current_offset >= self._decrypted_stream_size:
-        break
-
-      read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
-      self._decrypted_data_offset = 0
-      if read_count == 0:
-        break
-
-    if size > 0:
-      slice_start_offset = self._decrypted_data_offset
-      slice_end_offset = slice_start_offset + size
+      buffer_end_offset = buffer_offset + copy_size
+      decrypted_data_end_offset = self._decrypted_data_offset + copy_size
 
-      decrypted_data = b''.join([
-          decrypted_data,
-          self._decrypted_data[slice_start_offset:slice_end_offset]])
+      decrypted_data_view = memoryview(self._decrypted_data)
+      buffer_view[buffer_offset:buffer_end_offset] = decrypted_data_view[
+          self._decrypted_data_offset:decrypted_data_end_offset]
 
-      self._decrypted_data_offset += size
-      self._current_offset += size
+      buffer_offset = buffer_end_offset
+      self._decrypted_data_offset = decrypted_data_end_offset
+      self._current_offset += copy_size
 
-    return decrypted_data
+    return buffer_offset
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
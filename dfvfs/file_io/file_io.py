@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import abc
 import os
+import threading
 
 
 class FileIO(object):
@@ -21,6 +22,9 @@ class FileIO(object):
     super(FileIO, self).__init__()
     self._is_cached = False
     self._is_open = False
+    # Lock that serializes reads at a specific offset, which temporarily
+    # change the current offset.
+    self._read_at_lock = threading.RLock()
     self._resolver_context = resolver_context
 
   @abc.abstractmethod
@@ -66,6 +70,13 @@ class FileIO(object):
       PathSpecError: if the path specification is incorrect.
       ValueError: if the path specification or mode is invalid.
     """
+    if self._is_open and self._is_cached and (
+        not path_spec or
+        self._resolver_context.PeekFileObject(path_spec) is not self):
+      # A released file-like object remains open in the cache, hence it is
+      # evicted when it is opened with another path specification.
+      self._resolver_context.EvictFileObject(self)
+
     if self._is_open and not self._is_cached:
       raise IOError('Already open.')
 
@@ -76,10 +87,16 @@ class FileIO(object):
       self._Open(path_spec=path_spec, mode=mode)
       self._is_open = True
 
-      if path_spec and not self._resolver_context.GetFileObject(path_spec):
+      if path_spec and not self._resolver_context.PeekFileObject(path_spec):
         self._resolver_context.CacheFileObject(path_spec, self)
         self._is_cached = True
 
+    elif (self._is_cached and not
+          self._resolver_context.GetFileObjectReferenceCount(path_spec)):
+      # A released file-like object that remained open in the cache is reused
+      # hence it should behave as if it was opened again.
+      self.seek(0, os.SEEK_SET)
+
     if self._is_cached:
       self._resolver_context.GrabFileObject(path_spec)
 
@@ -90,7 +107,11 @@ class FileIO(object):
       IOError: if the file-like object was not opened or the close failed.
       OSError: if the file-like object was not opened or the close failed.
     """
-    if not self._is_open:
+    # A released file-like object remains open in the cache until it is
+    # evicted, but should behave as if it was closed.
+    if not self._is_open or (
+        self._is_cached and
+        not self._resolver_context.IsFileObjectReferenced(self)):
       raise IOError('Not opened.')
 
     if not self._is_cached:
@@ -124,6 +145,67 @@ class FileIO(object):
       OSError: if the read failed.
     """
 
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed. File-like
+    objects that can read at a specific offset without a seek override this
+    function.
+
+    This implementation seeks, reads and restores the current offset while
+    holding a lock of the file-like object, such that threads that share
+    the file-like object can call read_at concurrently. Note that read and
+    seek are not serialized with read_at, hence a shared file-like object
+    should only be read by read_at.
+
+    Args:
+      offset (int): offset to read from.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    with self._read_at_lock:
+      current_offset = self.get_offset()
+      self.seek(offset, os.SEEK_SET)
+      try:
+        return self.read(size)
+      finally:
+        self.seek(current_offset, os.SEEK_SET)
+
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    The function will read up to the size of the buffer. File-like objects
+    that can read directly into the buffer override this function to prevent
+    the intermediate copy of the data.
+
+    Args:
+      buffer_object (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read into the buffer, where 0 represents that
+          there is no more data to read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    buffer_view = memoryview(buffer_object)
+
+    data = self.read(len(buffer_view))
+    read_count = len(data)
+
+    buffer_view[:read_count] = data
+    return read_count
+
   @abc.abstractmethod
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -10,10 +10,30 @@ from dfvfs.file_io import file_io
 
 
 class FileObjectIO(file_io.FileIO):
-  """Base class for file object-based file-like object."""
+  """Base class for file object-based file-like object.
+
+  If the block cache of the resolver context is enabled, reads are served
+  from blocks cached in the context, such that the underlying file-like
+  object does not need to decode the same data again.
+
+  When sequential reads are detected, larger read-ahead requests are issued
+  to the underlying file-like object, such that reading a file in small
+  buffers is not dominated by the overhead per read. The read-ahead size
+  doubles with every read-ahead request up to the maximum read-ahead size
+  defined by the resolver context.
+  """
 
   # pylint: disable=redundant-returns-doc
 
+  _INITIAL_READ_AHEAD_SIZE = 64 * 1024
+
+  # Larger reads bypass the block cache, so that reading a large file does
+  # not evict the cached blocks of, for example, file system metadata.
+  _MAXIMUM_CACHED_READ_SIZE = 1024 * 1024
+
+  # Number of consecutive sequential reads before read-ahead is used.
+  _SEQUENTIAL_READS_THRESHOLD = 2
+
   def __init__(self, resolver_context, file_object=None):
     """Initializes a file-like object.
 
@@ -24,6 +44,12 @@ class FileObjectIO(file_io.FileIO):
     super(FileObjectIO, self).__init__(resolver_context)
     self._file_object = file_object
     self._file_object_set_in_init = bool(file_object)
+    self._last_read_end_offset = None
+    self._number_of_sequential_reads = 0
+    self._path_spec = None
+    self._read_ahead_data = b''
+    self._read_ahead_data_offset = 0
+    self._read_ahead_size = self._INITIAL_READ_AHEAD_SIZE
     self._size = None
 
   def _Close(self):
@@ -41,6 +67,49 @@ class FileObjectIO(file_io.FileIO):
         pass
       self._file_object = None
 
+    self._last_read_end_offset = None
+    self._number_of_sequential_reads = 0
+    self._path_spec = None
+    self._read_ahead_data = b''
+    self._read_ahead_size = self._INITIAL_READ_AHEAD_SIZE
+
+  def _GetBlockSize(self):
+    """Retrieves the size of the blocks in the block cache.
+
+    Returns:
+      int: size, in bytes, of a block or None if reads cannot be served from
+          the block cache.
+    """
+    if not self._path_spec:
+      return None
+
+    return self._resolver_context.GetBlockSize()
+
+  def _GetMaximumReadAheadSize(self):
+    """Retrieves the maximum size of a read-ahead request.
+
+    Returns:
+      int: maximum size, in bytes, of a read-ahead request, where 0 represents
+          that read-ahead is disabled.
+    """
+    if not self._resolver_context:
+      return 0
+
+    return self._resolver_context.GetMaximumReadAheadSize()
+
+  def _IsReadAheadData(self, offset):
+    """Determines if an offset is within the read-ahead data.
+
+    Args:
+      offset (int): offset.
+
+    Returns:
+      bool: True if the offset is within the read-ahead data.
+    """
+    read_ahead_data_end_offset = (
+        self._read_ahead_data_offset + len(self._read_ahead_data))
+    return self._read_ahead_data_offset <= offset < read_ahead_data_end_offset
+
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object defined by path specification.
 
@@ -65,6 +134,8 @@ class FileObjectIO(file_io.FileIO):
     if not self._file_object:
       raise IOError('Unable to open missing file-like object.')
 
+    self._path_spec = path_spec
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def _OpenFileObject(self, path_spec):
@@ -80,6 +151,167 @@ class FileObjectIO(file_io.FileIO):
       PathSpecError: if the path specification is incorrect.
     """
 
+  def _ReadAtOffset(self, offset, size):
+    """Reads a byte string at a specific offset.
+
+    Note that the current offset of the underlying file-like object is
+    undefined afterwards.
+
+    Args:
+      offset (int): offset to read from.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+    """
+    if offset == self._last_read_end_offset:
+      self._number_of_sequential_reads += 1
+    else:
+      self._number_of_sequential_reads = 0
+      self._read_ahead_size = self._INITIAL_READ_AHEAD_SIZE
+
+    maximum_read_ahead_size = self._GetMaximumReadAheadSize()
+    block_size = self._GetBlockSize()
+
+    if maximum_read_ahead_size and (
+        self._IsReadAheadData(offset) or
+        self._number_of_sequential_reads >= self._SEQUENTIAL_READS_THRESHOLD):
+      data = self._ReadWithReadAhead(offset, size, maximum_read_ahead_size)
+
+    elif block_size and size <= self._MAXIMUM_CACHED_READ_SIZE:
+      data = self._ReadWithBlockCache(offset, size, block_size)
+
+    else:
+      data = self._ReadFileObjectAtOffset(offset, size)
+
+    self._last_read_end_offset = offset + len(data)
+    return data
+
+  def _ReadBlocks(self, block_offset, end_offset, block_size):
+    """Reads blocks from the file-like object and caches them.
+
+    Args:
+      block_offset (int): offset of the first block to read.
+      end_offset (int): offset of the end of the last block to read.
+      block_size (int): size, in bytes, of a block.
+
+    Returns:
+      list[bytes]: data of the blocks read.
+    """
+    data = self._ReadFileObjectAtOffset(block_offset, end_offset - block_offset)
+
+    blocks = []
+    for data_offset in range(0, len(data), block_size):
+      block_data = data[data_offset:data_offset + block_size]
+      self._resolver_context.CacheBlock(
+          self._path_spec, block_offset + data_offset, block_data)
+      blocks.append(block_data)
+
+    return blocks
+
+  def _ReadFileObjectAtOffset(self, offset, size):
+    """Reads a byte string from the underlying file-like object.
+
+    Args:
+      offset (int): offset to read from.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+    """
+    # The libyal bindings can read at an offset without a separate seek.
+    if hasattr(self._file_object, 'read_buffer_at_offset'):
+      return self._file_object.read_buffer_at_offset(size, offset)
+
+    self._file_object.seek(offset, os.SEEK_SET)
+    return self._file_object.read(size)
+
+  def _ReadWithBlockCache(self, offset, size, block_size):
+    """Reads a byte string at a specific offset using the block cache.
+
+    Consecutive blocks that are not cached are read from the file-like
+    object at once.
+
+    Args:
+      offset (int): offset to read from.
+      size (int): number of bytes to read.
+      block_size (int): size, in bytes, of a block.
+
+    Returns:
+      bytes: data read.
+    """
+    size = min(size, self.get_size() - offset)
+
+    if size <= 0:
+      return b''
+
+    first_block_offset = offset - (offset % block_size)
+    end_offset = offset + size
+
+    blocks = []
+    uncached_block_offset = None
+    for block_offset in range(first_block_offset, end_offset, block_size):
+      block_data = self._resolver_context.GetBlock(
+          self._path_spec, block_offset)
+      if block_data is None:
+        if uncached_block_offset is None:
+          uncached_block_offset = block_offset
+        continue
+
+      if uncached_block_offset is not None:
+        blocks.extend(self._ReadBlocks(
+            uncached_block_offset, block_offset, block_size))
+        uncached_block_offset = None
+
+      blocks.append(block_data)
+
+    if uncached_block_offset is not None:
+      end_block_offset = block_offset + block_size
+      blocks.extend(self._ReadBlocks(
+          uncached_block_offset, end_block_offset, block_size))
+
+    data_offset = offset - first_block_offset
+    return b''.join(blocks)[data_offset:data_offset + size]
+
+  def _ReadWithReadAhead(self, offset, size, maximum_read_ahead_size):
+    """Reads a byte string at a specific offset using read-ahead.
+
+    Args:
+      offset (int): offset to read from.
+      size (int): number of bytes to read.
+      maximum_read_ahead_size (int): maximum size, in bytes, of a read-ahead
+          request.
+
+    Returns:
+      bytes: data read.
+    """
+    data_segments = []
+    while size > 0:
+      if not self._IsReadAheadData(offset):
+        read_ahead_size = min(self._read_ahead_size, maximum_read_ahead_size)
+
+        # Reads of at least the read-ahead size are not kept in memory.
+        if size >= read_ahead_size:
+          data_segments.append(self._ReadFileObjectAtOffset(offset, size))
+          break
+
+        self._read_ahead_data = self._ReadFileObjectAtOffset(
+            offset, read_ahead_size)
+        self._read_ahead_data_offset = offset
+        self._read_ahead_size = min(
+            read_ahead_size * 2, maximum_read_ahead_size)
+
+        if not self._read_ahead_data:
+          break
+
+      data_offset = offset - self._read_ahead_data_offset
+      data = self._read_ahead_data[data_offset:data_offset + size]
+      data_segments.append(data)
+      offset += len(data)
+      size -= len(data)
+
+    return b''.join(data_segments)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -104,9 +336,81 @@ class FileObjectIO(file_io.FileIO):
     if not self._is_open:
       raise IOError('Not opened.')
 
-    # Do not pass the size argument as a keyword argument since it breaks
-    # some file-like object implementations.
-    return self._file_object.read(size)
+    if size is None or size <= 0:
+      self._last_read_end_offset = None
+      self._number_of_sequential_reads = 0
+
+      # Do not pass the size argument as a keyword argument since it breaks
+      # some file-like object implementations.
+      return self._file_object.read(size)
+
+    current_offset = self.get_offset()
+    data = self._ReadAtOffset(current_offset, size)
+
+    self._file_object.seek(current_offset + len(data), os.SEEK_SET)
+    return data
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed.
+
+    Args:
+      offset (int): offset to read from.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    if size <= 0:
+      return b''
+
+    # The underlying file-like object, such as a libyal binding, maintains
+    # its own current offset, which is restored after the read.
+    with self._read_at_lock:
+      current_offset = self.get_offset()
+      data = self._ReadAtOffset(offset, size)
+
+      self._file_object.seek(current_offset, os.SEEK_SET)
+
+    return data
+
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    The function will read up to the size of the buffer.
+
+    Args:
+      buffer_object (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read into the buffer, where 0 represents that
+          there is no more data to read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    # Only read into the buffer directly if the file-like object supports it,
+    # which is not the case for the libyal Python bindings, and reads are not
+    # served from the block cache.
+    if self._GetBlockSize() or not hasattr(self._file_object, 'readinto'):
+      return super(FileObjectIO, self).readinto(buffer_object)
+
+    return self._file_object.readinto(buffer_object)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -131,20 +131,59 @@ class GzipFile(file_io.FileIO):
       IOError: if the read failed.
       OSError: if the read failed.
     """
-    data = b''
-    while ((size and len(data) < size) and
+    if not self._gzip_file_object:
+      raise IOError('Not opened.')
+
+    remaining_data_size = self.uncompressed_data_size - self._current_offset
+    if size is None or size > remaining_data_size:
+      size = remaining_data_size
+
+    # The data is read into a preallocated buffer to prevent the data read
+    # so far from being copied for every member read.
+    data = bytearray(max(size, 0))
+    read_count = self.readinto(data)
+
+    return memoryview(data)[:read_count].tobytes()
+
+  def readinto(self, buffer_object):
+    """Reads data from the gzip file at the current offset into a buffer.
+
+    The function will read up to the size of the buffer.
+
+    Args:
+      buffer_object (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read into the buffer, where 0 represents that
+          there is no more data to read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._gzip_file_object:
+      raise IOError('Not opened.')
+
+    buffer_view = memoryview(buffer_object)
+    size = len(buffer_view)
+
+    buffer_offset = 0
+    while (buffer_offset < size and
            self._current_offset < self.uncompressed_data_size):
       member = self._GetMemberForOffset(self._current_offset)
       member_offset = self._current_offset - member.uncompressed_data_offset
 
-      data_read = member.ReadAtOffset(member_offset, size)
+      data_read = member.ReadAtOffset(member_offset, size - buffer_offset)
       if not data_read:
         break
 
+      buffer_end_offset = buffer_offset + len(data_read)
+      buffer_view[buffer_offset:buffer_end_offset] = data_read
+
+      buffer_offset = buffer_end_offset
       self._current_offset += len(data_read)
-      data = b''.join([data, data_read])
 
-    return data
+    return buffer_offset
 
   def get_offset(self):
     """Retrieves the current offset into the file-like object.
@@ -207,6 +246,17 @@ class GzipFile(file_io.FileIO):
 
     self._gzip_file_object.seek(0, os.SEEK_SET)
 
+    seek_index_store = resolver.Resolver.seek_index_store
+
+    index_values = None
+    if seek_index_store:
+      index_values = seek_index_store.ReadIndex(
+          path_spec, self._gzip_file_object, self._resolver_context)
+
+    if index_values and index_values.get('members', None):
+      self._OpenMembersFromIndex(index_values)
+      return
+
     uncompressed_data_offset = 0
     next_member_offset = 0
 
@@ -218,3 +268,34 @@ class GzipFile(file_io.FileIO):
       self._members_by_end_offset[uncompressed_data_offset] = member
       self.uncompressed_data_size += member.uncompressed_data_size
       next_member_offset = member.member_end_offset
+
+    if seek_index_store:
+      members_values = []
+      for member in self._members_by_end_offset.values():
+        members_values.append({
+            'member_end_offset': member.member_end_offset,
+            'member_start_offset': member.member_start_offset,
+            'uncompressed_data_size': member.uncompressed_data_size})
+
+      seek_index_store.WriteIndex(
+          path_spec, self._gzip_file_object, self._resolver_context,
+          {'members': members_values})
+
+  def _OpenMembersFromIndex(self, index_values):
+    """Opens the members using the values of a seek index.
+
+    Args:
+      index_values (dict[str, object]): seek index values.
+    """
+    uncompressed_data_offset = 0
+
+    for member_values in index_values['members']:
+      member = gzipfile.GzipMember(
+          self._gzip_file_object, member_values['member_start_offset'],
+          uncompressed_data_offset,
+          member_end_offset=member_values['member_end_offset'],
+          uncompressed_data_size=member_values['uncompressed_data_size'])
+      uncompressed_data_offset = (
+          uncompressed_data_offset + member.uncompressed_data_size)
+      self._members_by_end_offset[uncompressed_data_offset] = member
+      self.uncompressed_data_size += member.uncompressed_data_size
@@ -3,18 +3,34 @@
 
 from __future__ import unicode_literals
 
+import mmap
 import stat
 import os
 
 import pysmdev
 
 from dfvfs.file_io import file_io
+from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import py2to3
 
 
 class OSFile(file_io.FileIO):
-  """File-like object using os."""
+  """File-like object using os.
+
+  The method used to access a file is defined by the resolver context:
+
+  * mmap: the file is memory mapped and data is copied directly from the
+    memory map. Note that the file should not be truncated while it is
+    mapped.
+  * pread: data is read at an offset without a separate seek.
+  * read: data is read from a Python file object.
+
+  Devices are always accessed with read. If a file cannot be memory mapped,
+  for example because it is empty or larger than the address space allows,
+  pread is used instead. If pread is not supported by the platform, read is
+  used instead.
+  """
 
   def __init__(self, resolver_context):
     """Initializes a file-like object.
@@ -23,13 +39,27 @@ class OSFile(file_io.FileIO):
       resolver_context (Context): resolver context.
     """
     super(OSFile, self).__init__(resolver_context)
+    self._access_method = None
+    self._current_offset = 0
     self._file_object = None
+    self._memory_map = None
+    self._memory_map_view = None
     self._size = 0
 
   def _Close(self):
     """Closes the file-like object."""
+    if self._memory_map_view is not None:
+      # The memory map cannot be closed while a view of it exists.
+      self._memory_map_view.release()
+      self._memory_map_view = None
+
+    if self._memory_map is not None:
+      self._memory_map.close()
+      self._memory_map = None
+
     self._file_object.close()
     self._file_object = None
+    self._access_method = None
 
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object defined by path specification.
@@ -94,11 +124,61 @@ class OSFile(file_io.FileIO):
       self._file_object = pysmdev.handle()
       self._file_object.open(location, mode=mode)
       self._size = self._file_object.media_size
+      self._access_method = definitions.OS_FILE_ACCESS_METHOD_READ
 
     else:
       self._file_object = open(location, mode=mode)
       self._size = stat_info.st_size
 
+      access_method = self._resolver_context.GetOSFileAccessMethod()
+      if (access_method == definitions.OS_FILE_ACCESS_METHOD_MMAP and
+          not self._OpenMemoryMap()):
+        access_method = definitions.OS_FILE_ACCESS_METHOD_PREAD
+
+      if (access_method == definitions.OS_FILE_ACCESS_METHOD_PREAD and
+          not hasattr(os, 'pread')):
+        access_method = definitions.OS_FILE_ACCESS_METHOD_READ
+
+      self._access_method = access_method
+
+    self._current_offset = 0
+
+  def _OpenMemoryMap(self):
+    """Opens a memory map of the file.
+
+    Returns:
+      bool: True if the file was memory mapped.
+    """
+    try:
+      self._memory_map = mmap.mmap(
+          self._file_object.fileno(), 0, access=mmap.ACCESS_READ)
+    except (EnvironmentError, OverflowError, ValueError):
+      # Empty files and files larger than the address space allows cannot
+      # be memory mapped.
+      return False
+
+    try:
+      self._memory_map_view = memoryview(self._memory_map)
+    except TypeError:
+      # Python 2 does not support a memoryview of a memory map.
+      pass
+
+    return True
+
+  def _ReadAtCurrentOffset(self, size):
+    """Reads a byte string at the current offset without a seek.
+
+    Args:
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+    """
+    data = self.read_at(self._current_offset, size)
+
+    self._current_offset += len(data)
+    return data
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -123,11 +203,107 @@ class OSFile(file_io.FileIO):
     if not self._is_open:
       raise IOError('Not opened.')
 
+    if self._access_method != definitions.OS_FILE_ACCESS_METHOD_READ:
+      if size is None or size < 0:
+        size = self._size - self._current_offset
+
+      return self._ReadAtCurrentOffset(size)
+
     if size is None:
       size = self._size - self._file_object.tell()
 
     return self._file_object.read(size)
 
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed.
+
+    Args:
+      offset (int): offset to read from.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    # Note that pysmdev does not support reading at an offset without
+    # changing the current offset.
+    if self._memory_map is None and (
+        not hasattr(os, 'pread') or
+        not hasattr(self._file_object, 'fileno')):
+      return super(OSFile, self).read_at(offset, size)
+
+    size = min(size, self._size - offset)
+    if size <= 0:
+      return b''
+
+    if self._memory_map is not None:
+      return self._memory_map[offset:offset + size]
+
+    return os.pread(self._file_object.fileno(), size, offset)
+
+  def readinto(self, buffer_object):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    The function will read up to the size of the buffer.
+
+    Args:
+      buffer_object (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read into the buffer, where 0 represents that
+          there is no more data to read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._memory_map_view is not None:
+      buffer_view = memoryview(buffer_object)
+      size = min(len(buffer_view), self._size - self._current_offset)
+      if size <= 0:
+        return 0
+
+      # Copy the data directly from the memory map into the buffer.
+      end_offset = self._current_offset + size
+      buffer_view[:size] = self._memory_map_view[
+          self._current_offset:end_offset]
+      self._current_offset = end_offset
+      return size
+
+    if (self._access_method == definitions.OS_FILE_ACCESS_METHOD_PREAD and
+        hasattr(os, 'preadv')):
+      buffer_view = memoryview(buffer_object)
+      size = min(len(buffer_view), self._size - self._current_offset)
+      if size <= 0:
+        return 0
+
+      read_count = os.preadv(
+          self._file_object.fileno(), [buffer_view[:size]],
+          self._current_offset)
+      self._current_offset += read_count
+      return read_count
+
+    # Note that pysmdev does not support reading into a buffer.
+    if (self._access_method != definitions.OS_FILE_ACCESS_METHOD_READ or
+        not hasattr(self._file_object, 'readinto')):
+      return super(OSFile, self).readinto(buffer_object)
+
+    return self._file_object.readinto(buffer_object)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
@@ -149,7 +325,19 @@ class OSFile(file_io.FileIO):
     if whence not in [os.SEEK_SET, os.SEEK_CUR, os.SEEK_END]:
       raise IOError('Unsupported whence.')
 
-    self._file_object.seek(offset, whence)
+    if self._access_method == definitions.OS_FILE_ACCESS_METHOD_READ:
+      self._file_object.seek(offset, whence)
+      return
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
 
   def get_offset(self):
     """Retrieves the current offset into the file-like object.
@@ -164,6 +352,9 @@ class OSFile(file_io.FileIO):
     if not self._is_open:
       raise IOError('Not opened.')
 
+    if self._access_method != definitions.OS_FILE_ACCESS_METHOD_READ:
+      return self._current_offset
+
     return self._file_object.tell()
 
   def get_size(self):
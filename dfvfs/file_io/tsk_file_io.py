@@ -167,20 +167,10 @@ class TSKFile(file_io.FileIO):
     if self._current_offset < 0:
       raise IOError('Invalid current offset value less than zero.')
 
-    # The SleuthKit is not POSIX compliant in its read behavior. Therefore
-    # pytsk3 will raise an IOError if the read offset is beyond the data size.
-    if self._current_offset >= self._size:
-      return b''
-
-    if size is None or self._current_offset + size > self._size:
-      size = self._size - self._current_offset
+    if size is None:
+      size = self._size
 
-    if self._tsk_attribute:
-      data = self._tsk_file.read_random(
-          self._current_offset, size, self._tsk_attribute.info.type,
-          self._tsk_attribute.info.id)
-    else:
-      data = self._tsk_file.read_random(self._current_offset, size)
+    data = self.read_at(self._current_offset, size)
 
     # It is possible the that returned data size is not the same as the
     # requested data size. At this layer we don't care and this discrepancy
@@ -189,6 +179,41 @@ class TSKFile(file_io.FileIO):
 
     return data
 
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    The current offset of the file-like object is not changed.
+
+    Args:
+      offset (int): offset to read from.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    # The SleuthKit is not POSIX compliant in its read behavior. Therefore
+    # pytsk3 will raise an IOError if the read offset is beyond the data size.
+    size = min(size, self._size - offset)
+    if size <= 0:
+      return b''
+
+    if self._tsk_attribute:
+      return self._tsk_file.read_random(
+          offset, size, self._tsk_attribute.info.type,
+          self._tsk_attribute.info.id)
+
+    return self._tsk_file.read_random(offset, size)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
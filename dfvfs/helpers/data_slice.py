@@ -3,8 +3,6 @@
 
 from __future__ import unicode_literals
 
-import os
-
 from dfvfs.lib import py2to3
 
 class DataSlice(object):
@@ -43,16 +41,18 @@ class DataSlice(object):
       bytes: range of file data.
 
     Raises:
+      IndexError: if a negative offset is before the start of the file data.
       TypeError: if the type of the key is not supported.
       ValueError: if the step value of a slice is not None.
     """
     if isinstance(key, py2to3.INTEGER_TYPES):
       if key < 0:
-        self._file_object.seek(key, os.SEEK_END)
-      else:
-        self._file_object.seek(key, os.SEEK_SET)
+        key += self._file_object_size
+
+        if key < 0:
+          raise IndexError('Offset out of range.')
 
-      return self._file_object.read(1)
+      return self._file_object.read_at(key, 1)
 
     if not isinstance(key, slice):
       raise TypeError('Unsupported key type: {0!s}'.format(type(key)))
@@ -65,16 +65,10 @@ class DataSlice(object):
       start_offset = 0
 
     end_offset = key.stop or self._file_object_size
-
     if end_offset < 0:
-      self._file_object.seek(end_offset, os.SEEK_END)
-      read_size = -(start_offset - end_offset)
-
-    else:
-      self._file_object.seek(start_offset, os.SEEK_SET)
-      read_size = end_offset - start_offset
+      end_offset += self._file_object_size
 
-    return self._file_object.read(read_size)
+    return self._file_object.read_at(start_offset, end_offset - start_offset)
 
   def __len__(self):
     """Retrieves the file data size.
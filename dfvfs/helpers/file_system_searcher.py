@@ -5,21 +5,30 @@ from __future__ import unicode_literals
 
 import re
 import sre_constants
+import threading
+
+from multiprocessing import pool
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import glob2regex
 from dfvfs.lib import py2to3
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 
 
 class FindSpec(object):
   """Find specification."""
 
+  _TIME_VALUE_NAMES = frozenset([
+      'access_time', 'change_time', 'creation_time', 'modification_time'])
+
   def __init__(
       self, case_sensitive=True, file_entry_types=None, is_allocated=True,
       location=None, location_glob=None, location_regex=None,
-      location_separator='/'):
+      location_separator='/', extensions=None, maximum_size=None,
+      minimum_size=None, time_ranges=None):
     """Initializes a find specification.
 
     Args:
@@ -46,13 +55,26 @@ class FindSpec(object):
           that the string will be split into segments based on the file system
           specific path segment separator.
       location_separator (str): location segment separator.
+      extensions (Optional[list[str]]): file name extensions, without the
+          leading dot, where None indicates no preference.
+      maximum_size (Optional[int]): maximum size of the data of the file
+          entry, where None indicates no preference.
+      minimum_size (Optional[int]): minimum size of the data of the file
+          entry, where None indicates no preference.
+      time_ranges (Optional[dict[str, tuple[DateTimeValues]]]): start and
+          end date and time values per name of a file entry date and time
+          value, such as "modification_time", where None indicates no
+          preference. A start or end date and time value of None indicates
+          an open range.
 
     Raises:
       TypeError: if the location, location_glob or location_regex type
           is not supported.
       ValueError: if the location, location_glob or location_regex arguments
-          are used at the same time, or if location separator is missing and
-          the location argument is of type string.
+          are used at the same time, if location separator is missing and
+          the location argument is of type string, if the minimum size is
+          larger than the maximum size or if a time range name is not
+          supported.
     """
     location_arguments = [argument for argument in (
         location, location_glob, location_regex) if argument]
@@ -66,7 +88,22 @@ class FindSpec(object):
         location_arguments[0], py2to3.STRING_TYPES) and not location_separator):
       raise ValueError('Missing location separator.')
 
+    if (maximum_size is not None and minimum_size is not None and
+        minimum_size > maximum_size):
+      raise ValueError('Minimum size larger than maximum size.')
+
+    if time_ranges:
+      for name in time_ranges:
+        if name not in self._TIME_VALUE_NAMES:
+          raise ValueError('Unsupported time range name: {0!s}.'.format(name))
+
+    if extensions:
+      if not case_sensitive:
+        extensions = [extension.lower() for extension in extensions]
+      extensions = frozenset(extensions)
+
     super(FindSpec, self).__init__()
+    self._extensions = extensions or None
     self._file_entry_types = file_entry_types
     self._is_allocated = is_allocated
     self._is_case_sensitive = case_sensitive
@@ -74,7 +111,10 @@ class FindSpec(object):
     self._location = None
     self._location_regex = None
     self._location_segments = None
+    self._maximum_size = maximum_size
+    self._minimum_size = minimum_size
     self._number_of_location_segments = None
+    self._time_ranges = time_ranges or None
 
     if location is not None:
       if isinstance(location, py2to3.STRING_TYPES):
@@ -134,11 +174,68 @@ class FindSpec(object):
     # TODO: add support for name
     # TODO: add support for owner (user, group)
     # TODO: add support for permissions (mode)
-    # TODO: add support for size
-    # TODO: add support for time values
     # TODO: add support for expression e.g.
     # attribute['$FILE_NAME'].creation_type == 'x'
 
+  def _CheckExtension(self, file_entry):
+    """Checks the extensions find specification.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      bool: True if the file entry matches the find specification, False if
+          not or None if no extensions specification is defined.
+    """
+    if not self._extensions:
+      return None
+
+    name, _, extension = (file_entry.name or '').rpartition('.')
+    if not name:
+      return False
+
+    if not self._is_case_sensitive:
+      extension = extension.lower()
+
+    return extension in self._extensions
+
+  def _CheckFileEntryProperties(self, file_entry):
+    """Checks the find specifications other than the location.
+
+    The find specifications that only require the name or values that are
+    cheap to retrieve from the file entry, such as the size and date and time
+    values, are checked before the find specifications that require the stat
+    object of the file entry.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      bool: True if the file entry matches the find specifications other than
+          the location, False if not.
+    """
+    match = self._CheckExtension(file_entry)
+    if match is not None and not match:
+      return False
+
+    match = self._CheckSize(file_entry)
+    if match is not None and not match:
+      return False
+
+    match = self._CheckTimeRanges(file_entry)
+    if match is not None and not match:
+      return False
+
+    match = self._CheckFileEntryType(file_entry)
+    if match is not None and not match:
+      return False
+
+    match = self._CheckIsAllocated(file_entry)
+    if match is not None and not match:
+      return False
+
+    return True
+
   def _CheckFileEntryType(self, file_entry):
     """Checks the file entry type find specifications.
 
@@ -307,6 +404,54 @@ class FindSpec(object):
 
     return True
 
+  def _CheckSize(self, file_entry):
+    """Checks the size find specifications.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      bool: True if the file entry matches the find specifications, False if
+          not or None if no size specification is defined.
+    """
+    if self._maximum_size is None and self._minimum_size is None:
+      return None
+
+    size = file_entry.size
+    if size is None:
+      return False
+
+    if self._maximum_size is not None and size > self._maximum_size:
+      return False
+
+    return self._minimum_size is None or size >= self._minimum_size
+
+  def _CheckTimeRanges(self, file_entry):
+    """Checks the time ranges find specification.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      bool: True if the file entry matches the find specification, False if
+          not or None if no time ranges specification is defined.
+    """
+    if not self._time_ranges:
+      return None
+
+    for name, (start_date_time, end_date_time) in self._time_ranges.items():
+      date_time = getattr(file_entry, name, None)
+      if date_time is None:
+        return False
+
+      if start_date_time is not None and date_time < start_date_time:
+        return False
+
+      if end_date_time is not None and date_time > end_date_time:
+        return False
+
+    return True
+
   def _ConvertLocationGlob2Regex(self, location_glob):
     """Converts a location glob into a regular expression.
 
@@ -381,20 +526,489 @@ class FindSpec(object):
       if search_depth != self._number_of_location_segments:
         return False, location_match
 
-    match = self._CheckFileEntryType(file_entry)
-    if match is not None and not match:
-      return False, location_match
+    match = self._CheckFileEntryProperties(file_entry)
+    return match, location_match
 
-    match = self._CheckIsAllocated(file_entry)
-    if match is not None and not match:
-      return False, location_match
 
-    return True, location_match
+class _FindSpecNode(object):
+  """Node of the segment-wise trie of a find specification matcher.
+
+  A node represents a location path segment, at a specific depth, of one or
+  more find specifications that share the preceding location path segments.
+
+  Attributes:
+    find_specs (list[FindSpec]): find specifications of which the last
+        location path segment is represented by the node.
+    is_recursive (bool): True if the node represents any location path
+        segment at any depth, which is used for find specifications without
+        a location.
+  """
+
+  # Maximum number of regular expressions combined in a single regular
+  # expression, which prevents exceeding the limit on the number of groups
+  # of some versions of Python.
+  _MAXIMUM_NUMBER_OF_COMBINED_REGEXES = 64
+
+  def __init__(self, is_recursive=False):
+    """Initializes a find specification node.
+
+    Args:
+      is_recursive (Optional[bool]): True if the node represents any location
+          path segment at any depth.
+    """
+    super(_FindSpecNode, self).__init__()
+    self._case_insensitive_names = {}
+    self._case_insensitive_sub_nodes = {}
+    self._case_sensitive_sub_nodes = {}
+    self._combined_regex_matchers = []
+    self._is_allocated_only = False
+    self._regex_matchers = []
+    self._regex_sub_nodes = {}
+    self.find_specs = []
+    self.is_recursive = is_recursive
+
+  def _CompileRegexMatchers(self):
+    """Compiles the regular expressions of the sub nodes.
+
+    The regular expressions of sub nodes with the same flags are combined
+    into a single regular expression with a look-ahead group per regular
+    expression, such that a name is matched against all of them at once.
+    Regular expressions that contain groups are matched separately, since
+    combining them would renumber their groups and break back references.
+    Regular expressions that cannot be combined are matched separately.
+    """
+    self._combined_regex_matchers = []
+    self._regex_matchers = []
+
+    regexes_per_flags = {}
+    for (regex, flags), sub_node in sorted(
+        self._regex_sub_nodes.items(), key=lambda item: item[0]):
+      try:
+        compiled_regex = re.compile(r'^{0:s}$'.format(regex), flags=flags)
+      except sre_constants.error:
+        # A segment with an invalid regular expression never matches.
+        continue
+
+      if compiled_regex.groups:
+        self._regex_matchers.append((compiled_regex, sub_node))
+      else:
+        regexes_per_flags.setdefault(flags, []).append(
+            (regex, compiled_regex, sub_node))
+
+    for flags, regexes in sorted(regexes_per_flags.items()):
+      regexes = sorted(regexes, key=lambda values: values[0])
+
+      for index in range(
+          0, len(regexes), self._MAXIMUM_NUMBER_OF_COMBINED_REGEXES):
+        combined_regexes = regexes[
+            index:index + self._MAXIMUM_NUMBER_OF_COMBINED_REGEXES]
+
+        combined_regex = ''.join([
+            '(?:(?=^{0:s}$)(?P<_find_spec_{1:d}>))?'.format(
+                regex, group_index)
+            for group_index, (regex, _, _) in enumerate(combined_regexes)])
+
+        try:
+          compiled_regex = re.compile(combined_regex, flags=flags)
+        except (AssertionError, sre_constants.error):
+          compiled_regex = None
+
+        if compiled_regex:
+          sub_nodes = [
+              ('_find_spec_{0:d}'.format(group_index), sub_node)
+              for group_index, (_, _, sub_node) in enumerate(
+                  combined_regexes)]
+          self._combined_regex_matchers.append((compiled_regex, sub_nodes))
+
+        else:
+          for _, compiled_regex, sub_node in combined_regexes:
+            self._regex_matchers.append((compiled_regex, sub_node))
+
+  def AddSubNode(self, segment, is_case_sensitive, is_regex):
+    """Adds a sub node for a location path segment.
+
+    Args:
+      segment (str|re.Pattern): location path segment.
+      is_case_sensitive (bool): True if the location path segment should be
+          matched case sensitive.
+      is_regex (bool): True if the location path segment is a regular
+          expression.
+
+    Returns:
+      _FindSpecNode: sub node.
+    """
+    if is_regex:
+      if isinstance(segment, py2to3.STRING_TYPES):
+        # Allow '\n' to be matched by '.' and make '\w', '\W', '\b', '\B',
+        # '\d', '\D', '\s' and '\S' Unicode safe.
+        flags = re.DOTALL | re.UNICODE
+        if not is_case_sensitive:
+          flags |= re.IGNORECASE
+
+        key = (segment, flags)
+      else:
+        # The segment was already compiled by FindSpec.Matches.
+        key = (segment.pattern[1:-1], segment.flags)
+
+      sub_nodes = self._regex_sub_nodes
+
+    elif is_case_sensitive:
+      key = segment
+      sub_nodes = self._case_sensitive_sub_nodes
+
+    else:
+      key = segment.lower()
+      sub_nodes = self._case_insensitive_sub_nodes
+
+      if key not in self._case_insensitive_names:
+        self._case_insensitive_names[key] = segment
+
+    sub_node = sub_nodes.get(key, None)
+    if not sub_node:
+      sub_node = _FindSpecNode()
+      sub_nodes[key] = sub_node
+
+    return sub_node
+
+  def Compile(self):
+    """Compiles the node and its sub nodes for matching.
+
+    Returns:
+      bool: True if the find specifications of the node and its sub nodes
+          only match allocated file entries.
+    """
+    self._CompileRegexMatchers()
+
+    # pylint: disable=protected-access
+    is_allocated_only = not self.is_recursive and all([
+        find_spec._is_allocated for find_spec in self.find_specs])
+
+    for sub_nodes in (
+        self._case_insensitive_sub_nodes, self._case_sensitive_sub_nodes,
+        self._regex_sub_nodes):
+      for sub_node in sub_nodes.values():
+        if not sub_node.Compile():
+          is_allocated_only = False
+
+    self._is_allocated_only = is_allocated_only
+    return is_allocated_only
+
+  def GetLiteralSubNodeNames(self):
+    """Retrieves the names of the literal sub nodes.
+
+    The sub file entries that match the node can only be looked up by name
+    when all sub nodes are literal and only match allocated file entries,
+    since a lookup by name does not return unallocated file entries.
+
+    Returns:
+      list[tuple[str, bool]]: name of every literal sub node and True if
+          the name is case sensitive, or None if the sub file entries that
+          match the node cannot be looked up by name.
+    """
+    if (self.is_recursive or self._regex_sub_nodes or
+        not self._is_allocated_only):
+      return None
+
+    names = [(name, True) for name in self._case_sensitive_sub_nodes]
+    names.extend([
+        (name, False) for name in self._case_insensitive_names.values()])
+    return names
+
+  def GetMatchingSubNodes(self, name):
+    """Retrieves the sub nodes that match the name of a file entry.
+
+    Args:
+      name (str): name of the file entry.
+
+    Returns:
+      list[_FindSpecNode]: sub nodes that match the name.
+    """
+    if self.is_recursive:
+      return [self]
+
+    matching_sub_nodes = []
+
+    sub_node = self._case_sensitive_sub_nodes.get(name, None)
+    if sub_node:
+      matching_sub_nodes.append(sub_node)
+
+    if self._case_insensitive_sub_nodes:
+      sub_node = self._case_insensitive_sub_nodes.get(name.lower(), None)
+      if sub_node:
+        matching_sub_nodes.append(sub_node)
+
+    for compiled_regex, sub_nodes in self._combined_regex_matchers:
+      regex_match = compiled_regex.match(name)
+      for group_name, sub_node in sub_nodes:
+        if regex_match.group(group_name) is not None:
+          matching_sub_nodes.append(sub_node)
+
+    for compiled_regex, sub_node in self._regex_matchers:
+      if compiled_regex.match(name):
+        matching_sub_nodes.append(sub_node)
+
+    return matching_sub_nodes
+
+  def HasSubNodes(self):
+    """Determines if the node has sub nodes.
+
+    Returns:
+      bool: True if the node has sub nodes or is recursive.
+    """
+    return bool(
+        self.is_recursive or self._case_insensitive_sub_nodes or
+        self._case_sensitive_sub_nodes or self._regex_sub_nodes)
+
+
+class FindSpecMatcher(object):
+  """Matcher of file entries against a set of find specifications.
+
+  The location path segments of the find specifications are merged into a
+  segment-wise trie, such that a file entry is matched against all find
+  specifications at once. Literal location path segments are looked up in
+  a dictionary and regular expression segments, including glob segments, are
+  combined into a single regular expression per node.
+  """
+
+  # pylint: disable=protected-access
+
+  def __init__(self, find_specs):
+    """Initializes a find specification matcher.
+
+    Args:
+      find_specs (list[FindSpec]): find specifications.
+    """
+    super(FindSpecMatcher, self).__init__()
+    self._root_nodes = []
+
+    root_node = _FindSpecNode()
+    recursive_node = _FindSpecNode(is_recursive=True)
+
+    for find_spec in find_specs:
+      location_segments = find_spec._location_segments
+      if location_segments is None:
+        recursive_node.find_specs.append(find_spec)
+        continue
+
+      node = root_node
+      for segment in location_segments:
+        node = node.AddSubNode(
+            segment, find_spec._is_case_sensitive, find_spec._is_regex)
+
+      node.find_specs.append(find_spec)
+
+    root_node.Compile()
+
+    if root_node.find_specs or root_node.HasSubNodes():
+      self._root_nodes.append(root_node)
+
+    if recursive_node.find_specs:
+      self._root_nodes.append(recursive_node)
+
+  def _MatchNodes(self, file_entry, nodes):
+    """Matches a file entry against the nodes that match its location.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      nodes (list[_FindSpecNode]): nodes that match the location of the file
+          entry.
+
+    Returns:
+      tuple: contains:
+
+        int: number of find specifications the file entry matches.
+        list[_FindSpecNode]: nodes to match the sub file entries of the file
+            entry with.
+    """
+    number_of_matches = 0
+    sub_nodes = []
+    for node in nodes:
+      for find_spec in node.find_specs:
+        if find_spec._CheckFileEntryProperties(file_entry):
+          number_of_matches += 1
+
+      if node.HasSubNodes():
+        sub_nodes.append(node)
+
+    return number_of_matches, sub_nodes
+
+  def GetSubFileEntryNames(self, nodes):
+    """Retrieves the names of the sub file entries that can match.
+
+    Args:
+      nodes (list[_FindSpecNode]): nodes to match the sub file entries with.
+
+    Returns:
+      list[tuple[str, bool]]: name of every sub file entry that can match and
+          True if the name is case sensitive, or None if the sub file entries
+          need to be enumerated to determine which match.
+    """
+    names = set()
+    for node in nodes:
+      node_names = node.GetLiteralSubNodeNames()
+      if node_names is None:
+        return None
+
+      names.update(node_names)
+
+    return sorted(names)
+
+  def Match(self, file_entry, nodes):
+    """Matches a sub file entry.
+
+    Args:
+      file_entry (FileEntry): sub file entry.
+      nodes (list[_FindSpecNode]): nodes to match the file entry with, as
+          returned by matching its parent file entry.
+
+    Returns:
+      tuple: contains:
+
+        int: number of find specifications the file entry matches.
+        list[_FindSpecNode]: nodes to match the sub file entries of the file
+            entry with, where an empty list indicates that the sub file
+            entries do not need to be searched.
+    """
+    name = file_entry.name
+
+    matching_nodes = []
+    for node in nodes:
+      matching_nodes.extend(node.GetMatchingSubNodes(name))
+
+    return self._MatchNodes(file_entry, matching_nodes)
+
+  def MatchRoot(self, file_entry):
+    """Matches the file entry the search starts at.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      tuple: contains:
+
+        int: number of find specifications the file entry matches.
+        list[_FindSpecNode]: nodes to match the sub file entries of the file
+            entry with, where an empty list indicates that the sub file
+            entries do not need to be searched.
+    """
+    # Note that the root has no location path segment and no name to match.
+    return self._MatchNodes(file_entry, self._root_nodes)
+
+
+class _PendingDirectories(object):
+  """Directories handed to the workers that have not been consumed yet."""
+
+  def __init__(
+      self, thread_pool, function, worker_state,
+      maximum_number_of_directories):
+    """Initializes the pending directories.
+
+    Args:
+      thread_pool (multiprocessing.pool.ThreadPool): pool of worker threads.
+      function (function): function that searches a directory in a worker.
+      worker_state (threading.local): state of the worker threads.
+      maximum_number_of_directories (int): maximum number of directories
+          that are handed to the workers ahead of being consumed.
+    """
+    super(_PendingDirectories, self).__init__()
+    self._function = function
+    self._maximum_number_of_directories = maximum_number_of_directories
+    self._number_of_directories = 0
+    self._thread_pool = thread_pool
+    self._worker_state = worker_state
+
+  def GetResult(self, search_directory):
+    """Retrieves the result of a directory searched by a worker.
+
+    Args:
+      search_directory (_SearchDirectory): directory handed to the workers.
+
+    Returns:
+      list[tuple[PathSpec, int, _SearchDirectory]]: result of the worker.
+    """
+    result = search_directory.result.get()
+
+    search_directory.result = None
+    self._number_of_directories -= 1
+
+    return result
+
+  def IsFull(self):
+    """Determines if the maximum number of pending directories was reached.
+
+    Returns:
+      bool: True if no more directories should be handed to the workers.
+    """
+    return self._number_of_directories >= self._maximum_number_of_directories
+
+  def Submit(self, search_directory):
+    """Hands a directory to the workers.
+
+    Args:
+      search_directory (_SearchDirectory): directory to search.
+    """
+    search_directory.result = self._thread_pool.apply_async(
+        self._function, (self._worker_state, search_directory))
+    self._number_of_directories += 1
+
+
+class _SearchDirectory(object):
+  """Directory to search by a worker.
+
+  Attributes:
+    find_spec_matcher (FindSpecMatcher): find specification matcher.
+    find_spec_nodes (list[_FindSpecNode]): find specification nodes to match
+        the sub file entries of the directory with.
+    path_spec (PathSpec): path specification of the directory.
+    result (multiprocessing.pool.AsyncResult): result of the worker or None
+        if the directory was not yet handed to a worker.
+  """
+
+  def __init__(self, path_spec, find_spec_matcher, find_spec_nodes):
+    """Initializes a directory to search.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+      find_spec_matcher (FindSpecMatcher): find specification matcher.
+      find_spec_nodes (list[_FindSpecNode]): find specification nodes to
+          match the sub file entries of the directory with.
+    """
+    super(_SearchDirectory, self).__init__()
+    self.find_spec_matcher = find_spec_matcher
+    self.find_spec_nodes = find_spec_nodes
+    self.path_spec = path_spec
+    self.result = None
 
 
 class FileSystemSearcher(object):
   """Searcher to find file entries within a file system."""
 
+  # The file system types that look up names case insensitive. Note that
+  # the names of a TSK file system are only case insensitive for FAT and
+  # NTFS.
+  _CASE_INSENSITIVE_TYPE_INDICATORS = frozenset([
+      definitions.TYPE_INDICATOR_APFS,
+      definitions.TYPE_INDICATOR_NTFS])
+
+  # Maximum number of directories handed to the workers, per worker, that
+  # have not been consumed yet.
+  _MAXIMUM_NUMBER_OF_PENDING_DIRECTORIES_PER_WORKER = 16
+
+  # Maximum number of sub file entries of a directory that are looked up by
+  # name, instead of enumerating the sub file entries.
+  _MAXIMUM_NUMBER_OF_NAME_LOOKUPS = 32
+
+  # The file system types that support looking up a file entry by location
+  # and of which the file entry name is the name stored in the file system.
+  # The OS file system is not included, since the name of an OS file entry
+  # is derived from the location that was looked up, which on a case
+  # insensitive host can differ in case from the name of the file.
+  _NAME_LOOKUP_TYPE_INDICATORS = frozenset([
+      definitions.TYPE_INDICATOR_APFS,
+      definitions.TYPE_INDICATOR_FAKE,
+      definitions.TYPE_INDICATOR_NTFS,
+      definitions.TYPE_INDICATOR_TSK])
+
   def __init__(self, file_system, mount_point):
     """Initializes a file system searcher.
 
@@ -418,48 +1032,362 @@ class FileSystemSearcher(object):
 
     super(FileSystemSearcher, self).__init__()
     self._file_system = file_system
+    self._is_case_insensitive = self._IsCaseInsensitive(file_system)
     self._mount_point = mount_point
+    self._worker_file_systems = []
+    self._worker_file_systems_lock = threading.Lock()
+
+  def _CloseWorkerFileSystems(self):
+    """Closes the file systems opened by the workers."""
+    with self._worker_file_systems_lock:
+      for file_system, resolver_context in self._worker_file_systems:
+        file_system.Close()
+        resolver_context.Empty()
+
+      self._worker_file_systems = []
+
+  def _FindInDirectory(self, search_directory, pending_directories):
+    """Searches for matching file entries within a directory using workers.
+
+    The results of the workers are consumed in the same order as a sequential
+    search would have found them.
+
+    Args:
+      search_directory (_SearchDirectory): directory to search.
+      pending_directories (_PendingDirectories): directories handed to
+          the workers that have not been consumed yet.
+
+    Yields:
+      PathSpec: path specification of a matching file entry.
+    """
+    if not search_directory.result:
+      pending_directories.Submit(search_directory)
+
+    sub_file_entry_results = pending_directories.GetResult(search_directory)
+
+    sub_search_directories = []
+    for _, _, sub_search_directory in sub_file_entry_results:
+      if sub_search_directory:
+        sub_search_directories.append(sub_search_directory)
+
+    # Hand the sub directories to the workers before consuming the results
+    # of any of them, such that they are searched concurrently.
+    for sub_search_directory in sub_search_directories:
+      if pending_directories.IsFull():
+        break
+      pending_directories.Submit(sub_search_directory)
+
+    for path_spec, number_of_matches, sub_search_directory in (
+        sub_file_entry_results):
+      for _ in range(number_of_matches):
+        yield path_spec
+
+      if sub_search_directory:
+        for matching_path_spec in self._FindInDirectory(
+            sub_search_directory, pending_directories):
+          yield matching_path_spec
 
-  def _FindInFileEntry(self, file_entry, find_specs, search_depth):
+  def _FindInFileEntry(self, file_entry, find_spec_matcher, find_spec_nodes):
     """Searches for matching file entries within the file entry.
 
     Args:
       file_entry (FileEntry): file entry.
-      find_specs (list[FindSpec]): find specifications.
-      search_depth (int): number of location path segments to compare.
+      find_spec_matcher (FindSpecMatcher): find specification matcher.
+      find_spec_nodes (list[_FindSpecNode]): find specification nodes to match
+          the sub file entries of the file entry with.
 
     Yields:
       PathSpec: path specification of a matching file entry.
     """
-    sub_find_specs = []
-    for find_spec in find_specs:
-      match, location_match = find_spec.Matches(
-          file_entry, search_depth=search_depth)
-      if match:
-        yield file_entry.path_spec
+    try:
+      for sub_file_entry in self._GetSubFileEntries(
+          self._file_system, file_entry, find_spec_matcher, find_spec_nodes):
+        number_of_matches, sub_find_spec_nodes = find_spec_matcher.Match(
+            sub_file_entry, find_spec_nodes)
+        for _ in range(number_of_matches):
+          yield sub_file_entry.path_spec
+
+        if sub_find_spec_nodes:
+          for matching_path_spec in self._FindInFileEntry(
+              sub_file_entry, find_spec_matcher, sub_find_spec_nodes):
+            yield matching_path_spec
 
-      # pylint: disable=singleton-comparison
-      if location_match != False and not find_spec.AtMaximumDepth(search_depth):
-        sub_find_specs.append(find_spec)
+    except errors.AccessError:
+      pass
 
-    if not sub_find_specs:
-      return
+  def _FindInFileEntryConcurrently(
+      self, file_entry, find_spec_matcher, find_spec_nodes, number_of_workers):
+    """Searches for matching file entries within the file entry using workers.
+
+    The directories within the file entry are distributed over a pool of
+    worker threads, where every worker uses its own file system object,
+    opened with its own resolver context. Workers take the next directory
+    to search from a shared queue, which contains a bounded number of
+    directories.
 
-    search_depth += 1
+    Args:
+      file_entry (FileEntry): file entry.
+      find_spec_matcher (FindSpecMatcher): find specification matcher.
+      find_spec_nodes (list[_FindSpecNode]): find specification nodes to match
+          the sub file entries of the file entry with.
+      number_of_workers (int): number of worker threads.
+
+    Yields:
+      PathSpec: path specification of a matching file entry.
+    """
+    worker_state = threading.local()
+
+    thread_pool = pool.ThreadPool(processes=number_of_workers)
     try:
-      for sub_file_entry in file_entry.sub_file_entries:
-        for matching_path_spec in self._FindInFileEntry(
-            sub_file_entry, sub_find_specs, search_depth):
-          yield matching_path_spec
+      maximum_number_of_pending_directories = (
+          number_of_workers *
+          self._MAXIMUM_NUMBER_OF_PENDING_DIRECTORIES_PER_WORKER)
+      pending_directories = _PendingDirectories(
+          thread_pool, self._FindInSubFileEntries, worker_state,
+          maximum_number_of_pending_directories)
+
+      search_directory = _SearchDirectory(
+          file_entry.path_spec, find_spec_matcher, find_spec_nodes)
+      for matching_path_spec in self._FindInDirectory(
+          search_directory, pending_directories):
+        yield matching_path_spec
+
+    finally:
+      thread_pool.terminate()
+      thread_pool.join()
+
+      self._CloseWorkerFileSystems()
+
+  def _FindInSubFileEntries(self, worker_state, search_directory):
+    """Matches the sub file entries of a directory in a worker.
+
+    Args:
+      worker_state (threading.local): state of the worker thread.
+      search_directory (_SearchDirectory): directory to search.
+
+    Returns:
+      list[tuple[PathSpec, int, _SearchDirectory]]: path specification of
+          every sub file entry that matches or needs to be searched, the number
+          of find specifications it matches and the directory to search or
+          None if the sub file entry does not need to be searched. The sub file
+          entries are in the order of the directory.
+    """
+    file_system = self._GetWorkerFileSystem(
+        worker_state, search_directory.path_spec)
+
+    file_entry = file_system.GetFileEntryByPathSpec(search_directory.path_spec)
+    if not file_entry:
+      return []
+
+    find_spec_matcher = search_directory.find_spec_matcher
+
+    sub_file_entry_results = []
+    try:
+      for sub_file_entry in self._GetSubFileEntries(
+          file_system, file_entry, find_spec_matcher,
+          search_directory.find_spec_nodes):
+        number_of_matches, sub_find_spec_nodes = find_spec_matcher.Match(
+            sub_file_entry, search_directory.find_spec_nodes)
+
+        sub_search_directory = None
+        if sub_find_spec_nodes and sub_file_entry.IsDirectory():
+          sub_search_directory = _SearchDirectory(
+              sub_file_entry.path_spec, find_spec_matcher,
+              sub_find_spec_nodes)
+
+        if number_of_matches or sub_search_directory:
+          sub_file_entry_results.append((
+              sub_file_entry.path_spec, number_of_matches,
+              sub_search_directory))
+
     except errors.AccessError:
       pass
 
-  def Find(self, find_specs=None):
+    return sub_file_entry_results
+
+  def _GetSubFileEntries(
+      self, file_system, file_entry, find_spec_matcher, find_spec_nodes):
+    """Retrieves the sub file entries that need to be matched.
+
+    When the find specifications only contain literal location path segments
+    for the sub file entries, the sub file entries are looked up by name
+    instead of enumerating all sub file entries of the file entry.
+
+    Args:
+      file_system (FileSystem): file system that contains the file entry.
+      file_entry (FileEntry): file entry.
+      find_spec_matcher (FindSpecMatcher): find specification matcher.
+      find_spec_nodes (list[_FindSpecNode]): find specification nodes to match
+          the sub file entries of the file entry with.
+
+    Returns:
+      iterator[FileEntry]: sub file entries.
+    """
+    sub_file_entries = None
+    if file_system.type_indicator in self._NAME_LOOKUP_TYPE_INDICATORS:
+      names = find_spec_matcher.GetSubFileEntryNames(find_spec_nodes)
+      if names is not None and len(names) <= (
+          self._MAXIMUM_NUMBER_OF_NAME_LOOKUPS):
+        sub_file_entries = self._GetSubFileEntriesByName(
+            file_system, file_entry, names)
+
+    if sub_file_entries is None:
+      sub_file_entries = file_entry.sub_file_entries
+
+    return sub_file_entries
+
+  def _GetSubFileEntriesByName(self, file_system, file_entry, names):
+    """Looks up sub file entries by name.
+
+    A file system with case sensitive names can contain multiple file entries
+    of which the names only differ in case, which all match a case insensitive
+    name. Therefore case insensitive names are only looked up on a file system
+    that looks up names case insensitive, where a name that cannot be looked
+    up represents that there is no such sub file entry.
+
+    Args:
+      file_system (FileSystem): file system that contains the file entry.
+      file_entry (FileEntry): file entry.
+      names (list[tuple[str, bool]]): name of every sub file entry to look up
+          and True if the name is case sensitive.
+
+    Returns:
+      list[FileEntry]: sub file entries sorted by name or None if the sub file
+          entries need to be enumerated, such as when a case insensitive name
+          cannot be looked up or the file system returns a file entry with
+          a name in a different case than a case sensitive name.
+    """
+    location = getattr(file_entry.path_spec, 'location', None)
+    if location is None:
+      return None
+
+    if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
+        file_system.type_indicator):
+      parent_path_spec = None
+    else:
+      parent_path_spec = file_entry.path_spec.parent
+
+    sub_file_entries = {}
+    for name, case_sensitive in names:
+      if not case_sensitive and not self._is_case_insensitive:
+        return None
+
+      try:
+        sub_file_entry = self._GetSubFileEntryByName(
+            file_system, location, parent_path_spec, name)
+        if not sub_file_entry:
+          # The file system does not contain a file entry with the name.
+          continue
+
+        sub_file_entry_name = sub_file_entry.name
+        if sub_file_entry_name != name:
+          if (not self._is_case_insensitive or
+              sub_file_entry_name.lower() != name.lower()):
+            return None
+
+          if case_sensitive:
+            # The file system cannot contain another file entry with a name
+            # that only differs in case.
+            continue
+
+          # Look up the sub file entry again by its name on the file system,
+          # such that its path specification contains the name in the same
+          # case.
+          sub_file_entry = self._GetSubFileEntryByName(
+              file_system, location, parent_path_spec, sub_file_entry_name)
+          if not sub_file_entry:
+            return None
+
+      except (IOError, OSError, errors.Error):
+        return None
+
+      # Prevent matching a sub file entry that is found with both a case
+      # sensitive and a case insensitive name more than once.
+      sub_file_entries.setdefault(sub_file_entry.name, sub_file_entry)
+
+    return [
+        sub_file_entry for _, sub_file_entry in sorted(
+            sub_file_entries.items())]
+
+  def _GetSubFileEntryByName(
+      self, file_system, location, parent_path_spec, name):
+    """Looks up a sub file entry by name.
+
+    Args:
+      file_system (FileSystem): file system that contains the file entry.
+      location (str): location of the file entry.
+      parent_path_spec (PathSpec): parent path specification of the file
+          entry or None if not available.
+      name (str): name of the sub file entry.
+
+    Returns:
+      FileEntry: sub file entry or None if not available.
+    """
+    kwargs = {'location': file_system.JoinPath([location, name])}
+    if parent_path_spec:
+      kwargs['parent'] = parent_path_spec
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        file_system.type_indicator, **kwargs)
+
+    return file_system.GetFileEntryByPathSpec(path_spec)
+
+  def _GetWorkerFileSystem(self, worker_state, path_spec):
+    """Retrieves the file system of a worker.
+
+    Args:
+      worker_state (threading.local): state of the worker thread.
+      path_spec (PathSpec): path specification of a file entry within
+          the file system.
+
+    Returns:
+      FileSystem: file system of the worker.
+    """
+    if self._file_system.type_indicator == definitions.TYPE_INDICATOR_FAKE:
+      # A fake file system only exists in memory and cannot be opened again.
+      return self._file_system
+
+    file_system = getattr(worker_state, 'file_system', None)
+    if not file_system:
+      resolver_context = context.Context()
+      file_system = resolver.Resolver.OpenFileSystem(
+          path_spec, resolver_context=resolver_context)
+
+      with self._worker_file_systems_lock:
+        self._worker_file_systems.append((file_system, resolver_context))
+
+      worker_state.file_system = file_system
+
+    return file_system
+
+  def _IsCaseInsensitive(self, file_system):
+    """Determines if a file system looks up names case insensitive.
+
+    Args:
+      file_system (FileSystem): file system.
+
+    Returns:
+      bool: True if the file system is known to look up names case
+          insensitive.
+    """
+    if file_system.type_indicator in self._CASE_INSENSITIVE_TYPE_INDICATORS:
+      return True
+
+    if file_system.type_indicator == definitions.TYPE_INDICATOR_TSK:
+      return file_system.IsFAT() or file_system.IsNTFS()
+
+    return False
+
+  def Find(self, find_specs=None, number_of_workers=0):
     """Searches for matching file entries within the file system.
 
     Args:
       find_specs (list[FindSpec]): find specifications. where None
           will return all allocated file entries.
+      number_of_workers (Optional[int]): number of worker threads used to
+          search directories concurrently, where 0 represents that the file
+          system is searched sequentially. Matching file entries are found
+          in the same order in both cases.
 
     Yields:
       PathSpec: path specification of a matching file entry.
@@ -473,7 +1401,24 @@ class FileSystemSearcher(object):
     else:
       file_entry = self._file_system.GetRootFileEntry()
 
-    for matching_path_spec in self._FindInFileEntry(file_entry, find_specs, 0):
+    find_spec_matcher = FindSpecMatcher(find_specs)
+
+    number_of_matches, find_spec_nodes = find_spec_matcher.MatchRoot(
+        file_entry)
+    for _ in range(number_of_matches):
+      yield file_entry.path_spec
+
+    if not find_spec_nodes:
+      return
+
+    if number_of_workers > 0:
+      matching_path_specs = self._FindInFileEntryConcurrently(
+          file_entry, find_spec_matcher, find_spec_nodes, number_of_workers)
+    else:
+      matching_path_specs = self._FindInFileEntry(
+          file_entry, find_spec_matcher, find_spec_nodes)
+
+    for matching_path_spec in matching_path_specs:
       yield matching_path_spec
 
   def GetFileEntryByPathSpec(self, path_spec):
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Persistent source scanner context store.
+
+Scanning a source for storage media images, volume systems and file systems
+requires the data of the source to be read and analyzed. The store keeps the
+resulting source scanner context in a context file per source, such that
+repeated processing of the same source does not need to scan it again.
+"""
+
+from __future__ import unicode_literals
+
+import hashlib
+import os
+
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.lib import json_file
+from dfvfs.lib import source_file
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver
+from dfvfs.serializer import json_serializer
+
+
+class ScanContextStore(object):
+  """Persistent source scanner context store.
+
+  Context files are stored in a directory and named after a hash of the
+  source path. A context file is only used when the size, modification time
+  and a hash of the header data of the source still match those stored in
+  the context file.
+  """
+
+  _FORMAT_VERSION = 1
+
+  _CONTEXT_FILE_EXTENSION = '.json'
+
+  # The size of the header data of the source that is hashed.
+  _HEADER_DATA_SIZE = 64 * 1024
+
+  def __init__(self, path):
+    """Initializes a source scanner context store.
+
+    Args:
+      path (str): path of the directory that contains the context files.
+    """
+    super(ScanContextStore, self).__init__()
+    self._path = path
+
+  def _GetContextFilePath(self, source_path):
+    """Retrieves the path of the context file of a source.
+
+    Args:
+      source_path (str): source path.
+
+    Returns:
+      str: path of the context file.
+    """
+    source_path_hash = hashlib.sha256(source_path.encode('utf-8'))
+    file_name = '{0:s}{1:s}'.format(
+        source_path_hash.hexdigest(), self._CONTEXT_FILE_EXTENSION)
+    return os.path.join(self._path, file_name)
+
+  def _GetSourceValues(self, source_path):
+    """Retrieves the values that identify the state of the source.
+
+    Args:
+      source_path (str): source path.
+
+    Returns:
+      tuple[int, str, str]: size, modification time and SHA-256 hash of
+          the header data of the source, where None represents a value that
+          is not available.
+    """
+    # Only sources that are files or devices are identified by their header
+    # data, scanning a directory is cheap.
+    if os.path.isdir(source_path):
+      return None, None, None
+
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=source_path)
+
+    size, modification_time = source_file.GetSourceValues(source_path_spec)
+    if size is None:
+      return None, None, None
+
+    try:
+      file_object = resolver.Resolver.OpenFileObject(source_path_spec)
+    except (IOError, OSError, errors.Error):
+      return size, modification_time, None
+
+    try:
+      header_data = file_object.read_at(0, self._HEADER_DATA_SIZE)
+    except (IOError, OSError):
+      header_data = None
+    finally:
+      file_object.close()
+
+    header_hash = None
+    if header_data is not None:
+      header_hash = hashlib.sha256(header_data).hexdigest()
+
+    return size, modification_time, header_hash
+
+  def ReadScanContext(self, source_path):
+    """Reads the source scanner context of a source.
+
+    Args:
+      source_path (str): source path.
+
+    Returns:
+      SourceScannerContext: source scanner context or None if no valid context
+          file is available.
+    """
+    # The root scan node contains the absolute source path.
+    source_path = os.path.abspath(source_path)
+    context_file_path = self._GetContextFilePath(source_path)
+
+    context_file_values = json_file.ReadJSONFile(context_file_path)
+    if not context_file_values:
+      return None
+
+    if (context_file_values.get('format_version', None) !=
+        self._FORMAT_VERSION or
+        context_file_values.get('source_path', None) != source_path):
+      return None
+
+    size, modification_time, header_hash = self._GetSourceValues(source_path)
+    if (size is None or header_hash is None or
+        context_file_values.get('source_size', None) != size or
+        context_file_values.get('source_modification_time', None) != (
+            modification_time) or
+        context_file_values.get('source_header_hash', None) != header_hash):
+      return None
+
+    serialized_scan_context = context_file_values.get('scan_context', None)
+    if not serialized_scan_context:
+      return None
+
+    serializer = json_serializer.JsonSourceScannerContextSerializer
+    try:
+      scan_context = serializer.ReadSerialized(serialized_scan_context)
+    except (KeyError, RuntimeError, TypeError, ValueError, errors.Error):
+      return None
+
+    root_scan_node = scan_context.GetRootScanNode()
+    if (not root_scan_node or
+        getattr(root_scan_node.path_spec, 'location', None) != source_path):
+      return None
+
+    return scan_context
+
+  def WriteScanContext(self, source_path, scan_context):
+    """Writes the source scanner context of a source.
+
+    Args:
+      source_path (str): source path.
+      scan_context (SourceScannerContext): source scanner context.
+    """
+    source_path = os.path.abspath(source_path)
+    size, modification_time, header_hash = self._GetSourceValues(source_path)
+    if size is None or header_hash is None:
+      # Without the size and header data of the source the context file
+      # cannot be validated.
+      return
+
+    serializer = json_serializer.JsonSourceScannerContextSerializer
+    context_file_values = {
+        'format_version': self._FORMAT_VERSION,
+        'scan_context': serializer.WriteSerialized(scan_context),
+        'source_header_hash': header_hash,
+        'source_modification_time': modification_time,
+        'source_path': source_path,
+        'source_size': size}
+
+    context_file_path = self._GetContextFilePath(source_path)
+
+    try:
+      json_file.WriteJSONFile(context_file_path, context_file_values)
+    except (IOError, OSError):
+      pass
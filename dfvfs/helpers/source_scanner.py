@@ -19,12 +19,15 @@ previously scanned or user provided context information, e.g.
 
 from __future__ import unicode_literals
 
+from multiprocessing import pool
+
 from dfvfs.analyzer import analyzer
 from dfvfs.lib import apfs_helper
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import raw
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
 from dfvfs.resolver import resolver
 
 
@@ -378,20 +381,122 @@ class SourceScannerContext(object):
 class SourceScanner(object):
   """Searcher to find volumes within a volume system."""
 
-  def __init__(self, resolver_context=None):
+  # The format categories a system level scan node is scanned for.
+  _SYSTEM_LEVEL_FORMAT_CATEGORIES = frozenset([
+      definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+      definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE,
+      definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+
+  # The format categories other scan nodes are scanned for.
+  _VOLUME_LEVEL_FORMAT_CATEGORIES = frozenset([
+      definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+      definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+
+  def __init__(self, resolver_context=None, number_of_workers=0):
     """Initializes a source scanner.
 
     Args:
       resolver_context (Optional[Context]): resolver context, where None
           indicates to use the built-in context which is not multi process
           safe.
+      number_of_workers (Optional[int]): number of worker threads used to
+          scan the volumes of a volume system concurrently, where 0
+          represents that the volumes are scanned sequentially.
     """
     super(SourceScanner, self).__init__()
+    self._number_of_workers = number_of_workers
     self._resolver_context = resolver_context
+    self._scanned_path_spec = None
+    self._scanned_type_indicators = None
 
   # TODO: add functions to check if path spec type is a storage media image
   # type, file system type, etc.
 
+  def _GetTypeIndicators(self, source_path_spec, format_category):
+    """Determines the supported format types of a specific format category.
+
+    The result of a previous scan for type indicators is used when it covers
+    the path specification and format category.
+
+    Args:
+      source_path_spec (PathSpec): source path specification.
+      format_category (str): format category.
+
+    Returns:
+      list[str]: supported format type indicators.
+
+    Raises:
+      IOError: if the source cannot be read.
+      RuntimeError: if the source cannot be scanned.
+    """
+    if (self._scanned_path_spec is None or
+        self._scanned_path_spec != source_path_spec or
+        format_category not in self._scanned_type_indicators):
+      type_indicators = analyzer.Analyzer.GetTypeIndicators(
+          source_path_spec, format_categories=[format_category],
+          resolver_context=self._resolver_context)
+
+      self._scanned_path_spec = source_path_spec
+      self._scanned_type_indicators = type_indicators
+
+    return self._scanned_type_indicators[format_category]
+
+  def _ScanForTypeIndicators(self, source_path_spec, format_categories):
+    """Scans the path specification for multiple format categories at once.
+
+    The source is read only once for all format categories and the result
+    is used by subsequent scans of the path specification for one of the
+    format categories. Errors are not raised here, since the subsequent
+    scans will report them.
+
+    Args:
+      source_path_spec (PathSpec): source path specification.
+      format_categories (set[str]): format categories.
+    """
+    if (self._scanned_path_spec is not None and
+        self._scanned_path_spec == source_path_spec):
+      return
+
+    try:
+      type_indicators = analyzer.Analyzer.GetTypeIndicators(
+          source_path_spec, format_categories=format_categories,
+          resolver_context=self._resolver_context)
+    except (IOError, RuntimeError):
+      return
+
+    self._scanned_path_spec = source_path_spec
+    self._scanned_type_indicators = type_indicators
+
+  def _MergeScanNode(
+      self, scan_context, parent_scan_node, worker_scan_context,
+      worker_scan_node):
+    """Merges a scan node scanned by a worker into the scan context.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+      parent_scan_node (SourceScanNode): parent scan node in the source
+          scanner context.
+      worker_scan_context (SourceScannerContext): source scanner context of
+          the worker.
+      worker_scan_node (SourceScanNode): scan node in the source scanner
+          context of the worker.
+    """
+    path_spec = worker_scan_node.path_spec
+
+    scan_node = scan_context.GetScanNode(path_spec)
+    if not scan_node:
+      scan_node = scan_context.AddScanNode(path_spec, parent_scan_node)
+
+    if worker_scan_node.scanned:
+      scan_node.scanned = True
+
+    if worker_scan_context.IsLockedScanNode(path_spec):
+      scan_context.LockScanNode(path_spec)
+
+    for worker_sub_scan_node in worker_scan_node.sub_nodes:
+      self._MergeScanNode(
+          scan_context, scan_node, worker_scan_context, worker_sub_scan_node)
+
   def _ScanNode(self, scan_context, scan_node, auto_recurse=True):
     """Scans a node for supported formats.
 
@@ -425,6 +530,9 @@ class SourceScanner(object):
         scan_context.SetSourceType(definitions.SOURCE_TYPE_DIRECTORY)
         return
 
+      self._ScanForTypeIndicators(
+          scan_node.path_spec, self._SYSTEM_LEVEL_FORMAT_CATEGORIES)
+
       source_path_spec = self.ScanForStorageMediaImage(scan_node.path_spec)
       if source_path_spec:
         scan_node.scanned = True
@@ -458,6 +566,13 @@ class SourceScanner(object):
         # scan it for a volume system.
         break
 
+      if (not scan_node.IsVolumeSystemRoot() and
+          scan_node.type_indicator not in (
+              definitions.TYPE_INDICATOR_APFS_CONTAINER,
+              definitions.TYPE_INDICATOR_VSHADOW)):
+        self._ScanForTypeIndicators(
+            scan_node.path_spec, self._VOLUME_LEVEL_FORMAT_CATEGORIES)
+
       source_path_spec = self.ScanForVolumeSystem(scan_node.path_spec)
       if not source_path_spec:
         # No volume system found continue with a file system scan.
@@ -581,6 +696,81 @@ class SourceScanner(object):
         if path_spec:
           scan_context.AddScanNode(path_spec, scan_node.parent_node)
 
+  def _ScanSubNodesConcurrently(self, scan_context, scan_node, sub_scan_nodes):
+    """Scans the sub nodes of a volume system root node concurrently.
+
+    Every sub node is scanned by a worker, with its own resolver context,
+    into a separate source scanner context. The results are merged into
+    the source scanner context in the order of the sub nodes, such that
+    the result is the same as that of a sequential scan.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+      scan_node (SourceScanNode): volume system root scan node.
+      sub_scan_nodes (list[SourceScanNode]): sub scan nodes to scan.
+
+    Raises:
+      BackEndError: if a sub node cannot be scanned.
+    """
+    number_of_workers = min(self._number_of_workers, len(sub_scan_nodes))
+
+    thread_pool = pool.ThreadPool(processes=number_of_workers)
+    try:
+      worker_results = [
+          thread_pool.apply_async(self._ScanSubNodeInWorker, (
+              scan_node.path_spec, sub_scan_node.path_spec))
+          for sub_scan_node in sub_scan_nodes]
+
+      for sub_scan_node, worker_result in zip(sub_scan_nodes, worker_results):
+        worker_scan_context = worker_result.get()
+
+        worker_scan_node = worker_scan_context.GetRootScanNode()
+        if not worker_scan_context.HasScanNode(sub_scan_node.path_spec):
+          scan_context.RemoveScanNode(sub_scan_node.path_spec)
+
+        # Scan nodes added next to the sub node, such as for the unencrypted
+        # part of a BitLocker To Go volume, are merged as well.
+        for worker_sub_scan_node in worker_scan_node.sub_nodes:
+          self._MergeScanNode(
+              scan_context, scan_node, worker_scan_context,
+              worker_sub_scan_node)
+
+        if worker_scan_context.source_type:
+          scan_context.SetSourceType(worker_scan_context.source_type)
+
+    finally:
+      thread_pool.terminate()
+      thread_pool.join()
+
+  def _ScanSubNodeInWorker(self, parent_path_spec, path_spec):
+    """Scans a sub node of a volume system root node in a worker.
+
+    Args:
+      parent_path_spec (PathSpec): path specification of the volume system
+          root scan node.
+      path_spec (PathSpec): path specification of the sub scan node.
+
+    Returns:
+      SourceScannerContext: source scanner context of the worker.
+
+    Raises:
+      BackEndError: if the sub node cannot be scanned.
+    """
+    worker_scan_context = SourceScannerContext()
+    parent_scan_node = worker_scan_context.AddScanNode(parent_path_spec, None)
+    scan_node = worker_scan_context.AddScanNode(path_spec, parent_scan_node)
+
+    resolver_context = context.Context()
+    source_scanner = SourceScanner(resolver_context=resolver_context)
+
+    try:
+      source_scanner._ScanNode(  # pylint: disable=protected-access
+          worker_scan_context, scan_node, auto_recurse=True)
+    finally:
+      resolver_context.Empty()
+
+    return worker_scan_context
+
   def _ScanVolumeSystemRootNode(
       self, scan_context, scan_node, auto_recurse=True):
     """Scans a volume system root node for supported formats.
@@ -604,6 +794,7 @@ class SourceScanner(object):
     file_entry = resolver.Resolver.OpenFileEntry(
         scan_node.path_spec, resolver_context=self._resolver_context)
 
+    sub_scan_nodes = []
     for sub_file_entry in file_entry.sub_file_entries:
       sub_scan_node = scan_context.AddScanNode(
           sub_file_entry.path_spec, scan_node)
@@ -613,9 +804,15 @@ class SourceScanner(object):
         # be expensive we only do this when explicitly asked for.
         continue
 
-      if auto_recurse or not scan_context.updated:
+      if auto_recurse and self._number_of_workers > 0:
+        sub_scan_nodes.append(sub_scan_node)
+
+      elif auto_recurse or not scan_context.updated:
         self._ScanNode(scan_context, sub_scan_node, auto_recurse=auto_recurse)
 
+    if sub_scan_nodes:
+      self._ScanSubNodesConcurrently(scan_context, scan_node, sub_scan_nodes)
+
   def GetVolumeIdentifiers(self, volume_system):
     """Retrieves the volume identifiers.
 
@@ -652,6 +849,9 @@ class SourceScanner(object):
 
     scan_context.updated = False
 
+    self._scanned_path_spec = None
+    self._scanned_type_indicators = None
+
     if scan_path_spec:
       scan_node = scan_context.GetScanNode(scan_path_spec)
 
@@ -685,8 +885,8 @@ class SourceScanner(object):
           parent=source_path_spec)
 
     try:
-      type_indicators = analyzer.Analyzer.GetFileSystemTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_FILE_SYSTEM)
     except RuntimeError as exception:
       raise errors.BackEndError((
           'Unable to process source path specification with error: '
@@ -739,8 +939,8 @@ class SourceScanner(object):
           media image type is found.
     """
     try:
-      type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE)
     except RuntimeError as exception:
       raise errors.BackEndError((
           'Unable to process source path specification with error: '
@@ -805,8 +1005,8 @@ class SourceScanner(object):
       return None
 
     try:
-      type_indicators = analyzer.Analyzer.GetVolumeSystemTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM)
     except (IOError, RuntimeError) as exception:
       raise errors.BackEndError((
           'Unable to process source path specification with error: '
@@ -882,4 +1082,8 @@ class SourceScanner(object):
     if not is_locked:
       scan_context.UnlockScanNode(path_spec)
 
+      # The data of the unlocked scan node differs from that scanned before.
+      self._scanned_path_spec = None
+      self._scanned_type_indicators = None
+
     return not is_locked
@@ -3,7 +3,6 @@
 
 from __future__ import unicode_literals
 
-import os
 
 # Since this class implements the readlines file-like object interface
 # the names of the interface functions are in lower case as an exception
@@ -98,8 +97,8 @@ class TextFile(object):
       if self._lines_buffer_offset + read_size > self._file_object_size:
         read_size = self._file_object_size - self._lines_buffer_offset
 
-      self._file_object.seek(self._lines_buffer_offset, os.SEEK_SET)
-      read_buffer = self._file_object.read(read_size)
+      read_buffer = self._file_object.read_at(
+          self._lines_buffer_offset, read_size)
 
       self._lines_buffer_offset += len(read_buffer)
 
@@ -91,14 +91,18 @@ class VolumeScannerMediator(object):
 class VolumeScanner(object):
   """Volume scanner."""
 
-  def __init__(self, mediator=None):
+  def __init__(self, mediator=None, scan_context_store=None):
     """Initializes a volume scanner.
 
     Args:
       mediator (VolumeScannerMediator): a volume scanner mediator.
+      scan_context_store (Optional[ScanContextStore]): source scanner context
+          store, used to reuse the source scanner context of a previous scan
+          of the same source, where None indicates to always scan the source.
     """
     super(VolumeScanner, self).__init__()
     self._mediator = mediator
+    self._scan_context_store = scan_context_store
     self._source_path = None
     self._source_scanner = source_scanner.SourceScanner()
     self._source_type = None
@@ -420,14 +424,24 @@ class VolumeScanner(object):
       raise errors.ScannerError(
           'No such device, file or directory: {0:s}.'.format(source_path))
 
-    scan_context = source_scanner.SourceScannerContext()
-    scan_context.OpenSourcePath(source_path)
+    scan_context = None
+    if self._scan_context_store:
+      scan_context = self._scan_context_store.ReadScanContext(source_path)
 
-    try:
-      self._source_scanner.Scan(scan_context)
-    except (ValueError, errors.BackEndError) as exception:
-      raise errors.ScannerError(
-          'Unable to scan source with error: {0!s}'.format(exception))
+    if not scan_context:
+      scan_context = source_scanner.SourceScannerContext()
+      scan_context.OpenSourcePath(source_path)
+
+      try:
+        self._source_scanner.Scan(scan_context)
+      except (ValueError, errors.BackEndError) as exception:
+        raise errors.ScannerError(
+            'Unable to scan source with error: {0!s}'.format(exception))
+
+      # The scan context is stored before any encrypted volume is unlocked,
+      # since credentials are not stored.
+      if self._scan_context_store:
+        self._scan_context_store.WriteScanContext(source_path, scan_context)
 
     self._source_path = source_path
     self._source_type = scan_context.source_type
@@ -468,13 +482,17 @@ class WindowsVolumeScanner(VolumeScanner):
       'C:\\WINNT35',
   ])
 
-  def __init__(self, mediator=None):
+  def __init__(self, mediator=None, scan_context_store=None):
     """Initializes a Windows volume scanner.
 
     Args:
       mediator (VolumeScannerMediator): a volume scanner mediator.
+      scan_context_store (Optional[ScanContextStore]): source scanner context
+          store, used to reuse the source scanner context of a previous scan
+          of the same source, where None indicates to always scan the source.
     """
-    super(WindowsVolumeScanner, self).__init__(mediator=mediator)
+    super(WindowsVolumeScanner, self).__init__(
+        mediator=mediator, scan_context_store=scan_context_store)
     self._file_system = None
     self._path_resolver = None
     self._windows_directory = None
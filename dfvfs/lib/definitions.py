@@ -28,6 +28,11 @@ ENCRYPTION_MODE_CFB = 'cfb'
 ENCRYPTION_MODE_ECB = 'ecb'
 ENCRYPTION_MODE_OFB = 'ofb'
 
+# The operating system file access method definitions.
+OS_FILE_ACCESS_METHOD_MMAP = 'mmap'
+OS_FILE_ACCESS_METHOD_PREAD = 'pread'
+OS_FILE_ACCESS_METHOD_READ = 'read'
+
 # The type indicator definitions.
 TYPE_INDICATOR_APFS = 'APFS'
 TYPE_INDICATOR_APFS_CONTAINER = 'APFS_CONTAINER'
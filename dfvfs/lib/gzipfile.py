@@ -7,6 +7,7 @@
 
 from __future__ import unicode_literals
 
+import bisect
 import os
 
 from dtfabric.runtime import fabric as dtfabric_fabric
@@ -27,7 +28,7 @@ class _GzipDecompressorState(object):
         member last emitted by the state object.
   """
 
-  _MAXIMUM_READ_SIZE = 16 * 1024 * 1024
+  _MAXIMUM_READ_SIZE = 256 * 1024
 
   def __init__(self, stream_start):
     """Initializes a gzip member decompressor wrapper.
@@ -41,6 +42,20 @@ class _GzipDecompressorState(object):
     self._last_read = stream_start
     self.uncompressed_offset = 0
 
+  def Copy(self):
+    """Copies the decompressor state.
+
+    Returns:
+      _GzipDecompressorState: copy of the decompressor state, that continues
+          decompression where this decompressor state is.
+    """
+    decompressor_state = _GzipDecompressorState(self._last_read)
+    # pylint: disable=protected-access
+    decompressor_state._compressed_data = self._compressed_data
+    decompressor_state._decompressor = self._decompressor.Copy()
+    decompressor_state.uncompressed_offset = self.uncompressed_offset
+    return decompressor_state
+
   def Read(self, file_object):
     """Reads the next uncompressed data from the gzip stream.
 
@@ -54,7 +69,10 @@ class _GzipDecompressorState(object):
     read_data = file_object.read(self._MAXIMUM_READ_SIZE)
     self._last_read = file_object.get_offset()
 
-    compressed_data = b''.join([self._compressed_data, read_data])
+    if self._compressed_data:
+      compressed_data = b''.join([self._compressed_data, read_data])
+    else:
+      compressed_data = read_data
     decompressed_data, remaining_compressed_data = (
         self._decompressor.Decompress(compressed_data))
 
@@ -83,6 +101,14 @@ class GzipMember(data_format.DataFormat):
   sequentially before metadata and random seeks are possible. This class
   provides caching of gzip member data during the initial read of each member.
 
+  During the initial read access points are recorded, in the spirit of zlib's
+  zran example, every _ACCESS_POINT_SPACING bytes of uncompressed data. An
+  access point is a copy of the decompressor state, including its 32 KiB
+  window, from which decompression can be resumed instead of decompressing
+  the member from its start. When the access points exceed the maximum
+  memory size, every other access point is discarded and the access point
+  spacing is doubled.
+
   Attributes:
     comment (str): comment stored in the member.
     member_end_offset (int): offset to the end of the member in the parent file
@@ -133,11 +159,23 @@ class GzipMember(data_format.DataFormat):
   _FLAG_FNAME = 0x08
   _FLAG_FCOMMENT = 0x10
 
+  # The initial minimum number of bytes of uncompressed data between access
+  # points.
+  _ACCESS_POINT_SPACING = 1 * 1024 * 1024
+
+  # The estimated size of a copy of the decompressor state, such as the zlib
+  # window of 32 KiB and the zlib inflate state.
+  _DECOMPRESSOR_STATE_SIZE = 48 * 1024
+
+  # The maximum number of bytes of memory used by the access points.
+  _MAXIMUM_ACCESS_POINTS_SIZE = 32 * 1024 * 1024
+
   # The maximum size of the uncompressed data cache.
   _UNCOMPRESSED_DATA_CACHE_SIZE = 2 * 1024 * 1024
 
   def __init__(
-      self, file_object, member_start_offset, uncompressed_data_offset):
+      self, file_object, member_start_offset, uncompressed_data_offset,
+      member_end_offset=None, uncompressed_data_size=None):
     """Initializes a gzip member.
 
     Args:
@@ -147,6 +185,12 @@ class GzipMember(data_format.DataFormat):
       uncompressed_data_offset (int): offset of the start of the uncompressed
           data in this member relative to the whole gzip file's uncompressed
           data.
+      member_end_offset (Optional[int]): offset to the end of the gzip member
+          in the containing file, where None represents that the member data
+          should be read to determine the offset.
+      uncompressed_data_size (Optional[int]): total size of the data in
+          the gzip member after decompression, where None represents that
+          the member data should be read to determine the size.
     """
     self._cache = b''
     # End offset of the cached uncompressed data of the member.
@@ -159,20 +203,99 @@ class GzipMember(data_format.DataFormat):
     self.operating_system = None
     self.original_filename = None
 
-    file_size = file_object.get_size()
-
     file_object.seek(member_start_offset, os.SEEK_SET)
     self._ReadMemberHeader(file_object)
 
-    data_offset = 0
-    uncompressed_data_size = 0
-
     compressed_data_offset = file_object.get_offset()
     decompressor_state = _GzipDecompressorState(compressed_data_offset)
 
-    # Read the member data to determine the uncompressed data size and
-    # the offset of the member footer.
-    file_offset = compressed_data_offset
+    # Access points of the member sorted by uncompressed offset and their
+    # uncompressed offsets, which are used to look up the access point
+    # nearest before an offset.
+    self._access_point_offsets = [0]
+    self._access_point_spacing = self._ACCESS_POINT_SPACING
+    self._access_points = [decompressor_state.Copy()]
+    self._access_points_size = self._GetAccessPointSize(
+        self._access_points[0])
+
+    if member_end_offset is None or uncompressed_data_size is None:
+      member_end_offset, uncompressed_data_size = self._ReadMemberData(
+          file_object, decompressor_state)
+
+    # Initialize the member with data.
+    self._file_object = file_object
+    self._file_object.seek(member_start_offset, os.SEEK_SET)
+
+    # Offset to the beginning of the compressed data in the file object.
+    self._compressed_data_start = compressed_data_offset
+    self._decompressor_state = self._access_points[0].Copy()
+
+    # Offset to the start of the member in the parent file object.
+    self.member_start_offset = member_start_offset
+
+    # Offset to the end of the member in the parent file object.
+    self.member_end_offset = member_end_offset
+
+    # Total size of the data in this gzip member after decompression.
+    self.uncompressed_data_size = uncompressed_data_size
+
+    # Offset of the start of the uncompressed data in this member relative to
+    # the whole gzip file's uncompressed data.
+    self.uncompressed_data_offset = uncompressed_data_offset
+
+  def _AddAccessPoint(self, decompressor_state):
+    """Adds an access point if far enough past the last access point.
+
+    Args:
+      decompressor_state (_GzipDecompressorState): decompressor state.
+    """
+    last_access_point = self._access_points[-1]
+    if decompressor_state.uncompressed_offset < (
+        last_access_point.uncompressed_offset + self._access_point_spacing):
+      return
+
+    access_point = decompressor_state.Copy()
+    self._access_point_offsets.append(access_point.uncompressed_offset)
+    self._access_points.append(access_point)
+    self._access_points_size += self._GetAccessPointSize(access_point)
+
+    if self._access_points_size > self._MAXIMUM_ACCESS_POINTS_SIZE:
+      # Keep the access point at the start of the member and every other
+      # access point after it.
+      self._access_point_offsets = self._access_point_offsets[::2]
+      self._access_points = self._access_points[::2]
+      self._access_points_size = sum(
+          self._GetAccessPointSize(access_point)
+          for access_point in self._access_points)
+      self._access_point_spacing *= 2
+
+  def _ReadMemberData(self, file_object, decompressor_state):
+    """Reads the member data.
+
+    The member data is read to determine the uncompressed data size and
+    the offset of the member footer. Access points are recorded while
+    reading and the uncompressed data of members that fit entirely in
+    the cache is cached.
+
+    Args:
+      file_object (FileIO): file-like object, containing the gzip member.
+      decompressor_state (_GzipDecompressorState): decompressor state at
+          the start of the compressed data.
+
+    Returns:
+      tuple[int, int]: offset to the end of the gzip member in the containing
+          file and total size of the data in the gzip member after
+          decompression.
+
+    Raises:
+      FileFormatError: if the member footer cannot be read.
+    """
+    file_size = file_object.get_size()
+
+    data_offset = 0
+    uncompressed_data_size = 0
+
+    file_offset = file_object.get_offset()
     while file_offset < file_size:
       data_offset += uncompressed_data_size
 
@@ -189,6 +312,8 @@ class GzipMember(data_format.DataFormat):
 
       file_offset = file_object.get_offset()
 
+      self._AddAccessPoint(decompressor_state)
+
     # Do not read the the last member footer if it is missing, which is
     # a common corruption scenario.
     if file_offset < file_size:
@@ -196,12 +321,6 @@ class GzipMember(data_format.DataFormat):
           file_object, file_offset, self._MEMBER_FOOTER_SIZE,
           self._MEMBER_FOOTER, 'member footer')
 
-    member_end_offset = file_object.get_offset()
-
-    # Initialize the member with data.
-    self._file_object = file_object
-    self._file_object.seek(member_start_offset, os.SEEK_SET)
-
     # Cache uncompressed data of gzip files that fit entirely in the cache.
     if (data_offset == 0 and
         uncompressed_data_size < self._UNCOMPRESSED_DATA_CACHE_SIZE):
@@ -209,22 +328,7 @@ class GzipMember(data_format.DataFormat):
       self._cache_start_offset = 0
       self._cache_end_offset = uncompressed_data_size
 
-    # Offset to the beginning of the compressed data in the file object.
-    self._compressed_data_start = compressed_data_offset
-    self._decompressor_state = _GzipDecompressorState(compressed_data_offset)
-
-    # Offset to the start of the member in the parent file object.
-    self.member_start_offset = member_start_offset
-
-    # Offset to the end of the member in the parent file object.
-    self.member_end_offset = member_end_offset
-
-    # Total size of the data in this gzip member after decompression.
-    self.uncompressed_data_size = uncompressed_data_size
-
-    # Offset of the start of the uncompressed data in this member relative to
-    # the whole gzip file's uncompressed data.
-    self.uncompressed_data_offset = uncompressed_data_offset
+    return file_object.get_offset(), uncompressed_data_size
 
   def _ReadMemberHeader(self, file_object):
     """Reads a member header.
@@ -277,16 +381,44 @@ class GzipMember(data_format.DataFormat):
     if member_header.flags & self._FLAG_FHCRC:
       file_object.read(2)
 
+  def _EmptyCache(self):
+    """Empties the cache without changing the decompressor state."""
+    self._cache = b''
+    self._cache_start_offset = None
+    self._cache_end_offset = None
+
+  def _GetAccessPoint(self, uncompressed_offset):
+    """Retrieves the access point nearest before an uncompressed offset.
+
+    Args:
+      uncompressed_offset (int): offset into this member's uncompressed data.
+
+    Returns:
+      _GzipDecompressorState: access point.
+    """
+    access_point_index = bisect.bisect_right(
+        self._access_point_offsets, uncompressed_offset)
+    return self._access_points[max(access_point_index - 1, 0)]
+
+  def _GetAccessPointSize(self, access_point):
+    """Retrieves the estimated memory size of an access point.
+
+    Args:
+      access_point (_GzipDecompressorState): access point.
+
+    Returns:
+      int: estimated number of bytes of memory used by the access point.
+    """
+    # pylint: disable=protected-access
+    return len(access_point._compressed_data) + self._DECOMPRESSOR_STATE_SIZE
+
   def _ResetDecompressorState(self):
     """Resets the state of the internal decompression object."""
-    self._decompressor_state = _GzipDecompressorState(
-        self._compressed_data_start)
+    self._decompressor_state = self._access_points[0].Copy()
 
   def FlushCache(self):
     """Empties the cache that holds cached decompressed data."""
-    self._cache = b''
-    self._cache_start_offset = None
-    self._cache_end_offset = None
+    self._EmptyCache()
     self._ResetDecompressorState()
 
   def GetCacheSize(self):
@@ -295,7 +427,7 @@ class GzipMember(data_format.DataFormat):
     Returns:
       int: number of cached bytes.
     """
-    if not self._cache_start_offset or not self._cache_end_offset:
+    if self._cache_start_offset is None or self._cache_end_offset is None:
       return 0
     return self._cache_end_offset - self._cache_start_offset
 
@@ -339,8 +471,8 @@ class GzipMember(data_format.DataFormat):
     if self._cache_start_offset is None:
       self._LoadDataIntoCache(self._file_object, offset)
 
-    if offset > self._cache_end_offset or offset < self._cache_start_offset:
-      self.FlushCache()
+    if offset >= self._cache_end_offset or offset < self._cache_start_offset:
+      self._EmptyCache()
       self._LoadDataIntoCache(self._file_object, offset)
 
     cache_offset = offset - self._cache_start_offset
@@ -368,9 +500,18 @@ class GzipMember(data_format.DataFormat):
     # Decompression can only be performed from beginning to end of the stream.
     # So, if data before the current position of the decompressor in the stream
     # is required, it's necessary to throw away the current decompression
-    # state and start again.
-    if minimum_offset < self._decompressor_state.uncompressed_offset:
-      self._ResetDecompressorState()
+    # state and continue from the nearest access point before the data. The
+    # nearest access point is also used when it is ahead of the current
+    # position of the decompressor.
+    access_point = self._GetAccessPoint(minimum_offset)
+    if (minimum_offset < self._decompressor_state.uncompressed_offset or
+        access_point.uncompressed_offset >
+        self._decompressor_state.uncompressed_offset):
+      self._decompressor_state = access_point.Copy()
+
+    # The data is joined after the loop to prevent the cached data from being
+    # copied for every decompressed data chunk.
+    cache_data_segments = [self._cache]
 
     while not self.IsCacheFull():
       decompressed_data = self._decompressor_state.Read(file_object)
@@ -379,6 +520,10 @@ class GzipMember(data_format.DataFormat):
       if not decompressed_data:
         break
 
+      # Access points are also recorded here, since they are not recorded
+      # during initialization when the member data size was provided.
+      self._AddAccessPoint(self._decompressor_state)
+
       decompressed_data_length = len(decompressed_data)
       decompressed_end_offset = self._decompressor_state.uncompressed_offset
       decompressed_start_offset = (
@@ -396,7 +541,7 @@ class GzipMember(data_format.DataFormat):
         added_data_start_offset = decompressed_end_offset - data_add_offset
 
       if not self.IsCacheFull() and data_to_add:
-        self._cache = b''.join([self._cache, data_to_add])
+        cache_data_segments.append(data_to_add)
         if self._cache_start_offset is None:
           self._cache_start_offset = added_data_start_offset
         if self._cache_end_offset is None:
@@ -413,3 +558,5 @@ class GzipMember(data_format.DataFormat):
         file_object.seek(seek_offset, os.SEEK_CUR)
         self._ResetDecompressorState()
         break
+
+    self._cache = b''.join(cache_data_segments)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Helper functions to read and write JSON files.
+
+The persistent stores, such as the seek index store, use JSON files that can
+be read and written by multiple processes concurrently. The values stored in
+these JSON files are only used to speed up subsequent processing, therefore
+the stores do not consider failing to read or write a JSON file an error.
+"""
+
+from __future__ import unicode_literals
+
+import json
+import os
+import tempfile
+
+
+def ReadJSONFile(path):
+  """Reads a JSON file that contains an object.
+
+  Args:
+    path (str): path of the JSON file.
+
+  Returns:
+    dict[str, object]: values of the JSON object or None if the file does
+        not exist or does not contain a valid JSON object.
+  """
+  try:
+    with open(path, 'rb') as file_object:
+      data = file_object.read()
+
+    values = json.loads(data.decode('utf-8'))
+
+  except (IOError, OSError, UnicodeDecodeError, ValueError):
+    return None
+
+  if not isinstance(values, dict):
+    return None
+
+  return values
+
+
+def WriteJSONFile(path, values):
+  """Writes a JSON file that contains an object.
+
+  The JSON file is written to a temporary file in the same directory first,
+  which then replaces the JSON file, such that concurrent readers never see
+  a partially written file. The directory is created if it does not exist.
+
+  Args:
+    path (str): path of the JSON file.
+    values (dict[str, object]): values of the JSON object, which must be
+        serializable to JSON.
+
+  Raises:
+    IOError: if the JSON file cannot be written.
+    OSError: if the JSON file cannot be written.
+  """
+  data = json.dumps(values, sort_keys=True)
+
+  directory, filename = os.path.split(path)
+  _, extension = os.path.splitext(filename)
+
+  if directory and not os.path.isdir(directory):
+    os.makedirs(directory)
+
+  file_descriptor, temporary_path = tempfile.mkstemp(
+      dir=directory or None, suffix=extension)
+
+  try:
+    with os.fdopen(file_descriptor, 'wb') as file_object:
+      file_object.write(data.encode('utf-8'))
+
+    if os.path.exists(path) and os.name == 'nt':
+      os.remove(path)
+
+    os.rename(temporary_path, path)
+
+  except (IOError, OSError):
+    if os.path.exists(temporary_path):
+      os.remove(temporary_path)
+    raise
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Persistent seek index store for compressed streams.
+
+The seek index of a compressed stream contains values, such as the size of
+the uncompressed data, that are expensive to determine, since they require
+the compressed stream to be decompressed. The store keeps these values in
+an index file per compressed stream, such that repeated analysis of the same
+compressed data does not need to determine them again.
+"""
+
+from __future__ import unicode_literals
+
+import hashlib
+import os
+
+from dfvfs.lib import errors
+from dfvfs.lib import json_file
+
+
+class SeekIndexStore(object):
+  """Persistent seek index store for compressed streams.
+
+  Index files are stored in a directory and named after a hash of the path
+  specification of the compressed stream. An index file is only used when
+  the size and modification time of the parent file still match those
+  stored in the index file.
+  """
+
+  _FORMAT_VERSION = 1
+
+  _INDEX_FILE_EXTENSION = '.json'
+
+  def __init__(self, path):
+    """Initializes a seek index store.
+
+    Args:
+      path (str): path of the directory that contains the index files.
+    """
+    super(SeekIndexStore, self).__init__()
+    self._path = path
+
+  def _GetIndexFilePath(self, path_spec):
+    """Retrieves the path of the index file of a compressed stream.
+
+    Args:
+      path_spec (PathSpec): path specification of the compressed stream.
+
+    Returns:
+      str: path of the index file.
+    """
+    comparable_hash = hashlib.sha256(path_spec.comparable.encode('utf-8'))
+    file_name = '{0:s}{1:s}'.format(
+        comparable_hash.hexdigest(), self._INDEX_FILE_EXTENSION)
+    return os.path.join(self._path, file_name)
+
+  def _GetParentModificationTime(self, path_spec, resolver_context):
+    """Retrieves the modification time of the parent file.
+
+    Args:
+      path_spec (PathSpec): path specification of the compressed stream.
+      resolver_context (Context): resolver context.
+
+    Returns:
+      str: modification time of the parent file or None if not available.
+    """
+    # Delay the import of the resolver to prevent circular imports.
+    from dfvfs.resolver import resolver
+
+    try:
+      file_entry = resolver.Resolver.OpenFileEntry(
+          path_spec.parent, resolver_context=resolver_context)
+    except (IOError, OSError, errors.Error):
+      return None
+
+    modification_time = getattr(file_entry, 'modification_time', None)
+    if not modification_time:
+      return None
+
+    return modification_time.CopyToDateTimeString()
+
+  def ReadIndex(self, path_spec, parent_file_object, resolver_context):
+    """Reads the seek index of a compressed stream.
+
+    Args:
+      path_spec (PathSpec): path specification of the compressed stream.
+      parent_file_object (FileIO): parent file-like object, that contains
+          the compressed stream.
+      resolver_context (Context): resolver context.
+
+    Returns:
+      dict[str, object]: seek index values or None if no valid index file
+          is available.
+    """
+    index_file_path = self._GetIndexFilePath(path_spec)
+
+    index_file_values = json_file.ReadJSONFile(index_file_path)
+    if not index_file_values:
+      return None
+
+    if (index_file_values.get('format_version', None) !=
+        self._FORMAT_VERSION or
+        index_file_values.get('comparable', None) != path_spec.comparable):
+      return None
+
+    if index_file_values.get('parent_size', None) != (
+        parent_file_object.get_size()):
+      return None
+
+    modification_time = self._GetParentModificationTime(
+        path_spec, resolver_context)
+    if index_file_values.get('parent_modification_time', None) != (
+        modification_time):
+      return None
+
+    return index_file_values.get('index', None)
+
+  def WriteIndex(
+      self, path_spec, parent_file_object, resolver_context, index_values):
+    """Writes the seek index of a compressed stream.
+
+    Args:
+      path_spec (PathSpec): path specification of the compressed stream.
+      parent_file_object (FileIO): parent file-like object, that contains
+          the compressed stream.
+      resolver_context (Context): resolver context.
+      index_values (dict[str, object]): seek index values, which must be
+          serializable to JSON.
+    """
+    index_file_values = {
+        'comparable': path_spec.comparable,
+        'format_version': self._FORMAT_VERSION,
+        'index': index_values,
+        'parent_modification_time': self._GetParentModificationTime(
+            path_spec, resolver_context),
+        'parent_size': parent_file_object.get_size()}
+
+    index_file_path = self._GetIndexFilePath(path_spec)
+
+    try:
+      json_file.WriteJSONFile(index_file_path, index_file_values)
+    except (IOError, OSError):
+      pass
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Helper functions to determine the state of a source file.
+
+The persistent stores, such as the format analysis results store, use the
+size and modification time of the source, which is the outermost parent of
+a path specification, to determine if stored values are still valid.
+"""
+
+from __future__ import unicode_literals
+
+import os
+
+from dfdatetime import posix_time as dfdatetime_posix_time
+
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+
+
+def GetSourceValues(path_spec, resolver_context=None):
+  """Retrieves the values that identify the state of the source.
+
+  The values of a source on the operating system are determined from its
+  stat information, which is cheap compared to opening the source with
+  the resolver.
+
+  Args:
+    path_spec (PathSpec): path specification.
+    resolver_context (Optional[Context]): resolver context, where None
+        represents the built-in context which is not multi process safe.
+
+  Returns:
+    tuple[int, str]: size and modification time of the source, which is
+        the outermost parent of the path specification, where None
+        represents a value that is not available.
+  """
+  source_path_spec = path_spec
+  while source_path_spec.HasParent():
+    source_path_spec = source_path_spec.parent
+
+  if source_path_spec.type_indicator == definitions.TYPE_INDICATOR_OS:
+    location = getattr(source_path_spec, 'location', None)
+    if not location:
+      return None, None
+
+    try:
+      stat_info = os.stat(location)
+    except OSError:
+      return None, None
+
+    modification_time = dfdatetime_posix_time.PosixTime(
+        timestamp=int(stat_info.st_mtime))
+
+    return stat_info.st_size, modification_time.CopyToDateTimeString()
+
+  # Delay the import of the resolver to prevent circular imports.
+  from dfvfs.resolver import resolver
+
+  try:
+    file_entry = resolver.Resolver.OpenFileEntry(
+        source_path_spec, resolver_context=resolver_context)
+  except (IOError, OSError, errors.Error):
+    return None, None
+
+  if not file_entry:
+    return None, None
+
+  stat_object = file_entry.GetStat()
+  size = getattr(stat_object, 'size', None)
+
+  modification_time = getattr(file_entry, 'modification_time', None)
+  if modification_time:
+    modification_time = modification_time.CopyToDateTimeString()
+
+  return size, modification_time or None
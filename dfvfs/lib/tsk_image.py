@@ -3,7 +3,6 @@
 
 from __future__ import unicode_literals
 
-import os
 import pytsk3
 
 
@@ -51,8 +50,7 @@ class TSKFileSystemImage(pytsk3.Img_Info):
     Returns:
       bytes: data read.
     """
-    self._file_object.seek(offset, os.SEEK_SET)
-    return self._file_object.read(size)
+    return self._file_object.read_at(offset, size)
 
   def get_size(self):
     """Retrieves the size."""
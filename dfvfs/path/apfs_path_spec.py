@@ -16,6 +16,8 @@ class APFSPathSpec(path_spec.PathSpec):
     location (str): location.
   """
 
+  __slots__ = ('identifier', 'location')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_APFS
 
   def __init__(
@@ -39,9 +41,12 @@ class APFSPathSpec(path_spec.PathSpec):
     self.identifier = identifier
     self.location = location
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.identifier is not None:
@@ -49,7 +54,7 @@ class APFSPathSpec(path_spec.PathSpec):
     if self.location is not None:
       string_parts.append('location: {0:s}'.format(self.location))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(APFSPathSpec)
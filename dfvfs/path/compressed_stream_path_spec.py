@@ -15,6 +15,8 @@ class CompressedStreamPathSpec(path_spec.PathSpec):
     compression_method (str): method used to the compress the data.
   """
 
+  __slots__ = ('compression_method',)
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_COMPRESSED_STREAM
 
   def __init__(self, compression_method=None, parent=None, **kwargs):
@@ -35,12 +37,14 @@ class CompressedStreamPathSpec(path_spec.PathSpec):
     super(CompressedStreamPathSpec, self).__init__(parent=parent, **kwargs)
     self.compression_method = compression_method
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    sub_comparable_string = (
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return (
         'compression_method: {0:s}').format(self.compression_method)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
 
 
 factory.Factory.RegisterPathSpec(CompressedStreamPathSpec)
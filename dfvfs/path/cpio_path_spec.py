@@ -11,6 +11,8 @@ from dfvfs.path import location_path_spec
 class CPIOPathSpec(location_path_spec.LocationPathSpec):
   """CPIO file path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_CPIO
 
   def __init__(self, location=None, parent=None, **kwargs):
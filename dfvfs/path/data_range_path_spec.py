@@ -16,6 +16,8 @@ class DataRangePathSpec(path_spec.PathSpec):
     range_size (int): size of the data range.
   """
 
+  __slots__ = ('range_offset', 'range_size')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_DATA_RANGE
 
   def __init__(self, parent=None, range_offset=None, range_size=None, **kwargs):
@@ -38,13 +40,15 @@ class DataRangePathSpec(path_spec.PathSpec):
     self.range_offset = range_offset
     self.range_size = range_size
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    sub_comparable_string = (
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return (
         'range_offset: 0x{0:08x}, range_size: 0x{1:08x}').format(
             self.range_offset, self.range_size)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
 
 
 factory.Factory.RegisterPathSpec(DataRangePathSpec)
@@ -15,6 +15,8 @@ class EncodedStreamPathSpec(path_spec.PathSpec):
     encoding_method (str): method used to the encode the data.
   """
 
+  __slots__ = ('encoding_method',)
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_ENCODED_STREAM
 
   def __init__(self, encoding_method=None, parent=None, **kwargs):
@@ -35,12 +37,14 @@ class EncodedStreamPathSpec(path_spec.PathSpec):
     super(EncodedStreamPathSpec, self).__init__(parent=parent, **kwargs)
     self.encoding_method = encoding_method
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    sub_comparable_string = 'encoding_method: {0:s}'.format(
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return 'encoding_method: {0:s}'.format(
         self.encoding_method)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
 
 
 factory.Factory.RegisterPathSpec(EncodedStreamPathSpec)
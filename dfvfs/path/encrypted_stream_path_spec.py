@@ -20,6 +20,9 @@ class EncryptedStreamPathSpec(path_spec.PathSpec):
     key (bytes): key.
   """
 
+  __slots__ = (
+      'cipher_mode', 'encryption_method', 'initialization_vector', 'key')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_ENCRYPTED_STREAM
 
   def __init__(
@@ -48,9 +51,12 @@ class EncryptedStreamPathSpec(path_spec.PathSpec):
     self.initialization_vector = initialization_vector
     self.key = key
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.cipher_mode:
@@ -71,7 +77,7 @@ class EncryptedStreamPathSpec(path_spec.PathSpec):
       key = key.decode('ascii')
       string_parts.append('key: {0:s}'.format(key))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(EncryptedStreamPathSpec)
@@ -11,6 +11,8 @@ from dfvfs.path import path_spec
 class EWFPathSpec(path_spec.PathSpec):
   """EWF image path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_EWF
 
   def __init__(self, parent=None, **kwargs):
@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+import weakref
+
 
 class Factory(object):
   """Path specification factory."""
@@ -34,6 +36,11 @@ class Factory(object):
       'table_name',
       'volume_index'])
 
+  # Interned path specifications by their comparable representation. Weak
+  # references are used so that interned path specifications that are no
+  # longer used are released.
+  _interned_path_specs = weakref.WeakValueDictionary()
+
   _path_spec_types = {}
 
   _system_level_type_indicators = {}
@@ -80,6 +87,46 @@ class Factory(object):
 
     return properties
 
+  @classmethod
+  def InternPathSpec(cls, path_spec):
+    """Interns a path specification.
+
+    Interning makes sure that equal path specifications, including their
+    parents, are represented by a single object. This reduces memory usage
+    when many path specifications are kept that were created with their own
+    but equal parent chain, for example path specifications that were
+    deserialized one at a time. Note that interned path specifications are
+    frozen.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      PathSpec: interned path specification, which is either the path
+          specification itself or an equal path specification that was
+          interned before.
+    """
+    comparable = path_spec.comparable
+
+    interned_path_spec = cls._interned_path_specs.get(comparable, None)
+    if interned_path_spec is not None:
+      return interned_path_spec
+
+    if path_spec.HasParent():
+      parent_path_spec = cls.InternPathSpec(path_spec.parent)
+      if parent_path_spec is not path_spec.parent:
+        # The path specification is frozen hence a new path specification
+        # is created that shares the interned parent.
+        kwargs = {
+            attribute_name: getattr(path_spec, attribute_name)
+            for attribute_name in path_spec.CopyToDict()
+            if attribute_name != 'parent'}
+        path_spec = cls.NewPathSpec(
+            path_spec.type_indicator, parent=parent_path_spec, **kwargs)
+
+    cls._interned_path_specs[comparable] = path_spec
+    return path_spec
+
   @classmethod
   def IsSystemLevelTypeIndicator(cls, type_indicator):
     """Determines if the type indicator is at system-level.
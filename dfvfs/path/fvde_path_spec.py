@@ -17,6 +17,8 @@ class FVDEPathSpec(path_spec.PathSpec):
     recovery_password (str): recovery password.
   """
 
+  __slots__ = ('encrypted_root_plist', 'password', 'recovery_password')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_FVDE
 
   def __init__(
@@ -44,9 +46,12 @@ class FVDEPathSpec(path_spec.PathSpec):
     self.password = password
     self.recovery_password = recovery_password
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.encrypted_root_plist:
@@ -58,7 +63,7 @@ class FVDEPathSpec(path_spec.PathSpec):
       string_parts.append('recovery_password: {0:s}'.format(
           self.recovery_password))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 # Register the path specification with the factory.
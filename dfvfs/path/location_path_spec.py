@@ -13,6 +13,8 @@ class LocationPathSpec(path_spec.PathSpec):
     location (str): location.
   """
 
+  __slots__ = ('location',)
+
   def __init__(self, location=None, parent=None, **kwargs):
     """Initializes a path specification.
 
@@ -29,8 +31,10 @@ class LocationPathSpec(path_spec.PathSpec):
     super(LocationPathSpec, self).__init__(parent=parent, **kwargs)
     self.location = location
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    sub_comparable_string = 'location: {0:s}'.format(self.location)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return 'location: {0:s}'.format(self.location)
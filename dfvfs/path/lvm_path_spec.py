@@ -16,6 +16,8 @@ class LVMPathSpec(path_spec.PathSpec):
     volume_index (int): volume index.
   """
 
+  __slots__ = ('location', 'volume_index')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_LVM
 
   def __init__(self, location=None, parent=None, volume_index=None, **kwargs):
@@ -38,9 +40,12 @@ class LVMPathSpec(path_spec.PathSpec):
     self.location = location
     self.volume_index = volume_index
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.location is not None:
@@ -48,7 +53,7 @@ class LVMPathSpec(path_spec.PathSpec):
     if self.volume_index is not None:
       string_parts.append('volume index: {0:d}'.format(self.volume_index))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(LVMPathSpec)
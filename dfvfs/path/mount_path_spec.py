@@ -15,6 +15,8 @@ class MountPathSpec(path_spec.PathSpec):
     identifier (str): identifier of the mount point.
   """
 
+  __slots__ = ('identifier',)
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_MOUNT
 
   def __init__(self, identifier, **kwargs):
@@ -34,11 +36,13 @@ class MountPathSpec(path_spec.PathSpec):
     super(MountPathSpec, self).__init__(parent=None, **kwargs)
     self.identifier = identifier
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    sub_comparable_string = 'identifier: {0:s}'.format(self.identifier)
-    return self._GetComparable(sub_comparable_string=sub_comparable_string)
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return 'identifier: {0:s}'.format(self.identifier)
 
 
 factory.Factory.RegisterPathSpec(MountPathSpec)
@@ -20,6 +20,8 @@ class NTFSPathSpec(path_spec.PathSpec):
     mft_entry (int): MFT entry, where the first entry is indicated by 0.
   """
 
+  __slots__ = ('data_stream', 'location', 'mft_attribute', 'mft_entry')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_NTFS
 
   def __init__(
@@ -51,9 +53,12 @@ class NTFSPathSpec(path_spec.PathSpec):
     self.mft_attribute = mft_attribute
     self.mft_entry = mft_entry
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.data_stream:
@@ -65,7 +70,7 @@ class NTFSPathSpec(path_spec.PathSpec):
     if self.mft_entry is not None:
       string_parts.append('MFT entry: {0:d}'.format(self.mft_entry))
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(NTFSPathSpec)
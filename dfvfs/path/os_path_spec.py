@@ -13,6 +13,8 @@ from dfvfs.path import location_path_spec
 class OSPathSpec(location_path_spec.LocationPathSpec):
   """Operating system path specification."""
 
+  __slots__ = ()
+
   _IS_SYSTEM_LEVEL = True
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_OS
 
@@ -9,12 +9,18 @@ from dfvfs.lib import definitions
 class PathSpec(object):
   """Path specification interface.
 
+  A path specification is frozen once its comparable representation has been
+  determined, for example when it is used as a cache key, to allow the
+  comparable representation to be determined only once.
+
   Attributes:
     parent (PathSpec): parent path specification.
   """
 
   # pylint: disable=missing-raises-doc
 
+  __slots__ = ('__weakref__', '_comparable', 'parent')
+
   _IS_SYSTEM_LEVEL = False
 
   def __init__(self, parent=None, **kwargs):
@@ -34,6 +40,7 @@ class PathSpec(object):
           ', '.join(kwargs)))
 
     super(PathSpec, self).__init__()
+    self._comparable = None
     self.parent = parent
 
     if not getattr(self, 'TYPE_INDICATOR', None):
@@ -43,10 +50,65 @@ class PathSpec(object):
     """Determines if the path specification is equal to the other."""
     return isinstance(other, PathSpec) and self.comparable == other.comparable
 
+  def __getstate__(self):
+    """Retrieves the state of the path specification for pickling.
+
+    Returns:
+      dict[str, object]: attribute values of the path specification.
+    """
+    return {
+        attribute_name: getattr(self, attribute_name, None)
+        for attribute_name in self._GetAttributeNames()}
+
   def __hash__(self):
     """Returns the hash of a path specification."""
     return hash(self.comparable)
 
+  def __setattr__(self, name, value):
+    """Sets an attribute of the path specification.
+
+    Args:
+      name (str): name of the attribute.
+      value (object): value of the attribute.
+
+    Raises:
+      AttributeError: if the path specification is frozen.
+    """
+    if getattr(self, '_comparable', None) is not None:
+      raise AttributeError(
+          'Unable to set attribute: {0:s} of frozen path specification.'.format(
+              name))
+
+    super(PathSpec, self).__setattr__(name, value)
+
+  def __setstate__(self, state):
+    """Sets the state of the path specification when unpickling.
+
+    Args:
+      state (dict[str, object]): attribute values of the path specification.
+    """
+    self._comparable = None
+    for attribute_name, attribute_value in iter(state.items()):
+      setattr(self, attribute_name, attribute_value)
+
+  def _GetAttributeNames(self):
+    """Retrieves the names of the public attributes.
+
+    Returns:
+      list[str]: names of the public attributes.
+    """
+    attribute_names = set()
+    for path_spec_type in type(self).__mro__:
+      attribute_names.update(path_spec_type.__dict__.get('__slots__', ()))
+
+    # Path specifications that do not define __slots__ store their
+    # attributes in __dict__.
+    attribute_names.update(getattr(self, '__dict__', {}))
+
+    return sorted(
+        attribute_name for attribute_name in attribute_names
+        if not attribute_name.startswith('_'))
+
   def _GetComparable(self, sub_comparable_string=''):
     """Retrieves the comparable representation.
 
@@ -69,10 +131,27 @@ class PathSpec(object):
 
     return ''.join(string_parts)
 
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return ''
+
   @property
   def comparable(self):
     """str: comparable representation of the path specification."""
-    return self._GetComparable()
+    comparable = self._comparable
+    if comparable is None:
+      comparable = self._GetComparable(
+          sub_comparable_string=self._GetSubComparableString())
+
+      # Set the comparable representation directly since the path
+      # specification is frozen from this point onwards.
+      super(PathSpec, self).__setattr__('_comparable', comparable)
+
+    return comparable
 
   @property
   def type_indicator(self):
@@ -87,7 +166,8 @@ class PathSpec(object):
       dict[str, object]: path specification attributes.
     """
     path_spec_dict = {}
-    for attribute_name, attribute_value in iter(self.__dict__.items()):
+    for attribute_name in self._GetAttributeNames():
+      attribute_value = getattr(self, attribute_name, None)
       if attribute_value is None:
         continue
 
@@ -11,6 +11,8 @@ from dfvfs.path import path_spec
 class VHDIPathSpec(path_spec.PathSpec):
   """VHD image path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_VHDI
 
   def __init__(self, parent=None, **kwargs):
@@ -11,6 +11,8 @@ from dfvfs.path import path_spec
 class VMDKPathSpec(path_spec.PathSpec):
   """VMDK image path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_VMDK
 
   def __init__(self, parent=None, **kwargs):
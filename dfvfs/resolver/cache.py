@@ -3,9 +3,178 @@
 
 from __future__ import unicode_literals
 
+import collections
+
 from dfvfs.lib import errors
 
 
+class BlockCacheStatistics(object):
+  """Resolver block cache statistics.
+
+  Attributes:
+    cache_size (int): size, in bytes, of the cached blocks.
+    number_of_evictions (int): number of cached blocks that were evicted
+        to make room for new blocks.
+    number_of_hits (int): number of lookups that returned a cached block.
+    number_of_misses (int): number of lookups of blocks that were not found
+        in the cache.
+  """
+
+  def __init__(self):
+    """Initializes resolver block cache statistics."""
+    super(BlockCacheStatistics, self).__init__()
+    self.cache_size = 0
+    self.number_of_evictions = 0
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+
+  @property
+  def hit_rate(self):
+    """float: fraction of the lookups that returned a cached block."""
+    number_of_lookups = self.number_of_hits + self.number_of_misses
+    if not number_of_lookups:
+      return 0.0
+
+    return float(self.number_of_hits) / number_of_lookups
+
+
+class BlockCache(object):
+  """Resolver block cache.
+
+  The block cache contains fixed-size blocks of data read from file-like
+  objects, such that repeated small reads, for example of file system
+  metadata, do not need to be decoded by the file-like objects again. Blocks
+  are identified by an identifier of the file-like object and the offset of
+  the block. When the maximum cache size is exceeded, the least recently
+  used blocks are evicted.
+  """
+
+  def __init__(self, maximum_cache_size, block_size=4096):
+    """Initializes the resolver block cache object.
+
+    Args:
+      maximum_cache_size (int): maximum size, in bytes, of the cached blocks.
+      block_size (Optional[int]): size, in bytes, of a block.
+
+    Raises:
+      ValueError: when the maximum cache size or block size is 0 or less.
+    """
+    if maximum_cache_size <= 0:
+      raise ValueError('Invalid maximum cache size value zero or less.')
+
+    if block_size <= 0:
+      raise ValueError('Invalid block size value zero or less.')
+
+    super(BlockCache, self).__init__()
+    self._block_size = block_size
+    self._cache_size = 0
+    self._maximum_cache_size = maximum_cache_size
+    self._number_of_evictions = 0
+    self._number_of_hits = 0
+    self._number_of_misses = 0
+    # The least recently used block is stored first.
+    self._blocks = collections.OrderedDict()
+
+  @property
+  def block_size(self):
+    """int: size, in bytes, of a block."""
+    return self._block_size
+
+  def _EvictBlocks(self, maximum_cache_size):
+    """Evicts least recently used blocks.
+
+    Args:
+      maximum_cache_size (int): maximum size, in bytes, of the cached blocks
+          that should remain after eviction.
+    """
+    while self._blocks and self._cache_size > maximum_cache_size:
+      _, block_data = self._blocks.popitem(last=False)
+      self._cache_size -= len(block_data)
+      self._number_of_evictions += 1
+
+  def CacheBlock(self, identifier, block_offset, block_data):
+    """Caches a block.
+
+    If the maximum cache size is exceeded the least recently used blocks
+    are evicted.
+
+    Args:
+      identifier (str): identifier of the file-like object that contains
+          the block.
+      block_offset (int): offset of the block, which should be a multiple
+          of the block size.
+      block_data (bytes): data of the block.
+    """
+    key = (identifier, block_offset)
+    cached_block_data = self._blocks.pop(key, None)
+    if cached_block_data is not None:
+      self._cache_size -= len(cached_block_data)
+
+    self._blocks[key] = block_data
+    self._cache_size += len(block_data)
+
+    self._EvictBlocks(self._maximum_cache_size)
+
+  def Empty(self):
+    """Empties the cache."""
+    self._blocks.clear()
+    self._cache_size = 0
+
+  def GetBlock(self, identifier, block_offset):
+    """Retrieves a cached block.
+
+    Args:
+      identifier (str): identifier of the file-like object that contains
+          the block.
+      block_offset (int): offset of the block.
+
+    Returns:
+      bytes: data of the block or None if not cached.
+    """
+    key = (identifier, block_offset)
+    block_data = self._blocks.pop(key, None)
+    if block_data is None:
+      self._number_of_misses += 1
+      return None
+
+    # Mark the block as most recently used.
+    self._blocks[key] = block_data
+    self._number_of_hits += 1
+
+    return block_data
+
+  def GetStatistics(self):
+    """Retrieves the cache statistics.
+
+    Returns:
+      BlockCacheStatistics: cache statistics.
+    """
+    statistics = BlockCacheStatistics()
+    statistics.cache_size = self._cache_size
+    statistics.number_of_evictions = self._number_of_evictions
+    statistics.number_of_hits = self._number_of_hits
+    statistics.number_of_misses = self._number_of_misses
+    return statistics
+
+  def SetMaximumCacheSize(self, maximum_cache_size):
+    """Sets the maximum cache size.
+
+    Least recently used blocks are evicted when more blocks are cached than
+    the new maximum allows.
+
+    Args:
+      maximum_cache_size (int): maximum size, in bytes, of the cached blocks.
+
+    Raises:
+      ValueError: when the maximum cache size is 0 or less.
+    """
+    if maximum_cache_size <= 0:
+      raise ValueError('Invalid maximum cache size value zero or less.')
+
+    self._maximum_cache_size = maximum_cache_size
+    self._EvictBlocks(maximum_cache_size)
+
+
 class ObjectsCacheValue(object):
   """Resolver object cache value."""
 
@@ -44,14 +213,46 @@ class ObjectsCacheValue(object):
     return self._reference_count == 0
 
 
+class ObjectsCacheStatistics(object):
+  """Resolver objects cache statistics.
+
+  Attributes:
+    number_of_evictions (int): number of cached values that were evicted
+        to make room for new values.
+    number_of_hits (int): number of lookups that returned a cached object.
+    number_of_misses (int): number of objects that needed to be cached
+        because they were not found in the cache.
+  """
+
+  def __init__(self):
+    """Initializes resolver objects cache statistics."""
+    super(ObjectsCacheStatistics, self).__init__()
+    self.number_of_evictions = 0
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+
+
 class ObjectsCache(object):
-  """Resolver object cache."""
+  """Resolver object cache.
+
+  The cache keeps track of the order in which the cached values were used.
+  When the maximum number of cached values is reached, the least recently
+  used value that is no longer referenced is evicted.
+  """
 
-  def __init__(self, maximum_number_of_cached_values):
+  def __init__(
+      self, maximum_number_of_cached_values, eviction_callback=None,
+      eviction_filter=None):
     """Initializes the resolver objects cache object.
 
     Args:
       maximum_number_of_cached_values (int): maximum number of cached values.
+      eviction_callback (Optional[function]): function that is called with
+          the VFS object of an evicted cache value, for example to close it.
+      eviction_filter (Optional[function]): function that is called with
+          the identifier of a dereferenced cache value and returns True if
+          the value can be evicted, where None represents that all
+          dereferenced values can be evicted.
 
     Raises:
       ValueError: when the maximum number of cached objects is 0 or less.
@@ -61,38 +262,115 @@ class ObjectsCache(object):
           'Invalid maximum number of cached objects value zero or less.')
 
     super(ObjectsCache, self).__init__()
+    self._eviction_callback = eviction_callback
+    self._eviction_filter = eviction_filter
+    # Identifiers of the cached values by the identity of their VFS object.
+    self._identifiers_by_object_identity = {}
     self._maximum_number_of_cached_values = maximum_number_of_cached_values
-    self._values = {}
+    self._number_of_evictions = 0
+    self._number_of_hits = 0
+    self._number_of_misses = 0
+    # The least recently used value is stored first.
+    self._values = collections.OrderedDict()
+
+  def _EvictDereferencedObjects(self, maximum_number_of_cached_values):
+    """Evicts least recently used dereferenced objects.
+
+    Args:
+      maximum_number_of_cached_values (int): maximum number of cached values
+          that should remain after eviction.
+    """
+    number_of_values_to_evict = (
+        len(self._values) - maximum_number_of_cached_values)
+    if number_of_values_to_evict <= 0:
+      return
+
+    identifiers = [
+        identifier for identifier, cache_value in self._values.items()
+        if cache_value.IsDereferenced() and (
+            not self._eviction_filter or self._eviction_filter(identifier))]
+
+    for identifier in identifiers[:number_of_values_to_evict]:
+      self._EvictObject(identifier)
+
+  def _EvictObject(self, identifier):
+    """Evicts a cached object.
+
+    Args:
+      identifier (str): VFS object identifier.
+    """
+    cache_value = self._values.pop(identifier)
+    self._identifiers_by_object_identity.pop(id(cache_value.vfs_object), None)
+    self._number_of_evictions += 1
+
+    if self._eviction_callback:
+      self._eviction_callback(cache_value.vfs_object)
+
+  def _MarkAsRecentlyUsed(self, identifier):
+    """Marks a cached value as most recently used.
+
+    Args:
+      identifier (str): VFS object identifier.
+    """
+    cache_value = self._values.pop(identifier)
+    self._values[identifier] = cache_value
 
   def CacheObject(self, identifier, vfs_object):
     """Caches a VFS object.
 
-    This method ignores the cache value reference count.
+    This method ignores the cache value reference count. If the maximum
+    number of cached values is reached the least recently used dereferenced
+    value is evicted.
 
     Args:
       identifier (str): VFS object identifier.
       vfs_object (object): VFS object to cache.
 
     Raises:
-      CacheFullError: if he maximum number of cached values is reached.
+      CacheFullError: if he maximum number of cached values is reached and
+          all cached values are still referenced.
       KeyError: if the VFS object already is cached.
     """
     if identifier in self._values:
       raise KeyError('Object already cached for identifier: {0:s}'.format(
           identifier))
 
-    if len(self._values) == self._maximum_number_of_cached_values:
+    self._EvictDereferencedObjects(self._maximum_number_of_cached_values - 1)
+
+    if len(self._values) >= self._maximum_number_of_cached_values:
       raise errors.CacheFullError('Maximum number of cached values reached.')
 
     self._values[identifier] = ObjectsCacheValue(vfs_object)
+    self._identifiers_by_object_identity[id(vfs_object)] = identifier
+    self._number_of_misses += 1
 
   def Empty(self):
     """Empties the cache.
 
     This method ignores the cache value reference count.
     """
+    self._identifiers_by_object_identity.clear()
     self._values.clear()
 
+  def EvictDereferencedObjects(self):
+    """Evicts all dereferenced objects.
+
+    This method ignores the eviction filter. Evicting an object can
+    dereference other objects, for example the parent file-like object of
+    a file-like object, which are evicted by a subsequent call.
+
+    Returns:
+      int: number of evicted values.
+    """
+    identifiers = [
+        identifier for identifier, cache_value in self._values.items()
+        if cache_value.IsDereferenced()]
+
+    for identifier in identifiers:
+      self._EvictObject(identifier)
+
+    return len(identifiers)
+
   def GetCacheValue(self, identifier):
     """Retrieves the cache value based on the identifier.
 
@@ -120,14 +398,16 @@ class ObjectsCache(object):
     Raises:
       RuntimeError: if the cache value is missing.
     """
-    for identifier, cache_value in iter(self._values.items()):
-      if not cache_value:
-        raise RuntimeError('Missing cache value.')
+    identifier = self._identifiers_by_object_identity.get(
+        id(vfs_object), None)
+    if identifier is None:
+      return None, None
 
-      if cache_value.vfs_object == vfs_object:
-        return identifier, cache_value
+    cache_value = self._values.get(identifier, None)
+    if not cache_value:
+      raise RuntimeError('Missing cache value.')
 
-    return None, None
+    return identifier, cache_value
 
   def GetObject(self, identifier):
     """Retrieves a cached object based on the identifier.
@@ -144,8 +424,23 @@ class ObjectsCache(object):
     if not cache_value:
       return None
 
+    self._MarkAsRecentlyUsed(identifier)
+    self._number_of_hits += 1
+
     return cache_value.vfs_object
 
+  def GetStatistics(self):
+    """Retrieves the cache statistics.
+
+    Returns:
+      ObjectsCacheStatistics: cache statistics.
+    """
+    statistics = ObjectsCacheStatistics()
+    statistics.number_of_evictions = self._number_of_evictions
+    statistics.number_of_hits = self._number_of_hits
+    statistics.number_of_misses = self._number_of_misses
+    return statistics
+
   def GrabObject(self, identifier):
     """Grabs a cached object based on the identifier.
 
@@ -167,6 +462,7 @@ class ObjectsCache(object):
       raise RuntimeError('Missing cache value for identifier: {0:s}'.format(
           identifier))
 
+    self._MarkAsRecentlyUsed(identifier)
     cache_value.IncrementReferenceCount()
 
   def ReleaseObject(self, identifier):
@@ -207,11 +503,15 @@ class ObjectsCache(object):
       raise KeyError('Missing cached object for identifier: {0:s}'.format(
           identifier))
 
-    del self._values[identifier]
+    cache_value = self._values.pop(identifier)
+    self._identifiers_by_object_identity.pop(id(cache_value.vfs_object), None)
 
   def SetMaximumNumberOfCachedValues(self, maximum_number_of_cached_values):
     """Sets the maximum number of cached values.
 
+    Least recently used dereferenced values are evicted when more values
+    are cached than the new maximum allows.
+
     Args:
       maximum_number_of_cached_values (int): maximum number of cached values.
 
@@ -223,3 +523,4 @@ class ObjectsCache(object):
           'Invalid maximum number of cached objects value zero or less.')
 
     self._maximum_number_of_cached_values = maximum_number_of_cached_values
+    self._EvictDereferencedObjects(maximum_number_of_cached_values)
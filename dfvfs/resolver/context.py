@@ -3,28 +3,129 @@
 
 from __future__ import unicode_literals
 
+import threading
+
+from dfvfs.lib import definitions
 from dfvfs.resolver import cache
 
 
 class Context(object):
-  """Resolver context."""
+  """Resolver context.
+
+  File-like and file system objects are cached in the context. Objects that
+  are no longer referenced remain open in the cache, such that they can be
+  reused when the same path specification is opened again. When a cache is
+  full the least recently used objects that are no longer referenced are
+  closed and evicted.
+
+  Optionally blocks of data read from file-like objects are cached in the
+  context, such that the file-like objects that decode storage media images
+  do not need to decode the same data again for repeated small reads.
+
+  The context also defines the maximum size of the read-ahead requests that
+  file-like objects issue when they detect sequential reads, and the method
+  used to access operating system files. Read-ahead is disabled by default,
+  since it only benefits callers that read files sequentially in small
+  buffers, and can be enabled with SetMaximumReadAheadSize.
+  """
+
+  _OS_FILE_ACCESS_METHODS = frozenset([
+      definitions.OS_FILE_ACCESS_METHOD_MMAP,
+      definitions.OS_FILE_ACCESS_METHOD_PREAD,
+      definitions.OS_FILE_ACCESS_METHOD_READ])
 
   def __init__(
-      self, maximum_number_of_file_objects=128,
-      maximum_number_of_file_systems=16):
+      self, maximum_block_cache_size=0, maximum_number_of_file_objects=128,
+      maximum_number_of_file_systems=16, maximum_read_ahead_size=0,
+      os_file_access_method=definitions.OS_FILE_ACCESS_METHOD_READ):
     """Initializes the resolver context object.
 
     Args:
+      maximum_block_cache_size (Optional[int]): maximum size, in bytes, of
+          the blocks of data cached in the context, where 0 represents that
+          the block cache is disabled.
       maximum_number_of_file_objects (Optional[int]): maximum number
           of file-like objects cached in the context.
       maximum_number_of_file_systems (Optional[int]): maximum number
           of file system objects cached in the context.
+      maximum_read_ahead_size (Optional[int]): maximum size, in bytes, of
+          a read-ahead request, where 0 represents that read-ahead is
+          disabled.
+      os_file_access_method (Optional[str]): method used to access operating
+          system files.
+
+    Raises:
+      ValueError: if the operating system file access method is not
+          supported.
     """
+    if os_file_access_method not in self._OS_FILE_ACCESS_METHODS:
+      raise ValueError('Unsupported OS file access method: {0!s}'.format(
+          os_file_access_method))
+
     super(Context, self).__init__()
+    self._block_cache = None
+    if maximum_block_cache_size > 0:
+      self._block_cache = cache.BlockCache(maximum_block_cache_size)
+
+    self._maximum_read_ahead_size = max(maximum_read_ahead_size, 0)
+    self._os_file_access_method = os_file_access_method
+
     self._file_object_cache = cache.ObjectsCache(
-        maximum_number_of_file_objects)
+        maximum_number_of_file_objects,
+        eviction_callback=self._CloseEvictedFileObject)
     self._file_system_cache = cache.ObjectsCache(
-        maximum_number_of_file_systems)
+        maximum_number_of_file_systems,
+        eviction_callback=self._CloseEvictedFileSystem)
+
+  # pylint: disable=protected-access
+
+  def _CloseEvictedFileObject(self, file_object):
+    """Closes a file-like object that was evicted from the cache.
+
+    Args:
+      file_object (FileIO): file-like object.
+    """
+    # The file-like object is no longer cached hence close will not try
+    # to release it from the context.
+    file_object._is_cached = False
+    if file_object._is_open:
+      file_object.close()
+
+  def _CloseEvictedFileSystem(self, file_system):
+    """Closes a file system object that was evicted from the cache.
+
+    Args:
+      file_system (FileSystem): file system object.
+    """
+    # The file system object is no longer cached hence close will not try
+    # to release it from the context.
+    file_system._is_cached = False
+    if file_system._is_open:
+      file_system.Close()
+
+  # pylint: enable=protected-access
+
+  def _GetBlockCacheIdentifier(self, path_spec):
+    """Determines the block cache identifier for the path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      str: identifier of the file-like object that contains the block.
+    """
+    return path_spec.comparable
+
+  def _GetFileObjectCacheIdentifier(self, path_spec):
+    """Determines the file-like object cache identifier for the path spec.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      str: identifier of the VFS object.
+    """
+    return path_spec.comparable
 
   def _GetFileSystemCacheIdentifier(self, path_spec):
     """Determines the file system cache identifier for the path specification.
@@ -42,6 +143,19 @@ class Context(object):
 
     return ''.join(string_parts)
 
+  def CacheBlock(self, path_spec, block_offset, block_data):
+    """Caches a block of data of a file-like object.
+
+    Args:
+      path_spec (PathSpec): path specification of the file-like object.
+      block_offset (int): offset of the block, which should be a multiple
+          of the block size.
+      block_data (bytes): data of the block.
+    """
+    if self._block_cache:
+      identifier = self._GetBlockCacheIdentifier(path_spec)
+      self._block_cache.CacheBlock(identifier, block_offset, block_data)
+
   def CacheFileObject(self, path_spec, file_object):
     """Caches a file-like object based on a path specification.
 
@@ -49,7 +163,8 @@ class Context(object):
       path_spec (PathSpec): path specification.
       file_object (FileIO): file-like object.
     """
-    self._file_object_cache.CacheObject(path_spec.comparable, file_object)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    self._file_object_cache.CacheObject(identifier, file_object)
 
   def CacheFileSystem(self, path_spec, file_system):
     """Caches a file system object based on a path specification.
@@ -62,10 +177,62 @@ class Context(object):
     self._file_system_cache.CacheObject(identifier, file_system)
 
   def Empty(self):
-    """Empties the caches."""
+    """Empties the caches.
+
+    The objects that are no longer referenced are closed.
+    """
+    if self._block_cache:
+      self._block_cache.Empty()
+
+    # Closing a file system can dereference file-like objects and closing
+    # a file-like object can dereference file systems.
+    number_of_evicted_objects = 1
+    while number_of_evicted_objects:
+      number_of_evicted_objects = (
+          self._file_system_cache.EvictDereferencedObjects() +
+          self._file_object_cache.EvictDereferencedObjects())
+
     self._file_object_cache.Empty()
     self._file_system_cache.Empty()
 
+  def EvictFileObject(self, file_object):
+    """Evicts a cached file-like object that is no longer referenced.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    Returns:
+      bool: True if the file-like object was evicted.
+    """
+    identifier, cache_value = self._file_object_cache.GetCacheValueByObject(
+        file_object)
+    if not identifier or not cache_value.IsDereferenced():
+      return False
+
+    self._file_object_cache.RemoveObject(identifier)
+    self._CloseEvictedFileObject(file_object)
+
+    return True
+
+  def EvictFileSystem(self, file_system):
+    """Evicts a cached file system object that is no longer referenced.
+
+    Args:
+      file_system (FileSystem): file system object.
+
+    Returns:
+      bool: True if the file system object was evicted.
+    """
+    identifier, cache_value = self._file_system_cache.GetCacheValueByObject(
+        file_system)
+    if not identifier or not cache_value.IsDereferenced():
+      return False
+
+    self._file_system_cache.RemoveObject(identifier)
+    self._CloseEvictedFileSystem(file_system)
+
+    return True
+
   def ForceRemoveFileObject(self, path_spec):
     """Forces the removal of a file-like object based on a path specification.
 
@@ -75,15 +242,57 @@ class Context(object):
     Returns:
       bool: True if the file-like object was cached.
     """
-    cache_value = self._file_object_cache.GetCacheValue(path_spec.comparable)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    cache_value = self._file_object_cache.GetCacheValue(identifier)
     if not cache_value:
       return False
 
     while not cache_value.IsDereferenced():
       cache_value.vfs_object.close()
 
+    self.EvictFileObject(cache_value.vfs_object)
+
     return True
 
+  def GetBlock(self, path_spec, block_offset):
+    """Retrieves a cached block of data of a file-like object.
+
+    Args:
+      path_spec (PathSpec): path specification of the file-like object.
+      block_offset (int): offset of the block.
+
+    Returns:
+      bytes: data of the block or None if not cached.
+    """
+    if not self._block_cache:
+      return None
+
+    identifier = self._GetBlockCacheIdentifier(path_spec)
+    return self._block_cache.GetBlock(identifier, block_offset)
+
+  def GetBlockCacheStatistics(self):
+    """Retrieves the block cache statistics.
+
+    Returns:
+      BlockCacheStatistics: hit, miss and eviction counters and size of
+          the block cache or None if the block cache is disabled.
+    """
+    if not self._block_cache:
+      return None
+
+    return self._block_cache.GetStatistics()
+
+  def GetBlockSize(self):
+    """Retrieves the size of the blocks in the block cache.
+
+    Returns:
+      int: size, in bytes, of a block or None if the block cache is disabled.
+    """
+    if not self._block_cache:
+      return None
+
+    return self._block_cache.block_size
+
   def GetFileObject(self, path_spec):
     """Retrieves a file-like object defined by path specification.
 
@@ -93,7 +302,17 @@ class Context(object):
     Returns:
       FileIO: a file-like object or None if not cached.
     """
-    return self._file_object_cache.GetObject(path_spec.comparable)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    return self._file_object_cache.GetObject(identifier)
+
+  def GetFileObjectCacheStatistics(self):
+    """Retrieves the file-like object cache statistics.
+
+    Returns:
+      ObjectsCacheStatistics: hit, miss and eviction counters of the
+          file-like object cache.
+    """
+    return self._file_object_cache.GetStatistics()
 
   def GetFileObjectReferenceCount(self, path_spec):
     """Retrieves the reference count of a cached file-like object.
@@ -105,7 +324,8 @@ class Context(object):
       int: reference count or None if there is no file-like object for
           the corresponding path specification cached.
     """
-    cache_value = self._file_object_cache.GetCacheValue(path_spec.comparable)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    cache_value = self._file_object_cache.GetCacheValue(identifier)
     if not cache_value:
       return None
 
@@ -123,6 +343,15 @@ class Context(object):
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
     return self._file_system_cache.GetObject(identifier)
 
+  def GetFileSystemCacheStatistics(self):
+    """Retrieves the file system object cache statistics.
+
+    Returns:
+      ObjectsCacheStatistics: hit, miss and eviction counters of the
+          file system object cache.
+    """
+    return self._file_system_cache.GetStatistics()
+
   def GetFileSystemReferenceCount(self, path_spec):
     """Retrieves the reference count of a cached file system object.
 
@@ -140,13 +369,31 @@ class Context(object):
 
     return cache_value.reference_count
 
+  def GetMaximumReadAheadSize(self):
+    """Retrieves the maximum size of a read-ahead request.
+
+    Returns:
+      int: maximum size, in bytes, of a read-ahead request, where 0 represents
+          that read-ahead is disabled.
+    """
+    return self._maximum_read_ahead_size
+
+  def GetOSFileAccessMethod(self):
+    """Retrieves the method used to access operating system files.
+
+    Returns:
+      str: method used to access operating system files.
+    """
+    return self._os_file_access_method
+
   def GrabFileObject(self, path_spec):
     """Grabs a cached file-like object defined by path specification.
 
     Args:
       path_spec (PathSpec): path specification.
     """
-    self._file_object_cache.GrabObject(path_spec.comparable)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    self._file_object_cache.GrabObject(identifier)
 
   def GrabFileSystem(self, path_spec):
     """Grabs a cached file system object defined by path specification.
@@ -157,14 +404,82 @@ class Context(object):
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
     self._file_system_cache.GrabObject(identifier)
 
+  def IsFileObjectReferenced(self, file_object):
+    """Determines if a cached file-like object is referenced.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    Returns:
+      bool: True if the file-like object is cached and referenced.
+    """
+    _, cache_value = self._file_object_cache.GetCacheValueByObject(
+        file_object)
+    return bool(cache_value and not cache_value.IsDereferenced())
+
+  def IsFileSystemReferenced(self, file_system):
+    """Determines if a cached file system object is referenced.
+
+    Args:
+      file_system (FileSystem): file system object.
+
+    Returns:
+      bool: True if the file system object is cached and referenced.
+    """
+    _, cache_value = self._file_system_cache.GetCacheValueByObject(
+        file_system)
+    return bool(cache_value and not cache_value.IsDereferenced())
+
+  def PeekFileObject(self, path_spec):
+    """Retrieves a cached file-like object without using it.
+
+    Unlike GetFileObject the lookup is not counted in the cache statistics
+    and does not mark the file-like object as recently used.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileIO: a file-like object or None if not cached.
+    """
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    cache_value = self._file_object_cache.GetCacheValue(identifier)
+    if not cache_value:
+      return None
+
+    return cache_value.vfs_object
+
+  def PeekFileSystem(self, path_spec):
+    """Retrieves a cached file system object without using it.
+
+    Unlike GetFileSystem the lookup is not counted in the cache statistics
+    and does not mark the file system object as recently used.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileSystem: a file system object or None if not cached.
+    """
+    identifier = self._GetFileSystemCacheIdentifier(path_spec)
+    cache_value = self._file_system_cache.GetCacheValue(identifier)
+    if not cache_value:
+      return None
+
+    return cache_value.vfs_object
+
   def ReleaseFileObject(self, file_object):
     """Releases a cached file-like object.
 
     Args:
       file_object (FileIO): file-like object.
 
+    A file-like object that is no longer referenced remains open in the cache
+    until it is evicted, which closes it.
+
     Returns:
-      bool: True if the file-like object can be closed.
+      bool: True if the file-like object can be closed, which is only the case
+          when it is not cached.
 
     Raises:
       PathSpecError: if the path specification is incorrect.
@@ -182,11 +497,7 @@ class Context(object):
 
     self._file_object_cache.ReleaseObject(identifier)
 
-    result = cache_value.IsDereferenced()
-    if result:
-      self._file_object_cache.RemoveObject(identifier)
-
-    return result
+    return False
 
   def ReleaseFileSystem(self, file_system):
     """Releases a cached file system object.
@@ -194,8 +505,12 @@ class Context(object):
     Args:
       file_system (FileSystem): file system object.
 
+    A file system object that is no longer referenced remains open in the cache
+    until it is evicted, which closes it.
+
     Returns:
-      bool: True if the file system object can be closed.
+      bool: True if the file system object can be closed, which is only the case
+          when it is not cached.
 
     Raises:
       PathSpecError: if the path specification is incorrect.
@@ -213,11 +528,24 @@ class Context(object):
 
     self._file_system_cache.ReleaseObject(identifier)
 
-    result = cache_value.IsDereferenced()
-    if result:
-      self._file_system_cache.RemoveObject(identifier)
+    return False
+
+  def SetMaximumBlockCacheSize(self, maximum_block_cache_size):
+    """Sets the maximum size of the cached blocks.
+
+    Args:
+      maximum_block_cache_size (int): maximum size, in bytes, of the blocks
+          of data cached in the context, where 0 represents that the block
+          cache is disabled.
+    """
+    if maximum_block_cache_size <= 0:
+      self._block_cache = None
+
+    elif not self._block_cache:
+      self._block_cache = cache.BlockCache(maximum_block_cache_size)
 
-    return result
+    else:
+      self._block_cache.SetMaximumCacheSize(maximum_block_cache_size)
 
   def SetMaximumNumberOfFileObjects(self, maximum_number_of_file_objects):
     """Sets the maximum number of cached file-like objects.
@@ -238,3 +566,594 @@ class Context(object):
     """
     self._file_system_cache.SetMaximumNumberOfCachedValues(
         maximum_number_of_file_systems)
+
+  def SetMaximumReadAheadSize(self, maximum_read_ahead_size):
+    """Sets the maximum size of a read-ahead request.
+
+    Args:
+      maximum_read_ahead_size (int): maximum size, in bytes, of a read-ahead
+          request, where 0 represents that read-ahead is disabled.
+    """
+    self._maximum_read_ahead_size = max(maximum_read_ahead_size, 0)
+
+  def SetOSFileAccessMethod(self, os_file_access_method):
+    """Sets the method used to access operating system files.
+
+    The method applies to operating system files opened afterwards.
+
+    Args:
+      os_file_access_method (str): method used to access operating system
+          files.
+
+    Raises:
+      ValueError: if the operating system file access method is not
+          supported.
+    """
+    if os_file_access_method not in self._OS_FILE_ACCESS_METHODS:
+      raise ValueError('Unsupported OS file access method: {0!s}'.format(
+          os_file_access_method))
+
+    self._os_file_access_method = os_file_access_method
+
+
+class ThreadSafeContext(Context):
+  """Thread-safe resolver context.
+
+  The file-like object and file system caches are each protected by their
+  own lock. Since a file-like object has a single current offset, and file
+  systems read from their parent file-like object, every thread is handed
+  its own file-like and file system objects for the same path specification.
+  The maximum number of cached objects applies to all threads combined.
+
+  A dereferenced object can be evicted by any thread, except when a thread
+  has retrieved it and is about to grab it. Evicted objects are closed after
+  the lock has been released, because closing an object can release its
+  parent objects from the context.
+
+  Cached blocks of data are shared by all threads, since the data of
+  a file-like object does not depend on the thread that read it.
+  """
+
+  def __init__(
+      self, maximum_block_cache_size=0, maximum_number_of_file_objects=128,
+      maximum_number_of_file_systems=16, maximum_read_ahead_size=0,
+      os_file_access_method=definitions.OS_FILE_ACCESS_METHOD_READ):
+    """Initializes the thread-safe resolver context object.
+
+    Args:
+      maximum_block_cache_size (Optional[int]): maximum size, in bytes, of
+          the blocks of data cached in the context, where 0 represents that
+          the block cache is disabled.
+      maximum_number_of_file_objects (Optional[int]): maximum number
+          of file-like objects cached in the context.
+      maximum_number_of_file_systems (Optional[int]): maximum number
+          of file system objects cached in the context.
+      maximum_read_ahead_size (Optional[int]): maximum size, in bytes, of
+          a read-ahead request, where 0 represents that read-ahead is
+          disabled.
+      os_file_access_method (Optional[str]): method used to access operating
+          system files.
+
+    Raises:
+      ValueError: if the operating system file access method is not
+          supported.
+    """
+    super(ThreadSafeContext, self).__init__(
+        maximum_block_cache_size=maximum_block_cache_size,
+        maximum_number_of_file_objects=maximum_number_of_file_objects,
+        maximum_number_of_file_systems=maximum_number_of_file_systems,
+        maximum_read_ahead_size=maximum_read_ahead_size,
+        os_file_access_method=os_file_access_method)
+    self._block_cache_lock = threading.Lock()
+    self._file_object_cache = cache.ObjectsCache(
+        maximum_number_of_file_objects,
+        eviction_callback=self._CloseEvictedFileObject,
+        eviction_filter=self._IsFileObjectEvictable)
+    self._file_object_cache_lock = threading.RLock()
+    self._file_system_cache = cache.ObjectsCache(
+        maximum_number_of_file_systems,
+        eviction_callback=self._CloseEvictedFileSystem,
+        eviction_filter=self._IsFileSystemEvictable)
+    self._file_system_cache_lock = threading.RLock()
+    # The identifiers of the cached objects that a thread has retrieved but
+    # not yet grabbed, per thread identifier.
+    self._retrieved_file_object_identifiers = {}
+    self._retrieved_file_system_identifiers = {}
+    self._thread_local_storage = threading.local()
+
+  def _CloseEvictedFileObject(self, file_object):
+    """Defers closing a file-like object that was evicted from the cache.
+
+    Args:
+      file_object (FileIO): file-like object.
+    """
+    close_function = super(ThreadSafeContext, self)._CloseEvictedFileObject
+    self._GetEvictedObjects().append((close_function, file_object))
+
+  def _CloseEvictedFileSystem(self, file_system):
+    """Defers closing a file system object that was evicted from the cache.
+
+    Args:
+      file_system (FileSystem): file system object.
+    """
+    close_function = super(ThreadSafeContext, self)._CloseEvictedFileSystem
+    self._GetEvictedObjects().append((close_function, file_system))
+
+  def _CloseEvictedObjects(self):
+    """Closes the objects evicted by the current thread.
+
+    This method should be called after the cache lock has been released.
+    """
+    evicted_objects = self._GetEvictedObjects()
+    while evicted_objects:
+      close_function, vfs_object = evicted_objects.pop(0)
+      close_function(vfs_object)
+
+  def _GetEvictedObjects(self):
+    """Retrieves the objects evicted by the current thread.
+
+    Returns:
+      list[tuple[function, object]]: close function and VFS object of
+          the evicted objects that still need to be closed.
+    """
+    evicted_objects = getattr(
+        self._thread_local_storage, 'evicted_objects', None)
+    if evicted_objects is None:
+      evicted_objects = []
+      self._thread_local_storage.evicted_objects = evicted_objects
+
+    return evicted_objects
+
+  def _GetFileObjectCacheIdentifier(self, path_spec):
+    """Determines the file-like object cache identifier for the path spec.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      str: identifier of the VFS object.
+    """
+    identifier = super(
+        ThreadSafeContext, self)._GetFileObjectCacheIdentifier(path_spec)
+    return ''.join([identifier, self._GetThreadIdentifierSuffix()])
+
+  def _GetFileSystemCacheIdentifier(self, path_spec):
+    """Determines the file system cache identifier for the path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      str: identifier of the VFS object.
+    """
+    identifier = super(
+        ThreadSafeContext, self)._GetFileSystemCacheIdentifier(path_spec)
+    return ''.join([identifier, self._GetThreadIdentifierSuffix()])
+
+  def _GetThreadIdentifierSuffix(self):
+    """Retrieves the cache identifier suffix of the current thread.
+
+    Returns:
+      str: cache identifier suffix.
+    """
+    return '\nthread: {0:d}\n'.format(threading.current_thread().ident)
+
+  def _IsFileObjectEvictable(self, identifier):
+    """Determines if a dereferenced file-like object can be evicted.
+
+    Args:
+      identifier (str): VFS object identifier.
+
+    Returns:
+      bool: True if no thread is about to grab the file-like object.
+    """
+    return identifier not in self._retrieved_file_object_identifiers.values()
+
+  def _IsFileSystemEvictable(self, identifier):
+    """Determines if a dereferenced file system object can be evicted.
+
+    Args:
+      identifier (str): VFS object identifier.
+
+    Returns:
+      bool: True if no thread is about to grab the file system object.
+    """
+    return identifier not in self._retrieved_file_system_identifiers.values()
+
+  def CacheBlock(self, path_spec, block_offset, block_data):
+    """Caches a block of data of a file-like object.
+
+    Args:
+      path_spec (PathSpec): path specification of the file-like object.
+      block_offset (int): offset of the block, which should be a multiple
+          of the block size.
+      block_data (bytes): data of the block.
+    """
+    with self._block_cache_lock:
+      super(ThreadSafeContext, self).CacheBlock(
+          path_spec, block_offset, block_data)
+
+  def CacheFileObject(self, path_spec, file_object):
+    """Caches a file-like object based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      file_object (FileIO): file-like object.
+    """
+    try:
+      with self._file_object_cache_lock:
+        super(ThreadSafeContext, self).CacheFileObject(path_spec, file_object)
+    finally:
+      self._CloseEvictedObjects()
+
+  def CacheFileSystem(self, path_spec, file_system):
+    """Caches a file system object based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      file_system (FileSystem): file system object.
+    """
+    try:
+      with self._file_system_cache_lock:
+        super(ThreadSafeContext, self).CacheFileSystem(path_spec, file_system)
+    finally:
+      self._CloseEvictedObjects()
+
+  def Empty(self):
+    """Empties the caches.
+
+    The objects that are no longer referenced are closed.
+    """
+    with self._block_cache_lock:
+      if self._block_cache:
+        self._block_cache.Empty()
+
+    # Closing a file system can dereference file-like objects and closing
+    # a file-like object can dereference file systems.
+    number_of_evicted_objects = 1
+    while number_of_evicted_objects:
+      try:
+        with self._file_system_cache_lock:
+          number_of_evicted_objects = (
+              self._file_system_cache.EvictDereferencedObjects())
+
+        with self._file_object_cache_lock:
+          number_of_evicted_objects += (
+              self._file_object_cache.EvictDereferencedObjects())
+      finally:
+        self._CloseEvictedObjects()
+
+    with self._file_object_cache_lock:
+      self._file_object_cache.Empty()
+      self._retrieved_file_object_identifiers = {}
+
+    with self._file_system_cache_lock:
+      self._file_system_cache.Empty()
+      self._retrieved_file_system_identifiers = {}
+
+  def EvictFileObject(self, file_object):
+    """Evicts a cached file-like object that is no longer referenced.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    Returns:
+      bool: True if the file-like object was evicted.
+    """
+    try:
+      with self._file_object_cache_lock:
+        return super(ThreadSafeContext, self).EvictFileObject(file_object)
+    finally:
+      self._CloseEvictedObjects()
+
+  def EvictFileSystem(self, file_system):
+    """Evicts a cached file system object that is no longer referenced.
+
+    Args:
+      file_system (FileSystem): file system object.
+
+    Returns:
+      bool: True if the file system object was evicted.
+    """
+    try:
+      with self._file_system_cache_lock:
+        return super(ThreadSafeContext, self).EvictFileSystem(file_system)
+    finally:
+      self._CloseEvictedObjects()
+
+  def ForceRemoveFileObject(self, path_spec):
+    """Forces the removal of a file-like object based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      bool: True if the file-like object was cached.
+    """
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    with self._file_object_cache_lock:
+      cache_value = self._file_object_cache.GetCacheValue(identifier)
+
+    if not cache_value:
+      return False
+
+    # Closing the file-like object acquires the lock to release it.
+    while not cache_value.IsDereferenced():
+      cache_value.vfs_object.close()
+
+    self.EvictFileObject(cache_value.vfs_object)
+
+    return True
+
+  def GetBlock(self, path_spec, block_offset):
+    """Retrieves a cached block of data of a file-like object.
+
+    Args:
+      path_spec (PathSpec): path specification of the file-like object.
+      block_offset (int): offset of the block.
+
+    Returns:
+      bytes: data of the block or None if not cached.
+    """
+    with self._block_cache_lock:
+      return super(ThreadSafeContext, self).GetBlock(path_spec, block_offset)
+
+  def GetBlockCacheStatistics(self):
+    """Retrieves the block cache statistics.
+
+    Returns:
+      BlockCacheStatistics: hit, miss and eviction counters and size of
+          the block cache or None if the block cache is disabled.
+    """
+    with self._block_cache_lock:
+      return super(ThreadSafeContext, self).GetBlockCacheStatistics()
+
+  def GetFileObject(self, path_spec):
+    """Retrieves a file-like object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileIO: a file-like object or None if not cached.
+    """
+    thread_identifier = threading.current_thread().ident
+    with self._file_object_cache_lock:
+      vfs_object = super(ThreadSafeContext, self).GetFileObject(path_spec)
+      if vfs_object:
+        # Prevent other threads from evicting the object before it is grabbed.
+        self._retrieved_file_object_identifiers[thread_identifier] = (
+            self._GetFileObjectCacheIdentifier(path_spec))
+      else:
+        self._retrieved_file_object_identifiers.pop(thread_identifier, None)
+
+      return vfs_object
+
+  def GetFileObjectCacheStatistics(self):
+    """Retrieves the file-like object cache statistics.
+
+    Returns:
+      ObjectsCacheStatistics: hit, miss and eviction counters of the
+          file-like object cache.
+    """
+    with self._file_object_cache_lock:
+      return super(ThreadSafeContext, self).GetFileObjectCacheStatistics()
+
+  def GetFileObjectReferenceCount(self, path_spec):
+    """Retrieves the reference count of a cached file-like object.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      int: reference count or None if there is no file-like object for
+          the corresponding path specification cached.
+    """
+    with self._file_object_cache_lock:
+      return super(ThreadSafeContext, self).GetFileObjectReferenceCount(
+          path_spec)
+
+  def GetFileSystem(self, path_spec):
+    """Retrieves a file system object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileSystem: a file system object or None if not cached.
+    """
+    thread_identifier = threading.current_thread().ident
+    with self._file_system_cache_lock:
+      vfs_object = super(ThreadSafeContext, self).GetFileSystem(path_spec)
+      if vfs_object:
+        # Prevent other threads from evicting the object before it is grabbed.
+        self._retrieved_file_system_identifiers[thread_identifier] = (
+            self._GetFileSystemCacheIdentifier(path_spec))
+      else:
+        self._retrieved_file_system_identifiers.pop(thread_identifier, None)
+
+      return vfs_object
+
+  def GetFileSystemCacheStatistics(self):
+    """Retrieves the file system object cache statistics.
+
+    Returns:
+      ObjectsCacheStatistics: hit, miss and eviction counters of the
+          file system object cache.
+    """
+    with self._file_system_cache_lock:
+      return super(ThreadSafeContext, self).GetFileSystemCacheStatistics()
+
+  def GetFileSystemReferenceCount(self, path_spec):
+    """Retrieves the reference count of a cached file system object.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      int: reference count or None if there is no file system object for
+          the corresponding path specification cached.
+    """
+    with self._file_system_cache_lock:
+      return super(ThreadSafeContext, self).GetFileSystemReferenceCount(
+          path_spec)
+
+  def GrabFileObject(self, path_spec):
+    """Grabs a cached file-like object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+    """
+    thread_identifier = threading.current_thread().ident
+    with self._file_object_cache_lock:
+      super(ThreadSafeContext, self).GrabFileObject(path_spec)
+      self._retrieved_file_object_identifiers.pop(thread_identifier, None)
+
+  def GrabFileSystem(self, path_spec):
+    """Grabs a cached file system object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+    """
+    thread_identifier = threading.current_thread().ident
+    with self._file_system_cache_lock:
+      super(ThreadSafeContext, self).GrabFileSystem(path_spec)
+      self._retrieved_file_system_identifiers.pop(thread_identifier, None)
+
+  def IsFileObjectReferenced(self, file_object):
+    """Determines if a cached file-like object is referenced.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    Returns:
+      bool: True if the file-like object is cached and referenced.
+    """
+    with self._file_object_cache_lock:
+      return super(ThreadSafeContext, self).IsFileObjectReferenced(
+          file_object)
+
+  def IsFileSystemReferenced(self, file_system):
+    """Determines if a cached file system object is referenced.
+
+    Args:
+      file_system (FileSystem): file system object.
+
+    Returns:
+      bool: True if the file system object is cached and referenced.
+    """
+    with self._file_system_cache_lock:
+      return super(ThreadSafeContext, self).IsFileSystemReferenced(
+          file_system)
+
+  def PeekFileObject(self, path_spec):
+    """Retrieves a cached file-like object without using it.
+
+    Unlike GetFileObject the lookup is not counted in the cache statistics
+    and does not mark the file-like object as recently used.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileIO: a file-like object or None if not cached.
+    """
+    with self._file_object_cache_lock:
+      return super(ThreadSafeContext, self).PeekFileObject(path_spec)
+
+  def PeekFileSystem(self, path_spec):
+    """Retrieves a cached file system object without using it.
+
+    Unlike GetFileSystem the lookup is not counted in the cache statistics
+    and does not mark the file system object as recently used.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileSystem: a file system object or None if not cached.
+    """
+    with self._file_system_cache_lock:
+      return super(ThreadSafeContext, self).PeekFileSystem(path_spec)
+
+  def ReleaseFileObject(self, file_object):
+    """Releases a cached file-like object.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    A file-like object that is no longer referenced remains open in the cache
+    until it is evicted, which closes it.
+
+    Returns:
+      bool: True if the file-like object can be closed, which is only the case
+          when it is not cached.
+
+    Raises:
+      PathSpecError: if the path specification is incorrect.
+      RuntimeError: if the file-like object is not cached or an inconsistency
+          is detected in the cache.
+    """
+    with self._file_object_cache_lock:
+      return super(ThreadSafeContext, self).ReleaseFileObject(file_object)
+
+  def ReleaseFileSystem(self, file_system):
+    """Releases a cached file system object.
+
+    Args:
+      file_system (FileSystem): file system object.
+
+    A file system object that is no longer referenced remains open in the cache
+    until it is evicted, which closes it.
+
+    Returns:
+      bool: True if the file system object can be closed, which is only the case
+          when it is not cached.
+
+    Raises:
+      PathSpecError: if the path specification is incorrect.
+      RuntimeError: if the file system object is not cached or an inconsistency
+          is detected in the cache.
+    """
+    with self._file_system_cache_lock:
+      return super(ThreadSafeContext, self).ReleaseFileSystem(file_system)
+
+  def SetMaximumBlockCacheSize(self, maximum_block_cache_size):
+    """Sets the maximum size of the cached blocks.
+
+    Args:
+      maximum_block_cache_size (int): maximum size, in bytes, of the blocks
+          of data cached in the context, where 0 represents that the block
+          cache is disabled.
+    """
+    with self._block_cache_lock:
+      super(ThreadSafeContext, self).SetMaximumBlockCacheSize(
+          maximum_block_cache_size)
+
+  def SetMaximumNumberOfFileObjects(self, maximum_number_of_file_objects):
+    """Sets the maximum number of cached file-like objects.
+
+    Args:
+      maximum_number_of_file_objects (int): maximum number of file-like
+          objects cached in the context.
+    """
+    try:
+      with self._file_object_cache_lock:
+        super(ThreadSafeContext, self).SetMaximumNumberOfFileObjects(
+            maximum_number_of_file_objects)
+    finally:
+      self._CloseEvictedObjects()
+
+  def SetMaximumNumberOfFileSystems(self, maximum_number_of_file_systems):
+    """Sets the maximum number of cached file system objects.
+
+    Args:
+      maximum_number_of_file_systems (int): maximum number of file system
+          objects cached in the context.
+    """
+    try:
+      with self._file_system_cache_lock:
+        super(ThreadSafeContext, self).SetMaximumNumberOfFileSystems(
+            maximum_number_of_file_systems)
+    finally:
+      self._CloseEvictedObjects()
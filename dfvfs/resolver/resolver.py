@@ -19,6 +19,10 @@ class Resolver(object):
 
   key_chain = keychain.KeyChain()
 
+  # Persistent seek index store of compressed streams, where None represents
+  # that seek indexes are not persisted.
+  seek_index_store = None
+
   @classmethod
   def _GetResolverHelper(cls, type_indicator):
     """Retrieves the path specification resolver helper for the specified type.
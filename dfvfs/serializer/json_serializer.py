@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import json
 
+from dfvfs.helpers import source_scanner
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.path import path_spec
 from dfvfs.serializer import serializer
@@ -37,6 +38,10 @@ class _PathSpecJsonDecoder(json.JSONDecoder):
     dicts and the _ConvertDictToObject method will be called for every dict.
     That is how the path specification parent objects are created.
 
+    The parent path specification is interned, such that the path
+    specifications that are deserialized one at a time share equal parent
+    chains instead of each having their own.
+
     Args:
       json_dict (dict[str, object]): JSON serialized objects.
 
@@ -64,6 +69,11 @@ class _PathSpecJsonDecoder(json.JSONDecoder):
     if 'row_condition' in json_dict:
       json_dict['row_condition'] = tuple(json_dict['row_condition'])
 
+    parent_path_spec = json_dict.get('parent', None)
+    if parent_path_spec:
+      json_dict['parent'] = path_spec_factory.Factory.InternPathSpec(
+          parent_path_spec)
+
     return path_spec_factory.Factory.NewPathSpec(type_indicator, **json_dict)
 
 
@@ -126,6 +136,154 @@ class _PathSpecJsonEncoder(json.JSONEncoder):
     return json_dict
 
 
+class _SourceScannerContextJsonDecoder(_PathSpecJsonDecoder):
+  """Source scanner context JSON decoder."""
+
+  _CLASS_TYPES = frozenset([
+      'PathSpec', 'SourceScanNode', 'SourceScannerContext'])
+
+  def _AddScanNode(self, scan_context, parent_scan_node, scan_node_dict):
+    """Adds a scan node and its sub nodes to a source scanner context.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+      parent_scan_node (SourceScanNode): parent scan node or None.
+      scan_node_dict (dict[str, object]): JSON serialized scan node.
+
+    Raises:
+      TypeError: if the JSON serialized scan node does not contain a path
+          specification.
+    """
+    scan_node_path_spec = scan_node_dict.get('path_spec', None)
+    if not isinstance(scan_node_path_spec, path_spec.PathSpec):
+      raise TypeError('Missing scan node path specification.')
+
+    scan_node = scan_context.AddScanNode(scan_node_path_spec, parent_scan_node)
+    scan_node.scanned = bool(scan_node_dict.get('scanned', False))
+
+    if scan_node_dict.get('locked', False):
+      scan_context.LockScanNode(scan_node_path_spec)
+
+    for sub_scan_node_dict in scan_node_dict.get('sub_nodes', []):
+      self._AddScanNode(scan_context, scan_node, sub_scan_node_dict)
+
+  def _ConvertDictToObject(self, json_dict):
+    """Converts a JSON dict into a source scanner context object.
+
+    The dictionary of the JSON serialized objects consists of:
+    {
+        '__type__': 'SourceScannerContext'
+        'root_scan_node': {
+            '__type__': 'SourceScanNode'
+            'locked': False
+            'path_spec': { ... }
+            'scanned': True
+            'sub_nodes': [{ ... }, ...]
+        }
+        'source_type': 'storage media image'
+    }
+
+    Args:
+      json_dict (dict[str, object]): JSON serialized objects.
+
+    Returns:
+      object: a source scanner context, a JSON serialized scan node, of
+          which the sub nodes are added when the source scanner context is
+          created, or a path specification.
+
+    Raises:
+      TypeError: if the JSON serialized object does not contain a '__type__'
+          attribute that contains a supported object type.
+    """
+    class_type = json_dict.get('__type__', None)
+
+    if class_type == 'SourceScanNode':
+      del json_dict['__type__']
+      return json_dict
+
+    if class_type == 'SourceScannerContext':
+      scan_context = source_scanner.SourceScannerContext()
+
+      root_scan_node_dict = json_dict.get('root_scan_node', None)
+      if root_scan_node_dict:
+        self._AddScanNode(scan_context, None, root_scan_node_dict)
+
+      scan_context.source_type = json_dict.get('source_type', None)
+      scan_context.updated = False
+      return scan_context
+
+    return super(
+        _SourceScannerContextJsonDecoder, self)._ConvertDictToObject(json_dict)
+
+
+class _SourceScannerContextJsonEncoder(_PathSpecJsonEncoder):
+  """Source scanner context JSON encoder."""
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the json.JSONEncoder object interface.
+  # pylint: disable=arguments-differ,invalid-name,method-hidden
+
+  def _ConvertScanNodeToDict(self, scan_context, scan_node):
+    """Converts a scan node into a JSON dictionary.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+      scan_node (SourceScanNode): scan node.
+
+    Returns:
+      dict[str, object]: JSON serialized scan node.
+    """
+    return {
+        '__type__': 'SourceScanNode',
+        'locked': scan_context.IsLockedScanNode(scan_node.path_spec),
+        'path_spec': self.default(scan_node.path_spec),
+        'scanned': scan_node.scanned,
+        'sub_nodes': [
+            self._ConvertScanNodeToDict(scan_context, sub_scan_node)
+            for sub_scan_node in scan_node.sub_nodes]}
+
+  def default(self, o):
+    """Converts a source scanner context object into a JSON dictionary.
+
+    The resulting dictionary of the JSON serialized objects consists of:
+    {
+        '__type__': 'SourceScannerContext'
+        'root_scan_node': {
+            '__type__': 'SourceScanNode'
+            'locked': False
+            'path_spec': { ... }
+            'scanned': True
+            'sub_nodes': [{ ... }, ...]
+        }
+        'source_type': 'storage media image'
+    }
+
+    Here the scan nodes make up the scan node tree of the source scanner
+    context from the root downwards.
+
+    Args:
+      o (SourceScannerContext|PathSpec): a source scanner context or a path
+          specification.
+
+    Returns:
+      dict[str, object]: JSON serialized objects.
+
+    Raises:
+      TypeError: if not an instance of SourceScannerContext or PathSpec.
+    """
+    if not isinstance(o, source_scanner.SourceScannerContext):
+      return super(_SourceScannerContextJsonEncoder, self).default(o)
+
+    root_scan_node = o.GetRootScanNode()
+    if root_scan_node:
+      root_scan_node = self._ConvertScanNodeToDict(o, root_scan_node)
+
+    return {
+        '__type__': 'SourceScannerContext',
+        'root_scan_node': root_scan_node,
+        'source_type': o.source_type}
+
+
 class JsonPathSpecSerializer(serializer.PathSpecSerializer):
   """JSON path specification serializer object."""
 
@@ -155,3 +313,35 @@ class JsonPathSpecSerializer(serializer.PathSpecSerializer):
       str: JSON serialized path specification.
     """
     return json.dumps(path_spec_object, cls=_PathSpecJsonEncoder)
+
+
+class JsonSourceScannerContextSerializer(
+    serializer.SourceScannerContextSerializer):
+  """JSON source scanner context serializer object."""
+
+  # pylint: disable=arguments-differ
+
+  @classmethod
+  def ReadSerialized(cls, json_string):
+    """Reads a source scanner context from serialized form.
+
+    Args:
+      json_string (str): JSON serialized source scanner context.
+
+    Returns:
+      SourceScannerContext: a source scanner context.
+    """
+    json_decoder = _SourceScannerContextJsonDecoder()
+    return json_decoder.decode(json_string)
+
+  @classmethod
+  def WriteSerialized(cls, scan_context):
+    """Writes a source scanner context to serialized form.
+
+    Args:
+      scan_context (SourceScannerContext): a source scanner context.
+
+    Returns:
+      str: JSON serialized source scanner context.
+    """
+    return json.dumps(scan_context, cls=_SourceScannerContextJsonEncoder)
@@ -35,3 +35,34 @@ class PathSpecSerializer(object):
     Returns:
       object: serialized form of the path specification.
     """
+
+
+class SourceScannerContextSerializer(object):
+  """Source scanner context serializer interface."""
+
+  # Since abc does not seem to have an @abc.abstractclassmethod we're using
+  # @abc.abstractmethod instead and shutting up pylint about:
+  # E0213: Method should have "self" as first argument.
+  # pylint: disable=no-self-argument,redundant-returns-doc
+
+  @abc.abstractmethod
+  def ReadSerialized(cls, serialized):
+    """Reads a source scanner context from serialized form.
+
+    Args:
+      serialized (object): serialized form of the source scanner context.
+
+    Returns:
+      SourceScannerContext: a source scanner context.
+    """
+
+  @abc.abstractmethod
+  def WriteSerialized(cls, scan_context):
+    """Writes a source scanner context to serialized form.
+
+    Args:
+      scan_context (SourceScannerContext): a source scanner context.
+
+    Returns:
+      object: serialized form of the source scanner context.
+    """
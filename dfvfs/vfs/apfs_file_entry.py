@@ -23,6 +23,19 @@ class APFSDirectory(file_entry.Directory):
     Yields:
       APFSPathSpec: APFS path specification.
     """
+    for path_spec, _ in self.GetEntriesAndAPFSFileEntries():
+      yield path_spec
+
+  def GetEntriesAndAPFSFileEntries(self):
+    """Retrieves directory entries and their APFS file entries.
+
+    The APFS file entry of a directory entry can be used to create its file
+    entry, without retrieving the APFS file entry again.
+
+    Yields:
+      tuple[APFSPathSpec, pyfsapfs.file_entry]: APFS path specification and
+          APFS file entry of a directory entry.
+    """
     try:
       fsapfs_file_entry = self._file_system.GetAPFSFileEntryByPathSpec(
           self.path_spec)
@@ -40,9 +53,10 @@ class APFSDirectory(file_entry.Directory):
         directory_entry = self._file_system.JoinPath([
             location, directory_entry])
 
-      yield apfs_path_spec.APFSPathSpec(
+      path_spec = apfs_path_spec.APFSPathSpec(
           identifier=fsapfs_sub_file_entry.identifier, location=directory_entry,
           parent=self.path_spec.parent)
+      yield path_spec, fsapfs_sub_file_entry
 
 
 class APFSFileEntry(file_entry.FileEntry):
@@ -130,7 +144,7 @@ class APFSFileEntry(file_entry.FileEntry):
     stat_object = super(APFSFileEntry, self)._GetStat()
 
     # File data stat information.
-    stat_object.size = self._fsapfs_file_entry.size
+    stat_object.size = self.size
 
     # Ownership and permissions stat information.
     stat_object.mode = self._fsapfs_file_entry.file_mode & 0x0fff
@@ -144,7 +158,7 @@ class APFSFileEntry(file_entry.FileEntry):
     stat_object.ino = self._fsapfs_file_entry.identifier
     stat_object.fs_type = 'APFS'
 
-    stat_object.is_allocated = True
+    stat_object.is_allocated = self.IsAllocated()
 
     return stat_object
 
@@ -158,9 +172,11 @@ class APFSFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      for path_spec in self._directory.entries:
+      for path_spec, fsapfs_file_entry in (
+          self._directory.GetEntriesAndAPFSFileEntries()):
         yield APFSFileEntry(
-            self._resolver_context, self._file_system, path_spec)
+            self._resolver_context, self._file_system, path_spec,
+            fsapfs_file_entry=fsapfs_file_entry)
 
   @property
   def access_time(self):
@@ -195,6 +211,11 @@ class APFSFileEntry(file_entry.FileEntry):
     timestamp = self._fsapfs_file_entry.get_modification_time_as_integer()
     return dfdatetime_apfs_time.APFSTime(timestamp=timestamp)
 
+  @property
+  def size(self):
+    """int: size of the data of the file entry or None if not available."""
+    return self._fsapfs_file_entry.size
+
   def GetAPFSFileEntry(self):
     """Retrieves the APFS file entry.
 
@@ -256,3 +277,12 @@ class APFSFileEntry(file_entry.FileEntry):
 
     return APFSFileEntry(
         self._resolver_context, self._file_system, path_spec, is_root=is_root)
+
+  def IsAllocated(self):
+    """Determines if the file entry is allocated.
+
+    Returns:
+      bool: True if the file entry is allocated.
+    """
+    # APFS file entries retrieved by pyfsapfs are always allocated.
+    return True
@@ -36,6 +36,18 @@ class APFSFileSystem(file_system.FileSystem):
     """
     self._fsapfs_volume = None
 
+  def _GetFileEntryIdentifier(self, file_entry):
+    """Retrieves the identifier of a file entry within the file system.
+
+    Args:
+      file_entry (APFSFileEntry): file entry.
+
+    Returns:
+      int: identifier of the file entry or None if not available.
+    """
+    fsapfs_file_entry = file_entry.GetAPFSFileEntry()
+    return getattr(fsapfs_file_entry, 'identifier', None)
+
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -42,6 +42,19 @@ class CPIOFileSystem(file_system.FileSystem):
     self._file_object.close()
     self._file_object = None
 
+  def _GetFileEntryIdentifier(self, file_entry):
+    """Retrieves the identifier of a file entry within the file system.
+
+    Args:
+      file_entry (CPIOFileEntry): file entry.
+
+    Returns:
+      int: inode number of the file entry or None if not available.
+    """
+    cpio_archive_file_entry = self.GetCPIOArchiveFileEntryByPathSpec(
+        file_entry.path_spec)
+    return getattr(cpio_archive_file_entry, 'inode_number', None)
+
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -161,3 +174,50 @@ class CPIOFileSystem(file_system.FileSystem):
     path_spec = cpio_path_spec.CPIOPathSpec(
         location=self.LOCATION_ROOT, parent=self._path_spec.parent)
     return self.GetFileEntryByPathSpec(path_spec)
+
+  def IterateMetadata(self, path_spec=None):
+    """Iterates over the metadata of file entries in the file system.
+
+    When iterating from the root file entry the CPIO archive file entries are
+    read once, instead of once per directory. Note that this also includes
+    the file entries of which the parent directory is missing in the CPIO
+    archive.
+
+    Args:
+      path_spec (Optional[PathSpec]): path specification of the file entry to
+          start from, where None represents the root file entry.
+
+    Yields:
+      FileEntryMetadata: metadata of a file entry, where the metadata of
+          a directory is yielded before that of its sub file entries.
+    """
+    location = getattr(path_spec, 'location', None)
+    if path_spec and location != self.LOCATION_ROOT:
+      for metadata in super(CPIOFileSystem, self).IterateMetadata(
+          path_spec=path_spec):
+        yield metadata
+      return
+
+    root_file_entry = self.GetRootFileEntry()
+    yield self._GetFileEntryMetadata(root_file_entry)
+
+    locations = set()
+    for cpio_archive_file_entry in self._cpio_archive_file.GetFileEntries():
+      path = cpio_archive_file_entry.path
+      if path:
+        locations.add(self.JoinPath([path]))
+
+    # A location sorts before the locations of its sub file entries.
+    for location in sorted(locations):
+      cpio_archive_file_entry = self._cpio_archive_file.GetFileEntryByPath(
+          location[1:])
+      if cpio_archive_file_entry is None:
+        continue
+
+      path_spec = cpio_path_spec.CPIOPathSpec(
+          location=location, parent=self._path_spec.parent)
+      file_entry = cpio_file_entry.CPIOFileEntry(
+          self._resolver_context, self, path_spec,
+          cpio_archive_file_entry=cpio_archive_file_entry)
+
+      yield self._GetFileEntryMetadata(file_entry)
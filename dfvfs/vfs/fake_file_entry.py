@@ -87,12 +87,9 @@ class FakeFileEntry(file_entry.FileEntry):
     """
     stat_object = super(FakeFileEntry, self)._GetStat()
 
-    location = getattr(self.path_spec, 'location', None)
-    if location:
-      file_data = self._file_system.GetDataByPath(location)
-
-      if file_data is not None:
-        stat_object.size = len(file_data)
+    size = self.size
+    if size is not None:
+      stat_object.size = size
 
     return stat_object
 
@@ -145,6 +142,19 @@ class FakeFileEntry(file_entry.FileEntry):
         self._name = self._file_system.BasenamePath(location)
     return self._name
 
+  @property
+  def size(self):
+    """int: size of the data of the file entry or None if not available."""
+    location = getattr(self.path_spec, 'location', None)
+    if not location:
+      return None
+
+    file_data = self._file_system.GetDataByPath(location)
+    if file_data is None:
+      return None
+
+    return len(file_data)
+
   def GetFileObject(self, data_stream_name=''):
     """Retrieves the file-like object.
 
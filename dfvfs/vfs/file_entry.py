@@ -312,6 +312,12 @@ class FileEntry(object):
     # We cannot use len(self._directory.entries) since entries is a generator.
     return sum(1 for path_spec in self._directory.entries)
 
+  @property
+  def size(self):
+    """int: size of the data of the file entry or None if not available."""
+    stat_object = self.GetStat()
+    return getattr(stat_object, 'size', None)
+
   @property
   def sub_file_entries(self):
     """generator[FileEntry]: sub file entries."""
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""The Virtual File System (VFS) file entry metadata."""
+
+from __future__ import unicode_literals
+
+
+class FileEntryMetadata(object):
+  """Metadata of a file entry.
+
+  The metadata contains the values commonly needed to generate a timeline or
+  bodyfile, without the need to retain the file entry.
+
+  Attributes:
+    access_time (dfdatetime.DateTimeValues): access time or None if not
+        available.
+    change_time (dfdatetime.DateTimeValues): change time or None if not
+        available.
+    creation_time (dfdatetime.DateTimeValues): creation time or None if not
+        available.
+    identifier (int): identifier of the file entry within the file system,
+        such as an inode number or MFT entry number, or None if not available.
+    is_allocated (bool): True if the file entry is allocated.
+    location (str): location of the file entry within the file system or None
+        if not available.
+    modification_time (dfdatetime.DateTimeValues): modification time or None
+        if not available.
+    size (int): size of the data of the file entry or None if not available.
+    type (str): file entry type, such as device, directory, file, link, socket
+        and pipe or None if not available. The available file entry types are
+        defined in dfvfs.lib.definitions for example FILE_ENTRY_TYPE_FILE.
+  """
+
+  __slots__ = (
+      'access_time', 'change_time', 'creation_time', 'identifier',
+      'is_allocated', 'location', 'modification_time', 'size', 'type')
+
+  def __init__(self):
+    """Initializes file entry metadata."""
+    super(FileEntryMetadata, self).__init__()
+    self.access_time = None
+    self.change_time = None
+    self.creation_time = None
+    self.identifier = None
+    self.is_allocated = True
+    self.location = None
+    self.modification_time = None
+    self.size = None
+    self.type = None
@@ -5,6 +5,9 @@ from __future__ import unicode_literals
 
 import abc
 
+from dfvfs.lib import definitions
+from dfvfs.vfs import file_entry_metadata
+
 
 class FileSystem(object):
   """Virtual file system interface."""
@@ -49,6 +52,48 @@ class FileSystem(object):
       IOError: if the close failed.
     """
 
+  # pylint: disable=unused-argument
+  def _GetFileEntryIdentifier(self, file_entry):
+    """Retrieves the identifier of a file entry within the file system.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      int: identifier of the file entry, such as an inode number, or None if
+          not available.
+    """
+    return None
+
+  # pylint: enable=unused-argument
+
+  def _GetFileEntryMetadata(self, file_entry):
+    """Retrieves the metadata of a file entry.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      FileEntryMetadata: metadata of the file entry.
+    """
+    entry_type = file_entry.entry_type
+    if entry_type is None:
+      stat_object = file_entry.GetStat()
+      entry_type = getattr(stat_object, 'type', None)
+
+    metadata = file_entry_metadata.FileEntryMetadata()
+    metadata.access_time = file_entry.access_time
+    metadata.change_time = file_entry.change_time
+    metadata.creation_time = file_entry.creation_time
+    metadata.identifier = self._GetFileEntryIdentifier(file_entry)
+    metadata.is_allocated = file_entry.IsAllocated()
+    metadata.location = getattr(file_entry.path_spec, 'location', None)
+    metadata.modification_time = file_entry.modification_time
+    metadata.size = file_entry.size
+    metadata.type = entry_type
+
+    return metadata
+
   @abc.abstractmethod
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system object defined by path specification.
@@ -86,7 +131,11 @@ class FileSystem(object):
       IOError: if the file system object was not opened or the close failed.
       OSError: if the file system object was not opened or the close failed.
     """
-    if not self._is_open:
+    # A released file system object remains open in the cache until it is
+    # evicted, but should behave as if it was closed.
+    if not self._is_open or (
+        self._is_cached and
+        not self._resolver_context.IsFileSystemReferenced(self)):
       raise IOError('Not opened.')
 
     if not self._is_cached:
@@ -208,6 +257,41 @@ class FileSystem(object):
       FileEntry: a file entry or None if not available.
     """
 
+  def IterateMetadata(self, path_spec=None):
+    """Iterates over the metadata of file entries in the file system.
+
+    The file system is walked once, where the metadata is read from the file
+    entries as they are enumerated, instead of retrieving their stat objects.
+
+    Args:
+      path_spec (Optional[PathSpec]): path specification of the file entry to
+          start from, where None represents the root file entry.
+
+    Yields:
+      FileEntryMetadata: metadata of a file entry, where the metadata of
+          a directory is yielded before that of its sub file entries.
+    """
+    if path_spec:
+      file_entry = self.GetFileEntryByPathSpec(path_spec)
+    else:
+      file_entry = self.GetRootFileEntry()
+
+    if not file_entry:
+      return
+
+    yield self._GetFileEntryMetadata(file_entry)
+
+    directories = [file_entry]
+    while directories:
+      file_entry = directories.pop()
+
+      for sub_file_entry in file_entry.sub_file_entries:
+        metadata = self._GetFileEntryMetadata(sub_file_entry)
+        yield metadata
+
+        if metadata.type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+          directories.append(sub_file_entry)
+
   def JoinPath(self, path_segments):
     """Joins the path segments into a path.
 
@@ -249,6 +333,13 @@ class FileSystem(object):
       PathSpecError: if the path specification is incorrect.
       ValueError: if the path specification or mode is invalid.
     """
+    if self._is_open and self._is_cached and (
+        not path_spec or
+        self._resolver_context.PeekFileSystem(path_spec) is not self):
+      # A released file system object remains open in the cache, hence it is
+      # evicted when it is opened with another path specification.
+      self._resolver_context.EvictFileSystem(self)
+
     if self._is_open and not self._is_cached:
       raise IOError('Already open.')
 
@@ -263,7 +354,7 @@ class FileSystem(object):
       self._is_open = True
       self._path_spec = path_spec
 
-      if path_spec and not self._resolver_context.GetFileSystem(path_spec):
+      if path_spec and not self._resolver_context.PeekFileSystem(path_spec):
         self._resolver_context.CacheFileSystem(path_spec, self)
         self._is_cached = True
 
@@ -201,6 +201,19 @@ class NTFSDirectory(file_entry.Directory):
     Yields:
       NTFSPathSpec: NTFS path specification.
     """
+    for path_spec, _ in self.GetEntriesAndNTFSFileEntries():
+      yield path_spec
+
+  def GetEntriesAndNTFSFileEntries(self):
+    """Retrieves directory entries and their NTFS file entries.
+
+    The NTFS file entry of a directory entry can be used to create its file
+    entry, without retrieving the NTFS file entry again.
+
+    Yields:
+      tuple[NTFSPathSpec, pyfsntfs.file_entry]: NTFS path specification and
+          NTFS file entry of a directory entry.
+    """
     try:
       fsntfs_file_entry = self._file_system.GetNTFSFileEntryByPathSpec(
           self.path_spec)
@@ -227,10 +240,11 @@ class NTFSDirectory(file_entry.Directory):
           directory_entry = self._file_system.JoinPath([
               location, directory_entry])
 
-        yield ntfs_path_spec.NTFSPathSpec(
+        path_spec = ntfs_path_spec.NTFSPathSpec(
             location=directory_entry,
             mft_attribute=fsntfs_sub_file_entry.name_attribute_index,
             mft_entry=directory_entry_mft_entry, parent=self.path_spec.parent)
+        yield path_spec, fsntfs_sub_file_entry
 
 
 class NTFSFileEntry(file_entry.FileEntry):
@@ -353,8 +367,7 @@ class NTFSFileEntry(file_entry.FileEntry):
     stat_object = super(NTFSFileEntry, self)._GetStat()
 
     # File data stat information.
-    if self._fsntfs_file_entry.has_default_data_stream():
-      stat_object.size = self._fsntfs_file_entry.get_size()
+    stat_object.size = self.size
 
     # Ownership and permissions stat information.
     # TODO: stat_object.mode
@@ -374,7 +387,7 @@ class NTFSFileEntry(file_entry.FileEntry):
     stat_object.ino = file_reference & _FILE_REFERENCE_MFT_ENTRY_BITMASK
     stat_object.fs_type = 'NTFS'
 
-    stat_object.is_allocated = self._fsntfs_file_entry.is_allocated()
+    stat_object.is_allocated = self.IsAllocated()
 
     return stat_object
 
@@ -388,9 +401,11 @@ class NTFSFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      for path_spec in self._directory.entries:
+      for path_spec, fsntfs_file_entry in (
+          self._directory.GetEntriesAndNTFSFileEntries()):
         yield NTFSFileEntry(
-            self._resolver_context, self._file_system, path_spec)
+            self._resolver_context, self._file_system, path_spec,
+            fsntfs_file_entry=fsntfs_file_entry)
 
   def _IsLink(self, file_attribute_flags):
     """Determines if a file entry is a link.
@@ -440,6 +455,14 @@ class NTFSFileEntry(file_entry.FileEntry):
     timestamp = self._fsntfs_file_entry.get_modification_time_as_integer()
     return dfdatetime_filetime.Filetime(timestamp=timestamp)
 
+  @property
+  def size(self):
+    """int: size of the data of the file entry or None if not available."""
+    if not self._fsntfs_file_entry.has_default_data_stream():
+      return None
+
+    return self._fsntfs_file_entry.get_size()
+
   def GetFileObject(self, data_stream_name=''):
     """Retrieves the file-like object.
 
@@ -549,3 +572,11 @@ class NTFSFileEntry(file_entry.FileEntry):
         self._fsntfs_file_entry.security_descriptor_data)
 
     return fwnt_security_descriptor
+
+  def IsAllocated(self):
+    """Determines if the file entry is allocated.
+
+    Returns:
+      bool: True if the file entry is allocated.
+    """
+    return self._fsntfs_file_entry.is_allocated()
@@ -44,6 +44,26 @@ class NTFSFileSystem(file_system.FileSystem):
     self._file_object.close()
     self._file_object = None
 
+  def _GetFileEntryIdentifier(self, file_entry):
+    """Retrieves the identifier of a file entry within the file system.
+
+    Args:
+      file_entry (NTFSFileEntry): file entry.
+
+    Returns:
+      int: MFT entry number of the file entry or None if not available.
+    """
+    mft_entry = getattr(file_entry.path_spec, 'mft_entry', None)
+    if mft_entry is None:
+      fsntfs_file_entry = file_entry.GetNTFSFileEntry()
+      file_reference = getattr(fsntfs_file_entry, 'file_reference', None)
+      if file_reference is not None:
+        # pylint: disable=protected-access
+        mft_entry = (
+            file_reference & ntfs_file_entry._FILE_REFERENCE_MFT_ENTRY_BITMASK)
+
+    return mft_entry
+
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system object defined by path specification.
 
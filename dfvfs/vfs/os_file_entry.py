@@ -178,7 +178,7 @@ class OSFileEntry(file_entry.FileEntry):
 
     if not self._is_windows_device:
       # File data stat information.
-      stat_object.size = self._stat_info.st_size
+      stat_object.size = self.size
 
       # Ownership and permissions stat information.
       stat_object.mode = stat.S_IMODE(self._stat_info.st_mode)
@@ -223,6 +223,14 @@ class OSFileEntry(file_entry.FileEntry):
     timestamp = int(self._stat_info.st_ctime)
     return dfdatetime_posix_time.PosixTime(timestamp=timestamp)
 
+  @property
+  def inode(self):
+    """int: inode number of the file entry or None if not available."""
+    if self._stat_info is None:
+      return None
+
+    return self._stat_info.st_ino
+
   @property
   def link(self):
     """str: full path of the linked file entry."""
@@ -258,6 +266,14 @@ class OSFileEntry(file_entry.FileEntry):
     timestamp = int(self._stat_info.st_mtime)
     return dfdatetime_posix_time.PosixTime(timestamp=timestamp)
 
+  @property
+  def size(self):
+    """int: size of the data of the file entry or None if not available."""
+    if self._stat_info is None or self._is_windows_device:
+      return None
+
+    return self._stat_info.st_size
+
   def GetLinkedFileEntry(self):
     """Retrieves the linked file entry, for example for a symbolic link.
 
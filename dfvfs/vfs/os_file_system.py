@@ -34,6 +34,17 @@ class OSFileSystem(file_system.FileSystem):
     """
     return
 
+  def _GetFileEntryIdentifier(self, file_entry):
+    """Retrieves the identifier of a file entry within the file system.
+
+    Args:
+      file_entry (OSFileEntry): file entry.
+
+    Returns:
+      int: inode number of the file entry or None if not available.
+    """
+    return file_entry.inode
+
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -188,3 +188,61 @@ class TARFileSystem(file_system.FileSystem):
       return self._tar_file.getmember(location[1:])
     except KeyError:
       pass
+
+  def IterateMetadata(self, path_spec=None):
+    """Iterates over the metadata of file entries in the file system.
+
+    When iterating from the root file entry the TAR members are read once,
+    instead of once per directory.
+
+    Args:
+      path_spec (Optional[PathSpec]): path specification of the file entry to
+          start from, where None represents the root file entry.
+
+    Yields:
+      FileEntryMetadata: metadata of a file entry, where the metadata of
+          a directory is yielded before that of its sub file entries.
+    """
+    location = getattr(path_spec, 'location', None)
+    if path_spec and location != self.LOCATION_ROOT:
+      for metadata in super(TARFileSystem, self).IterateMetadata(
+          path_spec=path_spec):
+        yield metadata
+      return
+
+    root_file_entry = self.GetRootFileEntry()
+    yield self._GetFileEntryMetadata(root_file_entry)
+
+    # The last TAR member with a specific name is used, similar to getmember.
+    tar_infos = {}
+    locations = set()
+
+    for tar_info in self._tar_file.getmembers():
+      path_segments = [
+          segment for segment in tar_info.name.split(self.PATH_SEPARATOR)
+          if segment]
+      if not path_segments:
+        continue
+
+      tar_infos[tar_info.name] = tar_info
+
+      # Sometimes the TAR file lacks directories, therefore we will
+      # provide virtual ones.
+      for segment_index in range(1, len(path_segments) + 1):
+        locations.add(self.JoinPath(path_segments[:segment_index]))
+
+    # A location sorts before the locations of its sub file entries.
+    for location in sorted(locations):
+      kwargs = {}
+      tar_info = tar_infos.get(location[1:], None)
+      if tar_info is not None:
+        kwargs['tar_info'] = tar_info
+      else:
+        kwargs['is_virtual'] = True
+
+      path_spec = tar_path_spec.TARPathSpec(
+          location=location, parent=self._path_spec.parent)
+      file_entry = tar_file_entry.TARFileEntry(
+          self._resolver_context, self, path_spec, **kwargs)
+
+      yield self._GetFileEntryMetadata(file_entry)
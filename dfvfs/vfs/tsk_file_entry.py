@@ -255,6 +255,22 @@ class TSKDirectory(file_entry.Directory):
     Yields:
       TSKPathSpec: a path specification.
 
+    Raises:
+      BackEndError: if pytsk3 cannot open the directory.
+    """
+    for path_spec, _ in self.GetEntriesAndTSKFiles():
+      yield path_spec
+
+  def GetEntriesAndTSKFiles(self):
+    """Retrieves directory entries and their TSK files.
+
+    The TSK file of a directory entry can be used to create its file entry,
+    without opening the TSK file again.
+
+    Yields:
+      tuple[TSKPathSpec, pytsk3.File]: path specification and TSK file of
+          a directory entry.
+
     Raises:
       BackEndError: if pytsk3 cannot open the directory.
     """
@@ -344,9 +360,10 @@ class TSKDirectory(file_entry.Directory):
               directory_entry = self._file_system.JoinPath([
                   location, directory_entry])
 
-        yield tsk_path_spec.TSKPathSpec(
+        path_spec = tsk_path_spec.TSKPathSpec(
             inode=directory_entry_inode, location=directory_entry,
             parent=self.path_spec.parent)
+        yield path_spec, tsk_directory_entry
 
 
 class TSKFileEntry(file_entry.FileEntry):
@@ -596,7 +613,7 @@ class TSKFileEntry(file_entry.FileEntry):
     stat_object = super(TSKFileEntry, self)._GetStat()
 
     # File data stat information.
-    stat_object.size = getattr(self._tsk_file.info.meta, 'size', None)
+    stat_object.size = self.size
 
     # Date and time stat information.
     stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
@@ -629,10 +646,7 @@ class TSKFileEntry(file_entry.FileEntry):
     # stat_object.nlink = getattr(self._tsk_file.info.meta, 'nlink', None)
     # stat_object.fs_type = 'Unknown'
 
-    flags = getattr(self._tsk_file.info.meta, 'flags', 0)
-
-    # The flags are an instance of pytsk3.TSK_FS_META_FLAG_ENUM.
-    stat_object.is_allocated = bool(int(flags) & pytsk3.TSK_FS_META_FLAG_ALLOC)
+    stat_object.is_allocated = self.IsAllocated()
 
     return stat_object
 
@@ -646,8 +660,10 @@ class TSKFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      for path_spec in self._directory.entries:
-        yield TSKFileEntry(self._resolver_context, self._file_system, path_spec)
+      for path_spec, tsk_file in self._directory.GetEntriesAndTSKFiles():
+        yield TSKFileEntry(
+            self._resolver_context, self._file_system, path_spec,
+            tsk_file=tsk_file)
 
   def _GetTimeValue(self, name):
     """Retrieves a date and time value.
@@ -783,6 +799,11 @@ class TSKFileEntry(file_entry.FileEntry):
 
     return self._GetTimeValue('mtime')
 
+  @property
+  def size(self):
+    """int: size of the data of the file entry or None if not available."""
+    return getattr(self._tsk_file.info.meta, 'size', None)
+
   def GetFileObject(self, data_stream_name=''):
     """Retrieves the file-like object.
 
@@ -877,3 +898,14 @@ class TSKFileEntry(file_entry.FileEntry):
       PathSpecError: if the path specification is missing inode and location.
     """
     return self._tsk_file
+
+  def IsAllocated(self):
+    """Determines if the file entry is allocated.
+
+    Returns:
+      bool: True if the file entry is allocated.
+    """
+    flags = getattr(self._tsk_file.info.meta, 'flags', 0)
+
+    # The flags are an instance of pytsk3.TSK_FS_META_FLAG_ENUM.
+    return bool(int(flags) & pytsk3.TSK_FS_META_FLAG_ALLOC)
@@ -43,6 +43,18 @@ class TSKFileSystem(file_system.FileSystem):
     self._file_object.close()
     self._file_object = None
 
+  def _GetFileEntryIdentifier(self, file_entry):
+    """Retrieves the identifier of a file entry within the file system.
+
+    Args:
+      file_entry (TSKFileEntry): file entry.
+
+    Returns:
+      int: inode number of the file entry or None if not available.
+    """
+    tsk_file = file_entry.GetTSKFile()
+    return getattr(tsk_file.info.meta, 'addr', None)
+
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system object defined by path specification.
 
@@ -223,6 +235,18 @@ class TSKFileSystem(file_system.FileSystem):
 
     return tsk_file
 
+  def IsFAT(self):
+    """Determines if the file system is FAT12, FAT16, FAT32 or exFAT.
+
+    Returns:
+      bool: True if the file system is FAT.
+    """
+    tsk_fs_type = self.GetFsType()
+    return tsk_fs_type in [
+        pytsk3.TSK_FS_TYPE_EXFAT, pytsk3.TSK_FS_TYPE_FAT12,
+        pytsk3.TSK_FS_TYPE_FAT16, pytsk3.TSK_FS_TYPE_FAT32,
+        pytsk3.TSK_FS_TYPE_FAT_DETECT]
+
   def IsHFS(self):
     """Determines if the file system is HFS, HFS+ or HFSX.
 
@@ -118,7 +118,13 @@ class TSKPartitionFileSystem(file_system.FileSystem):
           is_virtual=True)
 
     if location is None and partition_index is not None:
-      path_spec.location = '/p{0:d}'.format(partition_index)
+      # Path specifications are immutable hence a new path specification
+      # is created that contains the location.
+      path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+          location='/p{0:d}'.format(partition_index),
+          parent=path_spec.parent,
+          part_index=getattr(path_spec, 'part_index', None),
+          start_offset=getattr(path_spec, 'start_offset', None))
 
     return tsk_partition_file_entry.TSKPartitionFileEntry(
         self._resolver_context, self, path_spec)
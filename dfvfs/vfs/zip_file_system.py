@@ -7,6 +7,7 @@ import zipfile
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.lib import py2to3
 from dfvfs.path import zip_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
@@ -179,3 +180,72 @@ class ZipFileSystem(file_system.FileSystem):
       return self._zip_file.getinfo(location[1:])
 
     return None
+
+  def IterateMetadata(self, path_spec=None):
+    """Iterates over the metadata of file entries in the file system.
+
+    When iterating from the root file entry the ZIP infos are read once,
+    instead of once per directory.
+
+    Args:
+      path_spec (Optional[PathSpec]): path specification of the file entry to
+          start from, where None represents the root file entry.
+
+    Yields:
+      FileEntryMetadata: metadata of a file entry, where the metadata of
+          a directory is yielded before that of its sub file entries.
+    """
+    location = getattr(path_spec, 'location', None)
+    if path_spec and location != self.LOCATION_ROOT:
+      for metadata in super(ZipFileSystem, self).IterateMetadata(
+          path_spec=path_spec):
+        yield metadata
+      return
+
+    root_file_entry = self.GetRootFileEntry()
+    yield self._GetFileEntryMetadata(root_file_entry)
+
+    locations = set()
+
+    for zip_info in self._zip_file.infolist():
+      path = getattr(zip_info, 'filename', None)
+      if path is not None and not isinstance(path, py2to3.UNICODE_TYPE):
+        try:
+          path = path.decode(self.encoding)
+        except UnicodeDecodeError:
+          path = None
+
+      if not path:
+        continue
+
+      path_segments = [
+          segment for segment in path.split(self.PATH_SEPARATOR) if segment]
+      if not path_segments:
+        continue
+
+      # Some times the ZIP file lacks directories, therefore we will
+      # provide virtual ones.
+      for segment_index in range(1, len(path_segments)):
+        location = self.JoinPath(path_segments[:segment_index])
+        # Restore / at end path to indicate a directory.
+        locations.add('{0:s}{1:s}'.format(location, self.PATH_SEPARATOR))
+
+      location = self.JoinPath(path_segments)
+      if path.endswith(self.PATH_SEPARATOR):
+        location = '{0:s}{1:s}'.format(location, self.PATH_SEPARATOR)
+      locations.add(location)
+
+    # A location sorts before the locations of its sub file entries.
+    for location in sorted(locations):
+      kwargs = {}
+      try:
+        kwargs['zip_info'] = self._zip_file.getinfo(location[1:])
+      except KeyError:
+        kwargs['is_virtual'] = True
+
+      path_spec = zip_path_spec.ZipPathSpec(
+          location=location, parent=self._path_spec.parent)
+      file_entry = zip_file_entry.ZipFileEntry(
+          self._resolver_context, self, path_spec, **kwargs)
+
+      yield self._GetFileEntryMetadata(file_entry)
@@ -4,17 +4,26 @@
 
 from __future__ import unicode_literals
 
+import gzip
+import os
+import threading
 import unittest
 
 from dfvfs.analyzer import analyzer
 from dfvfs.analyzer import analyzer_helper
+from dfvfs.analyzer import results_store
 from dfvfs.analyzer import specification
+from dfvfs.file_io import fake_file_io
 from dfvfs.lib import definitions
+from dfvfs.lib import source_file
+from dfvfs.path import fake_path_spec
 from dfvfs.path import gzip_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
 from dfvfs.path import tsk_partition_path_spec
 from dfvfs.path import vshadow_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 
 from tests import test_lib as shared_test_lib
 
@@ -43,15 +52,285 @@ class TestAnalyzerHelper(analyzer_helper.AnalyzerHelper):
     return
 
 
+class ReadAtCountingFakeFile(fake_file_io.FakeFile):
+  """Fake file-like object that counts the positional reads for testing.
+
+  Attributes:
+    number_of_read_at_calls (int): number of positional reads.
+  """
+
+  def __init__(self, resolver_context, file_data):
+    """Initializes a file-like object.
+
+    Args:
+      resolver_context (Context): resolver context.
+      file_data (bytes): fake file data.
+    """
+    super(ReadAtCountingFakeFile, self).__init__(resolver_context, file_data)
+    self.number_of_read_at_calls = 0
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    Args:
+      offset (int): offset to read from.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+    """
+    self.number_of_read_at_calls += 1
+    return super(ReadAtCountingFakeFile, self).read_at(offset, size)
+
+
 class AnalyzerTest(shared_test_lib.BaseTestCase):
   """Format analyzer tests."""
 
   # pylint: disable=protected-access
 
+  def testCacheResult(self):
+    """Tests the _CacheResult and _GetCachedResult functions."""
+    path_spec = os_path_spec.OSPathSpec(location='/cached')
+    source_values = (1024, '2019-01-01 00:00:00')
+
+    type_indicators = analyzer.Analyzer._GetCachedResult(
+        path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, source_values)
+    self.assertIsNone(type_indicators)
+
+    analyzer.Analyzer._CacheResult(
+        path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, source_values,
+        [definitions.TYPE_INDICATOR_VSHADOW])
+
+    type_indicators = analyzer.Analyzer._GetCachedResult(
+        path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, source_values)
+    self.assertEqual(type_indicators, [definitions.TYPE_INDICATOR_VSHADOW])
+
+    type_indicators = analyzer.Analyzer._GetCachedResult(
+        path_spec, definitions.FORMAT_CATEGORY_FILE_SYSTEM, source_values)
+    self.assertIsNone(type_indicators)
+
+    # Test a source that was modified after the result was cached.
+    type_indicators = analyzer.Analyzer._GetCachedResult(
+        path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM,
+        (1024, '2019-01-02 00:00:00'))
+    self.assertIsNone(type_indicators)
+
+    # Test a source without a size, of which the result cannot be validated.
+    analyzer.Analyzer._CacheResult(
+        path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, (None, None),
+        [definitions.TYPE_INDICATOR_VSHADOW])
+
+    type_indicators = analyzer.Analyzer._GetCachedResult(
+        path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, (None, None))
+    self.assertIsNone(type_indicators)
+
+    maximum_number_of_cached_results = (
+        analyzer.Analyzer._MAXIMUM_NUMBER_OF_CACHED_RESULTS)
+    analyzer.Analyzer._MAXIMUM_NUMBER_OF_CACHED_RESULTS = 1
+
+    try:
+      analyzer.Analyzer._CacheResult(
+          path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, source_values,
+          [definitions.TYPE_INDICATOR_VSHADOW])
+      analyzer.Analyzer._CacheResult(
+          path_spec, definitions.FORMAT_CATEGORY_FILE_SYSTEM, source_values,
+          [])
+
+      type_indicators = analyzer.Analyzer._GetCachedResult(
+          path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, source_values)
+      self.assertIsNone(type_indicators)
+
+      type_indicators = analyzer.Analyzer._GetCachedResult(
+          path_spec, definitions.FORMAT_CATEGORY_FILE_SYSTEM, source_values)
+      self.assertEqual(type_indicators, [])
+
+    finally:
+      analyzer.Analyzer._MAXIMUM_NUMBER_OF_CACHED_RESULTS = (
+          maximum_number_of_cached_results)
+
+    analyzer.Analyzer._FlushCache(definitions.FORMAT_CATEGORIES)
+
+  def testCacheResultWithResultsStore(self):
+    """Tests the _CacheResult and _GetCachedResult functions with a store."""
+    test_file = self._GetTestFilePath(['syslog.gz'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    source_values = source_file.GetSourceValues(path_spec)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      analyzer.Analyzer.results_store = results_store.ResultsStore(
+          os.path.join(temp_directory, 'results'))
+
+      try:
+        analyzer.Analyzer._CacheResult(
+            path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM,
+            source_values, [definitions.TYPE_INDICATOR_GZIP])
+
+        analyzer.Analyzer._FlushCache(definitions.FORMAT_CATEGORIES)
+        self.assertEqual(len(analyzer.Analyzer._results_cache), 0)
+
+        type_indicators = analyzer.Analyzer._GetCachedResult(
+            path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM,
+            source_values)
+        self.assertEqual(type_indicators, [definitions.TYPE_INDICATOR_GZIP])
+
+      finally:
+        analyzer.Analyzer.results_store = None
+
+    analyzer.Analyzer._FlushCache(definitions.FORMAT_CATEGORIES)
+
   def testFlushCache(self):
     """Tests the _FlushCache function."""
+    path_spec = os_path_spec.OSPathSpec(location='/cached')
+    source_values = (1024, '2019-01-01 00:00:00')
+
+    analyzer.Analyzer._CacheResult(
+        path_spec, definitions.FORMAT_CATEGORY_FILE_SYSTEM, source_values, [])
+    analyzer.Analyzer._CacheResult(
+        path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, source_values,
+        [])
+
+    analyzer.Analyzer._FlushCache([definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+
+    type_indicators = analyzer.Analyzer._GetCachedResult(
+        path_spec, definitions.FORMAT_CATEGORY_FILE_SYSTEM, source_values)
+    self.assertEqual(type_indicators, [])
+
+    type_indicators = analyzer.Analyzer._GetCachedResult(
+        path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, source_values)
+    self.assertIsNone(type_indicators)
+
     analyzer.Analyzer._FlushCache(definitions.FORMAT_CATEGORIES)
 
+  def testGetFooterSignatureScanner(self):
+    """Tests the _GetFooterSignatureScanner function."""
+    format_specification = specification.FormatSpecification('test')
+    format_specification.AddNewSignature(b'test', offset=0)
+
+    specification_store = specification.FormatSpecificationStore()
+    specification_store.AddSpecification(format_specification)
+
+    signature_scanner = analyzer.Analyzer._GetFooterSignatureScanner(
+        specification_store, 8)
+    self.assertIsNone(signature_scanner)
+
+    format_specification = specification.FormatSpecification('other')
+    format_specification.AddNewSignature(b'other', offset=-8)
+    specification_store.AddSpecification(format_specification)
+
+    signature_scanner = analyzer.Analyzer._GetFooterSignatureScanner(
+        specification_store, 8)
+    self.assertIsNotNone(signature_scanner)
+
+  def testGetFormatCategoryScanner(self):
+    """Tests the _GetFormatCategoryScanner function."""
+    format_category_scanner = analyzer.Analyzer._GetFormatCategoryScanner(
+        definitions.FORMAT_CATEGORY_ARCHIVE)
+    self.assertIsNotNone(format_category_scanner.signature_scanner)
+    self.assertIsNone(format_category_scanner.footer_signature_scanner)
+    self.assertIsNotNone(format_category_scanner.header_signature_scanner)
+    self.assertEqual(format_category_scanner.footer_range_size, 0)
+    self.assertEqual(format_category_scanner.header_range_size, 265)
+
+    format_category_scanner = analyzer.Analyzer._GetFormatCategoryScanner(
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE)
+    self.assertIsNotNone(format_category_scanner.signature_scanner)
+    self.assertIsNotNone(format_category_scanner.footer_signature_scanner)
+    self.assertIsNotNone(format_category_scanner.header_signature_scanner)
+    self.assertEqual(format_category_scanner.footer_range_size, 512)
+
+  def testGetFormatCategoryScanners(self):
+    """Tests the _GetFormatCategoryScanners function."""
+    format_category_scanner = analyzer.Analyzer._GetFormatCategoryScanner(
+        definitions.FORMAT_CATEGORY_ARCHIVE)
+
+    format_category_scanners = analyzer.Analyzer._GetFormatCategoryScanners()
+    self.assertIs(
+        format_category_scanners[definitions.FORMAT_CATEGORY_ARCHIVE],
+        format_category_scanner)
+
+    thread_format_category_scanners = []
+
+    def _GetThreadFormatCategoryScanners():
+      """Retrieves the format category scanners of another thread."""
+      thread_format_category_scanners.append(
+          analyzer.Analyzer._GetFormatCategoryScanners())
+
+    thread = threading.Thread(target=_GetThreadFormatCategoryScanners)
+    thread.start()
+    thread.join()
+
+    self.assertEqual(thread_format_category_scanners, [{}])
+
+    analyzer.Analyzer._FlushCache([definitions.FORMAT_CATEGORY_ARCHIVE])
+
+    format_category_scanners = analyzer.Analyzer._GetFormatCategoryScanners()
+    self.assertEqual(format_category_scanners, {})
+
+  def testGetHeaderSignatureScanner(self):
+    """Tests the _GetHeaderSignatureScanner function."""
+    format_specification = specification.FormatSpecification('test')
+    format_specification.AddNewSignature(b'test', offset=-8)
+
+    specification_store = specification.FormatSpecificationStore()
+    specification_store.AddSpecification(format_specification)
+
+    signature_scanner = analyzer.Analyzer._GetHeaderSignatureScanner(
+        specification_store)
+    self.assertIsNone(signature_scanner)
+
+    format_specification = specification.FormatSpecification('other')
+    format_specification.AddNewSignature(b'other', offset=0)
+    specification_store.AddSpecification(format_specification)
+
+    signature_scanner = analyzer.Analyzer._GetHeaderSignatureScanner(
+        specification_store)
+    self.assertIsNotNone(signature_scanner)
+
+  def testGetScanRangeSizes(self):
+    """Tests the _GetScanRangeSizes function."""
+    specification_store = specification.FormatSpecificationStore()
+    format_specification = specification_store.AddNewSpecification('test')
+    format_specification.AddNewSignature(b'test', offset=4)
+    format_specification.AddNewSignature(b'te', offset=0)
+
+    scan_range_sizes = analyzer.Analyzer._GetScanRangeSizes(
+        specification_store)
+    self.assertEqual(scan_range_sizes, (8, 0))
+
+    format_specification.AddNewSignature(b'test', offset=-8)
+
+    scan_range_sizes = analyzer.Analyzer._GetScanRangeSizes(
+        specification_store)
+    self.assertEqual(scan_range_sizes, (8, 8))
+
+    format_specification.AddNewSignature(b'test')
+
+    scan_range_sizes = analyzer.Analyzer._GetScanRangeSizes(
+        specification_store)
+    self.assertEqual(scan_range_sizes, (None, 8))
+
+  def testGetScanState(self):
+    """Tests the _GetScanState function."""
+    scan_state = analyzer.Analyzer._GetScanState()
+    self.assertIsNotNone(scan_state)
+
+    other_scan_state = analyzer.Analyzer._GetScanState()
+    self.assertIs(other_scan_state, scan_state)
+
+    thread_scan_states = []
+
+    def _GetThreadScanState():
+      """Retrieves the scan state of another thread."""
+      thread_scan_states.append(analyzer.Analyzer._GetScanState())
+
+    thread = threading.Thread(target=_GetThreadScanState)
+    thread.start()
+    thread.join()
+
+    self.assertIsNot(thread_scan_states[0], scan_state)
+
   def testGetSignatureScanner(self):
     """Tests the _GetSignatureScanner function."""
     specification_store = specification.FormatSpecificationStore()
@@ -85,6 +364,27 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(
         len(analyzer.Analyzer._analyzer_helpers), number_of_helpers)
 
+  def testScanData(self):
+    """Tests the _ScanData function."""
+    format_specification = specification.FormatSpecification('test')
+    format_specification.AddNewSignature(b'test', offset=0)
+
+    specification_store = specification.FormatSpecificationStore()
+    specification_store.AddSpecification(format_specification)
+
+    signature_scanner = analyzer.Analyzer._GetSignatureScanner(
+        specification_store)
+
+    # Test that the results of a previous scan with the reused scan state
+    # are not returned.
+    for _ in range(2):
+      scan_results = analyzer.Analyzer._ScanData(
+          signature_scanner, b'test data')
+      self.assertEqual(len(scan_results), 1)
+
+    scan_results = analyzer.Analyzer._ScanData(signature_scanner, b'data')
+    self.assertEqual(scan_results, [])
+
   def testGetArchiveTypeIndicatorsTAR(self):
     """Tests the GetArchiveTypeIndicators function on a .tar file."""
     test_file = self._GetTestFilePath(['syslog.tar'])
@@ -140,6 +440,78 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         path_spec)
     self.assertEqual(type_indicators, expected_type_indicators)
 
+  def testGetFileObjectTypeIndicators(self):
+    """Tests the GetFileObjectTypeIndicators function."""
+    test_file = self._GetTestFilePath(['syslog.tgz'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = gzip_path_spec.GzipPathSpec(parent=path_spec)
+
+    file_object = resolver.Resolver.OpenFileObject(path_spec)
+
+    try:
+      type_indicators = analyzer.Analyzer.GetFileObjectTypeIndicators(
+          file_object, format_categories=[
+              definitions.FORMAT_CATEGORY_ARCHIVE,
+              definitions.FORMAT_CATEGORY_COMPRESSED_STREAM])
+
+    finally:
+      file_object.close()
+
+    self.assertEqual(type_indicators, {
+        definitions.FORMAT_CATEGORY_ARCHIVE: [definitions.TYPE_INDICATOR_TAR],
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: []})
+
+  def testGetFileObjectTypeIndicatorsWithFooter(self):
+    """Tests the GetFileObjectTypeIndicators function with a footer."""
+    test_data = b''.join([b'\x00' * 1024, b'conectix', b'\x00' * 504])
+
+    file_object = fake_file_io.FakeFile(context.Context(), test_data)
+    file_object.open(path_spec=fake_path_spec.FakePathSpec(location='/test'))
+
+    try:
+      type_indicators = analyzer.Analyzer.GetFileObjectTypeIndicators(
+          file_object, format_categories=[
+              definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE])
+      self.assertEqual(type_indicators, {
+          definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: [
+              definitions.TYPE_INDICATOR_VHDI]})
+
+      type_indicators = analyzer.Analyzer.GetFileObjectTypeIndicators(
+          file_object, format_categories=[
+              definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE],
+          skip_end_relative_signatures=True)
+      self.assertEqual(type_indicators, {
+          definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: []})
+
+    finally:
+      file_object.close()
+
+  def testGetFileObjectTypeIndicatorsReadOnce(self):
+    """Tests that the header and footer are read once for all categories."""
+    test_data = b''.join([b'\x00' * 65536, b'conectix', b'\x00' * 504])
+
+    file_object = ReadAtCountingFakeFile(context.Context(), test_data)
+    file_object.open(path_spec=fake_path_spec.FakePathSpec(location='/test'))
+
+    try:
+      type_indicators = analyzer.Analyzer.GetFileObjectTypeIndicators(
+          file_object, format_categories=[
+              definitions.FORMAT_CATEGORY_ARCHIVE,
+              definitions.FORMAT_CATEGORY_COMPRESSED_STREAM,
+              definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE])
+
+    finally:
+      file_object.close()
+
+    self.assertEqual(file_object.number_of_read_at_calls, 2)
+    self.assertEqual(type_indicators, {
+        definitions.FORMAT_CATEGORY_ARCHIVE: [],
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: [],
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: [
+            definitions.TYPE_INDICATOR_VHDI]})
+
   def testGetFileSystemTypeIndicators(self):
     """Tests the GetFileSystemTypeIndicators function on a .qcow2 file."""
     test_file = self._GetTestFilePath(['vsstest.qcow2'])
@@ -191,6 +563,30 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         path_spec)
     self.assertEqual(type_indicators, expected_type_indicators)
 
+  def testGetStorageMediaImageTypeIndicatorsVHDIInGzip(self):
+    """Tests the GetStorageMediaImageTypeIndicator function on a .vhd.gz."""
+    # A fixed disk image only contains the VHD signature in its footer.
+    vhd_data = b''.join([b'\x00' * 65536, b'conectix', b'\x00' * 504])
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'image.vhd.gz')
+      with gzip.open(test_path, 'wb') as file_object:
+        file_object.write(vhd_data)
+
+      path_spec = os_path_spec.OSPathSpec(location=test_path)
+      path_spec = gzip_path_spec.GzipPathSpec(parent=path_spec)
+
+      type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
+          path_spec, skip_end_relative_signatures=True)
+      self.assertEqual(type_indicators, [])
+
+      expected_type_indicators = [definitions.TYPE_INDICATOR_VHDI]
+      type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
+          path_spec)
+      self.assertEqual(type_indicators, expected_type_indicators)
+
+    analyzer.Analyzer._FlushCache(definitions.FORMAT_CATEGORIES)
+
   def testGetStorageMediaImageTypeIndicatorsVMDK(self):
     """Tests the GetStorageMediaImageTypeIndicator function on a .vmdk file."""
     test_file = self._GetTestFilePath(['ext2.vmdk'])
@@ -215,6 +611,123 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         path_spec)
     self.assertEqual(type_indicators, expected_type_indicators)
 
+  def testGetTypeIndicators(self):
+    """Tests the GetTypeIndicators function."""
+    test_file = self._GetTestFilePath(['syslog.tgz'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    type_indicators = analyzer.Analyzer.GetTypeIndicators(path_spec)
+    self.assertEqual(
+        set(type_indicators.keys()), set(definitions.FORMAT_CATEGORIES))
+
+    expected_type_indicators = [definitions.TYPE_INDICATOR_GZIP]
+    self.assertEqual(
+        type_indicators[definitions.FORMAT_CATEGORY_COMPRESSED_STREAM],
+        expected_type_indicators)
+    self.assertEqual(
+        type_indicators[definitions.FORMAT_CATEGORY_FILE_SYSTEM], [])
+
+    type_indicators = analyzer.Analyzer.GetTypeIndicators(
+        path_spec, format_categories=[
+            definitions.FORMAT_CATEGORY_ARCHIVE,
+            definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+    self.assertEqual(type_indicators, {
+        definitions.FORMAT_CATEGORY_ARCHIVE: [],
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: []})
+
+  def testGetTypeIndicatorsCached(self):
+    """Tests the GetTypeIndicators function with cached results."""
+    test_file = self._GetTestFilePath(['syslog.gz'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    resolver_context = context.Context()
+
+    analyzer.Analyzer._FlushCache(definitions.FORMAT_CATEGORIES)
+
+    type_indicators = analyzer.Analyzer.GetTypeIndicators(
+        path_spec, resolver_context=resolver_context)
+
+    file_object_statistics = resolver_context.GetFileObjectCacheStatistics()
+    file_system_statistics = resolver_context.GetFileSystemCacheStatistics()
+    number_of_lookups = (
+        file_object_statistics.number_of_hits,
+        file_object_statistics.number_of_misses,
+        file_system_statistics.number_of_hits,
+        file_system_statistics.number_of_misses)
+
+    # Validating the cached results does not open the source.
+    cached_type_indicators = analyzer.Analyzer.GetTypeIndicators(
+        path_spec, resolver_context=resolver_context)
+    self.assertEqual(cached_type_indicators, type_indicators)
+
+    file_object_statistics = resolver_context.GetFileObjectCacheStatistics()
+    file_system_statistics = resolver_context.GetFileSystemCacheStatistics()
+    self.assertEqual((
+        file_object_statistics.number_of_hits,
+        file_object_statistics.number_of_misses,
+        file_system_statistics.number_of_hits,
+        file_system_statistics.number_of_misses), number_of_lookups)
+
+    analyzer.Analyzer._FlushCache(definitions.FORMAT_CATEGORIES)
+
+  def testGetTypeIndicatorsModifiedSource(self):
+    """Tests the GetTypeIndicators function on a modified source."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'image.vhd')
+      with open(test_path, 'wb') as file_object:
+        file_object.write(b''.join([
+            b'\x00' * 1024, b'conectix', b'\x00' * 504]))
+
+      path_spec = os_path_spec.OSPathSpec(location=test_path)
+
+      type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
+          path_spec)
+      self.assertEqual(type_indicators, [definitions.TYPE_INDICATOR_VHDI])
+
+      with open(test_path, 'wb') as file_object:
+        file_object.write(b'\x00' * 2048)
+
+      type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
+          path_spec)
+      self.assertEqual(type_indicators, [])
+
+    analyzer.Analyzer._FlushCache(definitions.FORMAT_CATEGORIES)
+
+  def testGetTypeIndicatorsQCOW(self):
+    """Tests the GetTypeIndicators function on a .qcow2 file."""
+    test_file = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    type_indicators = analyzer.Analyzer.GetTypeIndicators(path_spec)
+
+    expected_type_indicators = [definitions.TYPE_INDICATOR_QCOW]
+    self.assertEqual(
+        type_indicators[definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE],
+        expected_type_indicators)
+
+    expected_type_indicators = (
+        analyzer.Analyzer.GetVolumeSystemTypeIndicators(path_spec))
+    self.assertEqual(
+        type_indicators[definitions.FORMAT_CATEGORY_VOLUME_SYSTEM],
+        expected_type_indicators)
+
+    path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+
+    type_indicators = analyzer.Analyzer.GetTypeIndicators(path_spec)
+
+    expected_type_indicators = (
+        analyzer.Analyzer.GetFileSystemTypeIndicators(path_spec))
+    self.assertEqual(
+        type_indicators[definitions.FORMAT_CATEGORY_FILE_SYSTEM],
+        expected_type_indicators)
+    self.assertEqual(
+        type_indicators[definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE], [])
+
   def testGetVolumeSystemTypeIndicatorsTSK(self):
     """Tests the GetVolumeSystemTypeIndicators function on partitions."""
     test_file = self._GetTestFilePath(['tsk_volume_system.raw'])
@@ -267,6 +780,48 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         path_spec)
     self.assertEqual(type_indicators, expected_type_indicators)
 
+  def testIterateTypeIndicators(self):
+    """Tests the IterateTypeIndicators function."""
+    test_file = self._GetTestFilePath(['syslog.tar'])
+    self._SkipIfPathNotExists(test_file)
+
+    format_categories = [
+        definitions.FORMAT_CATEGORY_ARCHIVE,
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM]
+
+    path_specs = [
+        os_path_spec.OSPathSpec(location=self._GetTestFilePath([filename]))
+        for filename in ('syslog.gz', 'syslog.tar', 'syslog.zip')]
+    expected_type_indicators = [
+        [definitions.TYPE_INDICATOR_GZIP], [definitions.TYPE_INDICATOR_TAR],
+        [definitions.TYPE_INDICATOR_ZIP]]
+
+    for number_of_workers in (0, 2):
+      results = list(analyzer.Analyzer.IterateTypeIndicators(
+          path_specs, format_categories=format_categories,
+          number_of_workers=number_of_workers,
+          resolver_context=context.ThreadSafeContext()))
+      self.assertEqual([source for source, _ in results], path_specs)
+
+      type_indicators = [
+          type_indicators[definitions.FORMAT_CATEGORY_ARCHIVE] +
+          type_indicators[definitions.FORMAT_CATEGORY_COMPRESSED_STREAM]
+          for _, type_indicators in results]
+      self.assertEqual(type_indicators, expected_type_indicators)
+
+    file_object = resolver.Resolver.OpenFileObject(path_specs[1])
+
+    try:
+      results = list(analyzer.Analyzer.IterateTypeIndicators(
+          [file_object], format_categories=format_categories))
+
+    finally:
+      file_object.close()
+
+    self.assertEqual(results, [(file_object, {
+        definitions.FORMAT_CATEGORY_ARCHIVE: [definitions.TYPE_INDICATOR_TAR],
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: []})])
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the persistent format analysis results store."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dfvfs.analyzer import results_store
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+
+from tests import test_lib as shared_test_lib
+
+
+class ResultsStoreTest(shared_test_lib.BaseTestCase):
+  """Tests for the persistent format analysis results store."""
+
+  # pylint: disable=protected-access
+
+  _ANALYZER_HELPERS = [definitions.TYPE_INDICATOR_GZIP]
+
+  _SOURCE_VALUES = (1024, '2019-01-01 00:00:00')
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    test_path = self._GetTestFilePath(['syslog.gz'])
+    self._SkipIfPathNotExists(test_path)
+
+    self._os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    self._gzip_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_GZIP, parent=self._os_path_spec)
+
+  def testGetResultsFilePath(self):
+    """Tests the _GetResultsFilePath function."""
+    test_store = results_store.ResultsStore('results')
+
+    results_file_path = test_store._GetResultsFilePath(
+        self._os_path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM)
+    self.assertEqual(os.path.dirname(results_file_path), 'results')
+    self.assertTrue(results_file_path.endswith('.json'))
+
+    other_results_file_path = test_store._GetResultsFilePath(
+        self._gzip_path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM)
+    self.assertNotEqual(results_file_path, other_results_file_path)
+
+    other_results_file_path = test_store._GetResultsFilePath(
+        self._os_path_spec, definitions.FORMAT_CATEGORY_ARCHIVE)
+    self.assertNotEqual(results_file_path, other_results_file_path)
+
+  def testReadWriteResult(self):
+    """Tests the ReadResult and WriteResult functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_store = results_store.ResultsStore(
+          os.path.join(temp_directory, 'results'))
+
+      type_indicators = test_store.ReadResult(
+          self._os_path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM,
+          self._ANALYZER_HELPERS, self._SOURCE_VALUES)
+      self.assertIsNone(type_indicators)
+
+      test_store.WriteResult(
+          self._os_path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM,
+          self._ANALYZER_HELPERS, self._SOURCE_VALUES,
+          [definitions.TYPE_INDICATOR_GZIP])
+
+      type_indicators = test_store.ReadResult(
+          self._os_path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM,
+          self._ANALYZER_HELPERS, self._SOURCE_VALUES)
+      self.assertEqual(type_indicators, [definitions.TYPE_INDICATOR_GZIP])
+
+      # A result of other analyzer helpers should not be used.
+      type_indicators = test_store.ReadResult(
+          self._os_path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM,
+          [], self._SOURCE_VALUES)
+      self.assertIsNone(type_indicators)
+
+      # Only the results file should remain in the directory.
+      results_file_path = test_store._GetResultsFilePath(
+          self._os_path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM)
+      self.assertEqual(
+          os.listdir(os.path.dirname(results_file_path)),
+          [os.path.basename(results_file_path)])
+
+      # Test a results file with a mismatching source size.
+      type_indicators = test_store.ReadResult(
+          self._os_path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM,
+          self._ANALYZER_HELPERS, (2048, '2019-01-01 00:00:00'))
+      self.assertIsNone(type_indicators)
+
+      # Test a results file with a mismatching source modification time.
+      type_indicators = test_store.ReadResult(
+          self._os_path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM,
+          self._ANALYZER_HELPERS, (1024, '2019-01-02 00:00:00'))
+      self.assertIsNone(type_indicators)
+
+      # Test a corrupt results file.
+      with open(results_file_path, 'wb') as file_object:
+        file_object.write(b'{"format_version": ')
+
+      type_indicators = test_store.ReadResult(
+          self._os_path_spec, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM,
+          self._ANALYZER_HELPERS, self._SOURCE_VALUES)
+      self.assertIsNone(type_indicators)
+
+
+if __name__ == '__main__':
+  unittest.main()
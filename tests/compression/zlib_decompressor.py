@@ -15,6 +15,33 @@ from tests.compression import test_lib
 class ZlibDecompressorTestCase(test_lib.DecompressorTestCase):
   """Tests for the zlib decompressor object."""
 
+  def testCopy(self):
+    """Tests the Copy method."""
+    decompressor = zlib_decompressor.ZlibDecompressor()
+
+    compressed_data = (
+        b'x\x9c\x0b\xc9\xc8,V\x00\xa2D\x85\x92\xd4\xe2\x12=\x00)\x97\x05$')
+
+    uncompressed_data, _ = decompressor.Decompress(compressed_data[:8])
+
+    decompressor_copy = decompressor.Copy()
+    self.assertIsInstance(
+        decompressor_copy, zlib_decompressor.ZlibDecompressor)
+
+    remaining_uncompressed_data, _ = decompressor_copy.Decompress(
+        compressed_data[8:])
+    expected_uncompressed_data = b'This is a test.'
+    self.assertEqual(
+        uncompressed_data + remaining_uncompressed_data,
+        expected_uncompressed_data)
+
+    # The state of the original decompressor is not affected by the copy.
+    remaining_uncompressed_data, _ = decompressor.Decompress(
+        compressed_data[8:])
+    self.assertEqual(
+        uncompressed_data + remaining_uncompressed_data,
+        expected_uncompressed_data)
+
   def testDecompress(self):
     """Tests the Decompress method."""
     decompressor = zlib_decompressor.ZlibDecompressor()
@@ -5,7 +5,10 @@
 from __future__ import unicode_literals
 
 import os
+import sys
+import threading
 import unittest
+import zlib
 
 try:
   import lzma
@@ -16,12 +19,17 @@ except ImportError:
     lzma = None
 
 from dfvfs.file_io import compressed_stream_io
+from dfvfs.file_io import fake_file_io
 from dfvfs.file_io import os_file_io
 from dfvfs.lib import definitions
+from dfvfs.lib import seek_index
 from dfvfs.path import compressed_stream_path_spec
+from dfvfs.path import fake_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 
+from tests import test_lib as shared_test_lib
 from tests.file_io import test_lib
 
 
@@ -293,6 +301,39 @@ class ZlibCompressedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testGetSizeWithSeekIndex(self):
+    """Test the get size functionality using a persistent seek index."""
+    # pylint: disable=protected-access
+    with shared_test_lib.TempDirectory() as temp_directory:
+      resolver.Resolver.seek_index_store = seek_index.SeekIndexStore(
+          temp_directory)
+
+      try:
+        file_object = compressed_stream_io.CompressedStream(
+            self._resolver_context)
+        file_object.open(path_spec=self._compressed_stream_path_spec)
+
+        self._TestGetSizeFileObject(file_object)
+
+        file_object.close()
+
+        self.assertEqual(len(os.listdir(temp_directory)), 1)
+
+        # The size is now read from the seek index without decompressing.
+        resolver_context = context.Context()
+        file_object = compressed_stream_io.CompressedStream(resolver_context)
+        file_object.open(path_spec=self._compressed_stream_path_spec)
+
+        self._TestGetSizeFileObject(file_object)
+        self.assertIsNone(file_object._decompressor)
+
+        self._TestReadFileObject(file_object)
+
+        file_object.close()
+
+      finally:
+        resolver.Resolver.seek_index_store = None
+
   def testRead(self):
     """Test the read functionality."""
     file_object = compressed_stream_io.CompressedStream(self._resolver_context)
@@ -302,6 +343,176 @@ class ZlibCompressedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = compressed_stream_io.CompressedStream(self._resolver_context)
+    file_object.open(path_spec=self._compressed_stream_path_spec)
+
+    self._TestReadAtFileObject(file_object)
+
+    file_object.close()
+
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = compressed_stream_io.CompressedStream(self._resolver_context)
+    file_object.open(path_spec=self._compressed_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
+
+class ZlibCompressedStreamCheckpointsTest(shared_test_lib.BaseTestCase):
+  """The unit test for zlib compressed stream checkpoints."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+
+    self._uncompressed_data = b''.join([
+        '{0:08d}\n'.format(index).encode('ascii')
+        for index in range(16 * 1024)])
+
+    fake_file_object = fake_file_io.FakeFile(
+        self._resolver_context, zlib.compress(self._uncompressed_data))
+    fake_file_object.open(
+        path_spec=fake_path_spec.FakePathSpec(location='/syslog.zlib'))
+
+    self._fake_file_object = fake_file_object
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._fake_file_object.close()
+
+  def _OpenCompressedStream(self, maximum_checkpoints_size=None):
+    """Opens a compressed stream with a small buffer and checkpoint spacing.
+
+    Args:
+      maximum_checkpoints_size (Optional[int]): maximum number of bytes of
+          memory used by checkpoints.
+
+    Returns:
+      CompressedStream: compressed stream.
+    """
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context,
+        compression_method=definitions.COMPRESSION_METHOD_ZLIB,
+        file_object=self._fake_file_object, checkpoint_spacing=4096,
+        maximum_checkpoints_size=maximum_checkpoints_size)
+    file_object._COMPRESSED_DATA_BUFFER_SIZE = 512
+    file_object.open()
+    return file_object
+
+  def _TestReadAtOffsets(self, file_object):
+    """Tests reading the compressed stream at out of order offsets.
+
+    Args:
+      file_object (CompressedStream): compressed stream.
+    """
+    for offset in (120000, 500, 80000, 8190, 147000, 0, 65536):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(300), self._uncompressed_data[offset:offset + 300])
+
+  def testGetSize(self):
+    """Tests that determining the size records checkpoints."""
+    file_object = self._OpenCompressedStream()
+
+    self.assertEqual(file_object.get_size(), len(self._uncompressed_data))
+    self.assertGreater(len(file_object._checkpoints), 1)
+
+    file_object.close()
+
+  def testSeekAndRead(self):
+    """Tests seeking and reading using checkpoints."""
+    file_object = self._OpenCompressedStream()
+
+    self._TestReadAtOffsets(file_object)
+
+    file_object.seek(len(self._uncompressed_data) - 9, os.SEEK_SET)
+    self.assertEqual(file_object.read(), b'00016383\n')
+
+    offsets = [
+        checkpoint.uncompressed_data_offset
+        for checkpoint in file_object._checkpoints]
+    self.assertEqual(offsets, sorted(offsets))
+    self.assertEqual(offsets[0], 0)
+    self.assertEqual(file_object._checkpoint_offsets, offsets)
+
+    # Seeking backwards should resume from a checkpoint near the offset
+    # instead of from the start of the stream.
+    file_object.seek(100000, os.SEEK_SET)
+    file_object.read(1)
+    self.assertGreater(file_object._uncompressed_stream_offset, 90000)
+
+    file_object.close()
+
+  def testMaximumCheckpointsSize(self):
+    """Tests that checkpoints are thinned out when exceeding the maximum."""
+    file_object = self._OpenCompressedStream(
+        maximum_checkpoints_size=(
+            8 * compressed_stream_io.CompressedStream._DECOMPRESSOR_STATE_SIZE))
+
+    file_object.get_size()
+
+    self.assertGreater(file_object._checkpoint_spacing, 4096)
+    self.assertLessEqual(
+        file_object._checkpoints_size, file_object._maximum_checkpoints_size)
+
+    offsets = [
+        checkpoint.uncompressed_data_offset
+        for checkpoint in file_object._checkpoints]
+    self.assertEqual(file_object._checkpoint_offsets, offsets)
+
+    self._TestReadAtOffsets(file_object)
+
+    file_object.close()
+
+  @unittest.skipIf(
+      not hasattr(sys, 'setswitchinterval'), 'missing setswitchinterval')
+  def testReadAtFromThreads(self):
+    """Tests reading at offsets by threads that share the compressed stream."""
+    file_object = self._OpenCompressedStream()
+
+    mismatched_offsets = []
+
+    def _ReadAtOffsets(offsets):
+      """Reads the compressed stream at offsets.
+
+      Args:
+        offsets (list[int]): offsets to read at.
+      """
+      for offset in offsets:
+        data = file_object.read_at(offset, 300)
+        if data != self._uncompressed_data[offset:offset + 300]:
+          mismatched_offsets.append(offset)
+
+    threads = []
+    for thread_index in range(4):
+      offsets = list(range(thread_index * 100, 140000, 997))
+      threads.append(threading.Thread(target=_ReadAtOffsets, args=(offsets, )))
+
+    # Switch between the threads often to make interleaved reads likely.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+      for thread in threads:
+        thread.start()
+
+      for thread in threads:
+        thread.join()
+
+    finally:
+      sys.setswitchinterval(switch_interval)
+
+    self.assertEqual(mismatched_offsets, [])
+    self.assertEqual(file_object.get_offset(), 0)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
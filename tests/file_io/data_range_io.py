@@ -84,6 +84,24 @@ class DataRangeTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = data_range_io.DataRange(self._resolver_context)
+    file_object.open(path_spec=self._data_range_path_spec)
+
+    self._TestReadAtFileObject(file_object, base_offset=0)
+
+    file_object.close()
+
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = data_range_io.DataRange(self._resolver_context)
+    file_object.open(path_spec=self._data_range_path_spec)
+
+    self._TestReadIntoFileObject(file_object, base_offset=0)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -223,6 +223,15 @@ class Base64EncodedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
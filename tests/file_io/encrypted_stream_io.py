@@ -420,6 +420,15 @@ class RC4EncryptedStreamWithKeyChainTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encrypted_stream_io.EncryptedStream(self._resolver_context)
+    file_object.open(path_spec=self._encrypted_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
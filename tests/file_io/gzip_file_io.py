@@ -4,13 +4,17 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
 from dfvfs.file_io import gzip_file_io
 from dfvfs.lib import definitions
+from dfvfs.lib import seek_index
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 
+from tests import test_lib as shared_test_lib
 from tests.file_io import test_lib
 
 
@@ -115,6 +119,55 @@ class GzipFileTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadWithSeekIndex(self):
+    """Tests reading a file using a persistent seek index."""
+    test_path = self._GetTestFilePath(['fsevents_000000000000b208'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    test_gzip_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_GZIP, parent=test_os_path_spec)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      resolver.Resolver.seek_index_store = seek_index.SeekIndexStore(
+          temp_directory)
+
+      try:
+        file_object = gzip_file_io.GzipFile(self._resolver_context)
+        file_object.open(path_spec=test_gzip_path_spec)
+        file_object.close()
+
+        self.assertEqual(len(os.listdir(temp_directory)), 1)
+
+        # The members are now opened from the seek index.
+        resolver_context = context.Context()
+        file_object = gzip_file_io.GzipFile(resolver_context)
+        file_object.open(path_spec=test_gzip_path_spec)
+
+        self.assertEqual(file_object.uncompressed_data_size, 506631)
+        self.assertEqual(file_object.operating_systems, [3, 3])
+
+        file_object.seek(28530)
+        self.assertEqual(file_object.read(6), b'OS\x00P\x07\x00')
+
+        file_object.seek(506631 - 4)
+        self.assertEqual(file_object.read(4), b'\x02\x00\x80\x00')
+
+        file_object.close()
+
+      finally:
+        resolver.Resolver.seek_index_store = None
+
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = gzip_file_io.GzipFile(self._resolver_context)
+    file_object.open(path_spec=self._gzip_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -8,6 +8,7 @@ import os
 import unittest
 
 from dfvfs.file_io import os_file_io
+from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
@@ -130,6 +131,57 @@ class OSFileTest(shared_test_lib.BaseTestCase):
 
     # TODO: add boundary scenarios.
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+
+    # Try read without the file object being open.
+    with self.assertRaises(IOError):
+      file_object.readinto(bytearray(10))
+
+    file_object.open(path_spec=self._path_spec1)
+
+    read_buffer = bytearray(200)
+    read_count = file_object.readinto(read_buffer)
+
+    expected_buffer = (
+        b'place,user,password\n'
+        b'bank,joesmith,superrich\n'
+        b'alarm system,-,1234\n'
+        b'treasure chest,-,1111\n'
+        b'uber secret laire,admin,admin\n')
+
+    self.assertEqual(read_count, 116)
+    self.assertEqual(bytes(read_buffer[:read_count]), expected_buffer)
+    self.assertEqual(file_object.get_offset(), 116)
+
+    file_object.close()
+
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+
+    # Try read without the file object being open.
+    with self.assertRaises(IOError):
+      file_object.read_at(0, 10)
+
+    file_object.open(path_spec=self._path_spec1)
+
+    read_buffer = file_object.read_at(20, 24)
+    self.assertEqual(read_buffer, b'bank,joesmith,superrich\n')
+    self.assertEqual(file_object.get_offset(), 0)
+
+    read_buffer = file_object.read_at(86, 100)
+    self.assertEqual(read_buffer, b'uber secret laire,admin,admin\n')
+
+    read_buffer = file_object.read_at(116, 10)
+    self.assertEqual(read_buffer, b'')
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-1, 10)
+
+    file_object.close()
+
   def testGetOffset(self):
     """Test the get offset functionality."""
     file_object = os_file_io.OSFile(self._resolver_context)
@@ -161,5 +213,72 @@ class OSFileTest(shared_test_lib.BaseTestCase):
     file_object.close()
 
 
+
+class MemoryMappedOSFileTest(OSFileTest):
+  """The unit test for the memory mapped operating system file-like object."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    super(MemoryMappedOSFileTest, self).setUp()
+    self._resolver_context = context.Context(
+        os_file_access_method=definitions.OS_FILE_ACCESS_METHOD_MMAP)
+
+  def testAccessMethod(self):
+    """Test the access method."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(path_spec=self._path_spec1)
+
+    self.assertEqual(
+        file_object._access_method, definitions.OS_FILE_ACCESS_METHOD_MMAP)
+
+    file_object.close()
+    self.assertIsNotNone(file_object._memory_map)
+
+    # The released file-like object is closed when it is evicted.
+    self._resolver_context.Empty()
+    self.assertIsNone(file_object._memory_map)
+
+  def testAccessMethodFallback(self):
+    """Test the access method fallback for files that cannot be mapped."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_file = os.path.join(temp_directory, 'empty')
+      with open(test_file, 'wb'):
+        pass
+
+      path_spec = os_path_spec.OSPathSpec(location=test_file)
+      file_object = os_file_io.OSFile(self._resolver_context)
+      file_object.open(path_spec=path_spec)
+
+      self.assertNotEqual(
+          file_object._access_method, definitions.OS_FILE_ACCESS_METHOD_MMAP)
+      self.assertEqual(file_object.read(), b'')
+
+      file_object.close()
+
+
+@unittest.skipUnless(hasattr(os, 'pread'), 'missing pread support')
+class PreadOSFileTest(OSFileTest):
+  """The unit test for the pread operating system file-like object."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    super(PreadOSFileTest, self).setUp()
+    self._resolver_context = context.Context(
+        os_file_access_method=definitions.OS_FILE_ACCESS_METHOD_PREAD)
+
+  def testAccessMethod(self):
+    """Test the access method."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(path_spec=self._path_spec1)
+
+    self.assertEqual(
+        file_object._access_method, definitions.OS_FILE_ACCESS_METHOD_PREAD)
+
+    file_object.close()
+
 if __name__ == '__main__':
   unittest.main()
@@ -6,9 +6,11 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.file_io import qcow_file_io
 from dfvfs.lib import errors
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
+from dfvfs.resolver import context
 
 from tests.file_io import test_lib
 
@@ -49,6 +51,105 @@ class QCOWFileTest(test_lib.Ext2ImageFileTestCase):
     """Test the read functionality."""
     self._TestRead(self._qcow_path_spec)
 
+  def testReadWithReadAhead(self):
+    """Test the read functionality using read-ahead."""
+    self._resolver_context = context.Context(maximum_read_ahead_size=0)
+
+    file_object = qcow_file_io.QCOWFile(self._resolver_context)
+    file_object.open(path_spec=self._qcow_path_spec)
+
+    expected_buffer = file_object.read(file_object.get_size())
+
+    self._resolver_context.SetMaximumReadAheadSize(256 * 1024)
+
+    file_object.seek(0)
+    data_segments = []
+    data = file_object.read(4096)
+    while data:
+      data_segments.append(data)
+      data = file_object.read(4096)
+
+    self.assertEqual(b''.join(data_segments), expected_buffer)
+
+    # pylint: disable=protected-access
+    self.assertEqual(file_object._read_ahead_size, 256 * 1024)
+
+    # Reading at a non-sequential offset resets the read-ahead size.
+    file_object.seek(1000)
+    self.assertEqual(file_object.read(5000), expected_buffer[1000:6000])
+    self.assertEqual(file_object.get_offset(), 6000)
+    self.assertEqual(
+        file_object._read_ahead_size, file_object._INITIAL_READ_AHEAD_SIZE)
+
+    self._TestRead(self._qcow_path_spec)
+
+    file_object.close()
+
+  def testReadWithBlockCache(self):
+    """Test the read functionality using the block cache."""
+    self._resolver_context = context.Context(
+        maximum_block_cache_size=1024 * 1024)
+
+    file_object = qcow_file_io.QCOWFile(self._resolver_context)
+    file_object.open(path_spec=self._qcow_path_spec)
+
+    file_object.seek(1000)
+    expected_buffer = file_object.read(5000)
+
+    self._resolver_context.SetMaximumBlockCacheSize(0)
+    file_object.seek(1000)
+    self.assertEqual(file_object.read(5000), expected_buffer)
+    self._resolver_context.SetMaximumBlockCacheSize(1024 * 1024)
+
+    self._TestRead(self._qcow_path_spec)
+
+    file_object.seek(1000)
+    self.assertEqual(file_object.read(5000), expected_buffer)
+    self.assertEqual(file_object.get_offset(), 6000)
+
+    file_object.seek(1000)
+    self.assertEqual(file_object.read(5000), expected_buffer)
+
+    statistics = self._resolver_context.GetBlockCacheStatistics()
+    self.assertGreater(statistics.number_of_hits, 0)
+
+    file_object.close()
+
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    self._TestReadAt(self._qcow_path_spec)
+
+    file_object = qcow_file_io.QCOWFile(self._resolver_context)
+    file_object.open(path_spec=self._qcow_path_spec)
+
+    file_object.seek(1024)
+    expected_buffer = file_object.read(512)
+
+    file_object.seek(100)
+    self.assertEqual(file_object.read_at(1024, 512), expected_buffer)
+    self.assertEqual(file_object.get_offset(), 100)
+
+    file_object.close()
+
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    self._TestReadInto(self._qcow_path_spec)
+
+    file_object = qcow_file_io.QCOWFile(self._resolver_context)
+    file_object.open(path_spec=self._qcow_path_spec)
+
+    file_object.seek(1024)
+    expected_buffer = file_object.read(512)
+
+    file_object.seek(1024)
+    read_buffer = bytearray(512)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 512)
+    self.assertEqual(bytes(read_buffer), expected_buffer)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
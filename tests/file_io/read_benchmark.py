@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmarks for reading stream file-like objects."""
+
+from __future__ import unicode_literals
+
+import base64
+import os
+import timeit
+import unittest
+import zlib
+
+from dfvfs.file_io import compressed_stream_io
+from dfvfs.file_io import encoded_stream_io
+from dfvfs.file_io import encrypted_stream_io
+from dfvfs.file_io import fake_file_io
+from dfvfs.file_io import gzip_file_io
+from dfvfs.lib import definitions
+from dfvfs.lib import gzipfile
+from dfvfs.path import encrypted_stream_path_spec
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+@unittest.skipUnless(
+    shared_test_lib.RUN_BENCHMARKS, 'DFVFS_RUN_BENCHMARKS is not set')
+class StreamReadBenchmarkTest(shared_test_lib.BaseTestCase):
+  """Micro-benchmarks for reading stream file-like objects.
+
+  The benchmarks read all data of a stream that is processed in small
+  buffers. If the data read so far would be copied for every buffer,
+  reading 4 times the data would be about 16 times slower, while it should
+  be about 4 times slower.
+  """
+
+  # pylint: disable=protected-access
+
+  _BUFFER_SIZE = 4096
+
+  _SMALL_DATA_SIZE = 1024 * 1024
+
+  def _GetReadTime(self, file_object):
+    """Determines the time needed to read all data of a file-like object.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    Returns:
+      float: fastest time, in seconds, of several runs of reading all data.
+    """
+    def _ReadAllData():
+      """Reads all data of the file-like object."""
+      file_object.seek(0, os.SEEK_SET)
+      file_object.read(file_object.get_size())
+
+    timer = timeit.Timer(_ReadAllData)
+    return min(timer.repeat(repeat=3, number=1))
+
+  def _OpenFakeFile(self, resolver_context, data):
+    """Opens a fake file-like object.
+
+    Args:
+      resolver_context (Context): resolver context.
+      data (bytes): data of the fake file.
+
+    Returns:
+      FakeFile: fake file-like object.
+    """
+    file_object = fake_file_io.FakeFile(resolver_context, data)
+    file_object.open(path_spec=fake_path_spec.FakePathSpec(location='/data'))
+    return file_object
+
+  def _TestReadScaling(self, get_read_time):
+    """Tests that the time to read a stream scales linearly with its size.
+
+    Args:
+      get_read_time (function): function that determines the time needed to
+          read a stream of the data size passed as its argument.
+    """
+    small_data_time = get_read_time(self._SMALL_DATA_SIZE)
+    large_data_time = get_read_time(self._SMALL_DATA_SIZE * 4)
+
+    self.assertLess(large_data_time, small_data_time * 8)
+
+  def testCompressedStreamReadScaling(self):
+    """Tests that CompressedStream.read scales linearly."""
+    def _GetReadTime(data_size):
+      """Determines the time needed to read a compressed stream."""
+      resolver_context = context.Context()
+      parent_file_object = self._OpenFakeFile(
+          resolver_context, zlib.compress(os.urandom(data_size)))
+
+      file_object = compressed_stream_io.CompressedStream(
+          resolver_context,
+          compression_method=definitions.COMPRESSION_METHOD_ZLIB,
+          file_object=parent_file_object)
+      file_object._COMPRESSED_DATA_BUFFER_SIZE = self._BUFFER_SIZE
+      file_object.open()
+
+      read_time = self._GetReadTime(file_object)
+
+      file_object.close()
+      parent_file_object.close()
+      return read_time
+
+    self._TestReadScaling(_GetReadTime)
+
+  def testEncodedStreamReadScaling(self):
+    """Tests that EncodedStream.read scales linearly."""
+    def _GetReadTime(data_size):
+      """Determines the time needed to read an encoded stream."""
+      resolver_context = context.Context()
+      parent_file_object = self._OpenFakeFile(
+          resolver_context, base64.b64encode(os.urandom(data_size)))
+
+      file_object = encoded_stream_io.EncodedStream(
+          resolver_context,
+          encoding_method=definitions.ENCODING_METHOD_BASE64,
+          file_object=parent_file_object)
+      file_object._ENCODED_DATA_BUFFER_SIZE = self._BUFFER_SIZE
+      file_object.open()
+
+      read_time = self._GetReadTime(file_object)
+
+      file_object.close()
+      parent_file_object.close()
+      return read_time
+
+    self._TestReadScaling(_GetReadTime)
+
+  def testEncryptedStreamReadScaling(self):
+    """Tests that EncryptedStream.read scales linearly."""
+    def _GetReadTime(data_size):
+      """Determines the time needed to read an encrypted stream."""
+      resolver_context = context.Context()
+      parent_file_object = self._OpenFakeFile(
+          resolver_context, os.urandom(data_size))
+
+      path_spec = encrypted_stream_path_spec.EncryptedStreamPathSpec(
+          encryption_method=definitions.ENCRYPTION_METHOD_RC4,
+          parent=fake_path_spec.FakePathSpec(location='/data'))
+      resolver.Resolver.key_chain.SetCredential(path_spec, 'key', b'rc4test')
+
+      file_object = encrypted_stream_io.EncryptedStream(
+          resolver_context,
+          encryption_method=definitions.ENCRYPTION_METHOD_RC4,
+          file_object=parent_file_object)
+      file_object._ENCRYPTED_DATA_BUFFER_SIZE = self._BUFFER_SIZE
+      file_object.open(path_spec=path_spec)
+
+      read_time = self._GetReadTime(file_object)
+
+      file_object.close()
+      parent_file_object.close()
+      return read_time
+
+    self._TestReadScaling(_GetReadTime)
+
+  def testGzipFileReadScaling(self):
+    """Tests that GzipFile.read scales linearly."""
+    def _GetReadTime(data_size):
+      """Determines the time needed to read a gzip file."""
+      compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+      compressed_data = b''.join([
+          compressor.compress(os.urandom(data_size)), compressor.flush()])
+
+      with shared_test_lib.TempDirectory() as temp_directory:
+        test_path = os.path.join(temp_directory, 'data.gz')
+        with open(test_path, 'wb') as file_object:
+          file_object.write(compressed_data)
+
+        os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path)
+        gzip_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_GZIP, parent=os_path_spec)
+
+        file_object = gzip_file_io.GzipFile(context.Context())
+        file_object.open(path_spec=gzip_path_spec)
+
+        read_time = self._GetReadTime(file_object)
+
+        file_object.close()
+
+      return read_time
+
+    cache_size = gzipfile.GzipMember._UNCOMPRESSED_DATA_CACHE_SIZE
+    gzipfile.GzipMember._UNCOMPRESSED_DATA_CACHE_SIZE = self._BUFFER_SIZE
+
+    try:
+      self._TestReadScaling(_GetReadTime)
+    finally:
+      gzipfile.GzipMember._UNCOMPRESSED_DATA_CACHE_SIZE = cache_size
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -124,6 +124,65 @@ class Ext2ImageFileTestCase(shared_test_lib.BaseTestCase):
 
     file_object.close()
 
+  def _TestReadAt(self, parent_path_spec):
+    """Test the read at offset functionality.
+
+    Args:
+      parent_path_spec (PathSpec): parent path specification.
+    """
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=self._INODE_PASSWORDS_TXT, location='/passwords.txt',
+        parent=parent_path_spec)
+    file_object = tsk_file_io.TSKFile(self._resolver_context)
+
+    file_object.open(path_spec=path_spec)
+
+    read_buffer = file_object.read_at(20, 24)
+    self.assertEqual(read_buffer, b'bank,joesmith,superrich\n')
+    self.assertEqual(file_object.get_offset(), 0)
+
+    read_buffer = file_object.read_at(86, 100)
+    self.assertEqual(read_buffer, b'uber secret laire,admin,admin\n')
+
+    read_buffer = file_object.read_at(116, 10)
+    self.assertEqual(read_buffer, b'')
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-1, 10)
+
+    file_object.close()
+
+  def _TestReadInto(self, parent_path_spec):
+    """Test the read into buffer functionality.
+
+    Args:
+      parent_path_spec (PathSpec): parent path specification.
+    """
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=self._INODE_PASSWORDS_TXT, location='/passwords.txt',
+        parent=parent_path_spec)
+    file_object = tsk_file_io.TSKFile(self._resolver_context)
+
+    file_object.open(path_spec=path_spec)
+
+    read_buffer = bytearray(200)
+    read_count = file_object.readinto(read_buffer)
+
+    expected_buffer = (
+        b'place,user,password\n'
+        b'bank,joesmith,superrich\n'
+        b'alarm system,-,1234\n'
+        b'treasure chest,-,1111\n'
+        b'uber secret laire,admin,admin\n')
+
+    self.assertEqual(read_count, 116)
+    self.assertEqual(bytes(read_buffer[:read_count]), expected_buffer)
+
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 0)
+
+    file_object.close()
+
 
 class ImageFileTestCase(shared_test_lib.BaseTestCase):
   """The unit test case for storage media image based test data."""
@@ -552,6 +611,82 @@ class SylogTestCase(shared_test_lib.BaseTestCase):
 
     self.assertEqual(file_object.get_offset(), expected_offset)
 
+  def _TestReadIntoFileObject(self, file_object, base_offset=167):
+    """Runs the read into buffer tests on the file-like object.
+
+    Args:
+      file_object (file): file-like object with the test data.
+      base_offset (Optional[int]): base offset use in the tests.
+    """
+    file_object.seek(base_offset, os.SEEK_SET)
+
+    expected_buffer = (
+        b'Jan 22 07:53:01 myhostname.myhost.com CRON[31051]: (root) CMD '
+        b'(touch /var/run/crond.somecheck)\n')
+
+    read_buffer = bytearray(95)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 95)
+    self.assertEqual(bytes(read_buffer), expected_buffer)
+    self.assertEqual(file_object.get_offset(), base_offset + 95)
+
+    # Test reading into part of a buffer using a memoryview.
+    file_object.seek(base_offset, os.SEEK_SET)
+
+    read_buffer = bytearray(20)
+    read_count = file_object.readinto(memoryview(read_buffer)[5:10])
+
+    self.assertEqual(read_count, 5)
+    self.assertEqual(bytes(read_buffer[5:10]), b'Jan 2')
+    self.assertEqual(read_buffer[:5], bytearray(5))
+
+    # Test reading into a buffer that is larger than the remaining data.
+    file_object.seek(-10, os.SEEK_END)
+
+    read_buffer = bytearray(20)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 10)
+    self.assertEqual(bytes(read_buffer[:5]), b'times')
+
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 0)
+
+  def _TestReadAtFileObject(self, file_object, base_offset=167):
+    """Runs the read at offset tests on the file-like object.
+
+    Args:
+      file_object (file): file-like object with the test data.
+      base_offset (Optional[int]): base offset use in the tests.
+    """
+    file_object.seek(10, os.SEEK_SET)
+
+    expected_buffer = (
+        b'Jan 22 07:53:01 myhostname.myhost.com CRON[31051]: (root) CMD '
+        b'(touch /var/run/crond.somecheck)\n')
+
+    read_buffer = file_object.read_at(base_offset, 95)
+    self.assertEqual(read_buffer, expected_buffer)
+
+    # The current offset should not change.
+    self.assertEqual(file_object.get_offset(), 10)
+
+    # Test reading beyond the end of the data.
+    file_size = file_object.get_size()
+
+    read_buffer = file_object.read_at(file_size - 10, 20)
+    self.assertEqual(len(read_buffer), 10)
+    self.assertEqual(read_buffer[:5], b'times')
+
+    read_buffer = file_object.read_at(file_size, 20)
+    self.assertEqual(read_buffer, b'')
+
+    self.assertEqual(file_object.get_offset(), 10)
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-1, 20)
+
   def _TestSeekFileObject(self, file_object, base_offset=167):
     """Runs the seek tests on the file-like object.
 
@@ -40,6 +40,10 @@ class TSKFileTestExt2(test_lib.Ext2ImageFileTestCase):
     """Test the read functionality."""
     self._TestRead(self._os_path_spec)
 
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    self._TestReadAt(self._os_path_spec)
+
 
 class TSKFileTestNTFS(test_lib.NTFSImageFileTestCase):
   """Tests the SleuthKit (TSK) file-like object on NTFS."""
@@ -51,6 +51,11 @@ class TextFileTest(shared_test_lib.BaseTestCase):
       # Test edge cases.
       self.assertEqual(file_data[-150:20], b'place,user,password\n')
       self.assertEqual(file_data[86:150], b'uber secret laire,admin,admin\n')
+      self.assertEqual(file_data[86:-1], b'uber secret laire,admin,admin')
+      self.assertEqual(file_data[-2], b'n')
+
+      with self.assertRaises(IndexError):
+        file_data[-150]  # pylint: disable=pointless-statement
 
       with self.assertRaises(TypeError):
         file_data['key']  # pylint: disable=pointless-statement
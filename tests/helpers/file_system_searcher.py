@@ -7,6 +7,9 @@ from __future__ import unicode_literals
 import os
 import unittest
 
+from dfdatetime import posix_time as dfdatetime_posix_time
+from dfdatetime import time_elements as dfdatetime_time_elements
+
 from dfvfs.lib import definitions
 from dfvfs.helpers import fake_file_system_builder
 from dfvfs.helpers import file_system_searcher
@@ -124,6 +127,88 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
     with self.assertRaises(TypeError):
       find_spec = file_system_searcher.FindSpec(location_regex={})
 
+    with self.assertRaises(ValueError):
+      find_spec = file_system_searcher.FindSpec(
+          maximum_size=16, minimum_size=32)
+
+    with self.assertRaises(ValueError):
+      find_spec = file_system_searcher.FindSpec(
+          time_ranges={'bogus_time': (None, None)})
+
+  def testCheckExtension(self):
+    """Test the _CheckExtension() function."""
+    file_system = self._CreateTestFileSystem()
+
+    path_spec = fake_path_spec.FakePathSpec(
+        location='/usr/lib/python2.7/site-packages/dfvfs/__init__.py')
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    find_spec = file_system_searcher.FindSpec(extensions=['py', 'pyc'])
+
+    result = find_spec._CheckExtension(file_entry)
+    self.assertTrue(result)
+
+    find_spec = file_system_searcher.FindSpec(extensions=['PY'])
+
+    result = find_spec._CheckExtension(file_entry)
+    self.assertFalse(result)
+
+    find_spec = file_system_searcher.FindSpec(
+        case_sensitive=False, extensions=['PY'])
+
+    result = find_spec._CheckExtension(file_entry)
+    self.assertTrue(result)
+
+    path_spec = fake_path_spec.FakePathSpec(
+        location='/usr/lib/python2.7/site-packages/dfvfs')
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    result = find_spec._CheckExtension(file_entry)
+    self.assertFalse(result)
+
+    find_spec = file_system_searcher.FindSpec()
+
+    result = find_spec._CheckExtension(file_entry)
+    self.assertIsNone(result)
+
+  def testCheckFileEntryProperties(self):
+    """Test the _CheckFileEntryProperties() function."""
+    file_system = self._CreateTestFileSystem()
+
+    path_spec = fake_path_spec.FakePathSpec(
+        location='/usr/lib/python2.7/site-packages/dfvfs/__init__.py')
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    find_spec = file_system_searcher.FindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])
+
+    result = find_spec._CheckFileEntryProperties(file_entry)
+    self.assertTrue(result)
+
+    find_spec = file_system_searcher.FindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_DIRECTORY])
+
+    result = find_spec._CheckFileEntryProperties(file_entry)
+    self.assertFalse(result)
+
+    find_spec = file_system_searcher.FindSpec(is_allocated=False)
+
+    result = find_spec._CheckFileEntryProperties(file_entry)
+    self.assertFalse(result)
+
+    find_spec = file_system_searcher.FindSpec(
+        extensions=['py'], file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE],
+        minimum_size=1)
+
+    result = find_spec._CheckFileEntryProperties(file_entry)
+    self.assertTrue(result)
+
+    find_spec = file_system_searcher.FindSpec(
+        extensions=['txt'], file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])
+
+    result = find_spec._CheckFileEntryProperties(file_entry)
+    self.assertFalse(result)
+
   def testCheckFileEntryType(self):
     """Test the _CheckFileEntryType() function."""
     file_system = self._CreateTestFileSystem()
@@ -274,6 +359,87 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
     result = find_spec._CheckLocation(file_entry, 6)
     self.assertFalse(result)
 
+  def testCheckSize(self):
+    """Test the _CheckSize() function."""
+    file_system = self._CreateTestFileSystem()
+
+    path_spec = fake_path_spec.FakePathSpec(
+        location='/usr/lib/python2.7/site-packages/dfvfs/__init__.py')
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    find_spec = file_system_searcher.FindSpec(
+        maximum_size=1024, minimum_size=16)
+
+    result = find_spec._CheckSize(file_entry)
+    self.assertTrue(result)
+
+    find_spec = file_system_searcher.FindSpec(maximum_size=16)
+
+    result = find_spec._CheckSize(file_entry)
+    self.assertFalse(result)
+
+    find_spec = file_system_searcher.FindSpec(minimum_size=1024)
+
+    result = find_spec._CheckSize(file_entry)
+    self.assertFalse(result)
+
+    # Test a file entry without data.
+    find_spec = file_system_searcher.FindSpec(minimum_size=0)
+
+    file_entry = file_system.GetRootFileEntry()
+
+    result = find_spec._CheckSize(file_entry)
+    self.assertFalse(result)
+
+    find_spec = file_system_searcher.FindSpec()
+
+    result = find_spec._CheckSize(file_entry)
+    self.assertIsNone(result)
+
+  def testCheckTimeRanges(self):
+    """Test the _CheckTimeRanges() function."""
+    file_system = self._CreateTestFileSystem()
+
+    path_spec = fake_path_spec.FakePathSpec(
+        location='/usr/lib/python2.7/site-packages/dfvfs/__init__.py')
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    # 2001-09-09 01:46:40
+    first_date_time = dfdatetime_posix_time.PosixTime(timestamp=1000000000)
+    # 2286-11-20 17:46:40
+    last_date_time = dfdatetime_posix_time.PosixTime(timestamp=10000000000)
+
+    find_spec = file_system_searcher.FindSpec(time_ranges={
+        'modification_time': (first_date_time, last_date_time)})
+
+    result = find_spec._CheckTimeRanges(file_entry)
+    self.assertTrue(result)
+
+    find_spec = file_system_searcher.FindSpec(time_ranges={
+        'access_time': (first_date_time, None),
+        'modification_time': (None, first_date_time)})
+
+    result = find_spec._CheckTimeRanges(file_entry)
+    self.assertFalse(result)
+
+    find_spec = file_system_searcher.FindSpec(time_ranges={
+        'modification_time': (last_date_time, None)})
+
+    result = find_spec._CheckTimeRanges(file_entry)
+    self.assertFalse(result)
+
+    # Test a date and time value that is not available.
+    find_spec = file_system_searcher.FindSpec(time_ranges={
+        'creation_time': (first_date_time, None)})
+
+    result = find_spec._CheckTimeRanges(file_entry)
+    self.assertFalse(result)
+
+    find_spec = file_system_searcher.FindSpec()
+
+    result = find_spec._CheckTimeRanges(file_entry)
+    self.assertIsNone(result)
+
   def testConvertLocationGlob2Regex(self):
     """Test the _ConvertLocationGlob2Regex function."""
     find_spec = file_system_searcher.FindSpec()
@@ -320,9 +486,189 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
     self.assertEqual(result, (False, False))
 
 
+class FindSpecMatcherTest(shared_test_lib.BaseTestCase):
+  """Tests for the find specification matcher."""
+
+  def _CreateTestFileSystem(self):
+    """Create a file system for testing.
+
+    Returns:
+      FakeFileSystem: file system for testing.
+    """
+    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+
+    file_system_builder.AddFile(
+        '/usr/lib/python2.7/site-packages/dfvfs/__init__.py', b'')
+    file_system_builder.AddFile(
+        '/usr/lib/python2.7/site-packages/dfvfs/dependencies.py', b'')
+
+    return file_system_builder.file_system
+
+  def _GetNumberOfMatches(self, find_spec_matcher, file_entry):
+    """Matches a file entry and the file entries of its parents.
+
+    Args:
+      find_spec_matcher (FindSpecMatcher): find specification matcher.
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      int: number of find specifications the file entry matches or None if
+          the file entry is not searched by the matcher.
+    """
+    file_entries = []
+    while file_entry:
+      file_entries.insert(0, file_entry)
+      file_entry = file_entry.GetParentFileEntry()
+
+    number_of_matches, find_spec_nodes = find_spec_matcher.MatchRoot(
+        file_entries[0])
+
+    for file_entry in file_entries[1:]:
+      if not find_spec_nodes:
+        return None
+
+      number_of_matches, find_spec_nodes = find_spec_matcher.Match(
+          file_entry, find_spec_nodes)
+
+    return number_of_matches
+
+  def testGetSubFileEntryNames(self):
+    """Test the GetSubFileEntryNames() function."""
+    file_system = self._CreateTestFileSystem()
+
+    file_entry = file_system.GetRootFileEntry()
+
+    find_spec_matcher = file_system_searcher.FindSpecMatcher([
+        file_system_searcher.FindSpec(
+            location='/usr/lib', location_separator='/'),
+        file_system_searcher.FindSpec(
+            case_sensitive=False, location='/USR/lib',
+            location_separator='/'),
+        file_system_searcher.FindSpec(
+            location='/var/log', location_separator='/')])
+
+    _, find_spec_nodes = find_spec_matcher.MatchRoot(file_entry)
+    names = find_spec_matcher.GetSubFileEntryNames(find_spec_nodes)
+    self.assertEqual(names, [('USR', False), ('usr', True), ('var', True)])
+
+    find_spec_matcher = file_system_searcher.FindSpecMatcher([
+        file_system_searcher.FindSpec(
+            location='/usr/lib', location_separator='/'),
+        file_system_searcher.FindSpec(
+            location_glob='/*/lib', location_separator='/')])
+
+    _, find_spec_nodes = find_spec_matcher.MatchRoot(file_entry)
+    names = find_spec_matcher.GetSubFileEntryNames(find_spec_nodes)
+    self.assertIsNone(names)
+
+    # Test find specifications that also match unallocated file entries.
+    find_spec_matcher = file_system_searcher.FindSpecMatcher([
+        file_system_searcher.FindSpec(
+            is_allocated=None, location='/usr/lib', location_separator='/')])
+
+    _, find_spec_nodes = find_spec_matcher.MatchRoot(file_entry)
+    names = find_spec_matcher.GetSubFileEntryNames(find_spec_nodes)
+    self.assertIsNone(names)
+
+    # Test a find specification without location.
+    find_spec_matcher = file_system_searcher.FindSpecMatcher([
+        file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])])
+
+    _, find_spec_nodes = find_spec_matcher.MatchRoot(file_entry)
+    names = find_spec_matcher.GetSubFileEntryNames(find_spec_nodes)
+    self.assertIsNone(names)
+
+  def testMatch(self):
+    """Test the Match() function."""
+    file_system = self._CreateTestFileSystem()
+
+    path_spec = fake_path_spec.FakePathSpec(
+        location='/usr/lib/python2.7/site-packages/dfvfs/__init__.py')
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    find_specs = [
+        file_system_searcher.FindSpec(
+            location='/usr/lib/python2.7/site-packages/dfvfs/__init__.py',
+            location_separator='/'),
+        file_system_searcher.FindSpec(
+            case_sensitive=False,
+            location='/USR/lib/python2.7/site-packages/dfvfs/__INIT__.py',
+            location_separator='/'),
+        file_system_searcher.FindSpec(
+            location_glob='/usr/*/python*/*/dfvfs/*.py',
+            location_separator='/'),
+        file_system_searcher.FindSpec(
+            location_regex='/usr/lib/.*/site-packages/dfvfs/__init__[.]py',
+            location_separator='/'),
+        file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])]
+
+    for find_spec in find_specs:
+      find_spec_matcher = file_system_searcher.FindSpecMatcher([find_spec])
+      number_of_matches = self._GetNumberOfMatches(
+          find_spec_matcher, file_entry)
+      self.assertEqual(number_of_matches, 1)
+
+    find_spec_matcher = file_system_searcher.FindSpecMatcher(find_specs)
+    number_of_matches = self._GetNumberOfMatches(find_spec_matcher, file_entry)
+    self.assertEqual(number_of_matches, 5)
+
+    find_specs = [
+        file_system_searcher.FindSpec(
+            location='/usr/lib/python2.7/site-packages/dfvfs/bogus.py',
+            location_separator='/'),
+        file_system_searcher.FindSpec(
+            location='/USR/lib/python2.7/site-packages/dfvfs/__INIT__.py',
+            location_separator='/'),
+        file_system_searcher.FindSpec(
+            location_glob='/usr/*/python*/dfvfs/*.py',
+            location_separator='/'),
+        file_system_searcher.FindSpec(
+            location_regex='/usr/lib/(bogus/site-packages/dfvfs/__init__.py',
+            location_separator='/'),
+        file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_DIRECTORY])]
+
+    find_spec_matcher = file_system_searcher.FindSpecMatcher(find_specs)
+    number_of_matches = self._GetNumberOfMatches(find_spec_matcher, file_entry)
+    self.assertEqual(number_of_matches, 0)
+
+    # Test a file entry that is not searched by the matcher.
+    find_spec_matcher = file_system_searcher.FindSpecMatcher(find_specs[1:4])
+    number_of_matches = self._GetNumberOfMatches(find_spec_matcher, file_entry)
+    self.assertIsNone(number_of_matches)
+
+  def testMatchRoot(self):
+    """Test the MatchRoot() function."""
+    file_system = self._CreateTestFileSystem()
+
+    file_entry = file_system.GetRootFileEntry()
+
+    find_spec_matcher = file_system_searcher.FindSpecMatcher([
+        file_system_searcher.FindSpec(location='/', location_separator='/'),
+        file_system_searcher.FindSpec(
+            location='/usr', location_separator='/')])
+
+    number_of_matches, find_spec_nodes = find_spec_matcher.MatchRoot(
+        file_entry)
+    self.assertEqual(number_of_matches, 1)
+    self.assertEqual(len(find_spec_nodes), 1)
+
+    find_spec_matcher = file_system_searcher.FindSpecMatcher([
+        file_system_searcher.FindSpec(location='/', location_separator='/')])
+
+    number_of_matches, find_spec_nodes = find_spec_matcher.MatchRoot(
+        file_entry)
+    self.assertEqual(number_of_matches, 1)
+    self.assertEqual(find_spec_nodes, [])
+
+
 class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
   """Tests for the file system searcher."""
 
+  # pylint: disable=protected-access
+
   def setUp(self):
     """Sets up the needed objects used throughout the test."""
     self._resolver_context = context.Context()
@@ -649,6 +995,229 @@ class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
     test_relative_path = searcher.GetRelativePath(first_path_spec)
     self.assertEqual(test_relative_path, expected_relative_path)
 
+  def testFindWithBackReferences(self):
+    """Test the Find() function with regular expression back references."""
+    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+    file_system_builder.AddFile('/aa', b'')
+    file_system_builder.AddFile('/ab', b'')
+    file_system_builder.AddFile('/bb', b'')
+    file_system = file_system_builder.file_system
+
+    searcher = file_system_searcher.FileSystemSearcher(
+        file_system, fake_path_spec.FakePathSpec(location='/'))
+
+    find_specs = [
+        file_system_searcher.FindSpec(
+            location_regex=['(a)\\1'], location_separator='/'),
+        file_system_searcher.FindSpec(
+            location_regex=['(b)\\1'], location_separator='/'),
+        file_system_searcher.FindSpec(
+            location_regex=['a[b]'], location_separator='/')]
+
+    path_spec_generator = searcher.Find(find_specs=find_specs)
+
+    locations = [path_spec.location for path_spec in path_spec_generator]
+    self.assertEqual(sorted(locations), ['/aa', '/ab', '/bb'])
+
+  def testFindWithMetadata(self):
+    """Test the Find() function with metadata find specifications."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    find_spec = file_system_searcher.FindSpec(
+        case_sensitive=False, extensions=['GZ', 'txt'])
+    path_spec_generator = searcher.Find(find_specs=[find_spec])
+    self.assertIsNotNone(path_spec_generator)
+
+    locations = [path_spec.location for path_spec in path_spec_generator]
+    self.assertEqual(sorted(locations), ['/password.txt', '/syslog.gz'])
+
+    find_spec = file_system_searcher.FindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE],
+        maximum_size=10485760, minimum_size=1048576)
+    path_spec_generator = searcher.Find(find_specs=[find_spec])
+    self.assertIsNotNone(path_spec_generator)
+
+    expected_locations = [
+        '/$Extend/$RmMetadata/$TxfLog/$TxfLogContainer00000000000000000001',
+        '/$Extend/$RmMetadata/$TxfLog/$TxfLogContainer00000000000000000002',
+        '/$LogFile',
+        ('/System Volume Information/{600f0b69-5bdf-11e3-9d6c-005056c00008}'
+         '{3808876b-c176-4e48-b7ae-04046e6cc752}')]
+
+    locations = [path_spec.location for path_spec in path_spec_generator]
+    self.assertEqual(sorted(locations), expected_locations)
+
+    start_date_time = dfdatetime_time_elements.TimeElements()
+    start_date_time.CopyFromDateTimeString('2013-12-03 06:38:00')
+
+    end_date_time = dfdatetime_time_elements.TimeElements()
+    end_date_time.CopyFromDateTimeString('2013-12-03 06:40:00')
+
+    find_spec = file_system_searcher.FindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE], time_ranges={
+            'modification_time': (start_date_time, end_date_time)})
+    path_spec_generator = searcher.Find(find_specs=[find_spec])
+    self.assertIsNotNone(path_spec_generator)
+
+    expected_locations = [
+        '/$Extend/$RmMetadata/$TxfLog/$TxfLog.blf',
+        '/$Extend/$RmMetadata/$TxfLog/$TxfLogContainer00000000000000000001',
+        '/$Extend/$RmMetadata/$TxfLog/$TxfLogContainer00000000000000000002',
+        '/password.txt']
+
+    locations = [path_spec.location for path_spec in path_spec_generator]
+    self.assertEqual(sorted(locations), expected_locations)
+
+  def testFindWithWorkers(self):
+    """Test the Find() function with workers."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    find_specs_list = [
+        [file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])],
+        [file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_DIRECTORY])],
+        [file_system_searcher.FindSpec(
+            location_glob='/*/$RmMetadata', location_separator='/'),
+         file_system_searcher.FindSpec(
+             location_glob=['$Extend', '$RmMetadata', '*', '*.blf'])],
+        [file_system_searcher.FindSpec(is_allocated=None)]]
+
+    for find_specs in find_specs_list:
+      expected_path_specs = [
+          path_spec.comparable
+          for path_spec in searcher.Find(find_specs=list(find_specs))]
+
+      path_spec_generator = searcher.Find(
+          find_specs=list(find_specs), number_of_workers=2)
+      self.assertIsNotNone(path_spec_generator)
+
+      path_specs = [path_spec.comparable for path_spec in path_spec_generator]
+      self.assertEqual(path_specs, expected_path_specs)
+
+    # Test stopping the search before all matching file entries are found.
+    find_spec = file_system_searcher.FindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])
+    path_spec_generator = searcher.Find(
+        find_specs=[find_spec], number_of_workers=2)
+
+    path_spec = next(path_spec_generator)
+    self.assertEqual(getattr(path_spec, 'location', ''), '/$AttrDef')
+    path_spec_generator.close()
+
+    # Test a fake file system, that cannot be opened by the workers.
+    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+    file_system_builder.AddFile('/usr/lib/python2.7/dfvfs/__init__.py', b'')
+    file_system_builder.AddFile('/usr/lib/python2.7/dfvfs/helpers.py', b'')
+
+    searcher = file_system_searcher.FileSystemSearcher(
+        file_system_builder.file_system, fake_path_spec.FakePathSpec(
+            location='/'))
+
+    find_spec = file_system_searcher.FindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])
+    path_spec_generator = searcher.Find(
+        find_specs=[find_spec], number_of_workers=2)
+
+    locations = [path_spec.location for path_spec in path_spec_generator]
+    self.assertEqual(locations, [
+        '/usr/lib/python2.7/dfvfs/__init__.py',
+        '/usr/lib/python2.7/dfvfs/helpers.py'])
+
+  def testGetSubFileEntries(self):
+    """Test the _GetSubFileEntries() function."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._os_file_system, self._os_path_spec)
+
+    file_entry = self._os_file_system.GetFileEntryByPathSpec(
+        self._os_path_spec)
+
+    find_spec_matcher = file_system_searcher.FindSpecMatcher([
+        file_system_searcher.FindSpec(
+            location='/SYSLOG.gz', location_separator='/')])
+
+    _, find_spec_nodes = find_spec_matcher.MatchRoot(file_entry)
+    names = find_spec_matcher.GetSubFileEntryNames(find_spec_nodes)
+    self.assertEqual(names, [('SYSLOG.gz', True)])
+
+    # The OS file system does not look up sub file entries by name, since
+    # the name of an OS file entry is derived from the location looked up.
+    sub_file_entries = searcher._GetSubFileEntries(
+        self._os_file_system, file_entry, find_spec_matcher, find_spec_nodes)
+
+    names = [sub_file_entry.name for sub_file_entry in sub_file_entries]
+    self.assertIn('syslog.gz', names)
+    self.assertNotIn('SYSLOG.gz', names)
+
+  def testGetSubFileEntriesByName(self):
+    """Test the _GetSubFileEntriesByName() function."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    file_entry = self._tsk_file_system.GetRootFileEntry()
+
+    # NTFS looks up names case insensitive.
+    self.assertTrue(searcher._is_case_insensitive)
+
+    sub_file_entries = searcher._GetSubFileEntriesByName(
+        self._tsk_file_system, file_entry, [
+            ('$Extend', True), ('bogus', True), ('PASSWORD.TXT', False)])
+    self.assertIsNotNone(sub_file_entries)
+
+    locations = [
+        sub_file_entry.path_spec.location
+        for sub_file_entry in sub_file_entries]
+    self.assertEqual(locations, ['/$Extend', '/password.txt'])
+
+    # Test a case sensitive name that differs in case from the file entry.
+    sub_file_entries = searcher._GetSubFileEntriesByName(
+        self._tsk_file_system, file_entry, [('$EXTEND', True)])
+    self.assertEqual(sub_file_entries, [])
+
+    # Test a case insensitive name that does not exist.
+    sub_file_entries = searcher._GetSubFileEntriesByName(
+        self._tsk_file_system, file_entry, [('bogus', False)])
+    self.assertEqual(sub_file_entries, [])
+
+    # Test a file system with case sensitive names, which can contain multiple
+    # file entries that match a case insensitive name.
+    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+    file_system_builder.AddFile('/usr/lib/python2.7/dfvfs/__init__.py', b'')
+    file_system_builder.AddFile('/usr/LIB/python2.7/dfvfs/__init__.py', b'')
+    file_system = file_system_builder.file_system
+
+    path_spec = fake_path_spec.FakePathSpec(location='/usr')
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    searcher = file_system_searcher.FileSystemSearcher(
+        file_system, fake_path_spec.FakePathSpec(location='/'))
+    self.assertFalse(searcher._is_case_insensitive)
+
+    sub_file_entries = searcher._GetSubFileEntriesByName(
+        file_system, file_entry, [('lib', True)])
+    self.assertIsNotNone(sub_file_entries)
+
+    locations = [
+        sub_file_entry.path_spec.location
+        for sub_file_entry in sub_file_entries]
+    self.assertEqual(locations, ['/usr/lib'])
+
+    sub_file_entries = searcher._GetSubFileEntriesByName(
+        file_system, file_entry, [('lib', False)])
+    self.assertIsNone(sub_file_entries)
+
+    find_spec = file_system_searcher.FindSpec(
+        case_sensitive=False, location='/usr/lib/python2.7/dfvfs/__init__.py',
+        location_separator='/')
+    path_spec_generator = searcher.Find(find_specs=[find_spec])
+
+    locations = [path_spec.location for path_spec in path_spec_generator]
+    self.assertEqual(sorted(locations), [
+        '/usr/LIB/python2.7/dfvfs/__init__.py',
+        '/usr/lib/python2.7/dfvfs/__init__.py'])
+
 
 if __name__ == '__main__':
   unittest.main()
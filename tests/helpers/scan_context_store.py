@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the persistent source scanner context store."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dfvfs.helpers import scan_context_store
+from dfvfs.helpers import source_scanner
+from dfvfs.lib import definitions
+
+from tests import test_lib as shared_test_lib
+
+
+class ScanContextStoreTest(shared_test_lib.BaseTestCase):
+  """Tests for the persistent source scanner context store."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._test_path = self._GetTestFilePath(['tsk_volume_system.raw'])
+    self._SkipIfPathNotExists(self._test_path)
+
+  def _GetScanContext(self):
+    """Scans the test source.
+
+    Returns:
+      SourceScannerContext: source scanner context.
+    """
+    scan_context = source_scanner.SourceScannerContext()
+    scan_context.OpenSourcePath(self._test_path)
+
+    test_source_scanner = source_scanner.SourceScanner()
+    test_source_scanner.Scan(scan_context)
+    return scan_context
+
+  def testGetContextFilePath(self):
+    """Tests the _GetContextFilePath function."""
+    test_store = scan_context_store.ScanContextStore('contexts')
+
+    context_file_path = test_store._GetContextFilePath(self._test_path)
+    self.assertEqual(os.path.dirname(context_file_path), 'contexts')
+    self.assertTrue(context_file_path.endswith('.json'))
+
+    other_context_file_path = test_store._GetContextFilePath(
+        self._GetTestFilePath(['ext2.qcow2']))
+    self.assertNotEqual(context_file_path, other_context_file_path)
+
+  def testGetSourceValues(self):
+    """Tests the _GetSourceValues function."""
+    test_store = scan_context_store.ScanContextStore('contexts')
+
+    size, modification_time, header_hash = test_store._GetSourceValues(
+        self._test_path)
+    self.assertEqual(size, os.path.getsize(self._test_path))
+    self.assertIsNotNone(modification_time)
+    self.assertEqual(len(header_hash), 64)
+
+    size, modification_time, header_hash = test_store._GetSourceValues(
+        self._GetTestFilePath(['testdir_os']))
+    self.assertIsNone(size)
+    self.assertIsNone(modification_time)
+    self.assertIsNone(header_hash)
+
+  def testReadWriteScanContext(self):
+    """Tests the ReadScanContext and WriteScanContext functions."""
+    expected_scan_context = self._GetScanContext()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_store = scan_context_store.ScanContextStore(
+          os.path.join(temp_directory, 'contexts'))
+
+      scan_context = test_store.ReadScanContext(self._test_path)
+      self.assertIsNone(scan_context)
+
+      test_store.WriteScanContext(self._test_path, expected_scan_context)
+
+      scan_context = test_store.ReadScanContext(self._test_path)
+      self.assertIsNotNone(scan_context)
+      self.assertEqual(
+          scan_context.source_type, definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE)
+      self.assertTrue(scan_context.HasFileSystemScanNodes())
+      self.assertIsNone(scan_context.GetUnscannedScanNode())
+
+      scan_node = scan_context.GetRootScanNode()
+      expected_scan_node = expected_scan_context.GetRootScanNode()
+      while expected_scan_node.sub_nodes:
+        self.assertEqual(
+            scan_node.path_spec.comparable,
+            expected_scan_node.path_spec.comparable)
+        self.assertEqual(
+            len(scan_node.sub_nodes), len(expected_scan_node.sub_nodes))
+        scan_node = scan_node.sub_nodes[-1]
+        expected_scan_node = expected_scan_node.sub_nodes[-1]
+
+      # Only the context file should remain in the directory.
+      context_file_path = test_store._GetContextFilePath(
+          os.path.abspath(self._test_path))
+      self.assertEqual(
+          os.listdir(os.path.dirname(context_file_path)),
+          [os.path.basename(context_file_path)])
+
+      # Test a context file with a mismatching header hash.
+      with open(context_file_path, 'rb') as file_object:
+        context_file_data = file_object.read()
+
+      with open(context_file_path, 'wb') as file_object:
+        file_object.write(context_file_data.replace(
+            b'"source_header_hash": "', b'"source_header_hash": "0'))
+
+      scan_context = test_store.ReadScanContext(self._test_path)
+      self.assertIsNone(scan_context)
+
+      # Test a corrupt context file.
+      with open(context_file_path, 'wb') as file_object:
+        file_object.write(b'{"format_version": ')
+
+      scan_context = test_store.ReadScanContext(self._test_path)
+      self.assertIsNone(scan_context)
+
+      # Test a directory source, for which no context file is written.
+      test_path = self._GetTestFilePath(['testdir_os'])
+      test_store.WriteScanContext(test_path, expected_scan_context)
+
+      scan_context = test_store.ReadScanContext(test_path)
+      self.assertIsNone(scan_context)
+
+
+if __name__ == '__main__':
+  unittest.main()
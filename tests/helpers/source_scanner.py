@@ -295,6 +295,26 @@ class SourceScannerTest(shared_test_lib.BaseTestCase):
 
     return scan_node
 
+  def _GetScanNodeValues(self, scan_context):
+    """Retrieves the values of the scan nodes for comparison.
+
+    Args:
+      scan_context (ScanContext): scan context.
+
+    Returns:
+      list[tuple[str, bool]]: comparable and scanned state of the scan nodes,
+          from the root downwards.
+    """
+    scan_node_values = []
+    scan_nodes = [scan_context.GetRootScanNode()]
+    while scan_nodes:
+      scan_node = scan_nodes.pop(0)
+      scan_node_values.append(
+          (scan_node.path_spec.comparable, scan_node.scanned))
+      scan_nodes.extend(scan_node.sub_nodes)
+
+    return scan_node_values
+
   # TODO: add tests for _ScanEncryptedVolumeNode.
   # TODO: add tests for _ScanNode.
   # TODO: add tests for _ScanVolumeSystemRootNode.
@@ -424,6 +444,36 @@ class SourceScannerTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(scan_node)
     self.assertEqual(scan_node.type_indicator, definitions.TYPE_INDICATOR_TSK)
 
+  def testScanOnPartitionedImageWithWorkers(self):
+    """Test the Scan function on a partitioned image with workers."""
+    test_path = self._GetTestFilePath(['tsk_volume_system.raw'])
+    self._SkipIfPathNotExists(test_path)
+
+    scan_context = source_scanner.SourceScannerContext()
+    scan_context.OpenSourcePath(test_path)
+
+    self._source_scanner.Scan(scan_context)
+    expected_scan_node_values = self._GetScanNodeValues(scan_context)
+
+    test_source_scanner = source_scanner.SourceScanner(number_of_workers=2)
+
+    scan_context = source_scanner.SourceScannerContext()
+    scan_context.OpenSourcePath(test_path)
+
+    test_source_scanner.Scan(scan_context)
+    self.assertEqual(
+        scan_context.source_type, definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE)
+
+    scan_node_values = self._GetScanNodeValues(scan_context)
+    self.assertEqual(scan_node_values, expected_scan_node_values)
+
+    scan_node = self._GetTestScanNode(scan_context)
+    self.assertEqual(len(scan_node.sub_nodes), 7)
+
+    scan_node = scan_node.sub_nodes[6].GetSubNodeByLocation('/')
+    self.assertIsNotNone(scan_node)
+    self.assertEqual(scan_node.type_indicator, definitions.TYPE_INDICATOR_TSK)
+
   def testScanOnVSS(self):
     """Test the Scan function on VSS."""
     test_path = self._GetTestFilePath(['vsstest.qcow2'])
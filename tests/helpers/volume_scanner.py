@@ -4,8 +4,10 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
+from dfvfs.helpers import scan_context_store
 from dfvfs.helpers import source_scanner
 from dfvfs.helpers import volume_scanner
 from dfvfs.lib import definitions
@@ -98,6 +100,28 @@ class TestVolumeScannerMediator(volume_scanner.VolumeScannerMediator):
         scan_context, locked_scan_node.path_spec, 'password', password)
 
 
+class TestSourceScanner(source_scanner.SourceScanner):
+  """Source scanner for testing that does not support scanning."""
+
+  # pylint: disable=unused-argument
+
+  def Scan(self, scan_context, auto_recurse=True, scan_path_spec=None):
+    """Scans for supported formats.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+      auto_recurse (Optional[bool]): True if the scan should automatically
+          recurse as far as possible.
+      scan_path_spec (Optional[PathSpec]): path specification to indicate
+          where the source scanner should continue scanning, where None
+          indicates the scanner will start with the sources.
+
+    Raises:
+      BackEndError: always.
+    """
+    raise errors.BackEndError('Unexpected scan.')
+
+
 class VolumeScannerTest(shared_test_lib.BaseTestCase):
   """Tests for a volume scanner."""
 
@@ -630,6 +654,38 @@ class VolumeScannerTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(base_path_specs, expected_base_path_specs)
 
+  def testGetBasePathSpecsWithScanContextStore(self):
+    """Tests the GetBasePathSpecs function with a scan context store."""
+    test_path = self._GetTestFilePath(['tsk_volume_system.raw'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_mediator = TestVolumeScannerMediator()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_store = scan_context_store.ScanContextStore(temp_directory)
+
+      test_scanner = volume_scanner.VolumeScanner(
+          mediator=test_mediator, scan_context_store=test_store)
+
+      expected_base_path_specs = test_scanner.GetBasePathSpecs(test_path)
+      expected_base_path_specs = [
+          base_path_spec.comparable
+          for base_path_spec in expected_base_path_specs]
+
+      self.assertEqual(len(os.listdir(temp_directory)), 1)
+
+      test_scanner = volume_scanner.VolumeScanner(
+          mediator=test_mediator, scan_context_store=test_store)
+
+      # The source should not be scanned when the scan context is reused.
+      test_scanner._source_scanner = TestSourceScanner()
+
+      base_path_specs = test_scanner.GetBasePathSpecs(test_path)
+      base_path_specs = [
+          base_path_spec.comparable for base_path_spec in base_path_specs]
+
+      self.assertEqual(base_path_specs, expected_base_path_specs)
+
   def testGetBasePathSpecsOnDirectory(self):
     """Tests the GetBasePathSpecs function on a directory."""
     test_path = self._GetTestFilePath(['testdir_os'])
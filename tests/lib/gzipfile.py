@@ -9,10 +9,154 @@
 from __future__ import unicode_literals
 
 import unittest
+import zlib
 
+from dfvfs.file_io import fake_file_io
+from dfvfs.lib import gzipfile
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
 
-# TODO: add tests for _GzipDecompressorState
-# TODO: add tests for GzipMember
+from tests import test_lib as shared_test_lib
+
+
+class SmallSpacingGzipMember(gzipfile.GzipMember):
+  """Gzip member with a small access point spacing for testing."""
+
+  _ACCESS_POINT_SPACING = 16 * 1024
+
+  _UNCOMPRESSED_DATA_CACHE_SIZE = 4 * 1024
+
+
+class LimitedAccessPointsGzipMember(SmallSpacingGzipMember):
+  """Gzip member with a small maximum access points size for testing."""
+
+  _MAXIMUM_ACCESS_POINTS_SIZE = 4 * 48 * 1024
+
+
+class GzipTestCase(shared_test_lib.BaseTestCase):
+  """Shared functionality for gzip tests."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+
+    self._uncompressed_data = b''.join([
+        '{0:08d}\n'.format(index).encode('ascii')
+        for index in range(16 * 1024)])
+
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    compressed_data = b''.join([
+        compressor.compress(self._uncompressed_data), compressor.flush()])
+
+    self._file_object = fake_file_io.FakeFile(
+        self._resolver_context, compressed_data)
+    self._file_object.open(
+        path_spec=fake_path_spec.FakePathSpec(location='/syslog.gz'))
+
+    decompressor_state_class = gzipfile._GzipDecompressorState
+    self._maximum_read_size = decompressor_state_class._MAXIMUM_READ_SIZE
+    decompressor_state_class._MAXIMUM_READ_SIZE = 1024
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    decompressor_state_class = gzipfile._GzipDecompressorState
+    decompressor_state_class._MAXIMUM_READ_SIZE = self._maximum_read_size
+
+    self._file_object.close()
+
+
+class GzipDecompressorStateTest(GzipTestCase):
+  """Tests for the gzip decompressor state."""
+
+  # pylint: disable=protected-access
+
+  def testCopy(self):
+    """Tests the Copy function."""
+    # The compressed data starts after the 10 byte member header.
+    decompressor_state = gzipfile._GzipDecompressorState(10)
+    decompressed_data = decompressor_state.Read(self._file_object)
+
+    decompressor_state_copy = decompressor_state.Copy()
+    self.assertEqual(
+        decompressor_state_copy.uncompressed_offset,
+        decompressor_state.uncompressed_offset)
+
+    expected_decompressed_data = decompressor_state.Read(self._file_object)
+    decompressed_data = decompressor_state_copy.Read(self._file_object)
+    self.assertEqual(decompressed_data, expected_decompressed_data)
+
+
+class GzipMemberTest(GzipTestCase):
+  """Tests for the gzip member."""
+
+  # pylint: disable=protected-access
+
+  def testAddAccessPoint(self):
+    """Tests the _AddAccessPoint function."""
+    member = LimitedAccessPointsGzipMember(self._file_object, 0, 0)
+
+    self.assertLessEqual(
+        member._access_points_size, member._MAXIMUM_ACCESS_POINTS_SIZE)
+    self.assertGreater(
+        member._access_point_spacing, member._ACCESS_POINT_SPACING)
+
+    uncompressed_offsets = [
+        access_point.uncompressed_offset
+        for access_point in member._access_points]
+    self.assertLessEqual(len(uncompressed_offsets), 4)
+    self.assertEqual(uncompressed_offsets[0], 0)
+    self.assertEqual(member._access_point_offsets, uncompressed_offsets)
+
+    for offset in (120000, 500, 80000, 8190, 147000, 0, 65536):
+      data = member.ReadAtOffset(offset, size=300)
+      self.assertEqual(data, self._uncompressed_data[offset:offset + 300])
+
+  def testGetAccessPoint(self):
+    """Tests the _GetAccessPoint function."""
+    member = SmallSpacingGzipMember(self._file_object, 0, 0)
+
+    access_point = member._GetAccessPoint(0)
+    self.assertEqual(access_point.uncompressed_offset, 0)
+
+    access_point = member._GetAccessPoint(100000)
+    self.assertLessEqual(access_point.uncompressed_offset, 100000)
+    self.assertGreater(access_point.uncompressed_offset, 100000 - 32 * 1024)
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    member = SmallSpacingGzipMember(self._file_object, 0, 0)
+
+    self.assertEqual(
+        member.uncompressed_data_size, len(self._uncompressed_data))
+    self.assertEqual(member.member_end_offset, self._file_object.get_size())
+
+    uncompressed_offsets = [
+        access_point.uncompressed_offset
+        for access_point in member._access_points]
+    self.assertGreater(len(uncompressed_offsets), 4)
+    self.assertEqual(uncompressed_offsets[0], 0)
+    self.assertEqual(uncompressed_offsets, sorted(uncompressed_offsets))
+    self.assertEqual(member._access_point_offsets, uncompressed_offsets)
+
+  def testReadAtOffset(self):
+    """Tests the ReadAtOffset function."""
+    member = SmallSpacingGzipMember(self._file_object, 0, 0)
+
+    for offset in (120000, 500, 80000, 8190, 147000, 0, 65536):
+      data = member.ReadAtOffset(offset, size=300)
+      self.assertEqual(data, self._uncompressed_data[offset:offset + 300])
+
+    offset = 0
+    data_segments = []
+    while offset < member.uncompressed_data_size:
+      data = member.ReadAtOffset(offset, size=5000)
+      self.assertNotEqual(data, b'')
+      data_segments.append(data)
+      offset += len(data)
+
+    self.assertEqual(b''.join(data_segments), self._uncompressed_data)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the JSON file helper functions."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dfvfs.lib import json_file
+
+from tests import test_lib as shared_test_lib
+
+
+class JSONFileTest(shared_test_lib.BaseTestCase):
+  """Tests for the JSON file helper functions."""
+
+  def testReadJSONFile(self):
+    """Tests the ReadJSONFile function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'test.json')
+
+      values = json_file.ReadJSONFile(path)
+      self.assertIsNone(values)
+
+      with open(path, 'wb') as file_object:
+        file_object.write(b'{"key": "value"')
+
+      values = json_file.ReadJSONFile(path)
+      self.assertIsNone(values)
+
+      with open(path, 'wb') as file_object:
+        file_object.write(b'["key", "value"]')
+
+      values = json_file.ReadJSONFile(path)
+      self.assertIsNone(values)
+
+      with open(path, 'wb') as file_object:
+        file_object.write(b'{"key": "value"}')
+
+      values = json_file.ReadJSONFile(path)
+      self.assertEqual(values, {'key': 'value'})
+
+  def testWriteJSONFile(self):
+    """Tests the WriteJSONFile function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      directory = os.path.join(temp_directory, 'store')
+      path = os.path.join(directory, 'test.json')
+
+      json_file.WriteJSONFile(path, {'key': 'value'})
+      self.assertEqual(os.listdir(directory), ['test.json'])
+
+      values = json_file.ReadJSONFile(path)
+      self.assertEqual(values, {'key': 'value'})
+
+      # Test replacing an existing file.
+      json_file.WriteJSONFile(path, {'key': 'other value'})
+      self.assertEqual(os.listdir(directory), ['test.json'])
+
+      values = json_file.ReadJSONFile(path)
+      self.assertEqual(values, {'key': 'other value'})
+
+
+if __name__ == '__main__':
+  unittest.main()
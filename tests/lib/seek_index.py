@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the persistent seek index store."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dfvfs.file_io import os_file_io
+from dfvfs.lib import definitions
+from dfvfs.lib import seek_index
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+
+from tests import test_lib as shared_test_lib
+
+
+class SeekIndexStoreTest(shared_test_lib.BaseTestCase):
+  """Tests for the persistent seek index store."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_path = self._GetTestFilePath(['syslog.gz'])
+    self._SkipIfPathNotExists(test_path)
+
+    self._os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    self._gzip_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_GZIP, parent=self._os_path_spec)
+
+    self._os_file_object = os_file_io.OSFile(self._resolver_context)
+    self._os_file_object.open(path_spec=self._os_path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._os_file_object.close()
+
+  def testGetIndexFilePath(self):
+    """Tests the _GetIndexFilePath function."""
+    test_store = seek_index.SeekIndexStore('index')
+
+    index_file_path = test_store._GetIndexFilePath(self._gzip_path_spec)
+    self.assertEqual(os.path.dirname(index_file_path), 'index')
+    self.assertTrue(index_file_path.endswith('.json'))
+
+    other_index_file_path = test_store._GetIndexFilePath(self._os_path_spec)
+    self.assertNotEqual(index_file_path, other_index_file_path)
+
+  def testGetParentModificationTime(self):
+    """Tests the _GetParentModificationTime function."""
+    test_store = seek_index.SeekIndexStore('index')
+
+    modification_time = test_store._GetParentModificationTime(
+        self._gzip_path_spec, self._resolver_context)
+    self.assertIsNotNone(modification_time)
+
+  def testReadWriteIndex(self):
+    """Tests the ReadIndex and WriteIndex functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_store = seek_index.SeekIndexStore(
+          os.path.join(temp_directory, 'index'))
+
+      index_values = test_store.ReadIndex(
+          self._gzip_path_spec, self._os_file_object, self._resolver_context)
+      self.assertIsNone(index_values)
+
+      test_store.WriteIndex(
+          self._gzip_path_spec, self._os_file_object, self._resolver_context,
+          {'uncompressed_stream_size': 1247})
+
+      index_values = test_store.ReadIndex(
+          self._gzip_path_spec, self._os_file_object, self._resolver_context)
+      self.assertEqual(index_values, {'uncompressed_stream_size': 1247})
+
+      # Only the index file should remain in the directory.
+      index_file_path = test_store._GetIndexFilePath(self._gzip_path_spec)
+      self.assertEqual(
+          os.listdir(os.path.join(temp_directory, 'index')),
+          [os.path.basename(index_file_path)])
+
+      # Test an index file with a mismatching parent size.
+      with open(index_file_path, 'rb') as file_object:
+        index_file_data = file_object.read()
+
+      index_file_data = index_file_data.replace(
+          b'"parent_size": ', b'"parent_size": 1')
+      with open(index_file_path, 'wb') as file_object:
+        file_object.write(index_file_data)
+
+      index_values = test_store.ReadIndex(
+          self._gzip_path_spec, self._os_file_object, self._resolver_context)
+      self.assertIsNone(index_values)
+
+      # Test a corrupt index file.
+      with open(index_file_path, 'wb') as file_object:
+        file_object.write(b'{"format_version": ')
+
+      index_values = test_store.ReadIndex(
+          self._gzip_path_spec, self._os_file_object, self._resolver_context)
+      self.assertIsNone(index_values)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the source file helper functions."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dfvfs.helpers import fake_file_system_builder
+from dfvfs.lib import source_file
+from dfvfs.path import fake_path_spec
+from dfvfs.path import gzip_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+class SourceFileTest(shared_test_lib.BaseTestCase):
+  """Tests for the source file helper functions."""
+
+  def testGetSourceValues(self):
+    """Tests the GetSourceValues function."""
+    test_file = self._GetTestFilePath(['syslog.gz'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = gzip_path_spec.GzipPathSpec(parent=path_spec)
+
+    size, modification_time = source_file.GetSourceValues(path_spec)
+    self.assertEqual(size, os.path.getsize(test_file))
+
+    # The values must match those of the file entry of the source.
+    file_entry = resolver.Resolver.OpenFileEntry(path_spec.parent)
+    self.assertEqual(
+        modification_time,
+        file_entry.modification_time.CopyToDateTimeString())
+
+    path_spec = os_path_spec.OSPathSpec(location='/bogus')
+
+    source_values = source_file.GetSourceValues(path_spec)
+    self.assertEqual(source_values, (None, None))
+
+    # Test a source that is not stored on the operating system.
+    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+    file_system_builder.AddFile('/image.raw', b'test data')
+
+    resolver_context = context.Context()
+    path_spec = fake_path_spec.FakePathSpec(location='/image.raw')
+    resolver_context.CacheFileSystem(
+        path_spec, file_system_builder.file_system)
+    resolver_context.GrabFileSystem(path_spec)
+
+    size, _ = source_file.GetSourceValues(
+        path_spec, resolver_context=resolver_context)
+    self.assertEqual(size, 9)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -8,6 +8,9 @@ import unittest
 
 from dfvfs.lib import definitions
 from dfvfs.path import factory
+from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
+from dfvfs.path import tsk_path_spec
 
 from tests.path import test_lib
 
@@ -39,6 +42,37 @@ class FactoryTest(unittest.TestCase):
 
     self.assertIsNotNone(test_path_spec)
 
+  def testInternPathSpec(self):
+    """Tests the InternPathSpec function."""
+    test_os_path_spec = os_path_spec.OSPathSpec(location='/test.qcow2')
+    test_qcow_path_spec1 = qcow_path_spec.QCOWPathSpec(
+        parent=test_os_path_spec)
+    test_tsk_path_spec1 = tsk_path_spec.TSKPathSpec(
+        location='/test', parent=test_qcow_path_spec1)
+
+    interned_path_spec1 = factory.Factory.InternPathSpec(test_tsk_path_spec1)
+    self.assertIs(interned_path_spec1, test_tsk_path_spec1)
+
+    # Test an equal path specification with its own parent chain.
+    test_os_path_spec = os_path_spec.OSPathSpec(location='/test.qcow2')
+    test_qcow_path_spec2 = qcow_path_spec.QCOWPathSpec(
+        parent=test_os_path_spec)
+    test_tsk_path_spec2 = tsk_path_spec.TSKPathSpec(
+        location='/test', parent=test_qcow_path_spec2)
+
+    interned_path_spec2 = factory.Factory.InternPathSpec(test_tsk_path_spec2)
+    self.assertIs(interned_path_spec2, interned_path_spec1)
+
+    # Test a different path specification that shares the parent chain.
+    test_tsk_path_spec3 = tsk_path_spec.TSKPathSpec(
+        inode=2, location='/other', parent=test_qcow_path_spec2)
+
+    interned_path_spec3 = factory.Factory.InternPathSpec(test_tsk_path_spec3)
+    self.assertIsNot(interned_path_spec3, test_tsk_path_spec3)
+    self.assertEqual(interned_path_spec3, test_tsk_path_spec3)
+    self.assertIs(interned_path_spec3.parent, test_qcow_path_spec1)
+    self.assertEqual(interned_path_spec3.inode, 2)
+
   def testIsSystemLevelTypeIndicator(self):
     """Tests the IsSystemLevelTypeIndicator function."""
     result = factory.Factory.IsSystemLevelTypeIndicator(
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Memory benchmarks for the path specification factory."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+try:
+  import tracemalloc
+except ImportError:
+  tracemalloc = None
+
+from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
+from dfvfs.path import tsk_partition_path_spec
+from dfvfs.path import tsk_path_spec
+from dfvfs.serializer import json_serializer
+
+from tests import test_lib as shared_test_lib
+
+
+@unittest.skipIf(tracemalloc is None, 'missing tracemalloc support')
+@unittest.skipUnless(
+    shared_test_lib.RUN_BENCHMARKS, 'DFVFS_RUN_BENCHMARKS is not set')
+class FactoryMemoryBenchmarkTest(unittest.TestCase):
+  """Memory benchmarks for the path specification factory."""
+
+  _NUMBER_OF_DIRECTORY_ENTRIES = 5000
+
+  def _GetDirectoryTreePathSpecs(self):
+    """Creates path specifications of a synthetic directory tree.
+
+    Every path specification is created with its own parent chain.
+
+    Returns:
+      list[TSKPathSpec]: path specifications.
+    """
+    path_specs = []
+    for index in range(self._NUMBER_OF_DIRECTORY_ENTRIES):
+      parent_path_spec = os_path_spec.OSPathSpec(
+          location='/cases/evidence/image.qcow2')
+      parent_path_spec = qcow_path_spec.QCOWPathSpec(parent=parent_path_spec)
+      parent_path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+          location='/p1', parent=parent_path_spec)
+
+      location = '/directory{0:d}/file{1:d}'.format(index // 100, index)
+      path_spec = tsk_path_spec.TSKPathSpec(
+          inode=index, location=location, parent=parent_path_spec)
+      path_specs.append(path_spec)
+
+    return path_specs
+
+  def _GetMemoryUsage(self, function, *args):
+    """Determines the memory used by the path specifications of a function.
+
+    Args:
+      function (function): function that returns path specifications.
+      args (list[object]): arguments of the function.
+
+    Returns:
+      int: number of bytes allocated for the path specifications.
+    """
+    tracemalloc.start()
+    try:
+      path_specs = function(*args)
+      memory_usage, _ = tracemalloc.get_traced_memory()
+    finally:
+      tracemalloc.stop()
+
+    self.assertEqual(len(path_specs), self._NUMBER_OF_DIRECTORY_ENTRIES)
+    return memory_usage
+
+  def _ReadSerializedPathSpecs(self, serialized_path_specs):
+    """Deserializes path specifications one at a time.
+
+    Args:
+      serialized_path_specs (list[str]): JSON serialized path specifications.
+
+    Returns:
+      list[TSKPathSpec]: path specifications.
+    """
+    return [
+        json_serializer.JsonPathSpecSerializer.ReadSerialized(
+            serialized_path_spec)
+        for serialized_path_spec in serialized_path_specs]
+
+  def testReadSerializedMemoryUsage(self):
+    """Tests the memory reduction of interning deserialized parents."""
+    path_specs = self._GetDirectoryTreePathSpecs()
+    serialized_path_specs = [
+        json_serializer.JsonPathSpecSerializer.WriteSerialized(path_spec)
+        for path_spec in path_specs]
+    del path_specs
+
+    memory_usage = self._GetMemoryUsage(self._GetDirectoryTreePathSpecs)
+    interned_memory_usage = self._GetMemoryUsage(
+        self._ReadSerializedPathSpecs, serialized_path_specs)
+
+    self.assertLess(interned_memory_usage, memory_usage * 0.6)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -4,9 +4,11 @@
 
 from __future__ import unicode_literals
 
+import pickle
 import unittest
 
 from dfvfs.path import path_spec
+from dfvfs.path import tsk_path_spec
 
 from tests.path import test_lib
 
@@ -36,8 +38,45 @@ class PathSpecTest(test_lib.PathSpecTestCase):
     with self.assertRaises(ValueError):
       path_spec.PathSpec()
 
-  # TODO: add tests for __eq__
-  # TODO: add tests for __hash__
+  def testEqualAndHash(self):
+    """Tests the __eq__ and __hash__ functions."""
+    test_path_spec1 = TestPathSpec()
+    test_path_spec2 = TestPathSpec()
+
+    self.assertEqual(test_path_spec1, test_path_spec2)
+    self.assertEqual(hash(test_path_spec1), hash(test_path_spec2))
+
+  def testGetAttributeNames(self):
+    """Tests the _GetAttributeNames function."""
+    test_path_spec = TestPathSpec()
+
+    attribute_names = test_path_spec._GetAttributeNames()
+    self.assertEqual(attribute_names, ['attribute', 'parent'])
+
+  def testFrozen(self):
+    """Tests that a path specification is frozen once it is compared."""
+    test_path_spec = TestPathSpec()
+    test_path_spec.attribute = 'OtherAttribute'
+
+    self.assertEqual(test_path_spec.comparable, 'type: test\n')
+
+    with self.assertRaises(AttributeError):
+      test_path_spec.attribute = 'MyAttribute'
+
+    self.assertEqual(test_path_spec.attribute, 'OtherAttribute')
+
+  def testPickle(self):
+    """Tests pickling a frozen path specification."""
+    test_path_spec = tsk_path_spec.TSKPathSpec(
+        inode=1, location='/test', parent=self._path_spec)
+    comparable = test_path_spec.comparable
+
+    pickled_path_spec = pickle.dumps(test_path_spec)
+    unpickled_path_spec = pickle.loads(pickled_path_spec)
+
+    self.assertEqual(unpickled_path_spec.comparable, comparable)
+    self.assertEqual(unpickled_path_spec.inode, 1)
+    self.assertEqual(unpickled_path_spec.location, '/test')
 
   def testGetComparable(self):
     """Tests the _GetComparable function."""
@@ -99,6 +99,13 @@ class TSKPathSpecTest(test_lib.PathSpecTestCase):
 
     self.assertEqual(path_spec.comparable, expected_comparable)
 
+  def testSlots(self):
+    """Tests that the path specification does not have a __dict__."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location='/test', parent=self._path_spec)
+
+    self.assertFalse(hasattr(path_spec, '__dict__'))
+
 
 if __name__ == '__main__':
   unittest.main()
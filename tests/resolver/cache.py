@@ -15,6 +15,102 @@ class TestVFSObject(object):
   """Test VFS object."""
 
 
+class BlockCacheStatisticsTest(unittest.TestCase):
+  """Tests for the resolver block cache statistics."""
+
+  def testHitRate(self):
+    """Tests the hit_rate property."""
+    statistics = cache.BlockCacheStatistics()
+    self.assertEqual(statistics.hit_rate, 0.0)
+
+    statistics.number_of_hits = 3
+    statistics.number_of_misses = 1
+    self.assertEqual(statistics.hit_rate, 0.75)
+
+
+class BlockCacheTest(unittest.TestCase):
+  """Tests for the resolver block cache."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    cache_object = cache.BlockCache(1024, block_size=512)
+    self.assertEqual(cache_object.block_size, 512)
+
+    with self.assertRaises(ValueError):
+      cache.BlockCache(0)
+
+    with self.assertRaises(ValueError):
+      cache.BlockCache(1024, block_size=0)
+
+  def testCacheBlock(self):
+    """Tests the CacheBlock and GetBlock functions."""
+    cache_object = cache.BlockCache(1024, block_size=512)
+
+    block_data = cache_object.GetBlock('1', 0)
+    self.assertIsNone(block_data)
+
+    cache_object.CacheBlock('1', 0, b'A' * 512)
+    cache_object.CacheBlock('2', 0, b'B' * 512)
+
+    block_data = cache_object.GetBlock('1', 0)
+    self.assertEqual(block_data, b'A' * 512)
+
+    block_data = cache_object.GetBlock('1', 512)
+    self.assertIsNone(block_data)
+
+    # Replacing a cached block should not change the cache size.
+    cache_object.CacheBlock('2', 0, b'C' * 512)
+
+    statistics = cache_object.GetStatistics()
+    self.assertEqual(statistics.cache_size, 1024)
+    self.assertEqual(statistics.number_of_evictions, 0)
+    self.assertEqual(statistics.number_of_hits, 1)
+    self.assertEqual(statistics.number_of_misses, 2)
+
+    cache_object.Empty()
+
+    statistics = cache_object.GetStatistics()
+    self.assertEqual(statistics.cache_size, 0)
+
+    block_data = cache_object.GetBlock('1', 0)
+    self.assertIsNone(block_data)
+
+  def testCacheBlockEviction(self):
+    """Tests the eviction of least recently used blocks."""
+    cache_object = cache.BlockCache(1024, block_size=512)
+
+    cache_object.CacheBlock('1', 0, b'A' * 512)
+    cache_object.CacheBlock('1', 512, b'B' * 512)
+
+    # Mark the first block as the most recently used.
+    cache_object.GetBlock('1', 0)
+
+    cache_object.CacheBlock('1', 1024, b'C' * 512)
+
+    self.assertIsNotNone(cache_object.GetBlock('1', 0))
+    self.assertIsNone(cache_object.GetBlock('1', 512))
+    self.assertIsNotNone(cache_object.GetBlock('1', 1024))
+
+    statistics = cache_object.GetStatistics()
+    self.assertEqual(statistics.cache_size, 1024)
+    self.assertEqual(statistics.number_of_evictions, 1)
+
+  def testSetMaximumCacheSize(self):
+    """Tests the SetMaximumCacheSize function."""
+    cache_object = cache.BlockCache(1024, block_size=512)
+
+    cache_object.CacheBlock('1', 0, b'A' * 512)
+    cache_object.CacheBlock('1', 512, b'B' * 512)
+
+    cache_object.SetMaximumCacheSize(512)
+
+    self.assertIsNone(cache_object.GetBlock('1', 0))
+    self.assertIsNotNone(cache_object.GetBlock('1', 512))
+
+    with self.assertRaises(ValueError):
+      cache_object.SetMaximumCacheSize(0)
+
+
 class ObjectsCacheValueTest(unittest.TestCase):
   """Tests for the resolver objects cache value."""
 
@@ -76,12 +172,18 @@ class ObjectsCacheTest(unittest.TestCase):
     cache_object.RemoveObject(self._path_spec.comparable)
     self.assertEqual(len(cache_object._values), 0)
 
+    identifier, cache_value = cache_object.GetCacheValueByObject(
+        self._vfs_object)
+    self.assertIsNone(identifier)
+    self.assertIsNone(cache_value)
+
   def testCacheFull(self):
     """Tests if the CacheFullError is raised."""
     cache_object = cache.ObjectsCache(1)
     self.assertIsNotNone(cache_object)
 
     cache_object.CacheObject(self._path_spec.comparable, self._vfs_object)
+    cache_object.GrabObject(self._path_spec.comparable)
 
     path_spec = fake_path_spec.FakePathSpec(location='2')
     vfs_object = TestVFSObject()
@@ -89,6 +191,49 @@ class ObjectsCacheTest(unittest.TestCase):
     with self.assertRaises(errors.CacheFullError):
       cache_object.CacheObject(path_spec.comparable, vfs_object)
 
+  def testCacheEviction(self):
+    """Tests the eviction of least recently used dereferenced objects."""
+    evicted_objects = []
+
+    cache_object = cache.ObjectsCache(
+        2, eviction_callback=evicted_objects.append)
+    self.assertIsNotNone(cache_object)
+
+    path_spec1 = fake_path_spec.FakePathSpec(location='1')
+    vfs_object1 = TestVFSObject()
+    cache_object.CacheObject(path_spec1.comparable, vfs_object1)
+
+    path_spec2 = fake_path_spec.FakePathSpec(location='2')
+    vfs_object2 = TestVFSObject()
+    cache_object.CacheObject(path_spec2.comparable, vfs_object2)
+
+    # Mark the first object as the most recently used.
+    cache_object.GetObject(path_spec1.comparable)
+
+    path_spec3 = fake_path_spec.FakePathSpec(location='3')
+    vfs_object3 = TestVFSObject()
+    cache_object.CacheObject(path_spec3.comparable, vfs_object3)
+
+    self.assertEqual(evicted_objects, [vfs_object2])
+    self.assertIsNone(cache_object.GetObject(path_spec2.comparable))
+    self.assertEqual(cache_object.GetObject(path_spec1.comparable), vfs_object1)
+
+    # Referenced objects are not evicted.
+    cache_object.GrabObject(path_spec1.comparable)
+
+    path_spec4 = fake_path_spec.FakePathSpec(location='4')
+    vfs_object4 = TestVFSObject()
+    cache_object.CacheObject(path_spec4.comparable, vfs_object4)
+
+    self.assertEqual(evicted_objects, [vfs_object2, vfs_object3])
+    self.assertEqual(cache_object.GetObject(path_spec1.comparable), vfs_object1)
+
+    cache_object.SetMaximumNumberOfCachedValues(1)
+    self.assertEqual(evicted_objects, [vfs_object2, vfs_object3, vfs_object4])
+
+    # pylint: disable=protected-access
+    self.assertEqual(len(cache_object._values), 1)
+
   def testEmpty(self):
     """Tests the Empty method."""
     cache_object = cache.ObjectsCache(5)
@@ -120,6 +265,25 @@ class ObjectsCacheTest(unittest.TestCase):
     cached_object = cache_object.GetObject(self._path_spec.comparable)
     self.assertEqual(cached_object, self._vfs_object)
 
+  def testGetStatistics(self):
+    """Tests the GetStatistics method."""
+    cache_object = cache.ObjectsCache(1)
+    self.assertIsNotNone(cache_object)
+
+    cache_object.CacheObject(self._path_spec.comparable, self._vfs_object)
+    cache_object.GetObject(self._path_spec.comparable)
+    cache_object.GetObject(self._path_spec.comparable)
+
+    path_spec = fake_path_spec.FakePathSpec(location='2')
+    vfs_object = TestVFSObject()
+    cache_object.CacheObject(path_spec.comparable, vfs_object)
+
+    statistics = cache_object.GetStatistics()
+    self.assertIsNotNone(statistics)
+    self.assertEqual(statistics.number_of_evictions, 1)
+    self.assertEqual(statistics.number_of_hits, 2)
+    self.assertEqual(statistics.number_of_misses, 2)
+
   def testGetCacheValueByObjectGetCacheValueByObject(self):
     """Tests the GetCacheValueByObject method."""
     cache_object = cache.ObjectsCache(1)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmarks for the resolver objects cache."""
+
+from __future__ import unicode_literals
+
+import timeit
+import unittest
+
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import cache
+
+from tests import test_lib as shared_test_lib
+
+
+class TestVFSObject(object):
+  """Test VFS object."""
+
+
+@unittest.skipUnless(
+    shared_test_lib.RUN_BENCHMARKS, 'DFVFS_RUN_BENCHMARKS is not set')
+class ObjectsCacheBenchmarkTest(unittest.TestCase):
+  """Micro-benchmarks for the resolver objects cache."""
+
+  _NUMBER_OF_LOOKUPS = 2000
+
+  def _GetLookupTime(self, number_of_cached_values):
+    """Determines the time needed to look up cache values by object.
+
+    Args:
+      number_of_cached_values (int): number of cached values.
+
+    Returns:
+      float: fastest time, in seconds, of several runs of lookups of
+          the least recently cached object.
+    """
+    cache_object = cache.ObjectsCache(number_of_cached_values)
+
+    vfs_objects = []
+    for index in range(number_of_cached_values):
+      path_spec = fake_path_spec.FakePathSpec(
+          location='/{0:d}'.format(index))
+      vfs_object = TestVFSObject()
+      cache_object.CacheObject(path_spec.comparable, vfs_object)
+      vfs_objects.append(vfs_object)
+
+    # The last cached object is the worst case for a linear scan.
+    vfs_object = vfs_objects[-1]
+
+    timer = timeit.Timer(
+        lambda: cache_object.GetCacheValueByObject(vfs_object))
+    return min(timer.repeat(repeat=5, number=self._NUMBER_OF_LOOKUPS))
+
+  def testGetCacheValueByObjectScaling(self):
+    """Tests that GetCacheValueByObject does not scale with the cache size."""
+    small_cache_time = self._GetLookupTime(128)
+    large_cache_time = self._GetLookupTime(128 * 64)
+
+    # A linear scan would be about 64 times slower for the large cache,
+    # a constant time lookup should be roughly as fast for both.
+    self.assertLess(large_cache_time, small_cache_time * 8)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -4,17 +4,52 @@
 
 from __future__ import unicode_literals
 
+import threading
 import unittest
 
 from dfvfs.file_io import fake_file_io
+from dfvfs.lib import definitions
 from dfvfs.path import fake_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
+from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 from dfvfs.vfs import fake_file_system
 
+from tests import test_lib as shared_test_lib
+
 
 class ContextTest(unittest.TestCase):
   """Tests for the resolver context object."""
 
+  def testCacheBlock(self):
+    """Tests the cache block functionality."""
+    path_spec = fake_path_spec.FakePathSpec(location='/data')
+
+    resolver_context = context.Context()
+    self.assertIsNone(resolver_context.GetBlockSize())
+    self.assertIsNone(resolver_context.GetBlockCacheStatistics())
+
+    resolver_context.CacheBlock(path_spec, 0, b'data')
+    self.assertIsNone(resolver_context.GetBlock(path_spec, 0))
+
+    resolver_context.SetMaximumBlockCacheSize(1024 * 1024)
+    self.assertEqual(resolver_context.GetBlockSize(), 4096)
+
+    resolver_context.CacheBlock(path_spec, 0, b'data')
+    self.assertEqual(resolver_context.GetBlock(path_spec, 0), b'data')
+
+    statistics = resolver_context.GetBlockCacheStatistics()
+    self.assertEqual(statistics.cache_size, 4)
+    self.assertEqual(statistics.number_of_hits, 1)
+
+    resolver_context.Empty()
+    self.assertIsNone(resolver_context.GetBlock(path_spec, 0))
+
+    resolver_context.SetMaximumBlockCacheSize(0)
+    self.assertIsNone(resolver_context.GetBlockSize())
+
   def testCacheFileObject(self):
     """Tests the cache file-like object functionality."""
     resolver_context = context.Context()
@@ -37,12 +72,88 @@ class ContextTest(unittest.TestCase):
     resolver_context.GrabFileObject(path_spec)
     self.assertEqual(len(resolver_context._file_object_cache._values), 1)
 
-    resolver_context.ReleaseFileObject(file_object)
+    result = resolver_context.ReleaseFileObject(file_object)
+    self.assertFalse(result)
     self.assertEqual(len(resolver_context._file_object_cache._values), 1)
 
-    resolver_context.ReleaseFileObject(file_object)
+    # The dereferenced file-like object remains cached until it is evicted.
+    result = resolver_context.ReleaseFileObject(file_object)
+    self.assertFalse(result)
+    self.assertEqual(len(resolver_context._file_object_cache._values), 1)
+    self.assertEqual(
+        resolver_context.GetFileObjectReferenceCount(path_spec), 0)
+
+    resolver_context.Empty()
     self.assertEqual(len(resolver_context._file_object_cache._values), 0)
 
+  def testCacheFileObjectEviction(self):
+    """Tests the eviction of dereferenced file-like objects."""
+    resolver_context = context.Context(maximum_number_of_file_objects=1)
+
+    path_spec1 = fake_path_spec.FakePathSpec(location='/empty1.txt')
+    file_object1 = fake_file_io.FakeFile(resolver_context, b'')
+    file_object1.open(path_spec=path_spec1)
+
+    # Closing the file-like object releases it but it remains open in
+    # the cache.
+    file_object1.close()
+
+    # pylint: disable=protected-access
+    self.assertEqual(
+        resolver_context.PeekFileObject(path_spec1), file_object1)
+    self.assertEqual(
+        resolver_context.GetFileObjectReferenceCount(path_spec1), 0)
+    self.assertTrue(file_object1._is_open)
+    self.assertTrue(file_object1._is_cached)
+
+    path_spec2 = fake_path_spec.FakePathSpec(location='/empty2.txt')
+    file_object2 = fake_file_io.FakeFile(resolver_context, b'')
+    file_object2.open(path_spec=path_spec2)
+
+    self.assertIsNone(resolver_context.PeekFileObject(path_spec1))
+    self.assertEqual(
+        resolver_context.PeekFileObject(path_spec2), file_object2)
+    self.assertFalse(file_object1._is_open)
+    self.assertFalse(file_object1._is_cached)
+
+    statistics = resolver_context.GetFileObjectCacheStatistics()
+    self.assertEqual(statistics.number_of_evictions, 1)
+    self.assertEqual(statistics.number_of_hits, 0)
+    self.assertEqual(statistics.number_of_misses, 2)
+
+    file_object2.close()
+    self.assertTrue(file_object2._is_open)
+
+    resolver_context.Empty()
+    self.assertFalse(file_object2._is_open)
+
+  def testCacheFileObjectReuse(self):
+    """Tests reusing a released file-like object."""
+    resolver_context = context.Context()
+
+    path_spec = fake_path_spec.FakePathSpec(location='/test.txt')
+    file_object = fake_file_io.FakeFile(resolver_context, b'test data')
+    file_object.open(path_spec=path_spec)
+    file_object.seek(5)
+    file_object.close()
+
+    reused_file_object = resolver_context.GetFileObject(path_spec)
+    self.assertEqual(reused_file_object, file_object)
+
+    reused_file_object.open(path_spec=path_spec)
+    self.assertEqual(
+        resolver_context.GetFileObjectReferenceCount(path_spec), 1)
+    self.assertEqual(reused_file_object.read(), b'test data')
+
+    statistics = resolver_context.GetFileObjectCacheStatistics()
+    self.assertEqual(statistics.number_of_hits, 1)
+    self.assertEqual(statistics.number_of_misses, 1)
+
+    reused_file_object.close()
+
+    with self.assertRaises(IOError):
+      reused_file_object.close()
+
   def testCacheFileSystem(self):
     """Tests the cache file system object functionality."""
     resolver_context = context.Context()
@@ -59,18 +170,185 @@ class ContextTest(unittest.TestCase):
     cached_object = resolver_context.GetFileSystem(path_spec)
     self.assertEqual(cached_object, file_system)
 
+    statistics = resolver_context.GetFileSystemCacheStatistics()
+    self.assertEqual(statistics.number_of_evictions, 0)
+    self.assertEqual(statistics.number_of_hits, 1)
+    self.assertEqual(statistics.number_of_misses, 1)
+
     resolver_context.GrabFileSystem(path_spec)
     self.assertEqual(len(resolver_context._file_system_cache._values), 1)
 
     resolver_context.GrabFileSystem(path_spec)
     self.assertEqual(len(resolver_context._file_system_cache._values), 1)
 
-    resolver_context.ReleaseFileSystem(file_system)
+    result = resolver_context.ReleaseFileSystem(file_system)
+    self.assertFalse(result)
+    self.assertEqual(len(resolver_context._file_system_cache._values), 1)
+
+    # The dereferenced file system object remains cached until it is evicted.
+    result = resolver_context.ReleaseFileSystem(file_system)
+    self.assertFalse(result)
     self.assertEqual(len(resolver_context._file_system_cache._values), 1)
+    self.assertEqual(
+        resolver_context.GetFileSystemReferenceCount(path_spec), 0)
 
-    resolver_context.ReleaseFileSystem(file_system)
+    resolver_context.Empty()
     self.assertEqual(len(resolver_context._file_system_cache._values), 0)
 
+  def testMaximumReadAheadSize(self):
+    """Tests the maximum read-ahead size functionality."""
+    resolver_context = context.Context()
+    self.assertEqual(resolver_context.GetMaximumReadAheadSize(), 0)
+
+    resolver_context = context.ThreadSafeContext()
+    self.assertEqual(resolver_context.GetMaximumReadAheadSize(), 0)
+
+    resolver_context = context.Context(maximum_read_ahead_size=1048576)
+    self.assertEqual(resolver_context.GetMaximumReadAheadSize(), 1048576)
+
+    resolver_context.SetMaximumReadAheadSize(4096)
+    self.assertEqual(resolver_context.GetMaximumReadAheadSize(), 4096)
+
+    resolver_context.SetMaximumReadAheadSize(-1)
+    self.assertEqual(resolver_context.GetMaximumReadAheadSize(), 0)
+
+  def testOSFileAccessMethod(self):
+    """Tests the OS file access method functionality."""
+    resolver_context = context.Context()
+    self.assertEqual(
+        resolver_context.GetOSFileAccessMethod(),
+        definitions.OS_FILE_ACCESS_METHOD_READ)
+
+    resolver_context.SetOSFileAccessMethod(
+        definitions.OS_FILE_ACCESS_METHOD_MMAP)
+    self.assertEqual(
+        resolver_context.GetOSFileAccessMethod(),
+        definitions.OS_FILE_ACCESS_METHOD_MMAP)
+
+    with self.assertRaises(ValueError):
+      resolver_context.SetOSFileAccessMethod('bogus')
+
+    with self.assertRaises(ValueError):
+      context.Context(os_file_access_method='bogus')
+
+
+class ThreadSafeContextTest(shared_test_lib.BaseTestCase):
+  """Tests for the thread-safe resolver context object."""
+
+  _NUMBER_OF_ITERATIONS = 20
+  _NUMBER_OF_THREADS = 16
+
+  def testCacheFileObjectPerThread(self):
+    """Tests that file-like objects are cached per thread."""
+    resolver_context = context.ThreadSafeContext()
+
+    path_spec = fake_path_spec.FakePathSpec(location='/empty.txt')
+    file_object = fake_file_io.FakeFile(resolver_context, b'')
+    file_object.open(path_spec=path_spec)
+
+    cached_objects = []
+
+    def _GetFileObject():
+      """Retrieves the cached file-like object in another thread."""
+      cached_objects.append(resolver_context.GetFileObject(path_spec))
+
+    thread = threading.Thread(target=_GetFileObject)
+    thread.start()
+    thread.join()
+
+    self.assertEqual(cached_objects, [None])
+    self.assertEqual(resolver_context.GetFileObject(path_spec), file_object)
+
+    file_object.close()
+    self.assertEqual(
+        resolver_context.GetFileObjectReferenceCount(path_spec), 0)
+
+  def testEvictFileObjectOfOtherThread(self):
+    """Tests evicting a file-like object released by another thread."""
+    resolver_context = context.ThreadSafeContext(
+        maximum_number_of_file_objects=1)
+
+    path_spec1 = fake_path_spec.FakePathSpec(location='/empty1.txt')
+    file_object1 = fake_file_io.FakeFile(resolver_context, b'')
+
+    def _OpenAndCloseFileObject():
+      """Opens and closes a file-like object in another thread."""
+      file_object1.open(path_spec=path_spec1)
+      file_object1.close()
+
+    thread = threading.Thread(target=_OpenAndCloseFileObject)
+    thread.start()
+    thread.join()
+
+    # pylint: disable=protected-access
+    self.assertTrue(file_object1._is_open)
+
+    path_spec2 = fake_path_spec.FakePathSpec(location='/empty2.txt')
+    file_object2 = fake_file_io.FakeFile(resolver_context, b'')
+    file_object2.open(path_spec=path_spec2)
+
+    self.assertFalse(file_object1._is_open)
+    self.assertFalse(file_object1._is_cached)
+
+    file_object2.close()
+
+  def testOpenFileObjectFromThreads(self):
+    """Tests opening the same file in a storage media image from threads."""
+    test_file = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_file)
+
+    test_os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    test_qcow_path_spec = qcow_path_spec.QCOWPathSpec(
+        parent=test_os_path_spec)
+    test_tsk_path_spec = tsk_path_spec.TSKPathSpec(
+        location='/a_directory/another_file', parent=test_qcow_path_spec)
+
+    resolver_context = context.ThreadSafeContext()
+
+    exceptions = []
+    results = []
+
+    def _ReadFileObject():
+      """Opens and reads the test file repeatedly."""
+      try:
+        for _ in range(self._NUMBER_OF_ITERATIONS):
+          file_object = resolver.Resolver.OpenFileObject(
+              test_tsk_path_spec, resolver_context=resolver_context)
+          try:
+            file_object.seek(10)
+            results.append(file_object.read(5))
+          finally:
+            file_object.close()
+
+      except Exception as exception:  # pylint: disable=broad-except
+        exceptions.append(exception)
+
+    threads = [
+        threading.Thread(target=_ReadFileObject)
+        for _ in range(self._NUMBER_OF_THREADS)]
+
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    self.assertEqual(exceptions, [])
+    self.assertEqual(
+        results,
+        [b'other'] * self._NUMBER_OF_ITERATIONS * self._NUMBER_OF_THREADS)
+
+    # The file system objects are only referenced by the released file-like
+    # objects that remained open in the cache.
+    # pylint: disable=protected-access
+    file_systems = [
+        cache_value.vfs_object
+        for cache_value in resolver_context._file_system_cache._values.values()]
+    self.assertNotEqual(file_systems, [])
+
+    resolver_context.Empty()
+    for file_system in file_systems:
+      self.assertFalse(file_system._is_open)
+
 
 if __name__ == '__main__':
   unittest.main()
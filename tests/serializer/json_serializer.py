@@ -7,6 +7,8 @@ from __future__ import unicode_literals
 import os
 import unittest
 
+from dfvfs.helpers import source_scanner
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
 from dfvfs.path import tsk_path_spec
@@ -60,6 +62,80 @@ class JsonPathSpecSerializerTest(shared_test_lib.BaseTestCase):
         sorted(path_spec_dict.items()),
         sorted(self._tsk_path_spec_dict.items()))
 
+    # Path specifications that are deserialized one at a time should share
+    # their parent chain.
+    other_path_spec = serializer.JsonPathSpecSerializer.ReadSerialized(
+        serialized_path_spec)
+
+    self.assertIsNot(other_path_spec, path_spec)
+    self.assertIs(other_path_spec.parent, path_spec.parent)
+
+
+class JsonSourceScannerContextSerializerTest(shared_test_lib.BaseTestCase):
+  """Tests for the JSON source scanner context serializer."""
+
+  def _GetScanNodeValues(self, scan_context):
+    """Retrieves the values of the scan nodes for comparison.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+
+    Returns:
+      list[tuple[str, bool, bool]]: comparable, scanned and locked state of
+          the scan nodes, from the root downwards.
+    """
+    scan_node_values = []
+    scan_nodes = [scan_context.GetRootScanNode()]
+    while scan_nodes:
+      scan_node = scan_nodes.pop(0)
+      scan_node_values.append((
+          scan_node.path_spec.comparable, scan_node.scanned,
+          scan_context.IsLockedScanNode(scan_node.path_spec)))
+      scan_nodes.extend(scan_node.sub_nodes)
+
+    return scan_node_values
+
+  def testReadAndWriteSerialized(self):
+    """Test the ReadSerialized and WriteSerialized function."""
+    test_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_scan_context = source_scanner.SourceScannerContext()
+    test_scan_context.OpenSourcePath(test_path)
+
+    test_source_scanner = source_scanner.SourceScanner()
+    test_source_scanner.Scan(test_scan_context)
+
+    # Mark a scan node as locked to test that the locked state is preserved.
+    test_scan_node = test_scan_context.GetRootScanNode().sub_nodes[0]
+    test_scan_context.LockScanNode(test_scan_node.path_spec)
+
+    serializer_object = serializer.JsonSourceScannerContextSerializer
+    serialized_scan_context = serializer_object.WriteSerialized(
+        test_scan_context)
+
+    self.assertIsNotNone(serialized_scan_context)
+
+    scan_context = serializer_object.ReadSerialized(serialized_scan_context)
+
+    self.assertIsNotNone(scan_context)
+    self.assertEqual(
+        scan_context.source_type, definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE)
+    self.assertFalse(scan_context.updated)
+    self.assertTrue(scan_context.HasLockedScanNodes())
+
+    self.assertEqual(
+        self._GetScanNodeValues(scan_context),
+        self._GetScanNodeValues(test_scan_context))
+
+    # Test an empty source scanner context.
+    serialized_scan_context = serializer_object.WriteSerialized(
+        source_scanner.SourceScannerContext())
+
+    scan_context = serializer_object.ReadSerialized(serialized_scan_context)
+    self.assertIsNone(scan_context.GetRootScanNode())
+    self.assertIsNone(scan_context.source_type)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -4,9 +4,35 @@
 from __future__ import unicode_literals
 
 import os
+import shutil
+import tempfile
 import unittest
 
 
+# Benchmarks depend on the load of the host, which makes them unreliable as
+# part of the test suite, hence they are only run when the environment
+# variable DFVFS_RUN_BENCHMARKS is set.
+RUN_BENCHMARKS = bool(os.environ.get('DFVFS_RUN_BENCHMARKS', None))
+
+
+class TempDirectory(object):
+  """Temporary directory."""
+
+  def __init__(self):
+    """Initializes a temporary directory."""
+    super(TempDirectory, self).__init__()
+    self.name = ''
+
+  def __enter__(self):
+    """Make this work with the 'with' statement."""
+    self.name = tempfile.mkdtemp()
+    return self.name
+
+  def __exit__(self, unused_type, unused_value, unused_traceback):
+    """Make this work with the 'with' statement."""
+    shutil.rmtree(self.name, True)
+
+
 class BaseTestCase(unittest.TestCase):
   """The base test case."""
 
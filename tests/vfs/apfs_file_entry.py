@@ -99,6 +99,17 @@ class APFSFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertIsNotNone(file_entry.modification_time)
 
+  def testSize(self):
+    """Test the size property."""
+    test_location = '/a_directory/another_file'
+    path_spec = apfs_path_spec.APFSPathSpec(
+        identifier=21, location=test_location,
+        parent=self._apfs_container_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertIsNotNone(file_entry)
+    self.assertEqual(file_entry.size, 22)
+
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     path_spec = apfs_path_spec.APFSPathSpec(
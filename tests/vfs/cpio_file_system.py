@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import cpio_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
@@ -91,6 +92,33 @@ class CPIOFileSystemTest(shared_test_lib.BaseTestCase):
 
   # TODO: add tests for GetCPIOArchiveFileEntryByPathSpec function.
 
+  def testIterateMetadata(self):
+    """Tests the IterateMetadata function."""
+    file_system = cpio_file_system.CPIOFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._cpio_path_spec)
+
+    locations = [
+        metadata.location for metadata in file_system.IterateMetadata()]
+
+    self.assertEqual(locations, ['/', '/syslog'])
+
+    metadata_per_location = {
+        metadata.location: metadata
+        for metadata in file_system.IterateMetadata()}
+
+    metadata = metadata_per_location.get('/syslog', None)
+    self.assertIsNotNone(metadata)
+    self.assertEqual(metadata.identifier, 45521)
+    self.assertEqual(metadata.size, 1247)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertEqual(
+        metadata.modification_time.CopyToDateTimeString(),
+        '2015-05-27 05:01:53')
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -114,6 +114,20 @@ class FakeFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertNotEqual(stat_object.ctime, 0)
     self.assertNotEqual(stat_object.mtime, 0)
 
+  def testSize(self):
+    """Test the size property."""
+    test_file = '/test_data/testdir_fake/file1.txt'
+    path_spec = fake_path_spec.FakePathSpec(location=test_file)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertIsNotNone(file_entry)
+    self.assertEqual(file_entry.size, 5)
+
+    file_entry = self._file_system.GetRootFileEntry()
+
+    self.assertIsNotNone(file_entry)
+    self.assertIsNone(file_entry.size)
+
   def testIsFunctions(self):
     """Test the Is? functions."""
     test_file = '/test_data/testdir_fake/file1.txt'
@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import fake_path_spec
 from dfvfs.resolver import context
 from dfvfs.vfs import fake_file_system
@@ -89,6 +90,47 @@ class FakeFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testIterateMetadata(self):
+    """Tests the IterateMetadata function."""
+    file_system = fake_file_system.FakeFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.AddFileEntry(
+        '/test_data', file_entry_type=definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    file_system.AddFileEntry(
+        '/test_data/testdir_fake',
+        file_entry_type=definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    file_system.AddFileEntry(
+        '/test_data/testdir_fake/file1.txt', file_data=b'FILE1')
+    file_system.AddFileEntry(
+        '/test_data/testdir_fake/file2.txt', file_data=b'FILE2!')
+
+    file_system.Open(self._fake_path_spec)
+
+    metadata_per_location = {
+        metadata.location: metadata
+        for metadata in file_system.IterateMetadata()}
+
+    expected_locations = [
+        '/', '/test_data', '/test_data/testdir_fake',
+        '/test_data/testdir_fake/file1.txt',
+        '/test_data/testdir_fake/file2.txt']
+    self.assertEqual(sorted(metadata_per_location), expected_locations)
+
+    metadata = metadata_per_location.get('/test_data', None)
+    self.assertIsNotNone(metadata)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    metadata = metadata_per_location.get(
+        '/test_data/testdir_fake/file2.txt', None)
+    self.assertIsNotNone(metadata)
+    self.assertIsNone(metadata.identifier)
+    self.assertTrue(metadata.is_allocated)
+    self.assertEqual(metadata.size, 6)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_FILE)
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
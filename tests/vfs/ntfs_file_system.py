@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import ntfs_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
@@ -103,6 +104,45 @@ class NTFSFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testIterateMetadata(self):
+    """Tests the IterateMetadata function."""
+    file_system = ntfs_file_system.NTFSFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._ntfs_path_spec)
+
+    metadata_per_location = {
+        metadata.location: metadata
+        for metadata in file_system.IterateMetadata()}
+
+    self.assertEqual(len(metadata_per_location), 30)
+
+    metadata = metadata_per_location.get('\\', None)
+    self.assertIsNotNone(metadata)
+    self.assertEqual(metadata.identifier, 5)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    metadata = metadata_per_location.get('\\password.txt', None)
+    self.assertIsNotNone(metadata)
+    self.assertEqual(metadata.identifier, 41)
+    self.assertTrue(metadata.is_allocated)
+    self.assertEqual(metadata.size, 116)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertEqual(
+        metadata.modification_time.CopyToDateTimeString(),
+        '2013-12-03 06:38:53.7839722')
+
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location='\\System Volume Information', parent=self._qcow_path_spec)
+    locations = [
+        metadata.location
+        for metadata in file_system.IterateMetadata(path_spec=path_spec)]
+
+    self.assertEqual(len(locations), 4)
+    self.assertEqual(locations[0], '\\System Volume Information')
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
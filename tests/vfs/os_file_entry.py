@@ -4,6 +4,7 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
 from dfvfs.path import os_path_spec
@@ -81,6 +82,28 @@ class OSFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertNotEqual(stat_object.ctime, 0)
     self.assertNotEqual(stat_object.mtime, 0)
 
+  def testSize(self):
+    """Test the size property."""
+    test_file = self._GetTestFilePath(['testdir_os', 'file1.txt'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertIsNotNone(file_entry)
+    self.assertEqual(file_entry.size, 6)
+
+  def testInode(self):
+    """Test the inode property."""
+    test_file = self._GetTestFilePath(['testdir_os', 'file1.txt'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertIsNotNone(file_entry)
+    self.assertEqual(file_entry.inode, os.lstat(test_file).st_ino)
+
   def testIsFunctions(self):
     """Test the Is? functions."""
     test_file = self._GetTestFilePath(['testdir_os', 'file1.txt'])
@@ -6,6 +6,7 @@ import os
 import platform
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 from dfvfs.vfs import os_file_system
@@ -135,6 +136,32 @@ class OSFileSystemTest(shared_test_lib.BaseTestCase):
 
     platform.system = original_platform_system
 
+  def testIterateMetadata(self):
+    """Tests the IterateMetadata function."""
+    file_system = os_file_system.OSFileSystem(self._resolver_context)
+
+    test_path = self._GetTestFilePath(['testdir_os'])
+    path_spec = os_path_spec.OSPathSpec(location=test_path)
+
+    metadata_per_location = {
+        metadata.location: metadata
+        for metadata in file_system.IterateMetadata(path_spec=path_spec)}
+
+    self.assertEqual(len(metadata_per_location), 8)
+
+    metadata = metadata_per_location.get(test_path, None)
+    self.assertIsNotNone(metadata)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    test_file = self._GetTestFilePath(['testdir_os', 'subdir1', 'file6.txt'])
+    metadata = metadata_per_location.get(test_file, None)
+    self.assertIsNotNone(metadata)
+    self.assertTrue(metadata.is_allocated)
+    self.assertEqual(metadata.identifier, os.lstat(test_file).st_ino)
+    self.assertEqual(metadata.size, 6)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertIsNotNone(metadata.modification_time)
+
 
 if __name__ == '__main__':
   unittest.main()
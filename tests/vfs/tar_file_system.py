@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
 from dfvfs.path import tar_path_spec
 from dfvfs.resolver import context
@@ -137,6 +138,64 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testIterateMetadata(self):
+    """Tests the IterateMetadata function."""
+    test_file = self._GetTestFilePath(['missing_directory_entries.tar'])
+    self._SkipIfPathNotExists(test_file)
+
+    test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/', parent=test_file_path_spec)
+
+    file_system = tar_file_system.TARFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+    file_system.Open(path_spec)
+
+    locations = [
+        metadata.location for metadata in file_system.IterateMetadata()]
+
+    expected_locations = [
+        '/',
+        '/File System',
+        '/File System/Recordings',
+        '/File System/Recordings/AssetManifest.plist',
+        '/Non Missing Directory Entry',
+        '/Non Missing Directory Entry/test_file.txt']
+    self.assertEqual(locations, expected_locations)
+
+    metadata_per_location = {
+        metadata.location: metadata
+        for metadata in file_system.IterateMetadata()}
+
+    # Test a virtual directory.
+    metadata = metadata_per_location.get('/File System', None)
+    self.assertIsNotNone(metadata)
+    self.assertIsNone(metadata.modification_time)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    metadata = metadata_per_location.get(
+        '/File System/Recordings/AssetManifest.plist', None)
+    self.assertIsNotNone(metadata)
+    self.assertEqual(metadata.size, 181)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertEqual(
+        metadata.modification_time.CopyToDateTimeString(),
+        '2014-06-07 20:06:58')
+
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/File System', parent=test_file_path_spec)
+    locations = [
+        metadata.location
+        for metadata in file_system.IterateMetadata(path_spec=path_spec)]
+
+    expected_locations = [
+        '/File System',
+        '/File System/Recordings',
+        '/File System/Recordings/AssetManifest.plist']
+    self.assertEqual(locations, expected_locations)
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
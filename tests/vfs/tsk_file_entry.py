@@ -422,6 +422,17 @@ class TSKFileEntryTestNTFS(shared_test_lib.BaseTestCase):
     self.assertEqual(stat_object.mtime, 1386052509)
     self.assertEqual(stat_object.mtime_nano, 5179783)
 
+  def testSize(self):
+    """Test the size property."""
+    test_location = (
+        '\\System Volume Information\\{3808876b-c176-4e48-b7ae-04046e6cc752}')
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=38, location=test_location, parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertIsNotNone(file_entry)
+    self.assertEqual(file_entry.size, 65536)
+
   def testAttributes(self):
     """Tests the number_of_attributes property."""
     test_location = (
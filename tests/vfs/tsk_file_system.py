@@ -6,7 +6,9 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
 from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import context
 from dfvfs.vfs import tsk_file_system
@@ -101,6 +103,53 @@ class TSKFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testIterateMetadata(self):
+    """Tests the IterateMetadata function."""
+    test_file = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file)
+
+    test_os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    test_qcow_path_spec = qcow_path_spec.QCOWPathSpec(parent=test_os_path_spec)
+    test_tsk_path_spec = tsk_path_spec.TSKPathSpec(
+        location='/', parent=test_qcow_path_spec)
+
+    file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(test_tsk_path_spec)
+
+    metadata_per_location = {
+        metadata.location: metadata
+        for metadata in file_system.IterateMetadata()}
+
+    self.assertEqual(len(metadata_per_location), 31)
+
+    metadata = metadata_per_location.get('/', None)
+    self.assertIsNotNone(metadata)
+    self.assertEqual(metadata.identifier, 5)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    metadata = metadata_per_location.get('/password.txt', None)
+    self.assertIsNotNone(metadata)
+    self.assertEqual(metadata.identifier, 41)
+    self.assertTrue(metadata.is_allocated)
+    self.assertEqual(metadata.size, 116)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertEqual(
+        metadata.modification_time.CopyToDateTimeString(),
+        '2013-12-03 06:38:53.783972200')
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location='/System Volume Information', parent=test_qcow_path_spec)
+    locations = [
+        metadata.location
+        for metadata in file_system.IterateMetadata(path_spec=path_spec)]
+
+    self.assertEqual(len(locations), 4)
+    self.assertEqual(locations[0], '/System Volume Information')
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
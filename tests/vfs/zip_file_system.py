@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
 from dfvfs.path import zip_path_spec
 from dfvfs.resolver import context
@@ -36,6 +37,38 @@ class ZIPFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+    with self.assertRaises(IOError):
+      file_system.Close()
+
+  def testOpenReleasedWithOtherPathSpec(self):
+    """Test opening a released file system with another path specification."""
+    test_file = self._GetTestFilePath(['missing_directory_entries.zip'])
+    self._SkipIfPathNotExists(test_file)
+
+    file_system = zip_file_system.ZipFileSystem(self._resolver_context)
+    file_system.Open(self._zip_path_spec)
+
+    # Closing the file system releases it but it remains open in the cache.
+    file_system.Close()
+
+    test_os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    test_zip_path_spec = zip_path_spec.ZipPathSpec(
+        location='/', parent=test_os_path_spec)
+
+    file_system.Open(test_zip_path_spec)
+
+    self.assertIsNone(
+        self._resolver_context.PeekFileSystem(self._zip_path_spec))
+    self.assertEqual(
+        self._resolver_context.GetFileSystemReferenceCount(
+            test_zip_path_spec), 1)
+
+    path_spec = zip_path_spec.ZipPathSpec(
+        location='/folder/syslog', parent=test_os_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    file_system.Close()
+
   def testFileEntryExistsByPathSpec(self):
     """Test the file entry exists by path specification functionality."""
     file_system = zip_file_system.ZipFileSystem(self._resolver_context)
@@ -140,6 +173,46 @@ class ZIPFileSystemTest(shared_test_lib.BaseTestCase):
 
   # TODO: add tests for GetZipInfoByPathSpec function.
 
+  def testIterateMetadata(self):
+    """Tests the IterateMetadata function."""
+    test_file = self._GetTestFilePath(['missing_directory_entries.zip'])
+    self._SkipIfPathNotExists(test_file)
+
+    test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = zip_path_spec.ZipPathSpec(
+        location='/', parent=test_file_path_spec)
+
+    file_system = zip_file_system.ZipFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+    file_system.Open(path_spec)
+
+    locations = [
+        metadata.location for metadata in file_system.IterateMetadata()]
+
+    expected_locations = [
+        '/', '/folder/', '/folder/syslog', '/folder/wtmp.1']
+    self.assertEqual(locations, expected_locations)
+
+    metadata_per_location = {
+        metadata.location: metadata
+        for metadata in file_system.IterateMetadata()}
+
+    # Test a virtual directory.
+    metadata = metadata_per_location.get('/folder/', None)
+    self.assertIsNotNone(metadata)
+    self.assertIsNone(metadata.modification_time)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    metadata = metadata_per_location.get('/folder/syslog', None)
+    self.assertIsNotNone(metadata)
+    self.assertEqual(metadata.size, 1247)
+    self.assertEqual(metadata.type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertEqual(
+        metadata.modification_time.CopyToDateTimeString(),
+        '2012-07-24 14:45:24')
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()